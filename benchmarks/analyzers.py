@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=invalid-name
+"""Analyzer benchmark.
+
+Measures the throughput in MB/s of the hashing analyzer, with different
+combinations of hashers, and of the Yara analyzer. The data is processed in
+blocks of the size the extraction worker uses.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+from plaso.analyzers import hashing_analyzer
+from plaso.analyzers import yara_analyzer
+
+
+# Since os.path.abspath() uses the current working directory (cwd)
+# os.path.abspath(__file__) will point to a different location if
+# cwd has been changed. Hence we preserve the absolute location of __file__.
+__file__ = os.path.abspath(__file__)
+
+
+class AnalyzerBenchmark(object):
+  """Analyzer benchmark."""
+
+  # Size of the blocks of data passed to the analyzer, which corresponds
+  # with the analyzer size limit used as read size by the extraction worker.
+  _BLOCK_SIZE = 32 * 1024 * 1024
+
+  # The comma separated names of the hashers per hashing analyzer benchmark.
+  _HASHER_NAMES_STRINGS = [
+      'entropy', 'md5', 'md5,sha1,sha256', 'sha1', 'sha256']
+
+  def __init__(self, data_size, yara_rules_path=None):
+    """Initializes an analyzer benchmark.
+
+    Args:
+      data_size (int): size of the data to analyze in bytes.
+      yara_rules_path (Optional[str]): path of the Yara rules file, where None
+          represents the Yara analyzer is not benchmarked.
+    """
+    super(AnalyzerBenchmark, self).__init__()
+    self._data = self._GenerateData(data_size)
+    self._yara_rules_path = yara_rules_path
+
+  def _GenerateData(self, data_size):
+    """Generates the data to analyze.
+
+    The data mixes random and repetitive content to prevent the analyzers
+    from processing only best or worst case data.
+
+    Args:
+      data_size (int): size of the data in bytes.
+
+    Returns:
+      bytes: data to analyze.
+    """
+    random_generator = random.Random(0x504c41534f)
+    random_data = bytes(bytearray(
+        random_generator.getrandbits(8) for _ in range(64 * 1024)))
+    repetitive_data = b'plaso benchmark ' * 4096
+
+    segment_data = random_data + repetitive_data
+    number_of_segments = max(data_size // len(segment_data), 1)
+    return segment_data * number_of_segments
+
+  def _MeasureThroughput(self, analyzer_object):
+    """Measures the throughput of an analyzer.
+
+    Args:
+      analyzer_object (BaseAnalyzer): analyzer.
+
+    Returns:
+      float: throughput in MB/s.
+    """
+    start_time = time.time()
+
+    for block_offset in range(0, len(self._data), self._BLOCK_SIZE):
+      analyzer_object.Analyze(
+          self._data[block_offset:block_offset + self._BLOCK_SIZE])
+
+    analyzer_object.GetResults()
+    analyzer_object.Reset()
+
+    elapsed_time = max(time.time() - start_time, 0.000001)
+
+    return (len(self._data) / (1024 * 1024)) / elapsed_time
+
+  def GetBenchmarkNames(self):
+    """Retrieves the names of the benchmarks.
+
+    Returns:
+      list[str]: names of the benchmarks.
+    """
+    benchmark_names = [
+        'hashing [{0:s}]'.format(hasher_names_string)
+        for hasher_names_string in self._HASHER_NAMES_STRINGS]
+
+    if self._yara_rules_path:
+      benchmark_names.append('yara')
+
+    return benchmark_names
+
+  def Run(self, benchmark_name):
+    """Runs a benchmark.
+
+    Args:
+      benchmark_name (str): name of the benchmark.
+
+    Returns:
+      float: throughput in MB/s.
+    """
+    if benchmark_name == 'yara':
+      with io.open(self._yara_rules_path, 'r', encoding='utf-8') as file_object:
+        rules_string = file_object.read()
+
+      analyzer_object = yara_analyzer.YaraAnalyzer()
+      analyzer_object.SetRules(rules_string)
+
+      return self._MeasureThroughput(analyzer_object)
+
+    hasher_names_string = benchmark_name[len('hashing ['):-len(']')]
+
+    analyzer_object = hashing_analyzer.HashingAnalyzer()
+    analyzer_object.SetHasherNames(hasher_names_string)
+
+    try:
+      return self._MeasureThroughput(analyzer_object)
+
+    finally:
+      # Shut down the thread pool used to run multiple hashers concurrently.
+      # pylint: disable=protected-access
+      if analyzer_object._thread_pool:
+        analyzer_object._thread_pool.shutdown()
+        analyzer_object._thread_pool = None
+
+
+def Main():
+  """The main function."""
+  argument_parser = argparse.ArgumentParser(
+      description='Measures the throughput of the analyzers.',
+      add_help=False, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+  argument_parser.add_argument(
+      '-h', '--help', action='help',
+      help='show this help message and exit.')
+
+  argument_parser.add_argument(
+      '--size', dest='size', action='store', metavar='MIB', type=int,
+      default=64, help='size of the data to analyze in MiB.')
+
+  argument_parser.add_argument(
+      '--test-data-directory', '--test_data_directory', action='store',
+      metavar='DIRECTORY', dest='test_data_directory', type=str,
+      default=None, help=(
+          'The location of the directory with the Yara rules file, the '
+          'default is the plaso test data directory.'))
+
+  options = argument_parser.parse_args()
+
+  if options.size < 1:
+    print('Unsupported size: {0:d}.'.format(options.size))
+    print('')
+    return False
+
+  test_data_path = options.test_data_directory or os.path.join(
+      os.path.dirname(os.path.dirname(__file__)), 'test_data')
+
+  yara_rules_path = os.path.join(test_data_path, 'yara.rules')
+  if not os.path.isfile(yara_rules_path):
+    yara_rules_path = None
+
+  benchmark = AnalyzerBenchmark(
+      options.size * 1024 * 1024, yara_rules_path=yara_rules_path)
+
+  print('{0:<40s}{1:>10s}'.format('Analyzer', 'MB/s'))
+
+  for benchmark_name in benchmark.GetBenchmarkNames():
+    throughput = benchmark.Run(benchmark_name)
+
+    print('{0:<40s}{1:>10.1f}'.format(benchmark_name, throughput))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,841 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=invalid-name
+"""Performance benchmark launcher.
+
+Runs log2timeline, pinfo and psort over a synthetic corpus, generated from
+the plaso test data at scaled multiples, records performance metrics per
+stage and compares them against stored baselines.
+
+The synthetic corpus either consists of copies of the corpus sources or of
+artifacts generated by the synthetic corpus generator.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import codecs
+import gzip
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+  import ConfigParser as configparser
+except ImportError:
+  import configparser  # pylint: disable=import-error
+
+import psutil
+
+# The synthetic corpus generator is in the same directory as this script.
+import synthetic_corpus  # pylint: disable=wrong-import-position
+
+if sys.version_info[0] < 3:
+  BYTES_TYPE = str
+else:
+  BYTES_TYPE = bytes
+
+# Since os.path.abspath() uses the current working directory (cwd)
+# os.path.abspath(__file__) will point to a different location if
+# cwd has been changed. Hence we preserve the absolute location of __file__.
+__file__ = os.path.abspath(__file__)
+
+
+class TempDirectory(object):
+  """Temporary directory."""
+
+  def __init__(self):
+    """Initializes a temporary directory."""
+    super(TempDirectory, self).__init__()
+    self.name = ''
+
+  def __enter__(self):
+    """Make this work with the 'with' statement."""
+    self.name = tempfile.mkdtemp()
+    return self.name
+
+  def __exit__(self, exception_type, value, traceback):
+    """Make this work with the 'with' statement."""
+    shutil.rmtree(self.name, True)
+
+
+class BenchmarkDefinition(object):
+  """Benchmark definition.
+
+  Attributes:
+    corpus_sources (list[str]): paths of the files, relative to the plaso
+        source directory, that are copied into the synthetic corpus.
+    log2timeline_options (list[str]): additional log2timeline command line
+        options.
+    name (str): name of the benchmark.
+    output_format (str): psort output format.
+    psort_options (list[str]): additional psort command line options.
+    scales (list[int]): numbers of copies of the corpus sources or
+        multipliers of the number of files per synthetic artifact.
+    synthetic_artifacts (list[synthetic_corpus.ArtifactDefinition]):
+        definitions of the artifacts to generate, instead of copying corpus
+        sources.
+    thresholds (dict[str, float]): maximum relative regression per metric.
+    workers (int): number of log2timeline worker processes.
+  """
+
+  def __init__(self, name):
+    """Initializes a benchmark definition.
+
+    Args:
+      name (str): name of the benchmark.
+    """
+    super(BenchmarkDefinition, self).__init__()
+    self.corpus_sources = []
+    self.log2timeline_options = []
+    self.name = name
+    self.output_format = 'dynamic'
+    self.psort_options = []
+    self.scales = [1]
+    self.synthetic_artifacts = []
+    self.thresholds = {}
+    self.workers = None
+
+
+class BenchmarkDefinitionReader(object):
+  """Benchmark definition reader.
+
+  The benchmark definition reader reads benchmark definitions from
+  a configuration file.
+  """
+
+  _THRESHOLD_PREFIX = 'threshold_'
+
+  def __init__(self):
+    """Initializes a benchmark definition reader."""
+    super(BenchmarkDefinitionReader, self).__init__()
+    self._config_parser = None
+
+  def _GetConfigValue(
+      self, section_name, value_name, default=None, split_string=False):
+    """Retrieves a value from the config parser.
+
+    Args:
+      section_name (str): name of the section that contains the value.
+      value_name (str): the name of the value.
+      default (Optional[object]): default value to return if no value is set
+          in the config parser.
+      split_string (Optional[bool]): if True, the value will be split into a
+          list of strings, suitable for passing to subprocess.Popen().
+
+    Returns:
+      object: value or the default if the value does not exist.
+    """
+    try:
+      value = self._config_parser.get(section_name, value_name)
+    except configparser.NoOptionError:
+      value = None
+
+    if isinstance(value, BYTES_TYPE):
+      value = value.decode('utf-8')
+
+    if split_string:
+      value = (value or '').split()
+
+    if value is None:
+      value = default
+
+    return value
+
+  def _GetConfigValuesList(self, section_name, value_name):
+    """Retrieves a comma separated list of values from the config parser.
+
+    Args:
+      section_name (str): name of the section that contains the value.
+      value_name (str): the name of the value.
+
+    Returns:
+      list[str]: values.
+    """
+    value = self._GetConfigValue(section_name, value_name, default='')
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+  def Read(self, file_object):
+    """Reads benchmark definitions.
+
+    Args:
+      file_object (file): a file-like object to read from.
+
+    Yields:
+      BenchmarkDefinition: benchmark definition.
+
+    Raises:
+      ValueError: if a value in a benchmark definition is not supported.
+    """
+    self._config_parser = configparser.RawConfigParser()
+
+    try:
+      if hasattr(self._config_parser, 'read_file'):
+        self._config_parser.read_file(file_object)
+      else:
+        # pylint: disable=deprecated-method
+        self._config_parser.readfp(file_object)
+
+      for section_name in self._config_parser.sections():
+        benchmark_definition = BenchmarkDefinition(section_name)
+
+        benchmark_definition.corpus_sources = self._GetConfigValuesList(
+            section_name, 'corpus_sources')
+
+        synthetic_artifacts = self._GetConfigValue(
+            section_name, 'synthetic_artifacts', default='')
+        benchmark_definition.synthetic_artifacts = (
+            synthetic_corpus.SyntheticCorpusGenerator.ParseArtifactDefinitions(
+                synthetic_artifacts))
+
+        if (not benchmark_definition.corpus_sources and
+            not benchmark_definition.synthetic_artifacts):
+          logging.warning((
+              'Corpus sources and synthetic artifacts missing in benchmark '
+              'definition: {0:s}.').format(section_name))
+          continue
+
+        scales = self._GetConfigValuesList(section_name, 'scales') or ['1']
+        benchmark_definition.scales = [int(scale, 10) for scale in scales]
+
+        benchmark_definition.log2timeline_options = self._GetConfigValue(
+            section_name, 'log2timeline_options', split_string=True)
+        benchmark_definition.output_format = self._GetConfigValue(
+            section_name, 'output_format', default='dynamic')
+        benchmark_definition.psort_options = self._GetConfigValue(
+            section_name, 'psort_options', split_string=True)
+
+        workers = self._GetConfigValue(section_name, 'workers')
+        if workers:
+          benchmark_definition.workers = int(workers, 10)
+
+        for value_name in self._config_parser.options(section_name):
+          if value_name.startswith(self._THRESHOLD_PREFIX):
+            metric_name = value_name[len(self._THRESHOLD_PREFIX):]
+            benchmark_definition.thresholds[metric_name] = float(
+                self._GetConfigValue(section_name, value_name))
+
+        yield benchmark_definition
+
+    finally:
+      self._config_parser = None
+
+
+class CorpusGenerator(object):
+  """Generates a synthetic corpus from the plaso test data."""
+
+  def __init__(self, sources_path):
+    """Initializes a corpus generator.
+
+    Args:
+      sources_path (str): path of the directory the corpus sources are
+          relative to.
+    """
+    super(CorpusGenerator, self).__init__()
+    self._sources_path = sources_path
+
+  def Generate(self, corpus_sources, scale, corpus_path):
+    """Generates a corpus.
+
+    Every copy of the corpus sources is stored in a separate sub directory,
+    so that the file entries in the corpus have distinct paths.
+
+    Args:
+      corpus_sources (list[str]): paths of the corpus sources.
+      scale (int): number of copies of the corpus sources.
+      corpus_path (str): path of the directory to generate the corpus in.
+
+    Returns:
+      tuple[int, int]: number of files and size in bytes of the corpus.
+
+    Raises:
+      IOError: if a corpus source does not exist.
+    """
+    source_paths = []
+    for corpus_source in corpus_sources:
+      source_path = os.path.join(self._sources_path, corpus_source)
+      if not os.path.isfile(source_path):
+        raise IOError('No such corpus source: {0:s}'.format(source_path))
+
+      source_paths.append(source_path)
+
+    number_of_files = 0
+    corpus_size = 0
+    for copy_index in range(scale):
+      copy_path = os.path.join(corpus_path, '{0:06d}'.format(copy_index))
+      os.makedirs(copy_path)
+
+      for source_path in source_paths:
+        destination_path = os.path.join(
+            copy_path, os.path.basename(source_path))
+        shutil.copyfile(source_path, destination_path)
+
+        number_of_files += 1
+        corpus_size += os.path.getsize(destination_path)
+
+    return number_of_files, corpus_size
+
+
+class StageResult(object):
+  """Result of running a stage of a benchmark.
+
+  Attributes:
+    duration (float): duration of the stage in seconds.
+    exit_code (int): exit code of the command of the stage.
+    peak_rss (int): peak resident set size (RSS) in bytes, of all processes
+        of the stage combined.
+  """
+
+  def __init__(self):
+    """Initializes a stage result."""
+    super(StageResult, self).__init__()
+    self.duration = 0.0
+    self.exit_code = None
+    self.peak_rss = 0
+
+
+class BenchmarkRunner(object):
+  """Benchmark runner.
+
+  A benchmark consists of the following stages:
+  * log2timeline, which extracts events from the corpus into a storage file;
+  * pinfo, which reads the storage file information;
+  * psort, which exports the events from the storage file.
+  """
+
+  # Interval in seconds between samples of the memory usage.
+  _SAMPLE_INTERVAL = 0.1
+
+  def __init__(self, tools_path, sources_path, results_path):
+    """Initializes a benchmark runner.
+
+    Args:
+      tools_path (str): path to the plaso tools.
+      sources_path (str): path of the directory the corpus sources are
+          relative to.
+      results_path (str): path to store the tool output.
+    """
+    super(BenchmarkRunner, self).__init__()
+    self._corpus_generator = CorpusGenerator(sources_path)
+    self._synthetic_corpus_generator = (
+        synthetic_corpus.SyntheticCorpusGenerator(
+            os.path.join(sources_path, 'test_data')))
+    self._results_path = results_path
+    self._tools_path = tools_path
+
+  def _GetMergeCPUTime(self, profiling_path):
+    """Retrieves the CPU time spent merging task storage.
+
+    Args:
+      profiling_path (str): path of the profiling directory of log2timeline.
+
+    Returns:
+      float: CPU time in seconds spent merging task storage or None if not
+          available.
+    """
+    profile_path = os.path.join(
+        profiling_path, 'processing-Main-processing.csv.gz')
+    if not os.path.isfile(profile_path):
+      return None
+
+    merge_cpu_time = 0.0
+    with gzip.open(profile_path, 'rb') as file_object:
+      # Skip the header.
+      file_object.readline()
+
+      for line in file_object:
+        line = codecs.decode(line, 'utf-8')
+        _, name, cpu_time = line.rstrip('\n').split('\t')
+        if name == 'merge':
+          merge_cpu_time += float(cpu_time)
+
+    return merge_cpu_time
+
+  def _GetNumberOfEvents(self, pinfo_output_path):
+    """Retrieves the number of events from the pinfo JSON output.
+
+    Args:
+      pinfo_output_path (str): path of the pinfo JSON output.
+
+    Returns:
+      int: number of events or None if not available.
+    """
+    with open(pinfo_output_path, 'rb') as file_object:
+      output = codecs.decode(file_object.read(), 'utf-8')
+
+    # Any messages printed before the JSON output are ignored.
+    json_start = output.find('{')
+    if json_start < 0:
+      return None
+
+    try:
+      json_dict = json.loads(output[json_start:])
+    except ValueError:
+      return None
+
+    storage_counters = json_dict.get('storage_counters', {})
+    return storage_counters.get('parsers', {}).get('total', None)
+
+  def _GetToolPath(self, tool_name):
+    """Retrieves the path of a plaso tool.
+
+    Args:
+      tool_name (str): name of the tool, such as "log2timeline".
+
+    Returns:
+      str: path of the tool.
+    """
+    tool_path = os.path.join(self._tools_path, '{0:s}.py'.format(tool_name))
+    if not os.path.exists(tool_path):
+      tool_path = os.path.join(self._tools_path, tool_name)
+
+    return tool_path
+
+  def _GetUsedMemory(self, process):
+    """Retrieves the memory used by a process and its child processes.
+
+    Args:
+      process (psutil.Process): process.
+
+    Returns:
+      int: combined resident set size (RSS) in bytes.
+    """
+    used_memory = 0
+
+    try:
+      processes = [process] + process.children(recursive=True)
+    except (psutil.AccessDenied, psutil.NoSuchProcess):
+      return used_memory
+
+    for process_object in processes:
+      try:
+        used_memory += process_object.memory_info().rss
+      except (psutil.AccessDenied, psutil.NoSuchProcess):
+        pass
+
+    return used_memory
+
+  def _RunCommand(self, command, output_path):
+    """Runs a command and monitors its resource usage.
+
+    Args:
+      command (list[str]): full command to run, as expected by the Popen()
+        constructor.
+      output_path (str): path of the file to write stdout and stderr to.
+
+    Returns:
+      StageResult: result of the command.
+    """
+    if command[0].endswith('py'):
+      command.insert(0, sys.executable)
+
+    logging.info('Running: {0:s}'.format(' '.join(command)))
+
+    stage_result = StageResult()
+
+    with open(output_path, 'wb') as output_file_object:
+      start_time = time.time()
+      child = subprocess.Popen(
+          command, stdout=output_file_object, stderr=subprocess.STDOUT)
+
+      try:
+        process = psutil.Process(child.pid)
+      except psutil.NoSuchProcess:
+        process = None
+
+      while child.poll() is None:
+        if process:
+          used_memory = self._GetUsedMemory(process)
+          stage_result.peak_rss = max(stage_result.peak_rss, used_memory)
+
+        time.sleep(self._SAMPLE_INTERVAL)
+
+      stage_result.duration = time.time() - start_time
+      stage_result.exit_code = child.returncode
+
+    if stage_result.exit_code != 0:
+      logging.error('Running: "{0:s}" failed (exit code {1:d}).'.format(
+          ' '.join(command), stage_result.exit_code))
+
+    return stage_result
+
+  def Run(self, benchmark_definition, scale):
+    """Runs a benchmark at a specific scale.
+
+    Args:
+      benchmark_definition (BenchmarkDefinition): benchmark definition.
+      scale (int): number of copies of the corpus sources or multiplier of
+          the number of files per synthetic artifact.
+
+    Returns:
+      dict[str, object]: benchmark results.
+    """
+    benchmark_identifier = '{0:s}@x{1:d}'.format(
+        benchmark_definition.name, scale)
+
+    results = {
+        'benchmark': benchmark_definition.name,
+        'scale': scale,
+        'stages': {}}
+
+    with TempDirectory() as temp_directory:
+      corpus_path = os.path.join(temp_directory, 'corpus')
+      profiling_path = os.path.join(temp_directory, 'profiling')
+      storage_file = os.path.join(temp_directory, 'storage.plaso')
+
+      os.mkdir(profiling_path)
+
+      if benchmark_definition.synthetic_artifacts:
+        artifacts_statistics = self._synthetic_corpus_generator.Generate(
+            benchmark_definition.synthetic_artifacts, corpus_path, scale=scale)
+
+        results['corpus'] = {
+            'artifacts': artifacts_statistics,
+            'number_of_files': sum(
+                statistics['number_of_files']
+                for statistics in artifacts_statistics.values()),
+            'size': sum(
+                statistics['size']
+                for statistics in artifacts_statistics.values())}
+
+      else:
+        number_of_files, corpus_size = self._corpus_generator.Generate(
+            benchmark_definition.corpus_sources, scale, corpus_path)
+
+        results['corpus'] = {
+            'number_of_files': number_of_files,
+            'size': corpus_size}
+
+      output_prefix = os.path.join(self._results_path, benchmark_identifier)
+
+      command = [
+          self._GetToolPath('log2timeline'), '--quiet',
+          '--status_view', 'none', '--profilers', 'processing',
+          '--profiling_directory', profiling_path]
+      if benchmark_definition.workers:
+        command.extend(['--workers', '{0:d}'.format(
+            benchmark_definition.workers)])
+      command.extend(benchmark_definition.log2timeline_options)
+      command.extend([storage_file, corpus_path])
+
+      stage_result = self._RunCommand(
+          command, '{0:s}-log2timeline.log'.format(output_prefix))
+      if stage_result.exit_code != 0:
+        results['error'] = 'log2timeline failed'
+        return results
+
+      log2timeline_results = {
+          'duration': stage_result.duration,
+          'peak_rss': stage_result.peak_rss,
+          'storage_size': os.path.getsize(storage_file)}
+      results['stages']['log2timeline'] = log2timeline_results
+
+      pinfo_output_path = '{0:s}-pinfo.json'.format(output_prefix)
+      command = [
+          self._GetToolPath('pinfo'), '--output_format', 'json', storage_file]
+
+      stage_result = self._RunCommand(command, pinfo_output_path)
+      if stage_result.exit_code != 0:
+        results['error'] = 'pinfo failed'
+        return results
+
+      results['stages']['pinfo'] = {
+          'duration': stage_result.duration,
+          'peak_rss': stage_result.peak_rss}
+
+      number_of_events = self._GetNumberOfEvents(pinfo_output_path)
+      results['number_of_events'] = number_of_events
+
+      if number_of_events is not None:
+        log2timeline_results['events_per_second'] = (
+            number_of_events / max(log2timeline_results['duration'], 0.001))
+
+        merge_cpu_time = self._GetMergeCPUTime(profiling_path)
+        if merge_cpu_time:
+          log2timeline_results['merge_events_per_second'] = (
+              number_of_events / merge_cpu_time)
+
+      psort_output_file = os.path.join(temp_directory, 'output')
+      command = [
+          self._GetToolPath('psort'), '--quiet', '--status_view', 'none',
+          '-o', benchmark_definition.output_format]
+      if benchmark_definition.output_format != 'null':
+        command.extend(['-w', psort_output_file])
+      command.extend(benchmark_definition.psort_options)
+      command.append(storage_file)
+
+      stage_result = self._RunCommand(
+          command, '{0:s}-psort.log'.format(output_prefix))
+      if stage_result.exit_code != 0:
+        results['error'] = 'psort failed'
+        return results
+
+      psort_results = {
+          'duration': stage_result.duration,
+          'peak_rss': stage_result.peak_rss}
+
+      if os.path.isfile(psort_output_file):
+        psort_results['storage_size'] = os.path.getsize(psort_output_file)
+
+      if number_of_events is not None:
+        psort_results['events_per_second'] = (
+            number_of_events / max(psort_results['duration'], 0.001))
+
+      results['stages']['psort'] = psort_results
+
+    return results
+
+
+class BaselineComparer(object):
+  """Compares benchmark results against baselines."""
+
+  # Metrics for which a higher value is better, for all other metrics
+  # a lower value is better.
+  _HIGHER_IS_BETTER_METRICS = frozenset([
+      'events_per_second', 'merge_events_per_second'])
+
+  def Compare(self, results, baselines, thresholds):
+    """Compares benchmark results against baselines.
+
+    Args:
+      results (dict[str, object]): results of a benchmark.
+      baselines (dict[str, object]): baseline results of the benchmark.
+      thresholds (dict[str, float]): maximum relative regression per metric.
+
+    Returns:
+      list[dict[str, object]]: regressions, where every regression contains
+          the stage, metric, value, baseline value, relative change and
+          threshold.
+    """
+    regressions = []
+
+    baseline_stages = baselines.get('stages', {})
+    for stage_name, stage_results in sorted(results.get('stages', {}).items()):
+      baseline_stage_results = baseline_stages.get(stage_name, {})
+
+      for metric_name, value in sorted(stage_results.items()):
+        threshold = thresholds.get(metric_name, None)
+        baseline_value = baseline_stage_results.get(metric_name, None)
+        if threshold is None or not baseline_value:
+          continue
+
+        if metric_name in self._HIGHER_IS_BETTER_METRICS:
+          change = float(baseline_value - value) / baseline_value
+        else:
+          change = float(value - baseline_value) / baseline_value
+
+        if change > threshold:
+          regressions.append({
+              'baseline': baseline_value,
+              'change': change,
+              'metric': metric_name,
+              'stage': stage_name,
+              'threshold': threshold,
+              'value': value})
+
+    return regressions
+
+
+def Main():
+  """The main function."""
+  argument_parser = argparse.ArgumentParser(
+      description=(
+          'Runs performance benchmarks of log2timeline, pinfo and psort over '
+          'a synthetic corpus and compares the results against baselines.'),
+      add_help=False, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+  argument_parser.add_argument(
+      '--baselines-file', '--baselines_file', dest='baselines_file',
+      action='store', metavar='PATH', default=None, help=(
+          'path of the baselines file, the default is baselines.json in '
+          'the benchmarks directory.'))
+
+  argument_parser.add_argument(
+      '--benchmarks', dest='benchmarks', action='store', metavar='NAMES',
+      default=None, help=(
+          'comma separated names of the benchmarks to run, the default is '
+          'to run all benchmarks.'))
+
+  argument_parser.add_argument(
+      '-c', '--config', dest='config_file', action='store',
+      metavar='CONFIG_FILE', default=None, help=(
+          'path of the benchmarks configuration file, the default is '
+          'benchmarks.ini in the benchmarks directory.'))
+
+  argument_parser.add_argument(
+      '-h', '--help', action='help',
+      help='show this help message and exit.')
+
+  argument_parser.add_argument(
+      '--results-directory', '--results_directory', action='store',
+      metavar='DIRECTORY', dest='results_directory', type=str,
+      default=None, help=(
+          'The location of the directory where to store the benchmark '
+          'results and tool output.'))
+
+  argument_parser.add_argument(
+      '--sources-directory', '--sources_directory', action='store',
+      metavar='DIRECTORY', dest='sources_directory', type=str,
+      default=None, help=(
+          'The location of the directory the corpus sources are relative to, '
+          'the default is the plaso source directory.'))
+
+  argument_parser.add_argument(
+      '--tools-directory', '--tools_directory', action='store',
+      metavar='DIRECTORY', dest='tools_directory', type=str,
+      default=None, help='The location of the plaso tools directory.')
+
+  argument_parser.add_argument(
+      '--update-baselines', '--update_baselines', dest='update_baselines',
+      action='store_true', default=False, help=(
+          'store the results of the benchmarks as the new baselines.'))
+
+  options = argument_parser.parse_args()
+
+  benchmarks_path = os.path.dirname(__file__)
+  plaso_path = os.path.dirname(benchmarks_path)
+
+  config_file = options.config_file or os.path.join(
+      benchmarks_path, 'benchmarks.ini')
+  if not os.path.exists(config_file):
+    print('No such config file: {0:s}.'.format(config_file))
+    print('')
+    return False
+
+  baselines_file = options.baselines_file or os.path.join(
+      benchmarks_path, 'baselines.json')
+
+  sources_path = options.sources_directory or plaso_path
+  if not os.path.isdir(sources_path):
+    print('No such sources directory: {0:s}.'.format(sources_path))
+    print('')
+    return False
+
+  tools_path = options.tools_directory or os.path.join(plaso_path, 'tools')
+
+  results_path = options.results_directory or os.getcwd()
+  if not os.path.isdir(results_path):
+    print('No such results directory: {0:s}.'.format(results_path))
+    print('')
+    return False
+
+  logging.basicConfig(
+      format='[%(levelname)s] %(message)s', level=logging.INFO)
+
+  benchmark_names = None
+  if options.benchmarks:
+    benchmark_names = set(options.benchmarks.split(','))
+
+  with open(config_file, 'r') as file_object:
+    benchmark_definition_reader = BenchmarkDefinitionReader()
+    benchmark_definitions = [
+        benchmark_definition
+        for benchmark_definition in benchmark_definition_reader.Read(
+            file_object)
+        if not benchmark_names or benchmark_definition.name in benchmark_names]
+
+  baselines = {}
+  if os.path.exists(baselines_file):
+    with open(baselines_file, 'r') as file_object:
+      baselines = json.load(file_object).get('benchmarks', {})
+  else:
+    logging.warning((
+        'No such baselines file: {0:s}, results are not compared against '
+        'baselines.').format(baselines_file))
+
+  timestamp = time.strftime('%Y%m%dT%H%M%S', time.gmtime())
+
+  benchmark_results = {
+      'benchmarks': {},
+      'metadata': {
+          'cpu_count': multiprocessing.cpu_count(),
+          'platform': platform.platform(),
+          'python_version': platform.python_version(),
+          'timestamp': timestamp},
+      'regressions': []}
+
+  benchmark_runner = BenchmarkRunner(tools_path, sources_path, results_path)
+  baseline_comparer = BaselineComparer()
+
+  failed_benchmarks = []
+  for benchmark_definition in benchmark_definitions:
+    for scale in benchmark_definition.scales:
+      benchmark_identifier = '{0:s}@x{1:d}'.format(
+          benchmark_definition.name, scale)
+
+      results = benchmark_runner.Run(benchmark_definition, scale)
+      benchmark_results['benchmarks'][benchmark_identifier] = results
+
+      if 'error' in results:
+        failed_benchmarks.append(benchmark_identifier)
+        continue
+
+      baseline_results = baselines.get(benchmark_identifier, None)
+      if baseline_results:
+        regressions = baseline_comparer.Compare(
+            results, baseline_results, benchmark_definition.thresholds)
+        for regression in regressions:
+          regression['benchmark'] = benchmark_identifier
+          benchmark_results['regressions'].append(regression)
+
+  results_file = os.path.join(
+      results_path, 'benchmarks-{0:s}.json'.format(timestamp))
+  with open(results_file, 'w') as file_object:
+    json.dump(benchmark_results, file_object, indent=2, sort_keys=True)
+
+  print('Benchmark results written to: {0:s}'.format(results_file))
+
+  for benchmark_identifier, results in sorted(
+      benchmark_results['benchmarks'].items()):
+    print('')
+    print('{0:s}: {1!s} events from {2:d} files'.format(
+        benchmark_identifier, results.get('number_of_events', None),
+        results.get('corpus', {}).get('number_of_files', 0)))
+
+    for stage_name, stage_results in sorted(results['stages'].items()):
+      metrics_string = ', '.join([
+          '{0:s}: {1:.2f}'.format(metric_name, value)
+          for metric_name, value in sorted(stage_results.items())])
+      print('  {0:s}: {1:s}'.format(stage_name, metrics_string))
+
+  if options.update_baselines and not failed_benchmarks:
+    with open(baselines_file, 'w') as file_object:
+      json.dump(benchmark_results, file_object, indent=2, sort_keys=True)
+
+    print('')
+    print('Baselines updated: {0:s}'.format(baselines_file))
+
+  if benchmark_results['regressions']:
+    print('')
+    print('Regressions:')
+    for regression in benchmark_results['regressions']:
+      print((' {0:s} {1:s} {2:s}: {3:.2f} compared to baseline {4:.2f} '
+             '({5:+.1%}, threshold {6:.0%})').format(
+                 regression['benchmark'], regression['stage'],
+                 regression['metric'], regression['value'],
+                 regression['baseline'], regression['change'],
+                 regression['threshold']))
+
+  if failed_benchmarks:
+    print('')
+    print('Failed benchmarks:')
+    for benchmark_identifier in failed_benchmarks:
+      print(' {0:s}'.format(benchmark_identifier))
+
+  print('')
+  return not failed_benchmarks and not benchmark_results['regressions']
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
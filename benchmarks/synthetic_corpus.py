@@ -0,0 +1,657 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=invalid-name
+"""Synthetic corpus generator.
+
+Generates a directory tree with synthetic artifacts, based on the plaso test
+data, to test plaso at scale without real case data. Artifacts are generated
+in formats the parsers already understand:
+* syslog: text log files with a configurable number of lines;
+* chrome_history: Chrome History SQLite databases with a configurable number
+  of visits;
+* evtx: copies of a Windows XML Event Log (EVTX) file;
+* registry: copies of a Windows Registry file.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import abc
+import argparse
+import io
+import os
+import random
+import re
+import shutil
+import sqlite3
+import sys
+
+
+# Since os.path.abspath() uses the current working directory (cwd)
+# os.path.abspath(__file__) will point to a different location if
+# cwd has been changed. Hence we preserve the absolute location of __file__.
+__file__ = os.path.abspath(__file__)
+
+
+class ArtifactDefinition(object):
+  """Synthetic artifact definition.
+
+  Attributes:
+    name (str): name of the artifact generator.
+    number_of_files (int): number of files to generate.
+    number_of_records (int): number of records per file or None if the
+        artifact generator does not support a number of records.
+  """
+
+  def __init__(self, name, number_of_files, number_of_records=None):
+    """Initializes a synthetic artifact definition.
+
+    Args:
+      name (str): name of the artifact generator.
+      number_of_files (int): number of files to generate.
+      number_of_records (Optional[int]): number of records per file or None
+          if the artifact generator does not support a number of records.
+    """
+    super(ArtifactDefinition, self).__init__()
+    self.name = name
+    self.number_of_files = number_of_files
+    self.number_of_records = number_of_records
+
+
+class ArtifactGenerator(object):
+  """Synthetic artifact generator interface."""
+
+  # The filename of the generated artifact files.
+  FILENAME = None
+
+  NAME = None
+
+  # Path of the template file, relative to the test data directory.
+  TEMPLATE_FILE = None
+
+  def __init__(self, test_data_path, random_generator):
+    """Initializes a synthetic artifact generator.
+
+    Args:
+      test_data_path (str): path of the test data directory.
+      random_generator (random.Random): pseudo random number generator.
+
+    Raises:
+      IOError: if the template file does not exist.
+    """
+    super(ArtifactGenerator, self).__init__()
+    self._random = random_generator
+    self._template_path = os.path.join(test_data_path, self.TEMPLATE_FILE)
+
+    if not os.path.isfile(self._template_path):
+      raise IOError('No such template file: {0:s}'.format(
+          self._template_path))
+
+  @abc.abstractmethod
+  def Generate(self, path, number_of_records=None):
+    """Generates an artifact file.
+
+    Args:
+      path (str): path of the artifact file.
+      number_of_records (Optional[int]): number of records to generate.
+
+    Returns:
+      int: number of generated records or None if not known.
+    """
+
+
+class ChromeHistoryGenerator(ArtifactGenerator):
+  """Chrome History SQLite database generator.
+
+  The test data database is used as template for the schema, the visited URLs
+  and their visits are generated.
+  """
+
+  FILENAME = 'History'
+
+  NAME = 'chrome_history'
+
+  TEMPLATE_FILE = 'History'
+
+  # Number of rows to insert per transaction.
+  _BATCH_SIZE = 10000
+
+  _HOSTNAMES = [
+      'docs.example.com', 'mail.example.com', 'news.example.org',
+      'shop.example.net', 'wiki.example.org', 'www.example.com']
+
+  # Timestamp of the first visit, in number of micro seconds since
+  # January 1, 1601 (WebKit time), which is 2016-01-01 00:00:00.
+  _FIRST_VISIT_TIME = 13096080000000000
+
+  # Number of visits per URL.
+  _VISITS_PER_URL = 4
+
+  # Transition of a link visit.
+  _TRANSITION_LINK = 805306368
+
+  def _GenerateURLs(self, number_of_urls, number_of_records):
+    """Generates URL rows.
+
+    The visits are distributed round robin over the URLs, so that the visit
+    count and last visit time of a URL can be determined without tracking
+    the visits.
+
+    Args:
+      number_of_urls (int): number of URLs to generate.
+      number_of_records (int): number of visits to generate.
+
+    Yields:
+      tuple: values of an urls table row.
+    """
+    for url_index in range(number_of_urls):
+      visit_count = number_of_records // number_of_urls
+      if url_index < number_of_records % number_of_urls:
+        visit_count += 1
+
+      last_visit_index = url_index + ((visit_count - 1) * number_of_urls)
+
+      hostname = self._random.choice(self._HOSTNAMES)
+      url = 'https://{0:s}/page/{1:d}'.format(hostname, url_index)
+      title = 'Synthetic page {0:d}'.format(url_index)
+
+      yield (
+          url_index + 1, url, title, visit_count, 0,
+          self._GetVisitTime(last_visit_index), 0, 0)
+
+  def _GenerateVisits(self, number_of_urls, number_of_records):
+    """Generates visit rows.
+
+    Args:
+      number_of_urls (int): number of URLs.
+      number_of_records (int): number of visits to generate.
+
+    Yields:
+      tuple: values of a visits table row.
+    """
+    for visit_index in range(number_of_records):
+      url_identifier = (visit_index % number_of_urls) + 1
+      yield (
+          visit_index + 1, url_identifier, self._GetVisitTime(visit_index), 0,
+          self._TRANSITION_LINK, 0, 0)
+
+  def _GetVisitTime(self, visit_index):
+    """Retrieves the time of a visit.
+
+    Args:
+      visit_index (int): index of the visit.
+
+    Returns:
+      int: visit time in number of micro seconds since January 1, 1601.
+    """
+    return self._FIRST_VISIT_TIME + (visit_index * 1000000)
+
+  def _InsertRows(self, connection, query, rows):
+    """Inserts rows in batches.
+
+    Args:
+      connection (sqlite3.Connection): database connection.
+      query (str): insert query.
+      rows (iterable[tuple]): values of the rows to insert.
+    """
+    batch = []
+    for row in rows:
+      batch.append(row)
+      if len(batch) >= self._BATCH_SIZE:
+        connection.executemany(query, batch)
+        batch = []
+
+    if batch:
+      connection.executemany(query, batch)
+
+  def Generate(self, path, number_of_records=None):
+    """Generates an artifact file.
+
+    Args:
+      path (str): path of the artifact file.
+      number_of_records (Optional[int]): number of visits to generate.
+
+    Returns:
+      int: number of generated visits.
+    """
+    number_of_records = number_of_records or 1
+    number_of_urls = max(1, number_of_records // self._VISITS_PER_URL)
+
+    shutil.copyfile(self._template_path, path)
+
+    connection = sqlite3.connect(path)
+    try:
+      # The template database is only used for its schema.
+      for table_name in (
+          'downloads', 'keyword_search_terms', 'segment_usage', 'segments',
+          'urls', 'visit_source', 'visits'):
+        connection.execute('DELETE FROM {0:s}'.format(table_name))
+
+      self._InsertRows(connection, (
+          'INSERT INTO urls (id, url, title, visit_count, typed_count, '
+          'last_visit_time, hidden, favicon_id) '
+          'VALUES (?, ?, ?, ?, ?, ?, ?, ?)'),
+          self._GenerateURLs(number_of_urls, number_of_records))
+
+      self._InsertRows(connection, (
+          'INSERT INTO visits (id, url, visit_time, from_visit, transition, '
+          'segment_id, is_indexed) VALUES (?, ?, ?, ?, ?, ?, ?)'),
+          self._GenerateVisits(number_of_urls, number_of_records))
+
+      connection.commit()
+
+    finally:
+      connection.close()
+
+    return number_of_records
+
+
+class SyslogGenerator(ArtifactGenerator):
+  """Syslog file generator.
+
+  The lines of the test data syslog file are used as templates for
+  the reporters and messages, the timestamps and process identifiers are
+  generated.
+  """
+
+  FILENAME = 'syslog'
+
+  NAME = 'syslog'
+
+  TEMPLATE_FILE = 'syslog'
+
+  # Number of lines to write at once.
+  _BATCH_SIZE = 10000
+
+  _LINE_RE = re.compile(
+      r'^[A-Z][a-z]{2} +[0-9]+ [0-9:.]+ \S+ ([^\s:\[]+)\[[0-9]+\]: (.+)$')
+
+  _MONTHS = [
+      'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct',
+      'Nov', 'Dec']
+
+  _DAYS_PER_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+  # The timestamps are spread over a single non-leap year, since syslog
+  # timestamps do not contain a year.
+  _SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+  def __init__(self, test_data_path, random_generator):
+    """Initializes a syslog file generator.
+
+    Args:
+      test_data_path (str): path of the test data directory.
+      random_generator (random.Random): pseudo random number generator.
+
+    Raises:
+      IOError: if the template file does not exist or contains no usable
+          lines.
+    """
+    super(SyslogGenerator, self).__init__(test_data_path, random_generator)
+    self._templates = self._ReadTemplates()
+
+    if not self._templates:
+      raise IOError('No template lines in: {0:s}'.format(self._template_path))
+
+  def _FormatTimestamp(self, seconds):
+    """Formats a syslog timestamp.
+
+    Args:
+      seconds (int): number of seconds since January 1, 00:00:00.
+
+    Returns:
+      str: syslog timestamp, such as "Jan  1 00:00:00".
+    """
+    days, seconds = divmod(seconds, 24 * 60 * 60)
+    hours, seconds = divmod(seconds, 60 * 60)
+    minutes, seconds = divmod(seconds, 60)
+
+    month = 0
+    while days >= self._DAYS_PER_MONTH[month]:
+      days -= self._DAYS_PER_MONTH[month]
+      month += 1
+
+    return '{0:s} {1:2d} {2:02d}:{3:02d}:{4:02d}'.format(
+        self._MONTHS[month], days + 1, hours, minutes, seconds)
+
+  def _ReadTemplates(self):
+    """Reads the reporter and message templates from the template file.
+
+    Returns:
+      list[tuple[str, str]]: reporter and message templates.
+    """
+    templates = []
+    with io.open(self._template_path, 'r', encoding='utf-8') as file_object:
+      for line in file_object:
+        match = self._LINE_RE.match(line.rstrip())
+        if match:
+          templates.append(match.groups())
+
+    return templates
+
+  def Generate(self, path, number_of_records=None):
+    """Generates an artifact file.
+
+    Args:
+      path (str): path of the artifact file.
+      number_of_records (Optional[int]): number of lines to generate.
+
+    Returns:
+      int: number of generated lines.
+    """
+    number_of_records = number_of_records or 1
+
+    with io.open(path, 'w', encoding='utf-8') as file_object:
+      lines = []
+      for line_index in range(number_of_records):
+        # Keep the timestamps increasing, multiple lines can have the same
+        # timestamp if there are more lines than seconds in a year.
+        seconds = (line_index * self._SECONDS_PER_YEAR) // number_of_records
+        reporter, message = self._random.choice(self._templates)
+
+        lines.append('{0:s} synthetic.example.com {1:s}[{2:d}]: {3:s}\n'.format(
+            self._FormatTimestamp(seconds), reporter,
+            self._random.randint(1, 65535), message))
+
+        if len(lines) >= self._BATCH_SIZE:
+          file_object.write(''.join(lines))
+          lines = []
+
+      if lines:
+        file_object.write(''.join(lines))
+
+    return number_of_records
+
+
+class TemplateCopyGenerator(ArtifactGenerator):
+  """Generator of artifacts that are copies of the template file.
+
+  This is used for binary formats, such as EVTX and Windows Registry files,
+  for which generating records is impractical.
+  """
+
+  def Generate(self, path, number_of_records=None):
+    """Generates an artifact file.
+
+    Args:
+      path (str): path of the artifact file.
+      number_of_records (Optional[int]): not supported, must be None.
+
+    Returns:
+      int: number of generated records or None if not known.
+    """
+    shutil.copyfile(self._template_path, path)
+    return None
+
+
+class EVTXGenerator(TemplateCopyGenerator):
+  """Windows XML Event Log (EVTX) file generator."""
+
+  FILENAME = 'System.evtx'
+
+  NAME = 'evtx'
+
+  TEMPLATE_FILE = 'System.evtx'
+
+
+class RegistryGenerator(TemplateCopyGenerator):
+  """Windows Registry file generator."""
+
+  FILENAME = 'NTUSER.DAT'
+
+  NAME = 'registry'
+
+  TEMPLATE_FILE = 'NTUSER.DAT'
+
+
+class SyntheticCorpusGenerator(object):
+  """Generates a synthetic corpus.
+
+  The artifact files are stored in a directory tree per artifact type, where
+  every file has its own directory, so that the file entries in the corpus
+  have distinct paths, and the number of directories per parent directory is
+  limited.
+  """
+
+  _GENERATOR_CLASSES = {
+      generator_class.NAME: generator_class for generator_class in (
+          ChromeHistoryGenerator, EVTXGenerator, RegistryGenerator,
+          SyslogGenerator)}
+
+  # Maximum number of entries per directory.
+  _MAXIMUM_DIRECTORY_ENTRIES = 256
+
+  def __init__(self, test_data_path, seed=0):
+    """Initializes a synthetic corpus generator.
+
+    Args:
+      test_data_path (str): path of the test data directory.
+      seed (Optional[int]): seed of the pseudo random number generator, where
+          the same seed generates the same corpus.
+    """
+    super(SyntheticCorpusGenerator, self).__init__()
+    self._seed = seed
+    self._test_data_path = test_data_path
+
+  def _GetDirectoryPath(self, corpus_path, artifact_name, file_index):
+    """Retrieves the path of the directory of an artifact file.
+
+    Args:
+      corpus_path (str): path of the directory to generate the corpus in.
+      artifact_name (str): name of the artifact generator.
+      file_index (int): index of the artifact file.
+
+    Returns:
+      str: path of the directory of the artifact file.
+    """
+    path_segments = []
+    while True:
+      file_index, remainder = divmod(
+          file_index, self._MAXIMUM_DIRECTORY_ENTRIES)
+      path_segments.insert(0, '{0:03d}'.format(remainder))
+      if not file_index:
+        break
+
+    return os.path.join(corpus_path, artifact_name, *path_segments)
+
+  @classmethod
+  def GetArtifactNames(cls):
+    """Retrieves the names of the supported artifact generators.
+
+    Returns:
+      list[str]: names of the artifact generators.
+    """
+    return sorted(cls._GENERATOR_CLASSES.keys())
+
+  @classmethod
+  def ParseArtifactDefinitions(cls, definitions_string):
+    """Parses artifact definitions.
+
+    Artifact definitions are comma separated and formatted as:
+    "NAME:FILES[xRECORDS]", for example "syslog:10x100000" defines 10 syslog
+    files with 100000 lines each.
+
+    Args:
+      definitions_string (str): artifact definitions.
+
+    Returns:
+      list[ArtifactDefinition]: artifact definitions.
+
+    Raises:
+      ValueError: if an artifact definition is not supported.
+    """
+    artifact_definitions = []
+    for definition_string in definitions_string.split(','):
+      definition_string = definition_string.strip()
+      if not definition_string:
+        continue
+
+      name, _, counts = definition_string.partition(':')
+      name = name.strip()
+      if name not in cls._GENERATOR_CLASSES:
+        raise ValueError('Unsupported artifact: {0:s}'.format(name))
+
+      number_of_files, _, number_of_records = counts.partition('x')
+      try:
+        number_of_files = int(number_of_files or '1', 10)
+        if number_of_records:
+          number_of_records = int(number_of_records, 10)
+        else:
+          number_of_records = None
+      except ValueError:
+        raise ValueError('Unsupported artifact definition: {0:s}'.format(
+            definition_string))
+
+      generator_class = cls._GENERATOR_CLASSES[name]
+      if (number_of_records is not None and
+          issubclass(generator_class, TemplateCopyGenerator)):
+        raise ValueError(
+            'Number of records not supported by artifact: {0:s}'.format(name))
+
+      artifact_definitions.append(ArtifactDefinition(
+          name, number_of_files, number_of_records=number_of_records))
+
+    return artifact_definitions
+
+  def Generate(self, artifact_definitions, corpus_path, scale=1):
+    """Generates a corpus.
+
+    Args:
+      artifact_definitions (list[ArtifactDefinition]): artifact definitions.
+      corpus_path (str): path of the directory to generate the corpus in.
+      scale (Optional[int]): multiplier of the number of files per artifact.
+
+    Returns:
+      dict[str, dict[str, int]]: number of files, records and size in bytes
+          of the generated files, per artifact name. The number of records is
+          None if not known.
+    """
+    random_generator = random.Random(self._seed)
+
+    corpus_statistics = {}
+    for artifact_definition in artifact_definitions:
+      generator_class = self._GENERATOR_CLASSES[artifact_definition.name]
+      generator = generator_class(self._test_data_path, random_generator)
+
+      statistics = corpus_statistics.setdefault(artifact_definition.name, {
+          'number_of_files': 0,
+          'number_of_records': 0,
+          'size': 0})
+
+      first_file_index = statistics['number_of_files']
+      number_of_files = artifact_definition.number_of_files * scale
+      for file_index in range(
+          first_file_index, first_file_index + number_of_files):
+        directory_path = self._GetDirectoryPath(
+            corpus_path, artifact_definition.name, file_index)
+        os.makedirs(directory_path)
+
+        path = os.path.join(directory_path, generator.FILENAME)
+        number_of_records = generator.Generate(
+            path, number_of_records=artifact_definition.number_of_records)
+
+        statistics['number_of_files'] += 1
+        statistics['size'] += os.path.getsize(path)
+
+        if number_of_records is None:
+          statistics['number_of_records'] = None
+        elif statistics['number_of_records'] is not None:
+          statistics['number_of_records'] += number_of_records
+
+    return corpus_statistics
+
+
+def Main():
+  """The main function."""
+  argument_parser = argparse.ArgumentParser(
+      description=(
+          'Generates a directory tree with synthetic artifacts, based on the '
+          'plaso test data, for scalability testing.'),
+      add_help=False, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+  argument_parser.add_argument(
+      '--artifacts', dest='artifacts', action='store', metavar='DEFINITIONS',
+      default='syslog:4x100000,chrome_history:4x100000,evtx:4,registry:4',
+      help=(
+          'comma separated artifact definitions formatted as: '
+          '"NAME:FILES[xRECORDS]", where RECORDS is the number of records per '
+          'file. Supported artifacts: {0:s}.').format(', '.join(
+              SyntheticCorpusGenerator.GetArtifactNames())))
+
+  argument_parser.add_argument(
+      '-h', '--help', action='help',
+      help='show this help message and exit.')
+
+  argument_parser.add_argument(
+      '--scale', dest='scale', action='store', metavar='SCALE', type=int,
+      default=1, help='multiplier of the number of files per artifact.')
+
+  argument_parser.add_argument(
+      '--seed', dest='seed', action='store', metavar='SEED', type=int,
+      default=0, help=(
+          'seed of the pseudo random number generator, where the same seed '
+          'generates the same corpus.'))
+
+  argument_parser.add_argument(
+      '--test-data-directory', '--test_data_directory', action='store',
+      metavar='DIRECTORY', dest='test_data_directory', type=str,
+      default=None, help=(
+          'The location of the directory with the template files, the default '
+          'is the plaso test data directory.'))
+
+  argument_parser.add_argument(
+      'output_directory', action='store', metavar='DIRECTORY', type=str,
+      help='The location of the directory to generate the corpus in.')
+
+  options = argument_parser.parse_args()
+
+  test_data_path = options.test_data_directory or os.path.join(
+      os.path.dirname(os.path.dirname(__file__)), 'test_data')
+  if not os.path.isdir(test_data_path):
+    print('No such test data directory: {0:s}.'.format(test_data_path))
+    print('')
+    return False
+
+  if os.path.exists(options.output_directory):
+    print('Output directory: {0:s} already exists.'.format(
+        options.output_directory))
+    print('')
+    return False
+
+  try:
+    artifact_definitions = SyntheticCorpusGenerator.ParseArtifactDefinitions(
+        options.artifacts)
+  except ValueError as exception:
+    print('Unable to parse artifacts with error: {0!s}.'.format(exception))
+    print('')
+    return False
+
+  corpus_generator = SyntheticCorpusGenerator(test_data_path, seed=options.seed)
+
+  try:
+    corpus_statistics = corpus_generator.Generate(
+        artifact_definitions, options.output_directory, scale=options.scale)
+  except IOError as exception:
+    print('Unable to generate corpus with error: {0!s}.'.format(exception))
+    print('')
+    return False
+
+  for name, statistics in sorted(corpus_statistics.items()):
+    number_of_records = statistics['number_of_records']
+    if number_of_records is None:
+      number_of_records = 'N/A'
+    else:
+      number_of_records = '{0:d}'.format(number_of_records)
+
+    print('{0:s}: {1:d} files, {2:s} records, {3:d} bytes'.format(
+        name, statistics['number_of_files'], number_of_records,
+        statistics['size']))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=invalid-name
+"""Text parser benchmark.
+
+Measures the number of lines per second of the single line text parsers that
+define line structure regular expressions, both using the regular expressions
+as a fast path and using only the pyparsing line structures. The lines are
+taken from the parser test data and repeated to the requested number of lines.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.containers import sessions
+from plaso.engine import knowledge_base
+from plaso.parsers import apache_access
+from plaso.parsers import mediator
+from plaso.parsers import selinux
+from plaso.parsers import skydrivelog
+from plaso.parsers import vsftpd
+from plaso.parsers import xchatlog
+from plaso.storage.fake import writer as fake_writer
+
+
+# Since os.path.abspath() uses the current working directory (cwd)
+# os.path.abspath(__file__) will point to a different location if
+# cwd has been changed. Hence we preserve the absolute location of __file__.
+__file__ = os.path.abspath(__file__)
+
+
+class TextParserBenchmark(object):
+  """Text parser benchmark."""
+
+  # The parsers to benchmark and the names of their test data files.
+  _PARSERS = {
+      'apache_access': (apache_access.ApacheAccessParser, 'access.log'),
+      'selinux': (selinux.SELinuxParser, 'selinux.log'),
+      'skydrive_log_old': (
+          skydrivelog.SkyDriveOldLogParser, 'skydrive_old.log'),
+      'vsftpd': (vsftpd.VsftpdLogParser, 'vsftpd.log'),
+      'xchatlog': (xchatlog.XChatLogParser, 'xchat.log')}
+
+  def __init__(self, test_data_path):
+    """Initializes a text parser benchmark.
+
+    Args:
+      test_data_path (str): path of the test data directory.
+    """
+    super(TextParserBenchmark, self).__init__()
+    self._test_data_path = test_data_path
+
+  def _ParseFile(self, parser, path):
+    """Parses a file with a parser.
+
+    Args:
+      parser (PyparsingSingleLineTextParser): parser.
+      path (str): path of the file.
+
+    Returns:
+      tuple[float, int]: duration in seconds and number of events.
+    """
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    parser_mediator = mediator.ParserMediator(
+        storage_writer, knowledge_base_object)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    parser_mediator.SetFileEntry(file_entry)
+
+    file_object = file_entry.GetFileObject()
+    try:
+      start_time = time.time()
+      parser.Parse(parser_mediator, file_object)
+      duration = time.time() - start_time
+
+    finally:
+      file_object.close()
+
+    number_of_events = storage_writer.number_of_events
+    storage_writer.Close()
+
+    return duration, number_of_events
+
+  def _WriteFile(self, template_path, path, number_of_lines):
+    """Writes a file with the lines of a template file.
+
+    Args:
+      template_path (str): path of the template file.
+      path (str): path of the file to write.
+      number_of_lines (int): number of lines to write.
+
+    Returns:
+      int: number of lines written.
+    """
+    with io.open(template_path, 'r', encoding='utf-8') as file_object:
+      lines = [line for line in file_object if line.strip()]
+
+    if not lines[-1].endswith('\n'):
+      lines[-1] = '{0:s}\n'.format(lines[-1])
+
+    with io.open(path, 'w', encoding='utf-8') as file_object:
+      for index in range(0, number_of_lines):
+        file_object.write(lines[index % len(lines)])
+
+    return number_of_lines
+
+  def GetParserNames(self):
+    """Retrieves the names of the parsers that can be benchmarked.
+
+    Returns:
+      list[str]: names of the parsers.
+    """
+    return sorted(self._PARSERS.keys())
+
+  def Run(self, parser_name, number_of_lines, temporary_directory):
+    """Benchmarks a parser.
+
+    Args:
+      parser_name (str): name of the parser.
+      number_of_lines (int): number of lines to parse.
+      temporary_directory (str): path of the directory to write the file to
+          parse in.
+
+    Returns:
+      dict[str, object]: benchmark results, which contains the number of lines,
+          the number of events and the number of lines per second with and
+          without the regular expressions.
+    """
+    parser_class, template_name = self._PARSERS[parser_name]
+
+    template_path = os.path.join(self._test_data_path, template_name)
+    path = os.path.join(temporary_directory, template_name)
+    number_of_lines = self._WriteFile(template_path, path, number_of_lines)
+
+    results = {'number_of_lines': number_of_lines}
+    for use_regular_expressions in (True, False):
+      parser = parser_class()
+      if not use_regular_expressions:
+        # pylint: disable=protected-access
+        parser._line_structure_regular_expression = None
+
+      duration, number_of_events = self._ParseFile(parser, path)
+
+      if use_regular_expressions:
+        results_key = 'regular_expressions'
+      else:
+        results_key = 'pyparsing'
+
+      results['number_of_events_{0:s}'.format(results_key)] = number_of_events
+      results['lines_per_second_{0:s}'.format(results_key)] = (
+          number_of_lines / max(duration, 0.000001))
+
+    return results
+
+
+def Main():
+  """The main function."""
+  argument_parser = argparse.ArgumentParser(
+      description=(
+          'Measures the number of lines per second of text parsers with and '
+          'without line structure regular expressions.'),
+      add_help=False, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+  argument_parser.add_argument(
+      '-h', '--help', action='help',
+      help='show this help message and exit.')
+
+  argument_parser.add_argument(
+      '--lines', dest='lines', action='store', metavar='LINES', type=int,
+      default=10000, help='number of lines to parse per parser.')
+
+  argument_parser.add_argument(
+      '--parsers', dest='parsers', action='store', metavar='NAMES',
+      default='', help=(
+          'comma separated names of the parsers to benchmark, where all '
+          'parsers are benchmarked by default.'))
+
+  argument_parser.add_argument(
+      '--test-data-directory', '--test_data_directory', action='store',
+      metavar='DIRECTORY', dest='test_data_directory', type=str,
+      default=None, help=(
+          'The location of the directory with the template files, the default '
+          'is the plaso test data directory.'))
+
+  options = argument_parser.parse_args()
+
+  test_data_path = options.test_data_directory or os.path.join(
+      os.path.dirname(os.path.dirname(__file__)), 'test_data')
+  if not os.path.isdir(test_data_path):
+    print('No such test data directory: {0:s}.'.format(test_data_path))
+    print('')
+    return False
+
+  if options.lines < 1:
+    print('Unsupported number of lines: {0:d}.'.format(options.lines))
+    print('')
+    return False
+
+  benchmark = TextParserBenchmark(test_data_path)
+
+  parser_names = benchmark.GetParserNames()
+  if options.parsers:
+    parser_names = [name.strip() for name in options.parsers.split(',')]
+    for parser_name in parser_names:
+      if parser_name not in benchmark.GetParserNames():
+        print('Unsupported parser: {0:s}.'.format(parser_name))
+        print('')
+        return False
+
+  print('{0:<20s}{1:>10s}{2:>20s}{3:>20s}{4:>10s}'.format(
+      'Parser', 'Lines', 'Lines/s (regex)', 'Lines/s (pyparsing)', 'Speedup'))
+
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    for parser_name in parser_names:
+      results = benchmark.Run(parser_name, options.lines, temporary_directory)
+
+      if (results['number_of_events_regular_expressions'] !=
+          results['number_of_events_pyparsing']):
+        print((
+            'Number of events of parser: {0:s} differ with and without '
+            'regular expressions.').format(parser_name))
+
+      lines_per_second_regular_expressions = results[
+          'lines_per_second_regular_expressions']
+      lines_per_second_pyparsing = results['lines_per_second_pyparsing']
+
+      print('{0:<20s}{1:>10d}{2:>20.0f}{3:>20.0f}{4:>9.1f}x'.format(
+          parser_name, results['number_of_lines'],
+          lines_per_second_regular_expressions, lines_per_second_pyparsing,
+          lines_per_second_regular_expressions / lines_per_second_pyparsing))
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -105,6 +105,8 @@ ADDITIONAL_MODULES = set([
     'flask',
     'lz4.block',
     'MySQLdb',
+    'numpy',
+    'pyarrow.parquet',
     'pyelasticsearch',
     'timesketch',
     'timesketch.lib',
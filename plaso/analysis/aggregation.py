@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Aggregation of analysis results with bounded memory usage."""
+
+from __future__ import unicode_literals
+
+import collections
+import heapq
+import itertools
+import json
+import os
+import tempfile
+
+
+class DiskBackedCounter(object):
+  """Counter of strings that spills to disk to bound memory usage.
+
+  The counts are kept in memory until the number of distinct keys in memory
+  reaches the maximum. The counts are then written, sorted by key, to
+  a temporary run file and counting continues in memory. The sorted run files
+  and the counts in memory are merged when the items are retrieved, which
+  allows counting more distinct keys than fit in memory.
+
+  Attributes:
+    number_of_runs (int): number of run files written to disk.
+  """
+
+  def __init__(
+      self, maximum_number_of_keys_in_memory=None, temporary_directory=None):
+    """Initializes a disk backed counter.
+
+    Args:
+      maximum_number_of_keys_in_memory (Optional[int]): maximum number of
+          distinct keys to count in memory, before the counts are written to
+          a temporary file, where None represents no maximum.
+      temporary_directory (Optional[str]): path of the directory for the
+          temporary files, where None represents the default temporary
+          directory.
+    """
+    super(DiskBackedCounter, self).__init__()
+    self._counter = collections.Counter()
+    self._maximum_number_of_keys_in_memory = maximum_number_of_keys_in_memory
+    self._run_files = []
+    self._temporary_directory = temporary_directory
+
+    self.number_of_runs = 0
+
+  def _ReadRunFile(self, file_object):
+    """Reads counts from a sorted run file.
+
+    Args:
+      file_object (file): file-like object of the run file.
+
+    Yields:
+      tuple[str, int]: key and count.
+    """
+    file_object.seek(0, os.SEEK_SET)
+
+    for line in file_object:
+      key, count = json.loads(line.decode('utf-8'))
+      yield key, count
+
+  def _WriteRunFile(self):
+    """Writes the counts in memory, sorted by key, to a temporary run file."""
+    file_object = tempfile.TemporaryFile(dir=self._temporary_directory)
+
+    for key, count in sorted(self._counter.items()):
+      line = '{0:s}\n'.format(json.dumps([key, count]))
+      file_object.write(line.encode('utf-8'))
+
+    self._run_files.append(file_object)
+    self._counter = collections.Counter()
+
+    self.number_of_runs += 1
+
+  def Close(self):
+    """Closes the counter and removes the temporary run files."""
+    for file_object in self._run_files:
+      file_object.close()
+
+    self._counter = collections.Counter()
+    self._run_files = []
+
+  def GetItems(self):
+    """Retrieves the keys and their counts.
+
+    Yields:
+      tuple[str, int]: key and count, sorted by key.
+    """
+    sorted_items = [
+        self._ReadRunFile(file_object) for file_object in self._run_files]
+    sorted_items.append(iter(sorted(self._counter.items())))
+
+    for key, items in itertools.groupby(
+        heapq.merge(*sorted_items), key=lambda item: item[0]):
+      yield key, sum(count for _, count in items)
+
+  def Increment(self, key, count=1):
+    """Increments the count of a key.
+
+    Args:
+      key (str): key.
+      count (Optional[int]): number to add to the count of the key.
+    """
+    self._counter[key] += count
+
+    if (self._maximum_number_of_keys_in_memory and
+        len(self._counter) >= self._maximum_number_of_keys_in_memory):
+      self._WriteRunFile()
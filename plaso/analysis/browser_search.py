@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import collections
+import heapq
 import re
 import sys
 
@@ -13,6 +14,7 @@ else:
   from urllib import parse as urlparse # pylint: disable=no-name-in-module
 
 # pylint: disable=wrong-import-position
+from plaso.analysis import aggregation
 from plaso.analysis import interface
 from plaso.analysis import logger
 from plaso.analysis import manager
@@ -35,6 +37,8 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
   # Indicate that we do not want to run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = False
 
+  ENABLE_INLINE_ANALYSIS = True
+
   _EVENT_TAG_COMMENT = 'Browser Search'
   _EVENT_TAG_LABELS = ['browser_search']
 
@@ -69,36 +73,51 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
       'safari:history:visit',
       'safari:history:visit_sqlite'])
 
-  # TODO: use groups to build a single RE.
-
   # Here we define filters and callback methods for all hits on each filter.
-  _URL_FILTERS = frozenset([
-      ('Bing', re.compile(r'bing\.com/search'), '_ExtractSearchQueryFromURL'),
-      ('DuckDuckGo', re.compile(r'duckduckgo\.com'),
-       '_ExtractDuckDuckGoSearchQuery'),
-      ('GMail', re.compile(r'mail\.google\.com'),
-       '_ExtractGMailSearchQuery'),
-      ('Google Docs', re.compile(r'docs\.google\.com'),
-       '_ExtractGoogleDocsSearchQuery'),
-      ('Google Drive', re.compile(r'drive\.google\.com/drive/search'),
-       '_ExtractGoogleSearchQuery'),
-      ('Google Search',
-       re.compile(r'(www\.|encrypted\.|/)google\.[^/]*/search'),
-       '_ExtractGoogleSearchQuery'),
-      ('Google Sites', re.compile(r'sites\.google\.com/site'),
-       '_ExtractGoogleSearchQuery'),
-      ('Yahoo', re.compile(r'yahoo\.com/search'),
-       '_ExtractYahooSearchQuery'),
-      ('Yandex', re.compile(r'yandex\.com/search'),
-       '_ExtractYandexSearchQuery'),
-      ('Youtube', re.compile(r'youtube\.com'),
-       '_ExtractYouTubeSearchQuery'),
-  ])
+  # The filters are grouped by a keyword of the host, that every URL matched
+  # by the filter contains, such that a single regular expression determines
+  # the filters that apply to an URL.
+  _URL_FILTERS = {
+      'bing.com': [
+          ('Bing', re.compile(r'bing\.com/search'),
+           '_ExtractSearchQueryFromURL')],
+      'duckduckgo.com': [
+          ('DuckDuckGo', re.compile(r'duckduckgo\.com'),
+           '_ExtractDuckDuckGoSearchQuery')],
+      'google.': [
+          ('GMail', re.compile(r'mail\.google\.com'),
+           '_ExtractGMailSearchQuery'),
+          ('Google Docs', re.compile(r'docs\.google\.com'),
+           '_ExtractGoogleDocsSearchQuery'),
+          ('Google Drive', re.compile(r'drive\.google\.com/drive/search'),
+           '_ExtractGoogleSearchQuery'),
+          ('Google Search',
+           re.compile(r'(www\.|encrypted\.|/)google\.[^/]*/search'),
+           '_ExtractGoogleSearchQuery'),
+          ('Google Sites', re.compile(r'sites\.google\.com/site'),
+           '_ExtractGoogleSearchQuery')],
+      'yahoo.com': [
+          ('Yahoo', re.compile(r'yahoo\.com/search'),
+           '_ExtractYahooSearchQuery')],
+      'yandex.com': [
+          ('Yandex', re.compile(r'yandex\.com/search'),
+           '_ExtractYandexSearchQuery')],
+      'youtube.com': [
+          ('Youtube', re.compile(r'youtube\.com'),
+           '_ExtractYouTubeSearchQuery')],
+  }
+
+  # The keywords do not overlap, hence finding all non-overlapping matches
+  # finds every keyword the URL contains.
+  _URL_FILTERS_KEYWORDS_RE = re.compile('|'.join([
+      re.escape(keyword) for keyword in sorted(_URL_FILTERS.keys())]))
 
   def __init__(self):
     """Initializes an analysis plugin."""
     super(BrowserSearchPlugin, self).__init__()
-    self._counter = collections.Counter()
+    self._counter = aggregation.DiskBackedCounter()
+    self._maximum_number_of_search_terms_per_engine = None
+    self._store_search_term_timeline = True
 
     # Store a list of search terms in a timeline format.
     # The format is key = timestamp, value = (source, engine, search term).
@@ -313,19 +332,47 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
     Returns:
       AnalysisReport: analysis report.
     """
-    results = {}
-    for key, count in iter(self._counter.items()):
+    # The counts are streamed from the counter. When a maximum is set only
+    # the most frequent search terms per engine are kept, in a heap of
+    # (count, search term) tuples, so that the report does not need to hold
+    # every distinct search term in memory.
+    maximum_number_of_search_terms = (
+        self._maximum_number_of_search_terms_per_engine)
+
+    search_terms_per_engine = {}
+    number_of_omitted_search_terms = collections.Counter()
+    for key, count in self._counter.GetItems():
       search_engine, _, search_term = key.partition(':')
-      results.setdefault(search_engine, {})
-      results[search_engine][search_term] = count
+      search_terms = search_terms_per_engine.setdefault(search_engine, [])
+
+      if not maximum_number_of_search_terms:
+        search_terms.append((count, search_term))
 
+      elif len(search_terms) < maximum_number_of_search_terms:
+        heapq.heappush(search_terms, (count, search_term))
+
+      else:
+        heapq.heappushpop(search_terms, (count, search_term))
+        number_of_omitted_search_terms[search_engine] += 1
+
+    self._counter.Close()
+
+    results = {}
     lines_of_text = []
-    for search_engine, terms in sorted(results.items()):
+    for search_engine, search_terms in sorted(
+        search_terms_per_engine.items()):
       lines_of_text.append(' == ENGINE: {0:s} =='.format(search_engine))
 
-      for search_term, count in sorted(
-          terms.items(), key=lambda x: (x[1], x[0]), reverse=True):
+      results[search_engine] = {}
+      for count, search_term in sorted(search_terms, reverse=True):
         lines_of_text.append('{0:d} {1:s}'.format(count, search_term))
+        results[search_engine][search_term] = count
+
+      number_of_omitted = number_of_omitted_search_terms[search_engine]
+      if number_of_omitted:
+        lines_of_text.append(
+            '{0:d} less frequent search terms omitted'.format(
+                number_of_omitted))
 
       # An empty string is added to have SetText create an empty line.
       lines_of_text.append('')
@@ -354,12 +401,20 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
     if not url:
       return
 
+    keywords = set(self._URL_FILTERS_KEYWORDS_RE.findall(url))
+    if not keywords:
+      return
+
+    url_filters = []
+    for keyword in sorted(keywords):
+      url_filters.extend(self._URL_FILTERS[keyword])
+
     parser_or_plugin_name = getattr(event_data, 'parser', 'N/A')
 
-    for engine, url_expression, method_name in self._URL_FILTERS:
+    for engine, url_expression, method_name in url_filters:
       callback_method = getattr(self, method_name, None)
       if not callback_method:
-        logger.warning('Missing method: {0:s}'.format(callback_method))
+        logger.warning('Missing method: {0:s}'.format(method_name))
         continue
 
       match = url_expression.search(url)
@@ -379,12 +434,40 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
           event, self._EVENT_TAG_COMMENT, self._EVENT_TAG_LABELS)
       mediator.ProduceEventTag(event_tag)
 
-      self._counter['{0:s}:{1:s}'.format(engine, search_query)] += 1
+      self._counter.Increment('{0:s}:{1:s}'.format(engine, search_query))
 
       # Add the timeline format for each search term.
-      search_object = SEARCH_OBJECT(
-          event.timestamp, parser_or_plugin_name, engine, search_query)
-      self._search_term_timeline.append(search_object)
+      if self._store_search_term_timeline:
+        search_object = SEARCH_OBJECT(
+            event.timestamp, parser_or_plugin_name, engine, search_query)
+        self._search_term_timeline.append(search_object)
+
+  def SetMaximumNumberOfSearchTermsInMemory(
+      self, maximum_number_of_search_terms, temporary_directory=None):
+    """Sets the maximum number of search terms to keep in memory.
+
+    When the maximum is reached the search terms counts are written to
+    a temporary file, which bounds the memory usage when analyzing large
+    numbers of URLs. Since the search term timeline grows with the number of
+    searches, it is not stored when a maximum is set and the report will not
+    contain it. The report is limited to the most frequent search terms
+    of every search engine, up to the maximum.
+
+    Args:
+      maximum_number_of_search_terms (int): maximum number of search terms to
+          keep in memory, where None represents no maximum.
+      temporary_directory (Optional[str]): path of the directory for the
+          temporary files, where None represents the default temporary
+          directory.
+    """
+    self._counter.Close()
+    self._counter = aggregation.DiskBackedCounter(
+        maximum_number_of_keys_in_memory=maximum_number_of_search_terms,
+        temporary_directory=temporary_directory)
+
+    self._maximum_number_of_search_terms_per_engine = (
+        maximum_number_of_search_terms)
+    self._store_search_term_timeline = not maximum_number_of_search_terms
 
 
 manager.AnalysisPluginManager.RegisterPlugin(BrowserSearchPlugin)
@@ -16,6 +16,8 @@ class FileHashesPlugin(interface.AnalysisPlugin):
   # Indicate that we can run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = True
 
+  ENABLE_INLINE_ANALYSIS = True
+
   def __init__(self):
     """Initializes the unique hashes plugin."""
     super(FileHashesPlugin, self).__init__()
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""SQLite-based persistent cache of hash analysis results.
+
+The cache stores the results of hash lookups, such as those of nsrlsvr or
+VirusTotal, so that they can be reused across psort runs and cases instead
+of looking up the same hashes again.
+"""
+
+from __future__ import unicode_literals
+
+import json
+import sqlite3
+import time
+
+from plaso.analysis import interface
+from plaso.analysis import logger
+
+
+class HashLookupCache(object):
+  """SQLite-based persistent cache of hash analysis results.
+
+  The hash analysis results are stored per namespace, such as the name of
+  the analysis plugin, and type of hash. Results older than the maximum age
+  are considered expired and are not returned.
+
+  Attributes:
+    maximum_age (int): maximum age of a cached hash analysis result in
+        seconds, where None represents no maximum.
+    path (str): path of the cache database file.
+  """
+
+  _CREATE_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS hash_analysis ('
+      'namespace TEXT, lookup_hash TEXT, subject_hash TEXT, '
+      'hash_information TEXT, timestamp INTEGER, '
+      'PRIMARY KEY (namespace, lookup_hash, subject_hash))')
+
+  _DELETE_EXPIRED_QUERY = 'DELETE FROM hash_analysis WHERE timestamp < ?'
+
+  _INSERT_QUERY = (
+      'INSERT OR REPLACE INTO hash_analysis (namespace, lookup_hash, '
+      'subject_hash, hash_information, timestamp) VALUES (?, ?, ?, ?, ?)')
+
+  _SELECT_QUERY = (
+      'SELECT hash_information, timestamp FROM hash_analysis '
+      'WHERE namespace = ? AND lookup_hash = ? AND subject_hash = ?')
+
+  # Number of seconds to wait for a lock held by another process, for example
+  # an analysis process of another hash analysis plugin using the same cache.
+  _LOCK_TIMEOUT = 60.0
+
+  def __init__(self, path, maximum_age=None):
+    """Initializes a hash lookup cache.
+
+    The cache database file is not opened until Open is called, such that
+    the cache can be passed to an analysis process before it is opened.
+
+    Args:
+      path (str): path of the cache database file.
+      maximum_age (Optional[int]): maximum age of a cached hash analysis
+          result in seconds, where None represents no maximum.
+    """
+    super(HashLookupCache, self).__init__()
+    self._connection = None
+    self._cursor = None
+
+    self.maximum_age = maximum_age
+    self.path = path
+
+  def _GetExpiryTimestamp(self):
+    """Retrieves the timestamp before which cached results are expired.
+
+    Returns:
+      int: timestamp, in number of seconds since January 1, 1970 00:00:00,
+          or None if cached results do not expire.
+    """
+    if self.maximum_age is None:
+      return None
+
+    return int(time.time()) - self.maximum_age
+
+  def Close(self):
+    """Closes the cache.
+
+    Raises:
+      IOError: if the cache is not opened.
+      OSError: if the cache is not opened.
+    """
+    if not self._connection:
+      raise IOError('Hash lookup cache not opened.')
+
+    self._connection.close()
+
+    self._connection = None
+    self._cursor = None
+
+  def GetHashAnalysis(self, namespace, lookup_hash, subject_hash):
+    """Retrieves a cached hash analysis result.
+
+    Args:
+      namespace (str): namespace of the hash analysis result, such as the
+          name of the analysis plugin.
+      lookup_hash (str): name of the hash, such as "md5".
+      subject_hash (str): hash that was analyzed.
+
+    Returns:
+      HashAnalysis: hash analysis result or None if the hash is not in
+          the cache or the cached result has expired.
+
+    Raises:
+      IOError: if the cache is not opened.
+      OSError: if the cache is not opened.
+    """
+    if not self._connection:
+      raise IOError('Hash lookup cache not opened.')
+
+    self._cursor.execute(
+        self._SELECT_QUERY, (namespace, lookup_hash, subject_hash.lower()))
+    row = self._cursor.fetchone()
+    if not row:
+      return None
+
+    hash_information_json, timestamp = row
+
+    expiry_timestamp = self._GetExpiryTimestamp()
+    if expiry_timestamp is not None and timestamp < expiry_timestamp:
+      return None
+
+    hash_information = json.loads(hash_information_json)
+    return interface.HashAnalysis(subject_hash, hash_information)
+
+  def Open(self):
+    """Opens the cache.
+
+    The cache database file is created if it does not exist and expired
+    cached results are removed.
+
+    The cache database file uses write-ahead logging, such that the analysis
+    processes of multiple hash analysis plugins can read from the cache while
+    another process writes to it.
+
+    Raises:
+      IOError: if the cache is already opened or cannot be opened.
+      OSError: if the cache is already opened or cannot be opened.
+    """
+    if self._connection:
+      raise IOError('Hash lookup cache already opened.')
+
+    try:
+      connection = sqlite3.connect(self.path, timeout=self._LOCK_TIMEOUT)
+      cursor = connection.cursor()
+      cursor.execute('PRAGMA journal_mode=WAL')
+      cursor.execute('PRAGMA synchronous=NORMAL')
+      cursor.execute(self._CREATE_TABLE_QUERY)
+
+      expiry_timestamp = self._GetExpiryTimestamp()
+      if expiry_timestamp is not None:
+        cursor.execute(self._DELETE_EXPIRED_QUERY, (expiry_timestamp, ))
+
+      connection.commit()
+
+    except sqlite3.Error as exception:
+      raise IOError(
+          'Unable to open hash lookup cache: {0:s} with error: {1!s}'.format(
+              self.path, exception))
+
+    self._connection = connection
+    self._cursor = cursor
+
+  def SetHashAnalysis(self, namespace, lookup_hash, hash_analysis):
+    """Caches a hash analysis result.
+
+    Hash analysis results with hash information that cannot be serialized as
+    JSON are not cached.
+
+    Every hash analysis result is committed when it is written, since
+    an uncommitted write keeps the cache database file locked for other
+    processes that use the same cache.
+
+    Args:
+      namespace (str): namespace of the hash analysis result, such as the
+          name of the analysis plugin.
+      lookup_hash (str): name of the hash, such as "md5".
+      hash_analysis (HashAnalysis): hash analysis result.
+
+    Raises:
+      IOError: if the cache is not opened.
+      OSError: if the cache is not opened.
+    """
+    if not self._connection:
+      raise IOError('Hash lookup cache not opened.')
+
+    try:
+      hash_information_json = json.dumps(hash_analysis.hash_information)
+    except (TypeError, ValueError) as exception:
+      logger.debug((
+          'Unable to cache hash analysis of: {0:s} with error: '
+          '{1!s}').format(hash_analysis.subject_hash, exception))
+      return
+
+    self._cursor.execute(self._INSERT_QUERY, (
+        namespace, lookup_hash, hash_analysis.subject_hash.lower(),
+        hash_information_json, int(time.time())))
+    self._connection.commit()
@@ -0,0 +1,678 @@
+# -*- coding: utf-8 -*-
+"""Analysis plugin to look up files in local hash set files and tag events.
+
+A hash set file contains the binary digests of a hash set, such as the NSRL
+RDS or an internal allow or deny list, sorted so they can be binary searched.
+The sorted digests are preceded by a Bloom filter so that most digests that
+are not in the hash set can be ruled out without searching. Hash set files
+are memory mapped, which allows to look up hashes in large hash sets without
+reading them into memory or running a service, such as nsrlsvr.
+
+Hash set files can be built from text hash lists with
+utils/build_hash_set.py.
+"""
+
+from __future__ import unicode_literals
+
+import binascii
+import heapq
+import math
+import mmap
+import os
+import struct
+import tempfile
+
+from plaso.analysis import interface
+from plaso.analysis import logger
+from plaso.analysis import manager
+from plaso.containers import events
+from plaso.lib import py2to3
+
+
+class HashSetFileFormat(object):
+  """Hash set file format.
+
+  The hash set file consists of:
+  * the file header;
+  * the fan-out table, which contains for every value of the first 2 bytes
+    of a digest, the number of digests with a first 2 bytes value that is
+    less or equal, which reduces the range of the binary search;
+  * the Bloom filter, with the number of bits rounded up to a multiple of 8;
+  * the sorted digests, without duplicates.
+  """
+
+  _FILE_SIGNATURE = b'PLSHSET\x00'
+
+  _FORMAT_VERSION = 1
+
+  # The file header contains: signature, format version, digest size,
+  # number of digests, number of Bloom filter bits, number of Bloom filter
+  # hash functions and label.
+  _FILE_HEADER = struct.Struct('<8sIIQQI32s4x')
+
+  _BLOOM_FILTER_HASH_VALUES = struct.Struct('<QQ')
+
+  _FAN_OUT_TABLE = struct.Struct('<65536I')
+
+  _FAN_OUT_VALUE = struct.Struct('>H')
+
+  _DIGEST_SIZES = {
+      'md5': 16,
+      'sha1': 20,
+      'sha256': 32}
+
+  _LOOKUP_HASHES = {
+      digest_size: lookup_hash
+      for lookup_hash, digest_size in _DIGEST_SIZES.items()}
+
+  _MAXIMUM_LABEL_SIZE = 32
+
+  def _GetBloomFilterBitIndexes(
+      self, digest, number_of_bits, number_of_hash_functions):
+    """Retrieves the indexes of the Bloom filter bits of a digest.
+
+    Since the digest is a cryptographic hash, its bytes are used as the hash
+    values of the Bloom filter, where the bit indexes are derived with double
+    hashing.
+
+    Args:
+      digest (bytes): binary digest.
+      number_of_bits (int): number of Bloom filter bits.
+      number_of_hash_functions (int): number of Bloom filter hash functions.
+
+    Returns:
+      list[int]: indexes of the Bloom filter bits.
+    """
+    first_hash_value, second_hash_value = (
+        self._BLOOM_FILTER_HASH_VALUES.unpack_from(digest))
+
+    # Make sure the bit indexes do not repeat when the number of bits is
+    # a power of 2.
+    second_hash_value |= 1
+
+    return [
+        (first_hash_value + index * second_hash_value) % number_of_bits
+        for index in range(number_of_hash_functions)]
+
+
+class HashSetFile(HashSetFileFormat):
+  """Hash set file.
+
+  Attributes:
+    label (str): label to apply to events of files in the hash set.
+    lookup_hash (str): name of the hash of the digests in the hash set.
+    number_of_digests (int): number of digests in the hash set.
+  """
+
+  def __init__(self):
+    """Initializes a hash set file."""
+    super(HashSetFile, self).__init__()
+    self._bloom_filter_offset = 0
+    self._digest_size = 0
+    self._digests_offset = 0
+    self._fan_out_table = None
+    self._file_object = None
+    self._mmap = None
+    self._number_of_bloom_filter_bits = 0
+    self._number_of_bloom_filter_hash_functions = 0
+
+    self.label = None
+    self.lookup_hash = None
+    self.number_of_digests = 0
+
+  def _ContainsDigestInBloomFilter(self, digest):
+    """Determines if a digest is in the Bloom filter.
+
+    Args:
+      digest (bytes): binary digest.
+
+    Returns:
+      bool: False if the digest is not in the hash set, True if the digest
+          could be in the hash set.
+    """
+    bit_indexes = self._GetBloomFilterBitIndexes(
+        digest, self._number_of_bloom_filter_bits,
+        self._number_of_bloom_filter_hash_functions)
+
+    for bit_index in bit_indexes:
+      byte_value = self._mmap[self._bloom_filter_offset + (bit_index >> 3)]
+      if py2to3.PY_2:
+        byte_value = ord(byte_value)
+
+      if not byte_value & (1 << (bit_index & 7)):
+        return False
+
+    return True
+
+  def _ContainsDigestInSortedDigests(self, digest):
+    """Determines if a digest is in the sorted digests with a binary search.
+
+    Args:
+      digest (bytes): binary digest.
+
+    Returns:
+      bool: True if the digest is in the hash set.
+    """
+    fan_out_value = self._FAN_OUT_VALUE.unpack_from(digest)[0]
+
+    if fan_out_value == 0:
+      lower_index = 0
+    else:
+      lower_index = self._fan_out_table[fan_out_value - 1]
+
+    upper_index = self._fan_out_table[fan_out_value]
+
+    while lower_index < upper_index:
+      middle_index = (lower_index + upper_index) // 2
+
+      offset = self._digests_offset + (middle_index * self._digest_size)
+      middle_digest = self._mmap[offset:offset + self._digest_size]
+
+      if middle_digest == digest:
+        return True
+
+      if middle_digest < digest:
+        lower_index = middle_index + 1
+      else:
+        upper_index = middle_index
+
+    return False
+
+  def Close(self):
+    """Closes the hash set file.
+
+    Raises:
+      IOError: if the hash set file is not opened.
+      OSError: if the hash set file is not opened.
+    """
+    if not self._file_object:
+      raise IOError('Hash set file not opened.')
+
+    self._mmap.close()
+    self._file_object.close()
+
+    self._fan_out_table = None
+    self._file_object = None
+    self._mmap = None
+
+  def ContainsDigest(self, digest):
+    """Determines if a digest is in the hash set.
+
+    Args:
+      digest (bytes): binary digest.
+
+    Returns:
+      bool: True if the digest is in the hash set.
+    """
+    if len(digest) != self._digest_size:
+      return False
+
+    if not self._ContainsDigestInBloomFilter(digest):
+      return False
+
+    return self._ContainsDigestInSortedDigests(digest)
+
+  def ContainsHash(self, hash_string):
+    """Determines if a hash is in the hash set.
+
+    Args:
+      hash_string (str): hexadecimal formatted hash.
+
+    Returns:
+      bool: True if the hash is in the hash set.
+    """
+    try:
+      digest = binascii.unhexlify(hash_string)
+    except (TypeError, ValueError):
+      return False
+
+    return self.ContainsDigest(digest)
+
+  def Open(self, path):
+    """Opens a hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+
+    Raises:
+      IOError: if the hash set file is already opened or is not supported.
+      OSError: if the hash set file is already opened or is not supported.
+      ValueError: if the hash set file cannot be mapped into memory, such as
+          an empty file, or its label cannot be decoded.
+    """
+    if self._file_object:
+      raise IOError('Hash set file already opened.')
+
+    file_object = open(path, 'rb')
+
+    try:
+      file_header_data = file_object.read(self._FILE_HEADER.size)
+      if len(file_header_data) != self._FILE_HEADER.size:
+        raise IOError('Unable to read hash set file header.')
+
+      (signature, format_version, digest_size, number_of_digests,
+       number_of_bloom_filter_bits, number_of_bloom_filter_hash_functions,
+       label) = self._FILE_HEADER.unpack(file_header_data)
+
+      if signature != self._FILE_SIGNATURE:
+        raise IOError('Unsupported hash set file signature.')
+
+      if format_version != self._FORMAT_VERSION:
+        raise IOError('Unsupported hash set file format version: {0:d}'.format(
+            format_version))
+
+      lookup_hash = self._LOOKUP_HASHES.get(digest_size, None)
+      if not lookup_hash:
+        raise IOError('Unsupported hash set digest size: {0:d}'.format(
+            digest_size))
+
+      if (not number_of_bloom_filter_bits or number_of_bloom_filter_bits % 8 or
+          not number_of_bloom_filter_hash_functions):
+        raise IOError('Unsupported hash set Bloom filter.')
+
+      fan_out_table_data = file_object.read(self._FAN_OUT_TABLE.size)
+      if len(fan_out_table_data) != self._FAN_OUT_TABLE.size:
+        raise IOError('Unable to read hash set fan-out table.')
+
+      fan_out_table = self._FAN_OUT_TABLE.unpack(fan_out_table_data)
+      if fan_out_table[-1] != number_of_digests:
+        raise IOError('Unsupported hash set fan-out table.')
+
+      bloom_filter_offset = self._FILE_HEADER.size + self._FAN_OUT_TABLE.size
+      digests_offset = bloom_filter_offset + (number_of_bloom_filter_bits // 8)
+
+      file_size = os.fstat(file_object.fileno()).st_size
+      expected_file_size = digests_offset + (number_of_digests * digest_size)
+      if file_size != expected_file_size:
+        raise IOError((
+            'Hash set file size: {0:d} does not match expected size: '
+            '{1:d}.').format(file_size, expected_file_size))
+
+      label = label.rstrip(b'\x00').decode('ascii')
+
+      file_mmap = mmap.mmap(
+          file_object.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (IOError, OSError, ValueError):
+      file_object.close()
+      raise
+
+    self._bloom_filter_offset = bloom_filter_offset
+    self._digest_size = digest_size
+    self._digests_offset = digests_offset
+    self._fan_out_table = fan_out_table
+    self._file_object = file_object
+    self._mmap = file_mmap
+    self._number_of_bloom_filter_bits = number_of_bloom_filter_bits
+    self._number_of_bloom_filter_hash_functions = (
+        number_of_bloom_filter_hash_functions)
+
+    self.label = label
+    self.lookup_hash = lookup_hash
+    self.number_of_digests = number_of_digests
+
+
+class HashSetFileWriter(HashSetFileFormat):
+  """Hash set file writer.
+
+  The digests are sorted in chunks, that are written to temporary files and
+  merged, which allows to build hash set files of hash sets that do not fit
+  in memory.
+  """
+
+  _DEFAULT_BITS_PER_DIGEST = 10
+
+  _DEFAULT_MAXIMUM_NUMBER_OF_DIGESTS_IN_MEMORY = 4 * 1024 * 1024
+
+  _READ_BUFFER_SIZE = 1024 * 1024
+
+  def __init__(
+      self, lookup_hash, label, bits_per_digest=None,
+      maximum_number_of_digests_in_memory=None, temporary_directory=None):
+    """Initializes a hash set file writer.
+
+    Args:
+      lookup_hash (str): name of the hash of the digests in the hash set,
+          such as "md5", "sha1" or "sha256".
+      label (str): label to apply to events of files in the hash set.
+      bits_per_digest (Optional[int]): number of Bloom filter bits per digest,
+          where more bits reduce the false positive rate of the Bloom filter.
+          The default of 10 bits per digest results in a false positive rate
+          of about 1 percent.
+      maximum_number_of_digests_in_memory (Optional[int]): maximum number of
+          digests that are sorted in memory, before they are written to
+          a temporary file.
+      temporary_directory (Optional[str]): path of the directory for the
+          temporary files, where None represents the default temporary
+          directory.
+
+    Raises:
+      ValueError: if the lookup hash or label is not supported.
+    """
+    digest_size = self._DIGEST_SIZES.get(lookup_hash, None)
+    if not digest_size:
+      raise ValueError('Unsupported lookup hash: {0!s}'.format(lookup_hash))
+
+    if (not events.EventTag.IsValidLabel(label) or
+        len(label) > self._MAXIMUM_LABEL_SIZE):
+      raise ValueError((
+          'Unsupported label: "{0:s}". A label must only consist of at most '
+          '{1:d} alphanumeric characters or underscores.').format(
+              label, self._MAXIMUM_LABEL_SIZE))
+
+    super(HashSetFileWriter, self).__init__()
+    self._bits_per_digest = bits_per_digest or self._DEFAULT_BITS_PER_DIGEST
+    self._digest_size = digest_size
+    self._encoded_label = label.encode('ascii')
+    self._maximum_number_of_digests_in_memory = (
+        maximum_number_of_digests_in_memory or
+        self._DEFAULT_MAXIMUM_NUMBER_OF_DIGESTS_IN_MEMORY)
+    self._temporary_directory = temporary_directory
+
+  def _ReadDigestsFromChunkFile(self, file_object):
+    """Reads digests from a sorted chunk file.
+
+    Args:
+      file_object (file): file-like object of the chunk file.
+
+    Yields:
+      bytes: binary digest.
+    """
+    file_object.seek(0, os.SEEK_SET)
+
+    read_size = self._READ_BUFFER_SIZE - (
+        self._READ_BUFFER_SIZE % self._digest_size)
+
+    data = file_object.read(read_size)
+    while data:
+      for offset in range(0, len(data), self._digest_size):
+        yield data[offset:offset + self._digest_size]
+
+      data = file_object.read(read_size)
+
+  def _WriteChunkFile(self, digests):
+    """Writes sorted digests to a temporary chunk file.
+
+    Args:
+      digests (list[bytes]): binary digests.
+
+    Returns:
+      file: file-like object of the chunk file.
+    """
+    digests.sort()
+
+    file_object = tempfile.TemporaryFile(dir=self._temporary_directory)
+    file_object.write(b''.join(digests))
+
+    return file_object
+
+  def WriteFile(self, path, hashes):
+    """Writes a hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+      hashes (iterable[str]): hexadecimal formatted hashes.
+
+    Returns:
+      int: number of digests in the hash set file, without duplicates.
+
+    Raises:
+      ValueError: if a hash is not supported.
+    """
+    chunk_files = []
+    digests = []
+    number_of_hashes = 0
+
+    try:
+      for hash_string in hashes:
+        try:
+          digest = binascii.unhexlify(hash_string)
+        except (TypeError, ValueError):
+          digest = None
+
+        if not digest or len(digest) != self._digest_size:
+          raise ValueError('Unsupported hash: {0!s}'.format(hash_string))
+
+        digests.append(digest)
+        number_of_hashes += 1
+
+        if len(digests) >= self._maximum_number_of_digests_in_memory:
+          chunk_file = self._WriteChunkFile(digests)
+          chunk_files.append(chunk_file)
+          digests = []
+
+      digests.sort()
+
+      sorted_digests = [
+          self._ReadDigestsFromChunkFile(chunk_file)
+          for chunk_file in chunk_files]
+      sorted_digests.append(iter(digests))
+
+      number_of_bloom_filter_bits = max(
+          number_of_hashes * self._bits_per_digest, 64)
+      number_of_bloom_filter_bits += (-number_of_bloom_filter_bits) % 8
+
+      number_of_bloom_filter_hash_functions = max(
+          int(round(self._bits_per_digest * math.log(2))), 1)
+
+      bloom_filter = bytearray(number_of_bloom_filter_bits // 8)
+      fan_out_counts = [0] * 65536
+
+      number_of_digests = 0
+      with open(path, 'wb') as file_object:
+        file_object.seek(
+            self._FILE_HEADER.size + self._FAN_OUT_TABLE.size +
+            len(bloom_filter))
+
+        last_digest = None
+        for digest in heapq.merge(*sorted_digests):
+          if digest == last_digest:
+            continue
+
+          for bit_index in self._GetBloomFilterBitIndexes(
+              digest, number_of_bloom_filter_bits,
+              number_of_bloom_filter_hash_functions):
+            bloom_filter[bit_index >> 3] |= 1 << (bit_index & 7)
+
+          fan_out_value = self._FAN_OUT_VALUE.unpack_from(digest)[0]
+          fan_out_counts[fan_out_value] += 1
+
+          file_object.write(digest)
+          number_of_digests += 1
+
+          last_digest = digest
+
+        file_header_data = self._FILE_HEADER.pack(
+            self._FILE_SIGNATURE, self._FORMAT_VERSION, self._digest_size,
+            number_of_digests, number_of_bloom_filter_bits,
+            number_of_bloom_filter_hash_functions, self._encoded_label)
+
+        fan_out_table = []
+        cumulative_number_of_digests = 0
+        for count in fan_out_counts:
+          cumulative_number_of_digests += count
+          fan_out_table.append(cumulative_number_of_digests)
+
+        file_object.seek(0, os.SEEK_SET)
+        file_object.write(file_header_data)
+        file_object.write(self._FAN_OUT_TABLE.pack(*fan_out_table))
+        file_object.write(bytes(bloom_filter))
+
+    finally:
+      for chunk_file in chunk_files:
+        chunk_file.close()
+
+    return number_of_digests
+
+
+class HashSetAnalyzer(interface.HashAnalyzer):
+  """Analyzes file hashes by looking them up in hash set files.
+
+  Attributes:
+    analyses_performed (int): number of analysis batches completed by this
+        analyzer.
+    hashes_per_batch (int): maximum number of hashes to analyze at once.
+    seconds_spent_analyzing (int): number of seconds this analyzer has spent
+        performing analysis (as opposed to waiting on queues, etc.)
+    wait_after_analysis (int): number of seconds the analyzer will sleep for
+        after analyzing a batch of hashes.
+  """
+
+  SUPPORTED_HASHES = ['md5', 'sha1', 'sha256']
+
+  def __init__(self, hash_queue, hash_analysis_queue, **kwargs):
+    """Initializes a hash set analyzer thread.
+
+    Args:
+      hash_queue (Queue.queue): contains hashes to be analyzed.
+      hash_analysis_queue (Queue.queue): that the analyzer will append
+          HashAnalysis objects this queue.
+    """
+    super(HashSetAnalyzer, self).__init__(
+        hash_queue, hash_analysis_queue, **kwargs)
+    self._hash_set_files = []
+    self.hashes_per_batch = 1000
+
+  def Analyze(self, hashes):
+    """Looks up hashes in the hash set files.
+
+    Args:
+      hashes (list[str]): hash values to look up.
+
+    Returns:
+      list[HashAnalysis]: analysis results, where the hash information
+          contains the labels of the hash sets that contain the hash.
+    """
+    hash_analyses = []
+    for hash_string in hashes:
+      try:
+        digest = binascii.unhexlify(hash_string)
+      except (TypeError, ValueError):
+        logger.warning('Unsupported hash: {0!s}'.format(hash_string))
+        digest = None
+
+      labels = []
+      if digest:
+        for hash_set_file in self._hash_set_files:
+          if (hash_set_file.label not in labels and
+              hash_set_file.ContainsDigest(digest)):
+            labels.append(hash_set_file.label)
+
+      hash_analysis = interface.HashAnalysis(hash_string, labels)
+      hash_analyses.append(hash_analysis)
+
+    return hash_analyses
+
+  def Close(self):
+    """Closes the hash set files."""
+    for hash_set_file in self._hash_set_files:
+      hash_set_file.Close()
+
+    self._hash_set_files = []
+
+  def OpenHashSetFiles(self, paths):
+    """Opens hash set files.
+
+    All hash set files must contain digests of the same hash, which is used
+    as the lookup hash.
+
+    Args:
+      paths (list[str]): paths of the hash set files.
+
+    Raises:
+      IOError: if a hash set file cannot be opened or if the hash set files
+          contain digests of different hashes.
+      OSError: if a hash set file cannot be opened or if the hash set files
+          contain digests of different hashes.
+      ValueError: if a hash set file cannot be mapped into memory or its
+          label cannot be decoded.
+    """
+    hash_set_files = []
+    try:
+      for path in paths:
+        hash_set_file = HashSetFile()
+        hash_set_file.Open(path)
+        hash_set_files.append(hash_set_file)
+
+        if hash_set_file.lookup_hash != hash_set_files[0].lookup_hash:
+          raise IOError((
+              'Hash set file: {0:s} contains {1:s} digests instead of '
+              '{2:s}.').format(
+                  path, hash_set_file.lookup_hash,
+                  hash_set_files[0].lookup_hash))
+
+    except (IOError, OSError, ValueError):
+      for hash_set_file in hash_set_files:
+        hash_set_file.Close()
+      raise
+
+    self.Close()
+
+    self._hash_set_files = hash_set_files
+    if hash_set_files:
+      self.SetLookupHash(hash_set_files[0].lookup_hash)
+
+
+class HashSetAnalysisPlugin(interface.HashTaggingAnalysisPlugin):
+  """Analysis plugin for looking up hashes in local hash set files."""
+
+  DATA_TYPES = ['fs:stat', 'fs:stat:ntfs']
+
+  NAME = 'hash_set'
+
+  def __init__(self):
+    """Initializes a hash set analysis plugin."""
+    super(HashSetAnalysisPlugin, self).__init__(HashSetAnalyzer)
+
+  def CompileReport(self, mediator):
+    """Compiles an analysis report.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+
+    Returns:
+      AnalysisReport: report.
+    """
+    analysis_report = super(HashSetAnalysisPlugin, self).CompileReport(
+        mediator)
+
+    # The analyzer thread is signaled to abort by CompileReport, but can still
+    # be looking up hashes in the memory mapped hash set files.
+    if self._analyzer_started:
+      self._analyzer.join()
+
+    self._analyzer.Close()
+
+    return analysis_report
+
+  def GenerateLabels(self, hash_information):
+    """Generates a list of strings that will be used in the event tag.
+
+    Args:
+      hash_information (list[str]): labels of the hash sets that contain
+          the hash.
+
+    Returns:
+      list[str]: labels to apply to events.
+    """
+    return list(hash_information)
+
+  def OpenHashSetFiles(self, paths):
+    """Opens hash set files.
+
+    Args:
+      paths (list[str]): paths of the hash set files.
+
+    Raises:
+      IOError: if a hash set file cannot be opened or if the hash set files
+          contain digests of different hashes.
+      OSError: if a hash set file cannot be opened or if the hash set files
+          contain digests of different hashes.
+      ValueError: if a hash set file cannot be mapped into memory or its
+          label cannot be decoded.
+    """
+    self._analyzer.OpenHashSetFiles(paths)
+
+
+manager.AnalysisPluginManager.RegisterPlugin(HashSetAnalysisPlugin)
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import abc
 import collections
+import sqlite3
 import sys
 import threading
 import time
@@ -54,6 +55,14 @@ class AnalysisPlugin(object):
   # should be able to run during the extraction phase.
   ENABLE_IN_EXTRACTION = False
 
+  # A flag indicating whether or not this plugin can run inline in the main
+  # psort process, when inline analysis is enabled, instead of in a separate
+  # analysis process. This is intended for plugins that do little work per
+  # event, where the overhead of passing events to an analysis process
+  # outweighs the work done by the plugin. The plugin should not block or
+  # depend on process wide state, such as threads or network connections.
+  ENABLE_INLINE_ANALYSIS = False
+
   def __init__(self):
     """Initializes an analysis plugin."""
     super(AnalysisPlugin, self).__init__()
@@ -87,6 +96,30 @@ class AnalysisPlugin(object):
 
     return event_tag
 
+  def _CreateEventTagInterval(
+      self, start_timestamp, end_timestamp, comment, labels):
+    """Creates an event tag interval.
+
+    Args:
+      start_timestamp (int): timestamp of the start of the interval,
+          inclusive.
+      end_timestamp (int): timestamp of the end of the interval, inclusive.
+      comment (str): event tag interval comment.
+      labels (list[str]): event tag interval labels.
+
+    Returns:
+      EventTagInterval: the event tag interval.
+    """
+    event_tag_interval = events.EventTagInterval(
+        comment=comment, end_timestamp=end_timestamp,
+        start_timestamp=start_timestamp)
+    event_tag_interval.AddLabels(labels)
+
+    logger.debug('Created event tag interval: {0:s} for: {1:d} - {2:d}'.format(
+        comment, start_timestamp, end_timestamp))
+
+    return event_tag_interval
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def CompileReport(self, mediator):
@@ -149,6 +182,11 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     self._comment = 'Tag applied by {0:s} analysis plugin'.format(self.NAME)
     self._event_identifiers_by_pathspec = collections.defaultdict(list)
     self._hash_pathspecs = collections.defaultdict(list)
+    self._lookup_cache = None
+    self._lookup_cache_hashes = set()
+    self._lookup_cache_opened = False
+    self._number_of_lookup_cache_hits = 0
+    self._number_of_lookup_cache_misses = 0
     self._requester_class = None
     self._time_of_last_status_log = time.time()
     self.hash_analysis_queue = Queue.Queue()
@@ -193,6 +231,98 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
 
     return path_specifications, labels, tags
 
+  def _CacheHashAnalysis(self, hash_analysis):
+    """Stores a hash analysis result in the lookup cache.
+
+    Args:
+      hash_analysis (HashAnalysis): hash analysis result.
+    """
+    if (not self._lookup_cache_opened or
+        hash_analysis.subject_hash in self._lookup_cache_hashes or
+        not self._IsCacheableHashAnalysis(hash_analysis)):
+      return
+
+    try:
+      self._lookup_cache.SetHashAnalysis(
+          self.NAME, self._analyzer.lookup_hash, hash_analysis)
+    except (IOError, OSError, sqlite3.Error) as exception:
+      logger.warning(
+          'Unable to write hash lookup cache with error: {0!s}'.format(
+              exception))
+
+  def _CloseLookupCache(self):
+    """Closes the lookup cache."""
+    if not self._lookup_cache_opened:
+      return
+
+    try:
+      self._lookup_cache.Close()
+    except (IOError, OSError, sqlite3.Error) as exception:
+      logger.warning(
+          'Unable to close hash lookup cache with error: {0!s}'.format(
+              exception))
+
+    self._lookup_cache_opened = False
+
+  def _GetCachedHashAnalysis(self, subject_hash):
+    """Retrieves a hash analysis result from the lookup cache.
+
+    The lookup cache is opened on first use, which is in the analysis process
+    when the plugin runs in an analysis process.
+
+    Args:
+      subject_hash (str): hash to look up.
+
+    Returns:
+      HashAnalysis: hash analysis result or None if no lookup cache is set or
+          the hash is not in the lookup cache.
+    """
+    if not self._lookup_cache:
+      return None
+
+    if not self._lookup_cache_opened:
+      try:
+        self._lookup_cache.Open()
+      except (IOError, OSError) as exception:
+        logger.warning((
+            'Unable to open hash lookup cache with error: {0!s}, continuing '
+            'without cache.').format(exception))
+        self._lookup_cache = None
+        return None
+
+      self._lookup_cache_opened = True
+
+    try:
+      hash_analysis = self._lookup_cache.GetHashAnalysis(
+          self.NAME, self._analyzer.lookup_hash, subject_hash)
+    except (IOError, OSError, ValueError, sqlite3.Error) as exception:
+      logger.warning(
+          'Unable to read hash lookup cache with error: {0!s}'.format(
+              exception))
+      hash_analysis = None
+
+    if not hash_analysis:
+      self._number_of_lookup_cache_misses += 1
+      return None
+
+    self._lookup_cache_hashes.add(subject_hash)
+    self._number_of_lookup_cache_hits += 1
+    return hash_analysis
+
+  def _IsCacheableHashAnalysis(self, hash_analysis):
+    """Determines if a hash analysis result can be stored in the lookup cache.
+
+    Subclasses should override this method when some results are transient,
+    such as an analysis that is still pending.
+
+    Args:
+      hash_analysis (HashAnalysis): hash analysis result.
+
+    Returns:
+      bool: True if the hash analysis result can be cached.
+    """
+    return True
+
   def _EnsureRequesterStarted(self):
     """Checks if the analyzer is running and starts it if not."""
     if not self._analyzer_started:
@@ -212,8 +342,6 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
         not self._analyzer.lookup_hash):
       return
 
-    self._EnsureRequesterStarted()
-
     event_identifiers = self._event_identifiers_by_pathspec[event_data.pathspec]
 
     event_identifier = event.GetIdentifier()
@@ -234,7 +362,13 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     # There may be multiple path specification that have the same hash. We only
     # want to look them up once.
     if len(path_specs) == 1:
-      self.hash_queue.put(lookup_hash)
+      hash_analysis = self._GetCachedHashAnalysis(lookup_hash)
+      if hash_analysis:
+        self.hash_analysis_queue.put(hash_analysis)
+      else:
+        # The analyzer is only started when a hash needs to be looked up.
+        self._EnsureRequesterStarted()
+        self.hash_queue.put(lookup_hash)
 
   def _ContinueReportCompilation(self):
     """Determines if the plugin should continue trying to compile the report.
@@ -289,6 +423,8 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
         # The result queue is empty, but there could still be items that need
         # to be processed by the analyzer.
         continue
+      self._CacheHashAnalysis(hash_analysis)
+
       pathspecs, labels, new_tags = self._HandleHashAnalysis(
           hash_analysis)
 
@@ -298,12 +434,31 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
 
     self._analyzer.SignalAbort()
 
+    self._CloseLookupCache()
+
     lines_of_text = ['{0:s} hash tagging results'.format(self.NAME)]
     for label, count in sorted(path_specs_per_labels_counter.items()):
       line_of_text = (
           '{0:d} path specifications tagged with label: {1:s}'.format(
               count, label))
       lines_of_text.append(line_of_text)
+
+    if self._lookup_cache:
+      number_of_lookups = (
+          self._number_of_lookup_cache_hits +
+          self._number_of_lookup_cache_misses)
+      if number_of_lookups:
+        hit_rate = (
+            100.0 * self._number_of_lookup_cache_hits) / number_of_lookups
+      else:
+        hit_rate = 0.0
+
+      line_of_text = (
+          'Lookup cache: {0:d} hits, {1:d} misses, hit rate: {2:.1f}%'.format(
+              self._number_of_lookup_cache_hits,
+              self._number_of_lookup_cache_misses, hit_rate))
+      lines_of_text.append(line_of_text)
+
     lines_of_text.append('')
     report_text = '\n'.join(lines_of_text)
 
@@ -330,9 +485,26 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
       average_analysis_time, _ = divmod(
           self._analyzer.seconds_spent_analyzing, analyses_performed)
 
-    batches_remaining, _ = divmod(number_of_hashes, hashes_per_batch)
+    batches_remaining, remainder = divmod(number_of_hashes, hashes_per_batch)
+    if remainder:
+      batches_remaining += 1
+
     estimated_seconds_per_batch = average_analysis_time + wait_time_per_batch
-    return batches_remaining * estimated_seconds_per_batch
+
+    # The analysis time, which includes the time spent waiting for the rate
+    # limit, is measured per requester and the requesters analyze batches
+    # concurrently.
+    number_of_requesters = getattr(self._analyzer, 'number_of_requesters', 1)
+    estimated_seconds_per_batch /= max(number_of_requesters, 1)
+
+    # Regardless of the number of requesters, batches cannot be analyzed
+    # faster than the rate limit allows.
+    requests_per_second = getattr(self._analyzer, 'requests_per_second', None)
+    if requests_per_second:
+      estimated_seconds_per_batch = max(
+          estimated_seconds_per_batch, 1.0 / requests_per_second)
+
+    return int(batches_remaining * estimated_seconds_per_batch)
 
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
@@ -348,6 +520,17 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
       list[str]: list of labels to apply to events.
     """
 
+  def SetLookupCache(self, lookup_cache):
+    """Sets the lookup cache.
+
+    Hashes in the lookup cache are not looked up again and the results of
+    hashes that are looked up are stored in the lookup cache.
+
+    Args:
+      lookup_cache (HashLookupCache): lookup cache, which is not opened yet.
+    """
+    self._lookup_cache = lookup_cache
+
   def SetLookupHash(self, lookup_hash):
     """Sets the hash to query.
 
@@ -402,13 +585,39 @@ class HashAnalyzer(threading.Thread):
     self.seconds_spent_analyzing = 0
     self.wait_after_analysis = wait_after_analysis
 
-  def _GetHashes(self, target_queue, max_hashes):
+    # Lock to serialize updates of the analysis statistics by requesters
+    # that run concurrently.
+    self._statistics_lock = threading.Lock()
+
+  def _AnalyzeQueuedHashes(self):
+    """Analyzes batches of hashes from the hash queue until aborted."""
+    while not self._abort:
+      # Wait for some more hashes to be added to the queue, if it is empty.
+      hashes = self._GetHashes(
+          self._hash_queue, self.hashes_per_batch,
+          timeout=self.EMPTY_QUEUE_WAIT_TIME)
+      if hashes:
+        time_before_analysis = time.time()
+        hash_analyses = self.Analyze(hashes)
+        current_time = time.time()
+        with self._statistics_lock:
+          self.seconds_spent_analyzing += current_time - time_before_analysis
+          self.analyses_performed += 1
+        for hash_analysis in hash_analyses:
+          self._hash_analysis_queue.put(hash_analysis)
+          self._hash_queue.task_done()
+        if self.wait_after_analysis:
+          time.sleep(self.wait_after_analysis)
+
+  def _GetHashes(self, target_queue, max_hashes, timeout=None):
     """Retrieves a list of items from a queue.
 
     Args:
       target_queue (Queue.queue): queue to retrieve hashes from.
       max_hashes (int): maximum number of items to retrieve from the
           target_queue.
+      timeout (Optional[float]): number of seconds to wait for the first item
+          if the target_queue is empty, where None represents not to wait.
 
     Returns:
       list[object]: list of at most max_hashes elements from the target_queue.
@@ -417,9 +626,12 @@ class HashAnalyzer(threading.Thread):
     hashes = []
     for _ in range(0, max_hashes):
       try:
-        item = target_queue.get_nowait()
+        if timeout and not hashes:
+          item = target_queue.get(timeout=timeout)
+        else:
+          item = target_queue.get_nowait()
       except Queue.Empty:
-        continue
+        break
       hashes.append(item)
     return hashes
 
@@ -439,21 +651,7 @@ class HashAnalyzer(threading.Thread):
   # not follow the style guide.
   def run(self):
     """The method called by the threading library to start the thread."""
-    while not self._abort:
-      hashes = self._GetHashes(self._hash_queue, self.hashes_per_batch)
-      if hashes:
-        time_before_analysis = time.time()
-        hash_analyses = self.Analyze(hashes)
-        current_time = time.time()
-        self.seconds_spent_analyzing += current_time - time_before_analysis
-        self.analyses_performed += 1
-        for hash_analysis in hash_analyses:
-          self._hash_analysis_queue.put(hash_analysis)
-          self._hash_queue.task_done()
-        time.sleep(self.wait_after_analysis)
-      else:
-        # Wait for some more hashes to be added to the queue.
-        time.sleep(self.EMPTY_QUEUE_WAIT_TIME)
+    self._AnalyzeQueuedHashes()
 
   def SetLookupHash(self, lookup_hash):
     """Sets the hash to query.
@@ -474,8 +672,102 @@ class HashAnalyzer(threading.Thread):
     self._abort = True
 
 
+class TokenBucketRateLimiter(object):
+  """Token bucket rate limiter.
+
+  Tokens are added to the bucket at a fixed rate, up to the capacity of the
+  bucket, and every request takes a token. A request that finds the bucket
+  empty waits until a token becomes available. The rate limiter can be shared
+  by multiple threads.
+
+  Attributes:
+    capacity (int): maximum number of tokens in the bucket, which is the
+        maximum number of requests that can be made in a burst.
+    rate (float): number of tokens added to the bucket per second.
+  """
+
+  def __init__(self, rate, capacity=1):
+    """Initializes a token bucket rate limiter.
+
+    The bucket starts full.
+
+    Args:
+      rate (float): number of tokens added to the bucket per second.
+      capacity (Optional[int]): maximum number of tokens in the bucket.
+
+    Raises:
+      ValueError: if the rate or capacity is not a positive value.
+    """
+    if rate <= 0:
+      raise ValueError('Invalid rate: {0!s}'.format(rate))
+
+    if capacity < 1:
+      raise ValueError('Invalid capacity: {0!s}'.format(capacity))
+
+    super(TokenBucketRateLimiter, self).__init__()
+    self._lock = threading.Lock()
+    self._number_of_tokens = float(capacity)
+    self._time_of_last_update = time.time()
+    self.capacity = capacity
+    self.rate = rate
+
+  def Acquire(self):
+    """Takes a token from the bucket, waiting until one is available.
+
+    A token that is not available yet is reserved, such that concurrent
+    callers wait in turn instead of competing for the next token.
+
+    Returns:
+      float: number of seconds waited.
+    """
+    with self._lock:
+      current_time = time.time()
+      elapsed_time = max(current_time - self._time_of_last_update, 0.0)
+      self._time_of_last_update = current_time
+
+      self._number_of_tokens = min(
+          self._number_of_tokens + (elapsed_time * self.rate),
+          float(self.capacity))
+      self._number_of_tokens -= 1.0
+
+      wait_time = 0.0
+      if self._number_of_tokens < 0.0:
+        wait_time = -self._number_of_tokens / self.rate
+
+    if wait_time:
+      time.sleep(wait_time)
+
+    return wait_time
+
+
 class HTTPHashAnalyzer(HashAnalyzer):
-  """Interface for hash analysis plugins that use HTTP(S)"""
+  """Interface for hash analysis plugins that use HTTP(S).
+
+  Requests are made using a shared session, which keeps connections alive
+  between requests, by one or more requesters that analyze batches of hashes
+  concurrently. Requests that fail with a connection error or a transient
+  HTTP error are retried with exponential backoff.
+
+  Attributes:
+    maximum_number_of_retries (int): maximum number of times a failed request
+        is retried.
+    number_of_requesters (int): number of requesters that analyze batches of
+        hashes concurrently.
+    requests_per_second (float): maximum number of requests per second, where
+        None represents no limit.
+    retry_backoff (float): number of seconds to wait before the first retry,
+        which is doubled for every subsequent retry.
+  """
+
+  DEFAULT_MAXIMUM_NUMBER_OF_RETRIES = 3
+  DEFAULT_REQUEST_TIMEOUT = 60
+  DEFAULT_RETRY_BACKOFF = 1.0
+
+  # HTTP status codes of responses to requests that are retried.
+  _RETRY_HTTP_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+  # Maximum number of seconds to wait before a retry.
+  _MAXIMUM_RETRY_WAIT_TIME = 300
 
   def __init__(self, hash_queue, hash_analysis_queue, **kwargs):
     """Initializes a HTTP hash analyzer.
@@ -488,6 +780,13 @@ class HTTPHashAnalyzer(HashAnalyzer):
     super(HTTPHashAnalyzer, self).__init__(
         hash_queue, hash_analysis_queue, **kwargs)
     self._checked_for_old_python_version = False
+    self._rate_limiter = None
+    self._session = None
+    self._session_lock = threading.Lock()
+    self.maximum_number_of_retries = self.DEFAULT_MAXIMUM_NUMBER_OF_RETRIES
+    self.number_of_requesters = 1
+    self.requests_per_second = None
+    self.retry_backoff = self.DEFAULT_RETRY_BACKOFF
 
   def _CheckPythonVersionAndDisableWarnings(self):
     """Checks python version, and disables SSL warnings.
@@ -519,6 +818,59 @@ class HTTPHashAnalyzer(HashAnalyzer):
 
     self._checked_for_old_python_version = True
 
+  def _CloseSession(self):
+    """Closes the session and its pooled connections."""
+    with self._session_lock:
+      if self._session:
+        self._session.close()
+        self._session = None
+
+  def _GetRetryWaitTime(self, retry_number, response=None):
+    """Determines the number of seconds to wait before retrying a request.
+
+    Args:
+      retry_number (int): number of the retry, where 0 represents the first
+          retry.
+      response (Optional[requests.Response]): response to the failed
+          request, where None represents that the request failed without
+          a response.
+
+    Returns:
+      float: number of seconds to wait.
+    """
+    wait_time = self.retry_backoff * (2 ** retry_number)
+
+    # The server can indicate how long to wait with a Retry-After header,
+    # which contains a number of seconds or a HTTP date. Only the former is
+    # supported.
+    if response is not None:
+      retry_after = response.headers.get('Retry-After', None)
+      try:
+        wait_time = max(wait_time, float(retry_after))
+      except (TypeError, ValueError):
+        pass
+
+    return min(wait_time, self._MAXIMUM_RETRY_WAIT_TIME)
+
+  def _GetSession(self):
+    """Retrieves the session, creating it on first use.
+
+    Returns:
+      requests.Session: session, with a connection pool large enough for
+          all requesters.
+    """
+    with self._session_lock:
+      if not self._session:
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.number_of_requesters)
+
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        self._session = session
+
+      return self._session
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def Analyze(self, hashes):
@@ -531,13 +883,17 @@ class HTTPHashAnalyzer(HashAnalyzer):
       list[HashAnalysis]: analysis results.
     """
 
-  def MakeRequestAndDecodeJSON(self, url, method, **kwargs):
+  def MakeRequestAndDecodeJSON(self, url, method, retry=True, **kwargs):
     """Make a HTTP request and decode the results as JSON.
 
+    The request is subject to the rate limit and is retried when it fails
+    with a connection error, a timeout or a transient HTTP error.
+
     Args:
       url (str): URL to make a request to.
       method (str): HTTP method to used to make the request. GET and POST are
           supported.
+      retry (Optional[bool]): True if a failed request should be retried.
       kwargs: parameters to the requests .get() or post() methods, depending
           on the value of the method parameter.
 
@@ -556,26 +912,103 @@ class HTTPHashAnalyzer(HashAnalyzer):
     if url.lower().startswith('https'):
       self._CheckPythonVersionAndDisableWarnings()
 
+    kwargs.setdefault('timeout', self.DEFAULT_REQUEST_TIMEOUT)
+
+    session = self._GetSession()
+
+    retry_number = 0
+    while True:
+      if self._rate_limiter:
+        self._rate_limiter.Acquire()
+
+      response = None
+      try:
+        response = session.request(method_upper, url, **kwargs)
+        if response.status_code not in self._RETRY_HTTP_STATUS_CODES:
+          response.raise_for_status()
+          return response.json()
+
+        error_string = '{0:s} returned a HTTP error: {1:d}'.format(
+            url, response.status_code)
+
+      except (requests.ConnectionError, requests.Timeout) as exception:
+        error_string = 'Unable to connect to {0:s} with error: {1!s}'.format(
+            url, exception)
+
+      except requests.HTTPError as exception:
+        error_string = '{0:s} returned a HTTP error: {1!s}'.format(
+            url, exception)
+        raise errors.ConnectionError(error_string)
+
+      if (not retry or self._abort or
+          retry_number >= self.maximum_number_of_retries):
+        raise errors.ConnectionError(error_string)
+
+      wait_time = self._GetRetryWaitTime(retry_number, response=response)
+      logger.debug('{0:s}, retrying in {1:.1f} seconds.'.format(
+          error_string, wait_time))
+
+      if response is not None:
+        response.close()
+
+      time.sleep(wait_time)
+      retry_number += 1
+
+  # This method is part of the threading.Thread interface, hence its name does
+  # not follow the style guide.
+  def run(self):
+    """The method called by the threading library to start the thread."""
+    requester_threads = []
+    for _ in range(1, self.number_of_requesters):
+      requester_thread = threading.Thread(target=self._AnalyzeQueuedHashes)
+      requester_thread.daemon = True
+      requester_thread.start()
+      requester_threads.append(requester_thread)
+
     try:
-      if method_upper == 'GET':
-        response = requests.get(url, **kwargs)
+      self._AnalyzeQueuedHashes()
+
+    finally:
+      for requester_thread in requester_threads:
+        requester_thread.join()
+
+      self._CloseSession()
 
-      elif method_upper == 'POST':
-        response = requests.post(url, **kwargs)
+  def SetNumberOfRequesters(self, number_of_requesters):
+    """Sets the number of requesters that analyze hashes concurrently.
 
-      response.raise_for_status()
+    Args:
+      number_of_requesters (int): number of requesters.
+
+    Raises:
+      ValueError: if the number of requesters is less than 1.
+    """
+    if number_of_requesters < 1:
+      raise ValueError('Invalid number of requesters: {0!s}'.format(
+          number_of_requesters))
+
+    # The connection pool of an existing session is sized for the previous
+    # number of requesters.
+    self._CloseSession()
 
-    except requests.ConnectionError as exception:
-      error_string = 'Unable to connect to {0:s} with error: {1!s}'.format(
-          url, exception)
-      raise errors.ConnectionError(error_string)
+    self.number_of_requesters = number_of_requesters
 
-    except requests.HTTPError as exception:
-      error_string = '{0:s} returned a HTTP error: {1!s}'.format(
-          url, exception)
-      raise errors.ConnectionError(error_string)
+  def SetRateLimit(self, requests_per_second):
+    """Sets the maximum rate of requests.
+
+    The rate limit is shared by all requesters and replaces waiting a fixed
+    time after each batch of hashes is analyzed.
+
+    Args:
+      requests_per_second (float): maximum number of requests per second,
+          where None represents no limit.
+    """
+    if requests_per_second:
+      self._rate_limiter = TokenBucketRateLimiter(requests_per_second)
+    else:
+      self._rate_limiter = None
 
-    return response.json()
+    self.requests_per_second = requests_per_second or None
 
 
 class HashAnalysis(object):
@@ -130,6 +130,16 @@ class AnalysisMediator(object):
 
     self.last_activity_timestamp = time.time()
 
+  def ProduceEventTagInterval(self, event_tag_interval):
+    """Produces an event tag interval.
+
+    Args:
+      event_tag_interval (EventTagInterval): event tag interval.
+    """
+    self._storage_writer.AddEventTagInterval(event_tag_interval)
+
+    self.last_activity_timestamp = time.time()
+
   def SignalAbort(self):
     """Signals the analysis plugins to abort."""
     self._abort = True
@@ -10,12 +10,19 @@ from plaso.lib import definitions
 
 
 class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
-  """Analysis plugin that labels events by session."""
+  """Analysis plugin that labels events by session.
+
+  Since the events are examined in chronological order, every session
+  covers a time range. The events of a session are labeled by an event tag
+  interval of the time range instead of an event tag per event.
+  """
 
   NAME = 'sessionize'
 
   ENABLE_IN_EXTRACTION = False
 
+  ENABLE_INLINE_ANALYSIS = True
+
   _EVENT_TAG_COMMENT = 'Tag applied by sessionize analysis plugin.'
 
   _DEFAULT_MAXIMUM_PAUSE = 10 * definitions.MICROSECONDS_PER_MINUTE
@@ -23,11 +30,26 @@ class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
   def __init__(self):
     """Initializes a sessionize analysis plugin."""
     super(SessionizeAnalysisPlugin, self).__init__()
+    self._last_event_timestamp = None
     self._maximum_pause_microseconds = self._DEFAULT_MAXIMUM_PAUSE
     self._session_counter = 0
+    self._session_start_timestamp = None
     self._events_per_session = []
-    self._number_of_event_tags = 0
-    self._session_end_timestamp = None
+    self._number_of_event_tag_intervals = 0
+
+  def _ProduceSessionEventTagInterval(self, mediator):
+    """Produces the event tag interval of the current session.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between analysis
+          plugins and other components, such as storage and dfvfs.
+    """
+    label = 'session_{0:d}'.format(self._session_counter)
+    event_tag_interval = self._CreateEventTagInterval(
+        self._session_start_timestamp, self._last_event_timestamp,
+        self._EVENT_TAG_COMMENT, [label])
+    mediator.ProduceEventTagInterval(event_tag_interval)
+    self._number_of_event_tag_intervals += 1
 
   def SetMaximumPause(self, maximum_pause_minutes):
     """Sets the maximum pause interval between events to consider a session.
@@ -49,10 +71,15 @@ class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
     Returns:
       AnalysisReport: analysis report.
     """
+    if self._session_start_timestamp is not None:
+      self._ProduceSessionEventTagInterval(mediator)
+      self._session_start_timestamp = None
+
     report_text = [
         'Sessionize plugin identified {0:d} sessions and '
-        'applied {1:d} tags.'.format(
-            len(self._events_per_session), self._number_of_event_tags)]
+        'applied {1:d} session labels.'.format(
+            len(self._events_per_session),
+            self._number_of_event_tag_intervals)]
     for session, event_count in enumerate(self._events_per_session):
       report_text.append('\tSession {0:d}: {1:d} events'.format(
           session, event_count))
@@ -61,7 +88,7 @@ class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
 
   # pylint: disable=unused-argument
   def ExamineEvent(self, mediator, event, event_data):
-    """Analyzes an EventObject and tags it as part of a session.
+    """Analyzes an EventObject and assigns it to a session.
 
     Args:
       mediator (AnalysisMediator): mediates interactions between analysis
@@ -69,25 +96,22 @@ class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
       event (EventObject): event to examine.
       event_data (EventData): event data.
     """
-    if self._session_end_timestamp is None:
-      self._session_end_timestamp = (
-          event.timestamp + self._maximum_pause_microseconds)
+    if self._session_start_timestamp is None:
+      self._session_start_timestamp = event.timestamp
       self._events_per_session.append(0)
 
-    if event.timestamp > self._session_end_timestamp:
+    elif (event.timestamp >
+          self._last_event_timestamp + self._maximum_pause_microseconds):
+      self._ProduceSessionEventTagInterval(mediator)
+
       self._session_counter += 1
+      self._session_start_timestamp = event.timestamp
       self._events_per_session.append(0)
 
-    self._session_end_timestamp = (
-        event.timestamp + self._maximum_pause_microseconds)
+    self._last_event_timestamp = event.timestamp
     # The counter for the current session is the always the last item in
     # the list.
     self._events_per_session[-1] += 1
 
-    label = 'session_{0:d}'.format(self._session_counter)
-    event_tag = self._CreateEventTag(event, self._EVENT_TAG_COMMENT, [label])
-    mediator.ProduceEventTag(event_tag)
-    self._number_of_event_tags += 1
-
 
 manager.AnalysisPluginManager.RegisterPlugin(SessionizeAnalysisPlugin)
@@ -19,6 +19,8 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
 
   ENABLE_IN_EXTRACTION = True
 
+  ENABLE_INLINE_ANALYSIS = True
+
   _EVENT_TAG_COMMENT = 'Tag applied by tagging analysis plugin.'
 
   _OS_TAG_FILES = {
@@ -9,6 +9,7 @@ except ImportError:
   from urllib import parse as urlparse
 
 # pylint: disable=wrong-import-position
+from plaso.analysis import aggregation
 from plaso.analysis import interface
 from plaso.analysis import manager
 from plaso.containers import reports
@@ -27,6 +28,8 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
   # Indicate that we can run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = True
 
+  ENABLE_INLINE_ANALYSIS = True
+
   _SUPPORTED_EVENT_DATA_TYPES = frozenset([
       'chrome:history:file_downloaded',
       'chrome:history:page_visited',
@@ -42,7 +45,7 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
   def __init__(self):
     """Initializes the domains visited plugin."""
     super(UniqueDomainsVisitedPlugin, self).__init__()
-    self._domains = []
+    self._domains = aggregation.DiskBackedCounter()
 
   # pylint: disable=unused-argument
   def ExamineEvent(self, mediator, event, event_data):
@@ -66,11 +69,7 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
 
     parsed_url = urlparse.urlparse(url)
     domain = getattr(parsed_url, 'netloc', None)
-    if domain in self._domains:
-      # We've already found an event containing this domain.
-      return
-
-    self._domains.append(domain)
+    self._domains.Increment(domain)
 
   def CompileReport(self, mediator):
     """Compiles an analysis report.
@@ -83,12 +82,33 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
       AnalysisReport: the analysis report.
     """
     lines_of_text = ['Listing domains visited by all users']
-    for domain in sorted(self._domains):
+    for domain, _ in self._domains.GetItems():
       lines_of_text.append(domain)
 
+    self._domains.Close()
+
     lines_of_text.append('')
     report_text = '\n'.join(lines_of_text)
     return reports.AnalysisReport(plugin_name=self.NAME, text=report_text)
 
+  def SetMaximumNumberOfDomainsInMemory(
+      self, maximum_number_of_domains, temporary_directory=None):
+    """Sets the maximum number of domains to keep in memory.
+
+    When the maximum is reached the domains are written to a temporary file,
+    which bounds the memory usage when analyzing large numbers of domains.
+
+    Args:
+      maximum_number_of_domains (int): maximum number of domains to keep in
+          memory, where None represents no maximum.
+      temporary_directory (Optional[str]): path of the directory for the
+          temporary files, where None represents the default temporary
+          directory.
+    """
+    self._domains.Close()
+    self._domains = aggregation.DiskBackedCounter(
+        maximum_number_of_keys_in_memory=maximum_number_of_domains,
+        temporary_directory=temporary_directory)
+
 
 manager.AnalysisPluginManager.RegisterPlugin(UniqueDomainsVisitedPlugin)
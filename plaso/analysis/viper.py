@@ -122,7 +122,7 @@ class ViperAnalyzer(interface.HTTPHashAnalyzer):
         self._protocol, self._host, self._port)
 
     try:
-      json_response = self.MakeRequestAndDecodeJSON(url, 'GET')
+      json_response = self.MakeRequestAndDecodeJSON(url, 'GET', retry=False)
     except errors.ConnectionError:
       json_response = None
 
@@ -191,6 +191,17 @@ class ViperAnalysisPlugin(interface.HashTaggingAnalysisPlugin):
     """
     self._analyzer.SetHost(host)
 
+  def SetNumberOfRequesters(self, number_of_requesters):
+    """Sets the number of requesters that query Viper concurrently.
+
+    Args:
+      number_of_requesters (int): number of requesters.
+
+    Raises:
+      ValueError: if the number of requesters is less than 1.
+    """
+    self._analyzer.SetNumberOfRequesters(number_of_requesters)
+
   def SetPort(self, port):
     """Sets the port where Viper server is listening.
 
@@ -33,11 +33,12 @@ class VirusTotalAnalyzer(interface.HTTPHashAnalyzer):
     self._api_key = None
     self._checked_for_old_python_version = False
 
-  def _QueryHashes(self, digests):
+  def _QueryHashes(self, digests, retry=True):
     """Queries VirusTotal for a specfic hashes.
 
     Args:
       digests (list[str]): hashes to look up.
+      retry (Optional[bool]): True if a failed query should be retried.
 
     Returns:
       dict[str, object]: JSON response or None on error.
@@ -46,7 +47,8 @@ class VirusTotalAnalyzer(interface.HTTPHashAnalyzer):
 
     try:
       json_response = self.MakeRequestAndDecodeJSON(
-          self._VIRUSTOTAL_API_REPORT_URL, 'GET', params=url_parameters)
+          self._VIRUSTOTAL_API_REPORT_URL, 'GET', retry=retry,
+          params=url_parameters)
     except errors.ConnectionError as exception:
       json_response = None
       logger.error('Unable to query VirusTotal with error: {0!s}.'.format(
@@ -102,7 +104,7 @@ class VirusTotalAnalyzer(interface.HTTPHashAnalyzer):
     Returns:
       bool: True if VirusTotal is reachable.
     """
-    json_response = self._QueryHashes([self._EICAR_SHA256])
+    json_response = self._QueryHashes([self._EICAR_SHA256], retry=False)
     return json_response is not None
 
 
@@ -125,15 +127,32 @@ class VirusTotalAnalysisPlugin(interface.HashTaggingAnalysisPlugin):
     super(VirusTotalAnalysisPlugin, self).__init__(VirusTotalAnalyzer)
     self._api_key = None
 
+  def _IsCacheableHashAnalysis(self, hash_analysis):
+    """Determines if a hash analysis result can be stored in the lookup cache.
+
+    Results of analyses that are still pending are not cached.
+
+    Args:
+      hash_analysis (HashAnalysis): hash analysis result.
+
+    Returns:
+      bool: True if the hash analysis result can be cached.
+    """
+    response_code = hash_analysis.hash_information.get('response_code', None)
+    return response_code in (
+        self._VIRUSTOTAL_NOT_PRESENT_RESPONSE_CODE,
+        self._VIRUSTOTAL_PRESENT_RESPONSE_CODE)
+
   def EnableFreeAPIKeyRateLimit(self):
     """Configures Rate limiting for queries to VirusTotal.
 
     The default rate limit for free VirusTotal API keys is 4 requests per
-    minute.
+    minute. The 4 hashes of a batch are looked up in a single request, hence
+    at most 1 request is made per minute.
     """
     self._analyzer.hashes_per_batch = 4
-    self._analyzer.wait_after_analysis = 60
-    self._analysis_queue_timeout = self._analyzer.wait_after_analysis + 1
+    self._analyzer.SetRateLimit(1.0 / 60)
+    self._analysis_queue_timeout = 61
 
   def GenerateLabels(self, hash_information):
     """Generates a list of strings that will be used in the event tag.
@@ -172,6 +191,17 @@ class VirusTotalAnalysisPlugin(interface.HashTaggingAnalysisPlugin):
     """
     self._analyzer.SetAPIKey(api_key)
 
+  def SetNumberOfRequesters(self, number_of_requesters):
+    """Sets the number of requesters that query VirusTotal concurrently.
+
+    Args:
+      number_of_requesters (int): number of requesters.
+
+    Raises:
+      ValueError: if the number of requesters is less than 1.
+    """
+    self._analyzer.SetNumberOfRequesters(number_of_requesters)
+
   def TestConnection(self):
     """Tests the connection to VirusTotal
 
@@ -192,6 +192,8 @@ class WindowsServicesAnalysisPlugin(interface.AnalysisPlugin):
   # Indicate that we can run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = True
 
+  ENABLE_INLINE_ANALYSIS = True
+
   _SUPPORTED_EVENT_DATA_TYPES = frozenset([
       'windows:registry:service'])
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """This file imports Python modules that register hashers."""
 
+from plaso.analyzers.hashers import entropy
 from plaso.analyzers.hashers import md5
 from plaso.analyzers.hashers import sha1
 from plaso.analyzers.hashers import sha256
@@ -7,6 +7,11 @@ from __future__ import unicode_literals
 import collections
 import math
 
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
 from plaso.analyzers.hashers import interface
 from plaso.analyzers.hashers import manager
 
@@ -18,12 +23,18 @@ class EntropyHasher(interface.BaseHasher):
   ATTRIBUTE_NAME = 'file_entropy'
   DESCRIPTION = 'Calculates the byte entropy of input data.'
 
+  ENABLED_BY_ALL = False
+
   def __init__(self):
     """Initializes the entropy hasher."""
     super(EntropyHasher, self).__init__()
-    self._byte_frequency_counter = collections.Counter()
     self._file_length = 0
 
+    if numpy:
+      self._byte_histogram = numpy.zeros(256, dtype=numpy.uint64)
+    else:
+      self._byte_histogram = [0] * 256
+
   def GetStringDigest(self):
     """Calculates the byte entropy value.
 
@@ -38,8 +49,8 @@ class EntropyHasher(interface.BaseHasher):
       return '0.000000'
 
     entropy = 0.0
-    for byte_frequency in self._byte_frequency_counter.values():
-      byte_probability = byte_frequency / self._file_length
+    for byte_frequency in self._byte_histogram:
+      byte_probability = int(byte_frequency) / self._file_length
       if byte_probability:
         entropy += - byte_probability * math.log(byte_probability, 2)
     return '{0:.6f}'.format(entropy)
@@ -54,9 +65,20 @@ class EntropyHasher(interface.BaseHasher):
       data(bytes): block of data with which to update the context of the entropy
           calculator.
     """
-    # The call to update() determines the number of occurrences of a byte value
-    # within data.
-    self._byte_frequency_counter.update(data)
+    if numpy:
+      # bincount() determines the number of occurrences of every byte value
+      # within data in a single pass.
+      self._byte_histogram += numpy.bincount(
+          numpy.frombuffer(data, dtype=numpy.uint8),
+          minlength=256).astype(numpy.uint64)
+
+    else:
+      # Counter() counts the byte values within data in C, which is
+      # significantly faster than incrementing the histogram per byte.
+      byte_frequencies = collections.Counter(data)
+      for byte_value, byte_frequency in byte_frequencies.items():
+        self._byte_histogram[byte_value] += byte_frequency
+
     self._file_length += len(data)
 
 
@@ -13,6 +13,10 @@ class BaseHasher(object):
   ATTRIBUTE_NAME = 'hash'
   DESCRIPTION = 'Calculates a digest hash over input data.'
 
+  # Hashers that are expensive to calculate are not enabled by "all" and
+  # need to be selected by name.
+  ENABLED_BY_ALL = True
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def GetStringDigest(self):
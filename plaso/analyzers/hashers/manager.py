@@ -38,8 +38,8 @@ class HashersManager(object):
 
     Args:
       hasher_names_string (str): comma separated names of hashers to enable,
-          the string 'all' to enable all hashers or 'none' to disable all
-          hashers.
+          the string 'all' to enable all hashers, except for those that are
+          only enabled by name, or 'none' to disable all hashers.
 
     Returns:
       list[str]: names of valid hashers from the string, or an empty list if no
@@ -51,7 +51,10 @@ class HashersManager(object):
       return hasher_names
 
     if hasher_names_string.strip() == 'all':
-      return cls.GetHasherNames()
+      return [
+          hasher_name
+          for hasher_name, hasher_class in cls._hasher_classes.items()
+          if hasher_class.ENABLED_BY_ALL]
 
     for hasher_name in hasher_names_string.split(','):
       hasher_name = hasher_name.strip()
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+from concurrent import futures
+
 from plaso.analyzers import interface
 from plaso.analyzers import logger
 from plaso.analyzers import manager
@@ -25,11 +27,35 @@ class HashingAnalyzer(interface.BaseAnalyzer):
 
   INCREMENTAL_ANALYZER = True
 
+  # Minimum size of a block of data that is processed by multiple hashers
+  # concurrently. hashlib releases the GIL while hashing large blocks of data
+  # so the hashers can run in parallel threads.
+  _CONCURRENT_UPDATE_MINIMUM_SIZE = 1024 * 1024
+
   def __init__(self):
     """Initializes a hashing analyzer."""
     super(HashingAnalyzer, self).__init__()
     self._hasher_names_string = ''
     self._hashers = []
+    self._thread_pool = None
+
+  def _UpdateHashersConcurrently(self, data):
+    """Updates the hashers with a block of data in a thread pool.
+
+    Args:
+      data (bytes): block of data from the data stream.
+    """
+    if not self._thread_pool:
+      self._thread_pool = futures.ThreadPoolExecutor(
+          max_workers=len(self._hashers))
+
+    update_futures = [
+        self._thread_pool.submit(hasher.Update, data)
+        for hasher in self._hashers]
+
+    for update_future in update_futures:
+      # result() re-raises any exception raised by the hasher.
+      update_future.result()
 
   def Analyze(self, data):
     """Updates the internal state of the analyzer, processing a block of data.
@@ -40,9 +66,20 @@ class HashingAnalyzer(interface.BaseAnalyzer):
     Args:
       data (bytes): block of data from the data stream.
     """
+    if (len(self._hashers) > 1 and
+        len(data) >= self._CONCURRENT_UPDATE_MINIMUM_SIZE):
+      self._UpdateHashersConcurrently(data)
+      return
+
     for hasher in self._hashers:
       hasher.Update(data)
 
+  def Close(self):
+    """Closes the analyzer and shuts down the threads used for hashing."""
+    if self._thread_pool:
+      self._thread_pool.shutdown()
+      self._thread_pool = None
+
   def GetResults(self):
     """Retrieves the hashing results.
 
@@ -80,5 +117,8 @@ class HashingAnalyzer(interface.BaseAnalyzer):
     self._hashers = hashers_manager.HashersManager.GetHashers(hasher_names)
     self._hasher_names_string = hasher_names_string
 
+    # The number of threads in the pool depends on the number of hashers.
+    self.Close()
+
 
 manager.AnalyzersManager.RegisterAnalyzer(HashingAnalyzer)
@@ -28,6 +28,14 @@ class BaseAnalyzer(object):
       data(bytes): block of data to process.
     """
 
+  def Close(self):
+    """Closes the analyzer.
+
+    Analyzers that hold resources, such as threads, override this method
+    to release them.
+    """
+    return
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def GetResults(self):
@@ -40,3 +48,13 @@ class BaseAnalyzer(object):
   @abc.abstractmethod
   def Reset(self):
     """Resets the internal state of the analyzer."""
+
+  def SetProcessingProfiler(self, processing_profiler):
+    """Sets the processing profiler.
+
+    Analyzers that record detailed timing information override this method.
+
+    Args:
+      processing_profiler (ProcessingProfiler): processing profiler.
+    """
+    return
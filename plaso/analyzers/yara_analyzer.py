@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import re
+
 import yara
 
 from plaso.analyzers import interface
@@ -27,29 +29,146 @@ class YaraAnalyzer(interface.BaseAnalyzer):
   _ATTRIBUTE_NAME = 'yara_match'
   _MATCH_TIMEOUT = 60
 
+  _IMPORT_RE = re.compile(r'^[ \t]*import[ \t]+"[^"]*"', re.MULTILINE)
+
+  _INCLUDE_RE = re.compile(r'^[ \t]*include[ \t]+"', re.MULTILINE)
+
+  _RULE_HEADER_RE = re.compile((
+      r'^[ \t]*((?:(?:global|private)\s+)*)rule\s+'
+      r'([A-Za-z_][A-Za-z0-9_]*)'), re.MULTILINE)
+
   def __init__(self):
     """Initializes the Yara analyzer."""
     super(YaraAnalyzer, self).__init__()
     self._matches = []
+    self._processing_profiler = None
     self._rules = None
+    self._rules_per_identifier = None
+    self._rules_string = None
 
-  def Analyze(self, data):
-    """Analyzes a block of data, attempting to match Yara rules to it.
+  def _CompileRulesPerIdentifier(self, rules_string):
+    """Compiles every rule in the Yara rule definitions individually.
 
     Args:
-      data(bytes): a block of data.
+      rules_string (str): Yara rule definitions.
+
+    Returns:
+      list[tuple[str, yara.Rules]]: identifier and compiled rules of every
+          rule or None if the rules cannot be compiled individually.
+    """
+    rule_definitions = self._SplitRules(rules_string)
+    if not rule_definitions:
+      return None
+
+    rules_per_identifier = []
+    for identifier, rule_definition in rule_definitions:
+      try:
+        rules = yara.compile(source=rule_definition)
+      except yara.Error as exception:
+        # For example if the condition of the rule refers to another rule.
+        logger.debug((
+            'Unable to compile Yara rule: {0:s} individually with error: '
+            '{1!s}').format(identifier, exception))
+        return None
+
+      rules_per_identifier.append((identifier, rules))
+
+    return rules_per_identifier
+
+  def _Match(self, rules, data):
+    """Matches Yara rules against data.
+
+    Args:
+      rules (yara.Rules): compiled Yara rules.
+      data (bytes): data.
+
+    Returns:
+      list[yara.Match]: matches.
     """
-    if not self._rules:
-      return
     try:
-      self._matches = self._rules.match(data=data, timeout=self._MATCH_TIMEOUT)
-    except yara.YaraTimeoutError:
+      return rules.match(data=data, timeout=self._MATCH_TIMEOUT)
+    except yara.TimeoutError:
       logger.error('Could not process file within timeout: {0:d}'.format(
           self._MATCH_TIMEOUT))
-    except yara.YaraError as exception:
+    except yara.Error as exception:
       logger.error('Error processing file with Yara: {0!s}.'.format(
           exception))
 
+    return []
+
+  def _SplitRules(self, rules_string):
+    """Splits Yara rule definitions into definitions of individual rules.
+
+    The rule definitions are split at the rule headers at the start of a line.
+    Text that resembles a rule header, for example in a comment, can result
+    in definitions that do not compile, which is checked when the definitions
+    are compiled.
+
+    Args:
+      rules_string (str): Yara rule definitions.
+
+    Returns:
+      list[tuple[str, str]]: identifier and definition of every rule, where
+          the definition includes the imports of the rule definitions, or
+          None if the rules cannot be split, for example if they contain
+          a global rule, which applies to all other rules.
+    """
+    if self._INCLUDE_RE.search(rules_string):
+      return None
+
+    imports_string = '\n'.join([
+        match.group(0).strip()
+        for match in self._IMPORT_RE.finditer(rules_string)])
+
+    rules_string = self._IMPORT_RE.sub('', rules_string)
+
+    matches = list(self._RULE_HEADER_RE.finditer(rules_string))
+    if not matches:
+      return None
+
+    rule_definitions = []
+    for index, match in enumerate(matches):
+      if 'global' in match.group(1):
+        return None
+
+      if index + 1 < len(matches):
+        end_offset = matches[index + 1].start()
+      else:
+        end_offset = len(rules_string)
+
+      rule_definition = rules_string[match.start():end_offset]
+      rule_definitions.append((
+          match.group(2), '\n'.join([imports_string, rule_definition])))
+
+    return rule_definitions
+
+  def Analyze(self, data):
+    """Analyzes a block of data, attempting to match Yara rules to it.
+
+    The Yara rules are matched against the whole data stream, since the
+    analyzer is not incremental, which ensures strings that would span
+    the boundary of a block of data are matched.
+
+    Args:
+      data(bytes): a block of data.
+    """
+    if not self._rules:
+      return
+
+    if not self._processing_profiler or not self._rules_per_identifier:
+      self._matches = self._Match(self._rules, data)
+      return
+
+    self._matches = []
+    for identifier, rules in self._rules_per_identifier:
+      profile_name = 'yara_rule_{0:s}'.format(identifier)
+
+      self._processing_profiler.StartTiming(profile_name)
+      try:
+        self._matches.extend(self._Match(rules, data))
+      finally:
+        self._processing_profiler.StopTiming(profile_name)
+
   def GetResults(self):
     """Retrieves results of the most recent analysis.
 
@@ -63,10 +182,53 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     result.attribute_value = ','.join(rule_names)
     return [result]
 
+  def LoadRules(self, path, rules_string=None):
+    """Loads compiled rules that the Yara analyzer will use.
+
+    Args:
+      path (str): path of the file that contains the compiled Yara rules.
+      rules_string (Optional[str]): Yara rule definitions from which the
+          rules were compiled, which are used to time individual rules when
+          profiling.
+    """
+    self._rules = yara.load(filepath=path)
+    self._rules_per_identifier = None
+    self._rules_string = rules_string
+
   def Reset(self):
     """Resets the internal state of the analyzer."""
     self._matches = []
 
+  def SaveRules(self, path):
+    """Saves the compiled rules that the Yara analyzer uses.
+
+    Args:
+      path (str): path of the file to save the compiled Yara rules to.
+    """
+    self._rules.save(filepath=path)
+
+  def SetProcessingProfiler(self, processing_profiler):
+    """Sets the processing profiler.
+
+    When profiling, every rule is matched individually so that the time
+    spent per rule is recorded in the processing profiler.
+
+    Args:
+      processing_profiler (ProcessingProfiler): processing profiler.
+    """
+    self._processing_profiler = processing_profiler
+
+    if (processing_profiler and self._rules_string and
+        self._rules_per_identifier is None):
+      self._rules_per_identifier = self._CompileRulesPerIdentifier(
+          self._rules_string)
+
+      if self._rules_per_identifier is None:
+        logger.warning(
+            'Unable to time Yara rules individually, rules cannot be split.')
+        # Prevent repeated attempts to split the rules.
+        self._rules_per_identifier = []
+
   def SetRules(self, rules_string):
     """Sets the rules that the Yara analyzer will use.
 
@@ -74,6 +236,8 @@ class YaraAnalyzer(interface.BaseAnalyzer):
       rules_string(str): Yara rule definitions
     """
     self._rules = yara.compile(source=rules_string)
+    self._rules_per_identifier = None
+    self._rules_string = rules_string
 
 
 manager.AnalyzersManager.RegisterAnalyzer(YaraAnalyzer)
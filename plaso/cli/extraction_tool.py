@@ -55,8 +55,12 @@ class ExtractionTool(
         input_reader=input_reader, output_writer=output_writer)
     self._artifacts_registry = None
     self._buffer_size = 0
+    self._evtx_xml_templates = False
+    self._metrics_port = None
     self._mount_path = None
+    self._ntfs_mft_enumeration = False
     self._operating_system = None
+    self._parse_result_cache_path = None
     self._parser_filter_expression = None
     self._preferred_year = None
     self._presets_file = None
@@ -138,10 +142,15 @@ class ExtractionTool(
     configuration.artifact_filters = self._artifact_filters
     configuration.credentials = self._credential_configurations
     configuration.debug_output = self._debug_mode
+    configuration.event_extraction.evtx_xml_templates = (
+        self._evtx_xml_templates)
     configuration.event_extraction.text_prepend = self._text_prepend
     configuration.extraction.hasher_file_size_limit = (
         self._hasher_file_size_limit)
     configuration.extraction.hasher_names_string = self._hasher_names_string
+    configuration.extraction.ntfs_mft_enumeration = self._ntfs_mft_enumeration
+    configuration.extraction.parse_result_cache_path = (
+        self._parse_result_cache_path)
     configuration.extraction.process_archives = self._process_archives
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
@@ -149,6 +158,7 @@ class ExtractionTool(
     configuration.filter_file = self._filter_file
     configuration.input_source.mount_path = self._mount_path
     configuration.log_filename = self._log_file
+    configuration.metrics_port = self._metrics_port
     configuration.parser_filter_expression = parser_filter_expression
     configuration.preferred_year = self._preferred_year
     configuration.profiling.directory = self._profiling_directory
@@ -183,8 +193,21 @@ class ExtractionTool(
         raise errors.BadConfigOption(
             'Invalid buffer size: {0!s}.'.format(self._buffer_size))
 
+    self._evtx_xml_templates = getattr(options, 'evtx_xml_templates', False)
+
+    self._ntfs_mft_enumeration = getattr(
+        options, 'ntfs_mft_enumeration', False)
+
     self._queue_size = self.ParseNumericOption(options, 'queue_size')
 
+    self._parse_result_cache_path = getattr(
+        options, 'parse_result_cache', None)
+    if self._parse_result_cache_path:
+      dirname = os.path.dirname(os.path.abspath(self._parse_result_cache_path))
+      if not os.path.isdir(dirname):
+        raise errors.BadConfigOption(
+            'No such directory for parse result cache: {0:s}.'.format(dirname))
+
   def _ParseProcessingOptions(self, options):
     """Parses the processing options.
 
@@ -283,6 +306,34 @@ class ExtractionTool(
         action='store', default=0, help=(
             'The buffer size for the output (defaults to 196MiB).'))
 
+    argument_group.add_argument(
+        '--evtx_xml_templates', '--evtx-xml-templates',
+        dest='evtx_xml_templates', action='store_true', default=False, help=(
+            'Store the XML representation of Windows XML EventLog (EVTX) '
+            'records as the values of an XML template per event source and '
+            'identifier, instead of the full XML representation of every '
+            'record, to reduce the size of the storage file. The XML '
+            'representation is rebuilt when the event data is read.'))
+
+    argument_group.add_argument(
+        '--ntfs_mft_enumeration', '--ntfs-mft-enumeration',
+        dest='ntfs_mft_enumeration', action='store_true', default=False, help=(
+            'Enumerate the file entries of NTFS file systems by reading the '
+            'MFT sequentially, instead of traversing the file system one '
+            'directory at a time, which is faster for volumes with a large '
+            'number of files. Filter files and artifact filters are applied '
+            'to the file entries read from the MFT.'))
+
+    argument_group.add_argument(
+        '--parse_result_cache', '--parse-result-cache',
+        dest='parse_result_cache', type=str, action='store', default=None,
+        metavar='PATH', help=(
+            'Path of a parse result cache database file. The events of a '
+            'parsed data stream are stored in the cache by content digest '
+            'and are reused for data streams with the same content, for '
+            'example in Volume Shadow Snapshots or re-imaged systems, '
+            'instead of parsing these again.'))
+
     argument_group.add_argument(
         '--queue_size', '--queue-size', dest='queue_size', action='store',
         default=0, help=(
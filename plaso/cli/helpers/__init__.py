@@ -4,6 +4,7 @@
 from plaso.cli.helpers import analysis_plugins
 from plaso.cli.helpers import artifact_definitions
 from plaso.cli.helpers import artifact_filters
+from plaso.cli.helpers import browser_search_analysis
 from plaso.cli.helpers import data_location
 from plaso.cli.helpers import date_filters
 from plaso.cli.helpers import dynamic_output
@@ -11,10 +12,13 @@ from plaso.cli.helpers import elastic_output
 from plaso.cli.helpers import event_filters
 from plaso.cli.helpers import extraction
 from plaso.cli.helpers import filter_file
+from plaso.cli.helpers import hash_lookup_cache
+from plaso.cli.helpers import hash_set_analysis
 from plaso.cli.helpers import hashers
 from plaso.cli.helpers import language
 from plaso.cli.helpers import nsrlsvr_analysis
 from plaso.cli.helpers import output_modules
+from plaso.cli.helpers import parquet_output
 from plaso.cli.helpers import parsers
 from plaso.cli.helpers import profiling
 from plaso.cli.helpers import process_resources
@@ -26,6 +30,7 @@ from plaso.cli.helpers import tagging_analysis
 from plaso.cli.helpers import temporary_directory
 from plaso.cli.helpers import text_prepend
 from plaso.cli.helpers import timesketch_output
+from plaso.cli.helpers import unique_domains_visited_analysis
 from plaso.cli.helpers import viper_analysis
 from plaso.cli.helpers import virustotal_analysis
 from plaso.cli.helpers import windows_services_analysis
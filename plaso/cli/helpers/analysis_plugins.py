@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import sys
 
+from plaso.analysis import interface as analysis_interface
 from plaso.analysis import manager as analysis_manager
 from plaso.cli import tools
 from plaso.cli.helpers import interface
@@ -50,6 +51,16 @@ class AnalysisPluginsArgumentsHelper(interface.ArgumentsHelper):
       manager.ArgumentHelperManager.AddCommandLineArguments(
           argument_group, category='analysis', names=names)
 
+      # The hash lookup cache arguments apply to all hash analysis plugins.
+      for plugin_name, plugin_class in (
+          analysis_manager.AnalysisPluginManager.GetPlugins()):
+        if plugin_name in names and issubclass(
+            plugin_class, analysis_interface.HashTaggingAnalysisPlugin):
+          manager.ArgumentHelperManager.AddCommandLineArguments(
+              argument_group, category='analysis',
+              names=['hash_lookup_cache'])
+          break
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""The browser search analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.analysis import browser_search
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class BrowserSearchAnalysisArgumentsHelper(interface.ArgumentsHelper):
+  """Browser search analysis plugin CLI arguments helper."""
+
+  NAME = 'browser_search'
+  CATEGORY = 'analysis'
+  DESCRIPTION = 'Argument helper for the browser search analysis plugin.'
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+          argparse group.
+    """
+    argument_group.add_argument(
+        '--browser-search-maximum-in-memory',
+        '--browser_search_maximum_in_memory',
+        dest='browser_search_maximum_in_memory', type=int, action='store',
+        default=0, metavar='NUMBER', help=(
+            'Maximum number of search terms to keep in memory, before they '
+            'are written to the temporary directory. This bounds the memory '
+            'usage of analyzing large numbers of URLs, but the report will '
+            'not contain the search term timeline and will only contain the '
+            'most frequent search terms of every search engine, up to the '
+            'maximum. By default all search terms are kept in memory.'))
+
+  # pylint: disable=arguments-differ
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options.
+      analysis_plugin (BrowserSearchPlugin): analysis plugin to configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when the maximum number of search terms is invalid.
+    """
+    if not isinstance(analysis_plugin, browser_search.BrowserSearchPlugin):
+      raise errors.BadConfigObject(
+          'Analysis plugin is not an instance of BrowserSearchPlugin')
+
+    maximum_in_memory = cls._ParseNumericOption(
+        options, 'browser_search_maximum_in_memory', default_value=0)
+
+    if maximum_in_memory < 0:
+      raise errors.BadConfigOption(
+          'Invalid maximum number of search terms in memory value cannot be '
+          'negative.')
+
+    if maximum_in_memory:
+      temporary_directory = cls._ParseStringOption(
+          options, 'temporary_directory')
+      analysis_plugin.SetMaximumNumberOfSearchTermsInMemory(
+          maximum_in_memory, temporary_directory=temporary_directory)
+
+
+manager.ArgumentHelperManager.RegisterHelper(
+    BrowserSearchAnalysisArgumentsHelper)
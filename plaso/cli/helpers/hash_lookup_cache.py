@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""The hash lookup cache CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.analysis import hash_lookup_cache
+from plaso.analysis import interface as analysis_interface
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class HashLookupCacheArgumentsHelper(interface.ArgumentsHelper):
+  """Hash lookup cache CLI arguments helper."""
+
+  NAME = 'hash_lookup_cache'
+  CATEGORY = 'analysis'
+  DESCRIPTION = 'Argument helper for the hash analysis plugins lookup cache.'
+
+  _DEFAULT_MAXIMUM_AGE = 30
+
+  _SECONDS_PER_DAY = 24 * 60 * 60
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser): group
+          to append arguments to.
+    """
+    argument_group.add_argument(
+        '--hash-lookup-cache', '--hash_lookup_cache',
+        dest='hash_lookup_cache', type=str, action='store', default='',
+        metavar='PATH', help=(
+            'Path of a SQLite database file to cache the results of hash '
+            'lookups in, such that hashes looked up in previous runs are not '
+            'looked up again. The cache can be shared across runs and cases. '
+            'By default no cache is used.'))
+
+    argument_group.add_argument(
+        '--hash-lookup-cache-maximum-age', '--hash_lookup_cache_maximum_age',
+        dest='hash_lookup_cache_maximum_age', type=int, action='store',
+        default=cls._DEFAULT_MAXIMUM_AGE, metavar='DAYS', help=(
+            'Maximum age, in days, of cached hash lookup results, where 0 '
+            'represents no maximum. The default is: {0:d}.').format(
+                cls._DEFAULT_MAXIMUM_AGE))
+
+  # pylint: disable=arguments-differ
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options object.
+      analysis_plugin (HashTaggingAnalysisPlugin): analysis plugin to
+          configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when the maximum age is invalid.
+    """
+    if not isinstance(
+        analysis_plugin, analysis_interface.HashTaggingAnalysisPlugin):
+      raise errors.BadConfigObject(
+          'Analysis plugin is not an instance of HashTaggingAnalysisPlugin')
+
+    path = cls._ParseStringOption(options, 'hash_lookup_cache')
+    if not path:
+      return
+
+    maximum_age = cls._ParseNumericOption(
+        options, 'hash_lookup_cache_maximum_age',
+        default_value=cls._DEFAULT_MAXIMUM_AGE)
+
+    if maximum_age < 0:
+      raise errors.BadConfigOption(
+          'Invalid hash lookup cache maximum age value cannot be negative.')
+
+    if maximum_age:
+      maximum_age *= cls._SECONDS_PER_DAY
+    else:
+      maximum_age = None
+
+    lookup_cache = hash_lookup_cache.HashLookupCache(
+        path, maximum_age=maximum_age)
+    analysis_plugin.SetLookupCache(lookup_cache)
+
+
+manager.ArgumentHelperManager.RegisterHelper(HashLookupCacheArgumentsHelper)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""The hash set analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.analysis import hash_set
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class HashSetAnalysisArgumentsHelper(interface.ArgumentsHelper):
+  """Hash set analysis plugin CLI arguments helper."""
+
+  NAME = 'hash_set'
+  CATEGORY = 'analysis'
+  DESCRIPTION = 'Argument helper for the hash set analysis plugin.'
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser): group
+          to append arguments to.
+    """
+    argument_group.add_argument(
+        '--hash-set-files', '--hash_set_files', dest='hash_set_files',
+        type=str, action='store', default='', metavar='PATHS', help=(
+            'Comma separated paths of the hash set files to look up hashes '
+            'in. Hash set files can be built from text hash lists with '
+            'utils/build_hash_set.py and contain the label that is applied '
+            'to events of files in the hash set. All hash set files must '
+            'contain the same type of hash.'))
+
+  # pylint: disable=arguments-differ
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options object.
+      analysis_plugin (HashSetAnalysisPlugin): analysis plugin to configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when the hash set files are missing or cannot be
+          opened.
+    """
+    if not isinstance(analysis_plugin, hash_set.HashSetAnalysisPlugin):
+      raise errors.BadConfigObject(
+          'Analysis plugin is not an instance of HashSetAnalysisPlugin')
+
+    hash_set_files = cls._ParseStringOption(options, 'hash_set_files')
+    paths = [
+        path.strip() for path in (hash_set_files or '').split(',')
+        if path.strip()]
+
+    if not paths:
+      raise errors.BadConfigOption('Missing hash set files.')
+
+    try:
+      analysis_plugin.OpenHashSetFiles(paths)
+    except (IOError, OSError, ValueError) as exception:
+      raise errors.BadConfigOption(
+          'Unable to open hash set files with error: {0!s}'.format(exception))
+
+
+manager.ArgumentHelperManager.RegisterHelper(HashSetAnalysisArgumentsHelper)
@@ -42,8 +42,9 @@ class HashersArgumentsHelper(interface.ArgumentsHelper):
             'Define a list of hashers to use by the tool. This is a comma '
             'separated list where each entry is the name of a hasher, such as '
             '"md5,sha256". "all" indicates that all hashers should be '
-            'enabled. "none" disables all hashers. Use "--hashers list" or '
-            '"--info" to list the available hashers.'))
+            'enabled, except for "entropy" which is only enabled by name. '
+            '"none" disables all hashers. Use "--hashers list" or "--info" '
+            'to list the available hashers.'))
 
   @classmethod
   def ParseOptions(cls, options, configuration_object):
@@ -33,6 +33,14 @@ class StatusViewArgumentsHelper(interface.ArgumentsHelper):
         metavar='TYPE', default=status_view.StatusView.MODE_WINDOW, help=(
             'The processing status view mode: "linear", "none" or "window".'))
 
+    argument_group.add_argument(
+        '--metrics_port', '--metrics-port', dest='metrics_port', type=int,
+        action='store', metavar='PORT', default=None, help=(
+            'Port of a HTTP endpoint on localhost that exports processing '
+            'metrics, such as the number of events per second per worker, '
+            'in Prometheus text format. Use 0 to select any available port. '
+            'The endpoint is only available when using multiple processes.'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -44,15 +52,23 @@ class StatusViewArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: when the metrics port is out of bounds.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
           'Configuration object is not an instance of CLITool')
 
+    metrics_port = cls._ParseNumericOption(options, 'metrics_port')
+    if metrics_port is not None and (metrics_port < 0 or metrics_port > 65535):
+      raise errors.BadConfigOption(
+          'Invalid metrics port: {0:d} value out of bounds.'.format(
+              metrics_port))
+
     status_view_mode = cls._ParseStringOption(
         options, 'status_view_mode',
         default_value=status_view.StatusView.MODE_WINDOW)
 
+    setattr(configuration_object, '_metrics_port', metrics_port)
     setattr(configuration_object, '_status_view_mode', status_view_mode)
 
 
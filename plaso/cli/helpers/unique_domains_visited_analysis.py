@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""The unique domains visited analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.analysis import unique_domains_visited
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class UniqueDomainsVisitedAnalysisArgumentsHelper(interface.ArgumentsHelper):
+  """Unique domains visited analysis plugin CLI arguments helper."""
+
+  NAME = 'unique_domains_visited'
+  CATEGORY = 'analysis'
+  DESCRIPTION = (
+      'Argument helper for the unique domains visited analysis plugin.')
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+          argparse group.
+    """
+    argument_group.add_argument(
+        '--unique-domains-maximum-in-memory',
+        '--unique_domains_maximum_in_memory',
+        dest='unique_domains_maximum_in_memory', type=int, action='store',
+        default=0, metavar='NUMBER', help=(
+            'Maximum number of domains to keep in memory, before they are '
+            'written to the temporary directory. This bounds the memory '
+            'usage of analyzing large numbers of URLs. By default all '
+            'domains are kept in memory.'))
+
+  # pylint: disable=arguments-differ
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options.
+      analysis_plugin (UniqueDomainsVisitedPlugin): analysis plugin to
+          configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when the maximum number of domains is invalid.
+    """
+    if not isinstance(
+        analysis_plugin, unique_domains_visited.UniqueDomainsVisitedPlugin):
+      raise errors.BadConfigObject(
+          'Analysis plugin is not an instance of UniqueDomainsVisitedPlugin')
+
+    maximum_in_memory = cls._ParseNumericOption(
+        options, 'unique_domains_maximum_in_memory', default_value=0)
+
+    if maximum_in_memory < 0:
+      raise errors.BadConfigOption(
+          'Invalid maximum number of domains in memory value cannot be '
+          'negative.')
+
+    if maximum_in_memory:
+      temporary_directory = cls._ParseStringOption(
+          options, 'temporary_directory')
+      analysis_plugin.SetMaximumNumberOfDomainsInMemory(
+          maximum_in_memory, temporary_directory=temporary_directory)
+
+
+manager.ArgumentHelperManager.RegisterHelper(
+    UniqueDomainsVisitedAnalysisArgumentsHelper)
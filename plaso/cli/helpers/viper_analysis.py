@@ -20,6 +20,7 @@ class ViperAnalysisArgumentsHelper(interface.ArgumentsHelper):
   _DEFAULT_HOST = 'localhost'
   _DEFAULT_PORT = 8080
   _DEFAULT_PROTOCOL = 'http'
+  _DEFAULT_REQUESTERS = 1
 
   @classmethod
   def AddArguments(cls, argument_group):
@@ -64,6 +65,13 @@ class ViperAnalysisArgumentsHelper(interface.ArgumentsHelper):
                 cls._DEFAULT_PROTOCOL, ', '.join(
                     viper.ViperAnalyzer.SUPPORTED_PROTOCOLS)))
 
+    argument_group.add_argument(
+        '--viper-requesters', '--viper_requesters', dest='viper_requesters',
+        type=int, action='store', default=cls._DEFAULT_REQUESTERS,
+        metavar='NUMBER', help=(
+            'Number of requests to make to the Viper server concurrently, '
+            'the default is: {0:d}.').format(cls._DEFAULT_REQUESTERS))
+
   # pylint: disable=arguments-differ
   @classmethod
   # pylint: disable=arguments-differ
@@ -76,7 +84,8 @@ class ViperAnalysisArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the output module object is of the wrong type.
-      BadConfigOption: when unable to connect to Viper instance.
+      BadConfigOption: when the number of requesters is invalid or when
+          unable to connect to Viper instance.
     """
     if not isinstance(analysis_plugin, viper.ViperAnalysisPlugin):
       raise errors.BadConfigObject(
@@ -99,6 +108,14 @@ class ViperAnalysisArgumentsHelper(interface.ArgumentsHelper):
     protocol = protocol.lower().strip()
     analysis_plugin.SetProtocol(protocol)
 
+    number_of_requesters = cls._ParseNumericOption(
+        options, 'viper_requesters', default_value=cls._DEFAULT_REQUESTERS)
+    if number_of_requesters < 1:
+      raise errors.BadConfigOption(
+          'Invalid number of Viper requesters value must be 1 or more.')
+
+    analysis_plugin.SetNumberOfRequesters(number_of_requesters)
+
     if not analysis_plugin.TestConnection():
       raise errors.BadConfigOption(
           'Unable to connect to Viper {0:s}:{1:d}'.format(host, port))
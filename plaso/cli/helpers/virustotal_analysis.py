@@ -20,6 +20,7 @@ class VirusTotalAnalysisArgumentsHelper(interface.ArgumentsHelper):
 
   _DEFAULT_HASH = 'sha256'
   _DEFAULT_RATE_LIMIT = True
+  _DEFAULT_REQUESTERS = 1
 
   @classmethod
   def AddArguments(cls, argument_group):
@@ -53,6 +54,15 @@ class VirusTotalAnalysisArgumentsHelper(interface.ArgumentsHelper):
             'Type of hash to query VirusTotal, the default is: {0:s}'.format(
                 cls._DEFAULT_HASH)))
 
+    argument_group.add_argument(
+        '--virustotal-requesters', '--virustotal_requesters',
+        dest='virustotal_requesters', type=int, action='store',
+        default=cls._DEFAULT_REQUESTERS, metavar='NUMBER', help=(
+            'Number of requests to make to VirusTotal concurrently, the '
+            'default is: {0:d}. Only useful with a key for the private '
+            'API, since the free API key rate limit applies to all '
+            'requests.').format(cls._DEFAULT_REQUESTERS))
+
   @classmethod
   def ParseOptions(cls, options, analysis_plugin):
     """Parses and validates options.
@@ -87,6 +97,15 @@ class VirusTotalAnalysisArgumentsHelper(interface.ArgumentsHelper):
         options, 'virustotal_hash', default_value=cls._DEFAULT_HASH)
     analysis_plugin.SetLookupHash(lookup_hash)
 
+    number_of_requesters = cls._ParseNumericOption(
+        options, 'virustotal_requesters',
+        default_value=cls._DEFAULT_REQUESTERS)
+    if number_of_requesters < 1:
+      raise errors.BadConfigOption(
+          'Invalid number of VirusTotal requesters value must be 1 or more.')
+
+    analysis_plugin.SetNumberOfRequesters(number_of_requesters)
+
     if not analysis_plugin.TestConnection():
       raise errors.BadConfigOption('Unable to connect to VirusTotal')
 
@@ -83,10 +83,14 @@ class PsortTool(
     self._event_filter_expression = None
     self._event_filter = None
     self._formatters_file = None
+    self._incremental_export = False
+    self._inline_analysis = False
     self._knowledge_base = knowledge_base.KnowledgeBase()
+    self._metrics_port = None
     self._number_of_analysis_reports = 0
     self._preferred_language = 'en-US'
     self._process_memory_limit = None
+    self._sort_memory_limit = None
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._stdout_output_writer = isinstance(
@@ -269,6 +273,16 @@ class PsortTool(
 
     self._worker_memory_limit = worker_memory_limit
 
+    self._inline_analysis = getattr(options, 'inline_analysis', False)
+
+    sort_memory_limit = getattr(options, 'sort_memory_limit', None)
+
+    if sort_memory_limit and sort_memory_limit < 0:
+      raise errors.BadConfigOption(
+          'Invalid sort memory limit value cannot be negative.')
+
+    self._sort_memory_limit = sort_memory_limit
+
   def _PrintAnalysisReportsDetails(self, storage_reader):
     """Prints the details of the analysis reports.
 
@@ -308,6 +322,34 @@ class PsortTool(
           'Unable to read event formatters from file with error: {0!s}'.format(
               exception))
 
+  def _WriteExportWatermark(self, session, watermark):
+    """Writes the export watermark to the storage file.
+
+    Args:
+      session (Session): session.
+      watermark (int): event watermark of the exported events.
+
+    Raises:
+      BadConfigOption: if the storage file cannot be opened with write access.
+      RuntimeError: if the export watermark cannot be written.
+    """
+    storage_writer = storage_factory.StorageFactory.CreateStorageWriterForFile(
+        session, self._storage_file_path)
+    if not storage_writer:
+      raise errors.BadConfigOption(
+          'Format of storage file: {0:s} not supported for writing'.format(
+              self._storage_file_path))
+
+    try:
+      storage_writer.Open()
+      storage_writer.WriteExportWatermark(watermark)
+      storage_writer.Close()
+
+    except (IOError, OSError) as exception:
+      raise RuntimeError(
+          'Unable to write export watermark with error: {0!s}'.format(
+              exception))
+
   def AddProcessingOptions(self, argument_group):
     """Adds processing options to the argument group
 
@@ -320,6 +362,26 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
         argument_group, names=argument_helper_names)
 
+    argument_group.add_argument(
+        '--inline-analysis', '--inline_analysis', dest='inline_analysis',
+        action='store_true', default=False, help=(
+            'Run analysis plugins that do little work per event, such as '
+            'tagging and sessionize, in the main process instead of in '
+            'a separate analysis process per plugin. These plugins share '
+            'a single storage writer and examine the events while they are '
+            'read from the storage file.'))
+
+    argument_group.add_argument(
+        '--sort-memory-limit', '--sort_memory_limit',
+        dest='sort_memory_limit', action='store', type=int,
+        metavar='SIZE', help=(
+            'Maximum amount of memory in bytes used to sort events before '
+            'they are exported. If set, events are sorted in chunks that are '
+            'written to the temporary directory and merged, instead of being '
+            'sorted by SQLite, which allows exporting storage files with more '
+            'events than fit in memory. By default events are sorted by '
+            'SQLite.'))
+
     argument_group.add_argument(
         '--worker-memory-limit', '--worker_memory_limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -386,6 +448,14 @@ class PsortTool(
             'output. This parameter changes that behavior so all events '
             'are included.'))
 
+    output_group.add_argument(
+        '--incremental', dest='incremental', action='store_true',
+        default=False, help=(
+            'Only export the events that were added to the storage file, '
+            'for example by a subsequent log2timeline session, since the '
+            'last incremental export. The export watermark is recorded in '
+            'the storage file.'))
+
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
         output_group, names=['language'])
 
@@ -492,6 +562,12 @@ class PsortTool(
 
     self._deduplicate_events = getattr(options, 'dedup', True)
 
+    self._incremental_export = getattr(options, 'incremental', False)
+    if self._incremental_export and self._time_slice:
+      raise errors.BadConfigOption(
+          'Incremental export and time slice cannot be used at the same '
+          'time.')
+
     if self._data_location:
       # Update the data location with the calculated value.
       options.data_location = self._data_location
@@ -549,9 +625,13 @@ class PsortTool(
 
     configuration = configurations.ProcessingConfiguration()
     configuration.data_location = self._data_location
+    configuration.inline_analysis = self._inline_analysis
+    configuration.metrics_port = self._metrics_port
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.sample_rate = self._profiling_sample_rate
     configuration.profiling.profilers = self._profilers
+    configuration.sort_memory_limit = self._sort_memory_limit
+    configuration.temporary_directory = self._temporary_directory
 
     analysis_counter = None
     if self._analysis_plugins:
@@ -583,6 +663,12 @@ class PsortTool(
           storage_factory.StorageFactory.CreateStorageReaderForFile(
               self._storage_file_path))
 
+      event_watermark = None
+      export_watermark = None
+      if self._incremental_export:
+        event_watermark = storage_reader.GetEventWatermark()
+        export_watermark = storage_reader.GetExportWatermark()
+
       # TODO: add single processing support.
       analysis_engine = psort.PsortMultiProcessEngine()
 
@@ -591,7 +677,13 @@ class PsortTool(
           configuration, deduplicate_events=self._deduplicate_events,
           event_filter=self._event_filter,
           status_update_callback=status_update_callback,
-          time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
+          time_slice=self._time_slice, use_time_slicer=self._use_time_slicer,
+          watermark=export_watermark)
+
+      if self._incremental_export:
+        storage_reader.Close()
+
+        self._WriteExportWatermark(session, event_watermark)
 
     if self._quiet_mode:
       return
@@ -256,12 +256,52 @@ class StatusView(object):
       # We need to explicitly flush stdout to prevent partial status updates.
       sys.stdout.flush()
 
+  def _PrintDataStreamReadStatus(self, processing_status):
+    """Prints the number of bytes read per byte of the data streams.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+    """
+    workers_status = [
+        worker_status for worker_status in processing_status.workers_status
+        if worker_status.number_of_data_stream_bytes]
+    if not workers_status:
+      return
+
+    table_view = views.CLITabularTableView(
+        column_names=['Identifier', 'Evidence', 'Read', 'Ratio'],
+        column_sizes=[15, 15, 15, 0])
+
+    for worker_status in workers_status:
+      read_ratio = '{0:.2f}'.format(
+          float(worker_status.number_of_bytes_read) /
+          worker_status.number_of_data_stream_bytes)
+
+      table_view.AddRow([
+          worker_status.identifier,
+          self._FormatSizeInUnitsOf1024(
+              worker_status.number_of_data_stream_bytes),
+          self._FormatSizeInUnitsOf1024(worker_status.number_of_bytes_read),
+          read_ratio])
+
+    table_view.Write(self._output_writer)
+    self._output_writer.Write('\n')
+
   def _PrintExtractionStatusUpdateLinear(self, processing_status):
     """Prints an extraction status update in linear mode.
 
     Args:
       processing_status (ProcessingStatus): processing status.
     """
+    for source_status in processing_status.sources_status or []:
+      if source_status.status == definitions.STATUS_INDICATOR_COLLECTING:
+        status_line = (
+            '{0:s} - sources collected: {1:d} - source: {2:s}\n').format(
+                source_status.identifier,
+                source_status.number_of_produced_sources,
+                source_status.display_name)
+        self._output_writer.Write(status_line)
+
     for worker_status in processing_status.workers_status:
       status_line = (
           '{0:s} (PID: {1:d}) - events produced: {2:d} - file: {3:s} '
@@ -300,6 +340,9 @@ class StatusView(object):
     table_view.Write(self._output_writer)
     self._output_writer.Write('\n')
 
+    self._PrintSourcesStatus(processing_status)
+    self._PrintDataStreamReadStatus(processing_status)
+
     if processing_status.aborted:
       self._output_writer.Write(
           'Processing aborted - waiting for clean up.\n\n')
@@ -333,6 +376,18 @@ class StatusView(object):
       self._output_writer.Write('\n')
       table_view.Write(self._output_writer)
 
+      if events_status.number_of_sorted_events:
+        table_view = views.CLITabularTableView(
+            column_names=['Sorting:', 'Sorted', 'Runs'],
+            column_sizes=[15, 15, 0])
+
+        table_view.AddRow([
+            '', events_status.number_of_sorted_events,
+            events_status.number_of_sort_runs])
+
+        self._output_writer.Write('\n')
+        table_view.Write(self._output_writer)
+
   def _PrintProcessingTime(self, processing_status):
     """Prints the processing time.
 
@@ -358,6 +413,26 @@ class StatusView(object):
         'Processing time\t\t: {0:s}{1:02d}:{2:02d}:{3:02d}\n'.format(
             days_string, hours, minutes, seconds))
 
+  def _PrintSourcesStatus(self, processing_status):
+    """Prints the collection status of the sources.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+    """
+    if processing_status and processing_status.sources_status:
+      table_view = views.CLITabularTableView(
+          column_names=['Identifier', 'Status', 'Sources', 'Source'],
+          column_sizes=[15, 15, 15, 0])
+
+      for source_status in processing_status.sources_status:
+        table_view.AddRow([
+            source_status.identifier, source_status.status,
+            '{0:d}'.format(source_status.number_of_produced_sources),
+            source_status.display_name])
+
+      table_view.Write(self._output_writer)
+      self._output_writer.Write('\n')
+
   def _PrintTasksStatus(self, processing_status):
     """Prints the status of the tasks.
 
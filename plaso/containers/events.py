@@ -7,6 +7,7 @@ import re
 
 from plaso.containers import interface
 from plaso.containers import manager
+from plaso.lib import definitions
 from plaso.lib import py2to3
 
 
@@ -28,10 +29,112 @@ class EventData(interface.AttributeContainer):
       data_type (Optional[str]): event data type indicator.
     """
     super(EventData, self).__init__()
+    self._attribute_value_deserializer = None
+    self._serialized_attributes = None
     self.data_type = data_type
     self.offset = None
     self.query = None
 
+  def __getattr__(self, attribute_name):
+    """Retrieves an attribute that has not been deserialized yet.
+
+    This method is only called when the attribute was not found by
+    the regular attribute lookup.
+
+    Args:
+      attribute_name (str): attribute name.
+
+    Returns:
+      object: attribute value.
+
+    Raises:
+      AttributeError: if the attribute is not defined.
+    """
+    serialized_attributes = self.__dict__.get('_serialized_attributes', None)
+    if not serialized_attributes or attribute_name not in serialized_attributes:
+      raise AttributeError('{0:s} has no attribute: {1:s}'.format(
+          type(self).__name__, attribute_name))
+
+    return self._DeserializeAttribute(attribute_name)
+
+  def _DeserializeAttribute(self, attribute_name):
+    """Deserializes an attribute and stores its value in the container.
+
+    Args:
+      attribute_name (str): attribute name.
+
+    Returns:
+      object: attribute value.
+    """
+    serialized_value = self._serialized_attributes.pop(attribute_name)
+    attribute_value = self._attribute_value_deserializer(serialized_value)
+    setattr(self, attribute_name, attribute_value)
+    return attribute_value
+
+  def _DeserializeAttributes(self):
+    """Deserializes all attributes that have not been deserialized yet."""
+    if not self._serialized_attributes:
+      return
+
+    for attribute_name in list(self._serialized_attributes.keys()):
+      # An attribute set after deserialization takes precedence over its
+      # serialized value.
+      if attribute_name in self.__dict__:
+        del self._serialized_attributes[attribute_name]
+      else:
+        self._DeserializeAttribute(attribute_name)
+
+  def GetAttributeNames(self):
+    """Retrieves the names of all attributes.
+
+    Returns:
+      list[str]: attribute names.
+    """
+    self._DeserializeAttributes()
+    return super(EventData, self).GetAttributeNames()
+
+  def GetAttributes(self):
+    """Retrieves the attribute names and values.
+
+    Attributes that are set to None are ignored.
+
+    Yields:
+      tuple[str, object]: attribute name and value.
+    """
+    self._DeserializeAttributes()
+    return super(EventData, self).GetAttributes()
+
+  def GetAttributeValuesString(self):
+    """Retrieves a comparable string of the attribute values.
+
+    Returns:
+      str: comparable string of the attribute values.
+    """
+    self._DeserializeAttributes()
+    return super(EventData, self).GetAttributeValuesString()
+
+  def SetSerializedAttributes(
+      self, serialized_attributes, attribute_value_deserializer):
+    """Sets attributes that are deserialized on first access.
+
+    Deferring deserialization allows consumers that only need a few
+    attributes, such as event filters, to skip expensive conversions,
+    for example of path specifications.
+
+    Args:
+      serialized_attributes (dict[str, object]): serialized attribute values
+          per name.
+      attribute_value_deserializer (function): function to deserialize
+          a serialized attribute value.
+    """
+    for attribute_name in serialized_attributes.keys():
+      # Remove the default value so that the attribute lookup falls back
+      # to __getattr__.
+      self.__dict__.pop(attribute_name, None)
+
+    self._attribute_value_deserializer = attribute_value_deserializer
+    self._serialized_attributes = serialized_attributes
+
 
 class EventObject(interface.AttributeContainer):
   """Event attribute container.
@@ -60,6 +163,25 @@ class EventObject(interface.AttributeContainer):
   # has a data type not the event itself.
   DATA_TYPE = None
 
+  # Attributes that are set on every event are stored in slots instead of
+  # the instance dictionary to reduce the memory usage of an event. The
+  # event_data_row_identifier and parser attributes are not set by default.
+  __slots__ = (
+      '_event_data_identifier', '_timestamp_desc', 'data_type',
+      'display_name', 'event_data_row_identifier', 'filename', 'hostname',
+      'inode', 'offset', 'parser', 'pathspec', 'tag', 'timestamp')
+
+  _SLOT_ATTRIBUTE_NAMES = (
+      'data_type', 'display_name', 'event_data_row_identifier', 'filename',
+      'hostname', 'inode', 'offset', 'parser', 'pathspec', 'tag', 'timestamp')
+
+  # Known timestamp descriptions are stored as a small integer code.
+  _TIME_DESCRIPTIONS = tuple(sorted(definitions.TIME_DESCRIPTIONS))
+
+  _TIME_DESCRIPTION_CODES = {
+      time_description: code
+      for code, time_description in enumerate(_TIME_DESCRIPTIONS)}
+
   def __init__(self):
     """Initializes an event attribute container."""
     super(EventObject, self).__init__()
@@ -98,6 +220,41 @@ class EventObject(interface.AttributeContainer):
     """
     return self.timestamp < other.timestamp
 
+  @property
+  def timestamp_desc(self):
+    """str: description of the meaning of the timestamp."""
+    timestamp_desc = self._timestamp_desc
+    if isinstance(timestamp_desc, int):
+      return self._TIME_DESCRIPTIONS[timestamp_desc]
+    return timestamp_desc
+
+  @timestamp_desc.setter
+  def timestamp_desc(self, value):
+    """Sets the description of the meaning of the timestamp.
+
+    Args:
+      value (str): description of the meaning of the timestamp.
+    """
+    self._timestamp_desc = self._TIME_DESCRIPTION_CODES.get(value, value)
+
+  def _GetAttributeItems(self):
+    """Retrieves the attribute names and values including protected ones.
+
+    Yields:
+      tuple[str, object]: attribute name and value.
+    """
+    for attribute_name in self._SLOT_ATTRIBUTE_NAMES:
+      try:
+        yield attribute_name, getattr(self, attribute_name)
+      except AttributeError:
+        # Slots that are not set are ignored.
+        pass
+
+    yield 'timestamp_desc', self.timestamp_desc
+
+    for attribute_name, attribute_value in self.__dict__.items():
+      yield attribute_name, attribute_value
+
   def GetEventDataIdentifier(self):
     """Retrieves the identifier of the event data associated with the event.
 
@@ -250,6 +407,18 @@ class EventTag(interface.AttributeContainer):
     """
     return self._event_identifier
 
+  @classmethod
+  def IsValidLabel(cls, label):
+    """Determines if a label is valid.
+
+    Args:
+      label (str): label.
+
+    Returns:
+      bool: True if the label is valid.
+    """
+    return bool(cls._VALID_LABEL_REGEX.match(label))
+
   def SetEventIdentifier(self, event_identifier):
     """Sets the identifier of the event associated with the event tag.
 
@@ -262,5 +431,59 @@ class EventTag(interface.AttributeContainer):
     self._event_identifier = event_identifier
 
 
+class EventTagInterval(interface.AttributeContainer):
+  """Event tag interval attribute container.
+
+  An event tag interval applies labels to all events with a timestamp within
+  the interval, instead of storing an event tag for every event.
+
+  Attributes:
+    comment (str): comments.
+    end_timestamp (int): timestamp of the end of the interval, inclusive,
+        which contains the number of micro seconds since January 1, 1970,
+        00:00:00 UTC.
+    labels (list[str]): labels, such as "session_1".
+    start_timestamp (int): timestamp of the start of the interval, inclusive,
+        which contains the number of micro seconds since January 1, 1970,
+        00:00:00 UTC.
+  """
+  CONTAINER_TYPE = 'event_tag_interval'
+
+  def __init__(self, comment=None, end_timestamp=None, start_timestamp=None):
+    """Initializes an event tag interval attribute container.
+
+    Args:
+      comment (Optional[str]): comments.
+      end_timestamp (Optional[int]): timestamp of the end of the interval,
+          inclusive.
+      start_timestamp (Optional[int]): timestamp of the start of the interval,
+          inclusive.
+    """
+    super(EventTagInterval, self).__init__()
+    self.comment = comment
+    self.end_timestamp = end_timestamp
+    self.labels = []
+    self.start_timestamp = start_timestamp
+
+  def AddLabels(self, labels):
+    """Adds labels to the event tag interval.
+
+    Args:
+      labels (list[str]): labels.
+
+    Raises:
+      ValueError: if a label is malformed.
+    """
+    for label in labels:
+      if not EventTag.IsValidLabel(label):
+        raise ValueError((
+            'Unsupported label: "{0:s}". A label must only consist of '
+            'alphanumeric characters or underscores.').format(label))
+
+    for label in labels:
+      if label not in self.labels:
+        self.labels.append(label)
+
+
 manager.AttributeContainersManager.RegisterAttributeContainers([
-    EventData, EventObject, EventTag])
+    EventData, EventObject, EventTag, EventTagInterval])
@@ -42,12 +42,25 @@ class AttributeContainer(object):
   """
   CONTAINER_TYPE = None
 
+  # The instance dictionary is retained for attributes that are defined at
+  # runtime. Subclasses can define additional slots for attributes that are
+  # set on every instance to reduce memory usage.
+  __slots__ = ('__dict__', '_identifier', '_session_identifier')
+
   def __init__(self):
     """Initializes an attribute container."""
     super(AttributeContainer, self).__init__()
-    self._identifier = AttributeContainerIdentifier()
+    self._identifier = None
     self._session_identifier = None
 
+  def _GetAttributeItems(self):
+    """Retrieves the attribute names and values including protected ones.
+
+    Returns:
+      iterator[tuple[str, object]]: attribute name and value.
+    """
+    return iter(self.__dict__.items())
+
   def CopyFromDict(self, attributes):
     """Copies the attribute container from a dictionary.
 
@@ -77,7 +90,7 @@ class AttributeContainer(object):
       list[str]: attribute names.
     """
     attribute_names = []
-    for attribute_name in iter(self.__dict__.keys()):
+    for attribute_name, _ in self._GetAttributeItems():
       # Not using startswith to improve performance.
       if attribute_name[0] == '_':
         continue
@@ -93,7 +106,7 @@ class AttributeContainer(object):
     Yields:
       tuple[str, object]: attribute name and value.
     """
-    for attribute_name, attribute_value in iter(self.__dict__.items()):
+    for attribute_name, attribute_value in self._GetAttributeItems():
       # Not using startswith to improve performance.
       if attribute_name[0] == '_' or attribute_value is None:
         continue
@@ -115,7 +128,7 @@ class AttributeContainer(object):
       str: comparable string of the attribute values.
     """
     attributes = []
-    for attribute_name, attribute_value in sorted(self.__dict__.items()):
+    for attribute_name, attribute_value in sorted(self._GetAttributeItems()):
       # Not using startswith to improve performance.
       if attribute_name[0] == '_' or attribute_value is None:
         continue
@@ -139,6 +152,10 @@ class AttributeContainer(object):
     Returns:
       AttributeContainerIdentifier: an unique identifier for the container.
     """
+    # The identifier is created on demand since most containers are assigned
+    # a storage specific identifier.
+    if not self._identifier:
+      self._identifier = AttributeContainerIdentifier()
     return self._identifier
 
   def GetSessionIdentifier(self):
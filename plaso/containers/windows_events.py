@@ -4,6 +4,9 @@
 from __future__ import unicode_literals
 
 from plaso.containers import events
+from plaso.containers import interface
+from plaso.containers import manager
+from plaso.lib import py2to3
 
 
 class WindowsDistributedLinkTrackingEventData(events.EventData):
@@ -46,6 +49,66 @@ class WindowsDistributedLinkTrackingEventData(events.EventData):
     self.uuid = '{0!s}'.format(uuid)
 
 
+class WindowsEventLogXMLTemplate(interface.AttributeContainer):
+  """Windows XML EventLog (EVTX) XML template attribute container.
+
+  An XML template contains the XML representation of event records of
+  a specific event source and identifier, where the element text and
+  attribute values are replaced by str.format() replacement fields.
+  It allows the event data of an event record to store the values of
+  the replacement fields instead of the full XML representation.
+
+  Attributes:
+    event_identifier (int): event identifier.
+    identifier (str): identifier of the XML template, which is a digest
+        of the event source, event identifier and XML skeleton.
+    source_name (str): name of the event source.
+    xml_skeleton (str): XML representation of the event records, where
+        the element text and attribute values are replaced by str.format()
+        replacement fields.
+  """
+  CONTAINER_TYPE = 'windows_eventlog_xml_template'
+
+  def __init__(
+      self, event_identifier=None, identifier=None, source_name=None,
+      xml_skeleton=None):
+    """Initializes a Windows XML EventLog (EVTX) XML template.
+
+    Args:
+      event_identifier (Optional[int]): event identifier.
+      identifier (Optional[str]): identifier of the XML template.
+      source_name (Optional[str]): name of the event source.
+      xml_skeleton (Optional[str]): XML representation of the event records,
+          where the element text and attribute values are replaced by
+          str.format() replacement fields.
+    """
+    super(WindowsEventLogXMLTemplate, self).__init__()
+    self.event_identifier = event_identifier
+    self.identifier = identifier
+    self.source_name = source_name
+    self.xml_skeleton = xml_skeleton
+
+  def FormatXMLString(self, values, strings=None):
+    """Formats the XML representation of an event record.
+
+    Args:
+      values (list[int|str]): values of the replacement fields, where
+          an integer value is the index of an event string.
+      strings (Optional[list[str]]): event strings.
+
+    Returns:
+      str: XML representation of the event record.
+
+    Raises:
+      IndexError: if a value refers to an event string that is not
+          available.
+    """
+    values = [
+        strings[value] if isinstance(value, py2to3.INTEGER_TYPES) else value
+        for value in values]
+    return self.xml_skeleton.format(*values)
+
+
 class WindowsRegistryEventData(events.EventData):
   """Windows Registry event data attribute container.
 
@@ -81,3 +144,7 @@ class WindowsVolumeEventData(events.EventData):
     # TODO: replace origin with something machine readable.
     self.origin = None
     self.serial_number = None
+
+
+manager.AttributeContainersManager.RegisterAttributeContainer(
+    WindowsEventLogXMLTemplate)
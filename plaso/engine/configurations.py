@@ -37,6 +37,8 @@ class EventExtractionConfiguration(interface.AttributeContainer):
   These settings are primarily used by the parser mediator.
 
   Attributes:
+    evtx_xml_templates (bool): True if the XML representation of Windows
+        XML EventLog (EVTX) records should be stored as XML templates.
     filter_object (objectfilter.Filter): filter that specifies which
         events to include.
     text_prepend (str): text to prepend to every event.
@@ -46,6 +48,7 @@ class EventExtractionConfiguration(interface.AttributeContainer):
   def __init__(self):
     """Initializes an event extraction configuration object."""
     super(EventExtractionConfiguration, self).__init__()
+    self.evtx_xml_templates = False
     self.filter_object = None
     self.text_prepend = None
 
@@ -60,10 +63,18 @@ class ExtractionConfiguration(interface.AttributeContainer):
         should process, where 0 or None represents unlimited.
     hasher_names_string (str): comma separated string of names
         of hashers to use during processing.
+    ntfs_mft_enumeration (bool): True if the file entries of NTFS file
+        systems should be enumerated from the MFT instead of by traversing
+        directories.
+    parse_result_cache_path (str): path of the parse result cache database
+        file, where None represents no parse result cache.
     process_archives (bool): True if archive files should be
         scanned for file entries.
     process_compressed_streams (bool): True if file content in
         compressed streams should be processed.
+    yara_rules_path (str): path of the file containing the Yara rules
+        compiled from the Yara rule definitions, where None represents
+        the rules should be compiled from the definitions.
     yara_rules_string (str): Yara rule definitions.
   """
   CONTAINER_TYPE = 'extraction_configuration'
@@ -73,8 +84,11 @@ class ExtractionConfiguration(interface.AttributeContainer):
     super(ExtractionConfiguration, self).__init__()
     self.hasher_file_size_limit = None
     self.hasher_names_string = None
+    self.ntfs_mft_enumeration = False
+    self.parse_result_cache_path = None
     self.process_archives = False
     self.process_compressed_streams = True
+    self.yara_rules_path = None
     self.yara_rules_string = None
 
 
@@ -191,13 +205,21 @@ class ProcessingConfiguration(interface.AttributeContainer):
         configuration.
     extraction (ExtractionConfiguration): extraction configuration.
     filter_file (str): path to a file with find specifications.
+    inline_analysis (bool): True if analysis plugins that support it should
+        run inline in the main process instead of in an analysis process.
     input_source (InputSourceConfiguration): input source configuration.
     log_filename (str): name of the log file.
+    metrics_port (int): port of the HTTP endpoint on localhost that exports
+        processing metrics, where None represents no endpoint and 0 any
+        available port.
     parser_filter_expression (str): parser filter expression,
         where None represents all parsers and plugins.
     preferred_year (int): preferred initial year value for year-less date and
         time values.
     profiling (ProfilingConfiguration): profiling configuration.
+    sort_memory_limit (int): maximum amount of memory, in bytes, used to sort
+        events in external memory, where None represents sorting by
+        the storage.
     task_storage_format (str): format to use for storing task results.
     temporary_directory (str): path of the directory for temporary files.
   """
@@ -213,10 +235,13 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.event_extraction = EventExtractionConfiguration()
     self.extraction = ExtractionConfiguration()
     self.filter_file = None
+    self.inline_analysis = False
     self.input_source = InputSourceConfiguration()
     self.log_filename = None
+    self.metrics_port = None
     self.parser_filter_expression = None
     self.preferred_year = None
     self.profiling = ProfilingConfiguration()
+    self.sort_memory_limit = None
     self.task_storage_format = None
     self.temporary_directory = None
@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+"""Reader that reads a data stream once for analyzers and parsers."""
+
+from __future__ import unicode_literals
+
+import os
+
+
+class BufferedDataStreamFileObject(object):
+  """File-like object of a data stream that is buffered in memory.
+
+  The data is read from the buffer of the data stream reader, which reads
+  the data stream into the buffer as far as it has been read.
+  """
+
+  def __init__(self, data_stream_reader):
+    """Initializes a buffered data stream file-like object.
+
+    Args:
+      data_stream_reader (DataStreamReader): data stream reader that
+          maintains the buffer of the data stream.
+    """
+    super(BufferedDataStreamFileObject, self).__init__()
+    self._current_offset = 0
+    self._data_stream_reader = data_stream_reader
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def close(self):
+    """Closes the file-like object."""
+    return
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+
+    Raises:
+      IOError: if the data stream is not buffered.
+      OSError: if the data stream is not buffered.
+    """
+    return self._data_stream_reader.GetBufferedDataSize()
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if size is not None and size < 0:
+      raise IOError('Invalid size value smaller than zero.')
+
+    data_size = self._data_stream_reader.GetBufferedDataSize()
+    if self._current_offset >= data_size:
+      return b''
+
+    if size is None or self._current_offset + size > data_size:
+      size = data_size - self._current_offset
+
+    data = self._data_stream_reader.ReadBufferedData(
+        self._current_offset, size)
+    self._current_offset += len(data)
+
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._data_stream_reader.GetBufferedDataSize()
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def seekable(self):
+    """Determines if a file-like object is seekable.
+
+    Returns:
+      bool: True since a buffered data stream is seekable.
+    """
+    return True
+
+  def tell(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+
+class ReadCountingFileObject(object):
+  """File-like object that counts the number of bytes read from a data stream.
+  """
+
+  def __init__(self, file_object, data_stream_reader):
+    """Initializes a read counting file-like object.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object of the data stream.
+      data_stream_reader (DataStreamReader): data stream reader that
+          maintains the number of bytes read.
+    """
+    super(ReadCountingFileObject, self).__init__()
+    self._data_stream_reader = data_stream_reader
+    self._file_object = file_object
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def close(self):
+    """Closes the file-like object."""
+    self._file_object.close()
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._file_object.get_offset()
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    return self._file_object.get_size()
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    data = self._file_object.read(size)
+    self._data_stream_reader.number_of_bytes_read += len(data)
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
+    """
+    self._file_object.seek(offset, whence)
+
+  def seekable(self):
+    """Determines if a file-like object is seekable.
+
+    Returns:
+      bool: True if the file-like object is seekable.
+    """
+    return self._file_object.seekable()
+
+  def tell(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._file_object.get_offset()
+
+
+class DataStreamReader(object):
+  """Reader that reads a data stream once for analyzers and parsers.
+
+  A data stream with a size up to the maximum buffer size is buffered in
+  memory. The data stream is read into the buffer when, and as far as,
+  a reader, such as the analyzers, the signature scanner or the parsers,
+  reads the data. Subsequent readers read the buffered data instead of
+  the data stream. Larger data streams are read from the data stream by
+  every reader.
+
+  Attributes:
+    number_of_bytes_read (int): number of bytes read from the data streams.
+    number_of_data_stream_bytes (int): number of bytes of the data streams
+        that were read.
+  """
+
+  # The default maximum size of a data stream that is buffered in memory.
+  _DEFAULT_MAXIMUM_BUFFER_SIZE = 64 * 1024 * 1024
+
+  # The minimum number of bytes to read at once when buffering a data stream.
+  _READ_BUFFER_SIZE = 4 * 1024 * 1024
+
+  def __init__(self, maximum_buffer_size=None):
+    """Initializes a data stream reader.
+
+    Args:
+      maximum_buffer_size (Optional[int]): maximum size of a data stream
+          that is buffered in memory, where None represents the default
+          of 64 MiB and 0 disables buffering.
+    """
+    if maximum_buffer_size is None:
+      maximum_buffer_size = self._DEFAULT_MAXIMUM_BUFFER_SIZE
+
+    super(DataStreamReader, self).__init__()
+    self._buffer = None
+    self._buffered_data_size = 0
+    self._data_size = 0
+    self._data_stream_name = None
+    self._data_stream_read = False
+    self._file_entry = None
+    self._file_object = None
+    self._maximum_buffer_size = maximum_buffer_size
+
+    self.number_of_bytes_read = 0
+    self.number_of_data_stream_bytes = 0
+
+  def _ReadIntoBuffer(self, end_offset):
+    """Reads the data stream into the buffer up to an offset.
+
+    Args:
+      end_offset (int): offset up to which the data stream is buffered.
+    """
+    # The data stream is read in blocks of at least the read buffer size
+    # to limit the number of reads of small sizes.
+    end_offset = min(
+        max(end_offset, self._buffered_data_size + self._READ_BUFFER_SIZE),
+        self._data_size)
+
+    while self._buffered_data_size < end_offset:
+      data = self._file_object.read(end_offset - self._buffered_data_size)
+      if not data:
+        # The data stream is smaller than its size indicated.
+        self._data_size = self._buffered_data_size
+        break
+
+      data_size = len(data)
+      buffer_end_offset = self._buffered_data_size + data_size
+      self._buffer[self._buffered_data_size:buffer_end_offset] = data
+      self._buffered_data_size = buffer_end_offset
+
+      self.number_of_bytes_read += data_size
+
+  def Close(self):
+    """Closes the data stream and releases the buffered data."""
+    if self._file_object:
+      self._file_object.close()
+
+    self._buffer = None
+    self._buffered_data_size = 0
+    self._data_size = 0
+    self._data_stream_name = None
+    self._data_stream_read = False
+    self._file_entry = None
+    self._file_object = None
+
+  def GetBufferedDataSize(self):
+    """Retrieves the size of the buffered data stream.
+
+    Returns:
+      int: size of the buffered data stream.
+
+    Raises:
+      IOError: if the data stream is not buffered.
+      OSError: if the data stream is not buffered.
+    """
+    if self._buffer is None:
+      raise IOError('Data stream not buffered.')
+
+    return self._data_size
+
+  def GetFileObject(self):
+    """Retrieves a file-like object of the data stream.
+
+    Returns:
+      file: file-like object of the data stream or None if not available.
+
+    Raises:
+      IOError: if the data stream reader is not open.
+      OSError: if the data stream reader is not open.
+    """
+    if not self._file_entry:
+      raise IOError('Data stream reader not open.')
+
+    if self._buffer is not None:
+      return BufferedDataStreamFileObject(self)
+
+    file_object = self._file_entry.GetFileObject(
+        data_stream_name=self._data_stream_name)
+    if not file_object:
+      return None
+
+    if not self._data_stream_read:
+      self._data_stream_read = True
+
+      file_size = file_object.get_size()
+      self.number_of_data_stream_bytes += file_size
+
+      if file_size <= self._maximum_buffer_size:
+        # The buffer is allocated once, with the size of the data stream,
+        # and filled when the data is read.
+        file_object.seek(0, os.SEEK_SET)
+
+        self._buffer = bytearray(file_size)
+        self._data_size = file_size
+        self._file_object = file_object
+
+        return BufferedDataStreamFileObject(self)
+
+    return ReadCountingFileObject(file_object, self)
+
+  def Open(self, file_entry, data_stream_name):
+    """Opens a data stream.
+
+    The data stream is not read until a file-like object is requested.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry of the data stream.
+      data_stream_name (str): name of the data stream.
+    """
+    self.Close()
+
+    self._data_stream_name = data_stream_name
+    self._file_entry = file_entry
+
+  def ReadBufferedData(self, offset, size):
+    """Reads data from the buffered data stream.
+
+    The data stream is read into the buffer if the data has not been
+    buffered yet.
+
+    Args:
+      offset (int): offset of the data in the data stream.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the data stream is not buffered.
+      OSError: if the data stream is not buffered.
+    """
+    if self._buffer is None:
+      raise IOError('Data stream not buffered.')
+
+    end_offset = min(offset + size, self._data_size)
+    if end_offset > self._buffered_data_size:
+      self._ReadIntoBuffer(end_offset)
+      end_offset = min(end_offset, self._data_size)
+
+    return bytes(self._buffer[offset:end_offset])
@@ -6,6 +6,7 @@ An extractor is a class used to extract information from "raw" data.
 
 from __future__ import unicode_literals
 
+import collections
 import copy
 import hashlib
 
@@ -17,6 +18,7 @@ from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.engine import logger
+from plaso.engine import ntfs_mft
 from plaso.lib import errors
 from plaso.parsers import interface as parsers_interface
 from plaso.parsers import manager as parsers_manager
@@ -279,18 +281,24 @@ class EventExtractor(object):
 
     return parse_results
 
-  def ParseDataStream(self, parser_mediator, file_entry, data_stream_name):
+  def ParseDataStream(
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
     """Parses a data stream of a file entry with the enabled parsers.
 
     Args:
       parser_mediator (ParserMediator): parser mediator.
       file_entry (dfvfs.FileEntry): file entry.
       data_stream_name (str): data stream name.
+      file_object (Optional[file]): file-like object of the data stream,
+          which is closed after parsing. If not set the data stream is
+          opened from the file entry.
 
     Raises:
       RuntimeError: if the file-like object or the parser object is missing.
     """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      file_object = file_entry.GetFileObject(
+          data_stream_name=data_stream_name)
     if not file_object:
       raise RuntimeError(
           'Unable to retrieve file-like object from file entry.')
@@ -422,7 +430,7 @@ class PathSpecExtractor(object):
 
   def _ExtractPathSpecs(
       self, path_spec, find_specs=None, recurse_file_system=True,
-      resolver_context=None):
+      resolver_context=None, ntfs_mft_enumeration=False):
     """Extracts path specification from a specific source.
 
     Args:
@@ -432,6 +440,9 @@ class PathSpecExtractor(object):
       recurse_file_system (Optional[bool]): True if extraction should
           recurse into a file system.
       resolver_context (Optional[dfvfs.Context]): resolver context.
+      ntfs_mft_enumeration (Optional[bool]): True if the file entries of
+          NTFS file systems should be enumerated from the MFT, see
+          _ExtractPathSpecsFromNTFSMFT for details.
 
     Yields:
       dfvfs.PathSpec: path specification of a file entry found in the source.
@@ -462,7 +473,8 @@ class PathSpecExtractor(object):
       for extracted_path_spec in self._ExtractPathSpecsFromFileSystem(
           path_spec, find_specs=find_specs,
           recurse_file_system=recurse_file_system,
-          resolver_context=resolver_context):
+          resolver_context=resolver_context,
+          ntfs_mft_enumeration=ntfs_mft_enumeration):
         yield extracted_path_spec
 
   def _ExtractPathSpecsFromDirectory(self, file_entry, depth=0):
@@ -562,7 +574,7 @@ class PathSpecExtractor(object):
 
   def _ExtractPathSpecsFromFileSystem(
       self, path_spec, find_specs=None, recurse_file_system=True,
-      resolver_context=None):
+      resolver_context=None, ntfs_mft_enumeration=False):
     """Extracts path specification from a file system within a specific source.
 
     Args:
@@ -573,6 +585,9 @@ class PathSpecExtractor(object):
       recurse_file_system (Optional[bool]): True if extraction should
           recurse into a file system.
       resolver_context (Optional[dfvfs.Context]): resolver context.
+      ntfs_mft_enumeration (Optional[bool]): True if the file entries of
+          NTFS file systems should be enumerated from the MFT, see
+          _ExtractPathSpecsFromNTFSMFT for details.
 
     Yields:
       dfvfs.PathSpec: path specification of a file entry found in
@@ -590,7 +605,15 @@ class PathSpecExtractor(object):
 
     if file_system:
       try:
-        if find_specs:
+        if (ntfs_mft_enumeration and file_system.type_indicator == (
+            dfvfs_definitions.TYPE_INDICATOR_NTFS)):
+          for extracted_path_spec in self._ExtractPathSpecsFromNTFSMFT(
+              file_system, path_spec, find_specs=find_specs,
+              recurse_file_system=recurse_file_system,
+              resolver_context=resolver_context):
+            yield extracted_path_spec
+
+        elif find_specs:
           searcher = file_system_searcher.FileSystemSearcher(
               file_system, path_spec)
           for extracted_path_spec in searcher.Find(find_specs=find_specs):
@@ -614,9 +637,151 @@ class PathSpecExtractor(object):
       finally:
         file_system.Close()
 
+  def _ExtractPathSpecsFromNTFSDirectories(
+      self, file_system, path_spec, find_specs=None, recurse_file_system=True):
+    """Extracts path specification from a NTFS file system using directories.
+
+    This is the fallback of _ExtractPathSpecsFromNTFSMFT for when the MFT
+    cannot be read. If recurse_file_system is False, the file entries within
+    the directories matching the find specifications are extracted as well,
+    since the directories of the file system are not traversed by
+    the extraction worker when NTFS MFT enumeration is enabled.
+
+    Args:
+      file_system (dfvfs.FileSystem): NTFS file system.
+      path_spec (dfvfs.PathSpec): path specification of the root of
+          the file system.
+      find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
+          used in path specification extraction.
+      recurse_file_system (Optional[bool]): True if extraction should
+          recurse into a file system.
+
+    Yields:
+      dfvfs.PathSpec: path specification of a file entry found in
+          the file system.
+    """
+    if find_specs:
+      searcher = file_system_searcher.FileSystemSearcher(
+          file_system, path_spec)
+      matching_path_specs = list(searcher.Find(find_specs=find_specs))
+
+    elif recurse_file_system:
+      file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+      if file_entry:
+        for extracted_path_spec in self._ExtractPathSpecsFromDirectory(
+            file_entry):
+          yield extracted_path_spec
+      return
+
+    else:
+      matching_path_specs = [path_spec]
+
+    directories = collections.deque()
+    for matching_path_spec in matching_path_specs:
+      yield matching_path_spec
+
+      if not recurse_file_system:
+        file_entry = file_system.GetFileEntryByPathSpec(matching_path_spec)
+        if file_entry and file_entry.IsDirectory():
+          directories.append(file_entry)
+
+    # File entries that match the find specifications have already been
+    # extracted.
+    matching_locations = set([
+        getattr(matching_path_spec, 'location', None)
+        for matching_path_spec in matching_path_specs])
+
+    while directories:
+      file_entry = directories.popleft()
+      for sub_file_entry in file_entry.sub_file_entries:
+        try:
+          if not sub_file_entry.IsAllocated():
+            continue
+        except dfvfs_errors.BackEndError as exception:
+          logger.warning(
+              'Unable to process file: {0:s} with error: {1!s}'.format(
+                  sub_file_entry.path_spec.comparable.replace(
+                      '\n', ';'), exception))
+          continue
+
+        sub_location = getattr(sub_file_entry.path_spec, 'location', None)
+        if sub_location in matching_locations:
+          continue
+
+        yield sub_file_entry.path_spec
+
+        if sub_file_entry.IsDirectory() and not sub_file_entry.IsLink():
+          directories.append(sub_file_entry)
+
+  def _ExtractPathSpecsFromNTFSMFT(
+      self, file_system, path_spec, find_specs=None, recurse_file_system=True,
+      resolver_context=None):
+    """Extracts path specification from a NTFS file system using its MFT.
+
+    The MFT is read sequentially into a MFT table, from which the path
+    specifications are extracted in MFT order, instead of traversing the
+    file system one directory at a time.
+
+    If recurse_file_system is False, all the file entries are extracted,
+    including the file entries within directories matching the find
+    specifications, since the directories of the file system are not
+    traversed by the extraction worker in this mode.
+
+    Args:
+      file_system (dfvfs.FileSystem): NTFS file system.
+      path_spec (dfvfs.PathSpec): path specification of the root of
+          the file system.
+      find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
+          used in path specification extraction.
+      recurse_file_system (Optional[bool]): True if extraction should
+          recurse into a file system.
+      resolver_context (Optional[dfvfs.Context]): resolver context.
+
+    Yields:
+      dfvfs.PathSpec: path specification of a file entry found in
+          the file system.
+    """
+    mft_table = ntfs_mft.NTFSMFTTable(file_system, path_spec)
+
+    try:
+      mft_table.Read(resolver_context=resolver_context)
+    except (IOError, OSError) as exception:
+      logger.error((
+          'Unable to read MFT of NTFS file system: {0:s} with error: '
+          '{1!s}, falling back to traversing its directories.').format(
+              path_spec.comparable, exception))
+
+      for extracted_path_spec in self._ExtractPathSpecsFromNTFSDirectories(
+          file_system, path_spec, find_specs=find_specs,
+          recurse_file_system=recurse_file_system):
+        yield extracted_path_spec
+      return
+
+    rows = mft_table.GetRows(
+        find_specs=find_specs, include_sub_directories=not recurse_file_system)
+
+    for row in rows:
+      if recurse_file_system and not find_specs:
+        if mft_table.IsRoot(row) or mft_table.IsLink(row):
+          continue
+
+      extracted_path_spec = mft_table.GetPathSpec(row)
+      if not extracted_path_spec:
+        continue
+
+      yield extracted_path_spec
+
+      if recurse_file_system and not find_specs:
+        for data_stream_name in mft_table.GetDataStreamNames(row):
+          # Make a copy so we don't make the changes on a path specification
+          # that already has been produced.
+          data_stream_path_spec = copy.deepcopy(extracted_path_spec)
+          setattr(data_stream_path_spec, 'data_stream', data_stream_name)
+          yield data_stream_path_spec
+
   def ExtractPathSpecs(
       self, path_specs, find_specs=None, recurse_file_system=True,
-      resolver_context=None):
+      resolver_context=None, ntfs_mft_enumeration=False):
     """Extracts path specification from a specific source.
 
     Args:
@@ -626,6 +791,9 @@ class PathSpecExtractor(object):
       recurse_file_system (Optional[bool]): True if extraction should
           recurse into a file system.
       resolver_context (Optional[dfvfs.Context]): resolver context.
+      ntfs_mft_enumeration (Optional[bool]): True if the file entries of
+          NTFS file systems should be enumerated from the MFT, see
+          _ExtractPathSpecsFromNTFSMFT for details.
 
     Yields:
       dfvfs.PathSpec: path specification of a file entry found in the source.
@@ -634,5 +802,6 @@ class PathSpecExtractor(object):
       for extracted_path_spec in self._ExtractPathSpecs(
           path_spec, find_specs=find_specs,
           recurse_file_system=recurse_file_system,
-          resolver_context=resolver_context):
+          resolver_context=resolver_context,
+          ntfs_mft_enumeration=ntfs_mft_enumeration):
         yield extracted_path_spec
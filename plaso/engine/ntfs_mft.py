@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+"""Enumerates the file entries of a NTFS file system from its MFT."""
+
+from __future__ import unicode_literals
+
+import array
+
+import pyfsntfs
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import logger
+
+
+class NTFSMFTFileEntry(object):
+  """File entry in a NTFS MFT table.
+
+  The MFT table file entry provides the subset of the dfVFS file entry
+  interface that is needed to match find specifications.
+
+  Attributes:
+    name (str): name of the file entry.
+    path_spec (dfvfs.PathSpec): path specification of the file entry.
+  """
+
+  def __init__(self, file_system, name, path_spec, entry_flags):
+    """Initializes a MFT table file entry.
+
+    Args:
+      file_system (dfvfs.FileSystem): file system.
+      name (str): name of the file entry.
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+      entry_flags (int): file entry flags of the MFT table.
+    """
+    super(NTFSMFTFileEntry, self).__init__()
+    self._entry_flags = entry_flags
+    self._file_system = file_system
+    self.name = name
+    self.path_spec = path_spec
+
+  def GetFileSystem(self):
+    """Retrieves the file system which contains the file entry.
+
+    Returns:
+      dfvfs.FileSystem: file system.
+    """
+    return self._file_system
+
+  def IsAllocated(self):
+    """Determines if the file entry is allocated.
+
+    Returns:
+      bool: True since the MFT table only contains allocated file entries.
+    """
+    return True
+
+  def IsDevice(self):
+    """Determines if the file entry is a device.
+
+    Returns:
+      bool: False since NTFS has no devices.
+    """
+    return False
+
+  def IsDirectory(self):
+    """Determines if the file entry is a directory.
+
+    Returns:
+      bool: True if the file entry is a directory.
+    """
+    return bool(self._entry_flags & NTFSMFTTable.ENTRY_FLAG_DIRECTORY)
+
+  def IsFile(self):
+    """Determines if the file entry is a file.
+
+    Returns:
+      bool: True if the file entry is a file.
+    """
+    return not self._entry_flags
+
+  def IsLink(self):
+    """Determines if the file entry is a link.
+
+    Returns:
+      bool: True if the file entry is a link.
+    """
+    return bool(self._entry_flags & NTFSMFTTable.ENTRY_FLAG_LINK)
+
+  def IsPipe(self):
+    """Determines if the file entry is a pipe.
+
+    Returns:
+      bool: False since NTFS has no pipes.
+    """
+    return False
+
+  def IsSocket(self):
+    """Determines if the file entry is a socket.
+
+    Returns:
+      bool: False since NTFS has no sockets.
+    """
+    return False
+
+
+class NTFSMFTTable(object):
+  """Table of the file entries of a NTFS file system built from its MFT.
+
+  The MFT is read sequentially and every name of an allocated file entry,
+  except for short (DOS) names, is stored as a row of the table. The rows
+  are kept in compact arrays, in MFT order, and the locations are rebuilt
+  from the parent references of the rows, which prevents the file system
+  from having to be traversed one directory index at a time.
+  """
+
+  ENTRY_FLAG_DIRECTORY = 0x01
+  ENTRY_FLAG_LINK = 0x02
+
+  # The MFT entry of the root directory.
+  _ROOT_MFT_ENTRY = 5
+
+  _FILE_NAME_ATTRIBUTE_TYPE = 0x00000030
+
+  _FILE_REFERENCE_MFT_ENTRY_BITMASK = 0xffffffffffff
+
+  # The $FILE_NAME name space of short (DOS) names.
+  _NAME_SPACE_DOS = 2
+
+  _MAXIMUM_DEPTH = 255
+
+  def __init__(self, file_system, path_spec):
+    """Initializes a MFT table.
+
+    Args:
+      file_system (dfvfs.FileSystem): NTFS file system.
+      path_spec (dfvfs.PathSpec): path specification of the root of
+          the file system.
+    """
+    super(NTFSMFTTable, self).__init__()
+    self._children = None
+    self._data_stream_names = {}
+    self._directory_rows = {}
+    self._directory_sequence_numbers = {}
+    self._entry_flags = array.array('B')
+    self._file_system = file_system
+    self._locations = {}
+    self._mft_attributes = array.array('H')
+    self._mft_entries = array.array('L')
+    self._names = []
+    self._parent_mft_entries = array.array('L')
+    self._parent_sequence_numbers = array.array('H')
+    self._path_spec = path_spec
+    self._root_row = None
+
+  @property
+  def number_of_rows(self):
+    """int: number of rows in the table."""
+    return len(self._names)
+
+  def _AddFileEntry(self, mft_entry, fsntfs_file_entry):
+    """Adds the names of a file entry to the table.
+
+    Args:
+      mft_entry (int): MFT entry of the file entry.
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+    """
+    entry_flags = 0
+    if (fsntfs_file_entry.file_attribute_flags or 0) & (
+        pyfsntfs.file_attribute_flags.REPARSE_POINT):
+      entry_flags = self.ENTRY_FLAG_LINK
+    elif fsntfs_file_entry.has_directory_entries_index():
+      entry_flags = self.ENTRY_FLAG_DIRECTORY
+
+    data_stream_names = None
+    if fsntfs_file_entry.number_of_alternate_data_streams:
+      data_stream_names = tuple(
+          fsntfs_data_stream.name
+          for fsntfs_data_stream in fsntfs_file_entry.alternate_data_streams)
+
+    first_row = None
+    for attribute_index in range(fsntfs_file_entry.number_of_attributes):
+      fsntfs_attribute = fsntfs_file_entry.get_attribute(attribute_index)
+      if fsntfs_attribute.attribute_type != self._FILE_NAME_ATTRIBUTE_TYPE:
+        continue
+
+      if fsntfs_attribute.name_space == self._NAME_SPACE_DOS:
+        continue
+
+      row = len(self._names)
+      if first_row is None:
+        first_row = row
+
+      self._entry_flags.append(entry_flags)
+      self._mft_attributes.append(attribute_index)
+      self._mft_entries.append(mft_entry)
+      self._names.append(fsntfs_attribute.name)
+
+      parent_file_reference = fsntfs_attribute.parent_file_reference
+      self._parent_mft_entries.append(
+          parent_file_reference & self._FILE_REFERENCE_MFT_ENTRY_BITMASK)
+      self._parent_sequence_numbers.append(parent_file_reference >> 48)
+
+      if data_stream_names:
+        self._data_stream_names[row] = data_stream_names
+
+    if first_row is not None and entry_flags & self.ENTRY_FLAG_DIRECTORY:
+      self._directory_rows[mft_entry] = first_row
+      self._directory_sequence_numbers[mft_entry] = (
+          fsntfs_file_entry.file_reference >> 48)
+
+      if mft_entry == self._ROOT_MFT_ENTRY:
+        self._root_row = first_row
+
+  def _FindInRow(self, row, find_specs, search_depth):
+    """Searches for matching rows within a row.
+
+    This mirrors the dfVFS file system searcher but compares the find
+    specifications against the file entries of the table.
+
+    Args:
+      row (int): row.
+      find_specs (list[dfvfs.FindSpec]): find specifications.
+      search_depth (int): number of location path segments to compare.
+
+    Returns:
+      set[int]: matching rows.
+    """
+    matching_rows = set()
+    children = self._GetChildren()
+
+    rows_to_search = [(row, find_specs, search_depth)]
+    while rows_to_search:
+      row, find_specs, search_depth = rows_to_search.pop()
+
+      file_entry = self._GetFileEntry(row)
+      if file_entry.path_spec is None:
+        continue
+
+      sub_find_specs = []
+      for find_spec in find_specs:
+        match, location_match = find_spec.Matches(
+            file_entry, search_depth=search_depth)
+        if match:
+          matching_rows.add(row)
+
+        # pylint: disable=singleton-comparison
+        if location_match != False and not find_spec.AtMaximumDepth(
+            search_depth):
+          sub_find_specs.append(find_spec)
+
+      if sub_find_specs:
+        for sub_row in children.get(row, []):
+          rows_to_search.append((sub_row, sub_find_specs, search_depth + 1))
+
+    return matching_rows
+
+  def _GetChildren(self):
+    """Retrieves the rows of the file entries per directory.
+
+    Returns:
+      dict[int, list[int]]: rows of the file entries per row of the parent
+          directory.
+    """
+    if self._children is None:
+      self._children = {}
+      for row in range(len(self._names)):
+        if row == self._root_row:
+          continue
+
+        parent_row = self._GetParentRow(row)
+        if parent_row is not None:
+          self._children.setdefault(parent_row, []).append(row)
+
+    return self._children
+
+  def _GetFileEntry(self, row):
+    """Retrieves the file entry of a row.
+
+    Args:
+      row (int): row.
+
+    Returns:
+      NTFSMFTFileEntry: file entry.
+    """
+    return NTFSMFTFileEntry(
+        self._file_system, self._names[row], self.GetPathSpec(row),
+        self._entry_flags[row])
+
+  def _GetParentRow(self, row):
+    """Retrieves the row of the parent directory.
+
+    Args:
+      row (int): row.
+
+    Returns:
+      int: row of the parent directory or None if the parent directory
+          is not available, for example if the file entry is an orphan.
+    """
+    parent_mft_entry = self._parent_mft_entries[row]
+
+    sequence_number = self._directory_sequence_numbers.get(
+        parent_mft_entry, None)
+    if sequence_number != self._parent_sequence_numbers[row]:
+      return None
+
+    return self._directory_rows.get(parent_mft_entry, None)
+
+  def GetDataStreamNames(self, row):
+    """Retrieves the names of the alternate data streams of a row.
+
+    Args:
+      row (int): row.
+
+    Returns:
+      tuple[str]: names of the alternate data streams.
+    """
+    return self._data_stream_names.get(row, ())
+
+  def GetLocation(self, row):
+    """Retrieves the location of a row.
+
+    Args:
+      row (int): row.
+
+    Returns:
+      str: location of the file entry or None if the location cannot be
+          determined, for example if the file entry is an orphan.
+    """
+    if row == self._root_row:
+      return self._file_system.LOCATION_ROOT
+
+    path_segments = [self._names[row]]
+    parent_row = self._GetParentRow(row)
+
+    # Locations of directories are cached so that the parent references
+    # of a directory are only followed once.
+    directory_rows = []
+    location = None
+    while parent_row is not None and len(directory_rows) < self._MAXIMUM_DEPTH:
+      if parent_row == self._root_row:
+        location = ''
+        break
+
+      location = self._locations.get(parent_row, None)
+      if location is not None:
+        break
+
+      directory_rows.append(parent_row)
+      path_segments.append(self._names[parent_row])
+      parent_row = self._GetParentRow(parent_row)
+
+    if location is None:
+      return None
+
+    path_separator = self._file_system.PATH_SEPARATOR
+    for directory_row in reversed(directory_rows):
+      location = path_separator.join([location, self._names[directory_row]])
+      self._locations[directory_row] = location
+
+    return path_separator.join([location, path_segments[0]])
+
+  def GetPathSpec(self, row):
+    """Retrieves the path specification of a row.
+
+    Args:
+      row (int): row.
+
+    Returns:
+      dfvfs.PathSpec: path specification of the file entry or None if
+          the location cannot be determined.
+    """
+    location = self.GetLocation(row)
+    if location is None:
+      return None
+
+    return path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location=location,
+        mft_attribute=self._mft_attributes[row],
+        mft_entry=self._mft_entries[row], parent=self._path_spec.parent)
+
+  def GetRows(self, find_specs=None, include_sub_directories=False):
+    """Retrieves the rows of the file entries in MFT order.
+
+    Args:
+      find_specs (Optional[list[dfvfs.FindSpec]]): find specifications, where
+          None represents all file entries.
+      include_sub_directories (Optional[bool]): True if the file entries
+          within matching directories should be included.
+
+    Returns:
+      list[int]: rows of the file entries in MFT order.
+    """
+    if self._root_row is None:
+      return []
+
+    if not find_specs:
+      return list(range(len(self._names)))
+
+    matching_rows = self._FindInRow(self._root_row, find_specs, 0)
+
+    if include_sub_directories:
+      children = self._GetChildren()
+
+      rows_to_include = list(matching_rows)
+      while rows_to_include:
+        row = rows_to_include.pop()
+        for sub_row in children.get(row, []):
+          if sub_row not in matching_rows:
+            matching_rows.add(sub_row)
+            rows_to_include.append(sub_row)
+
+    return sorted(matching_rows)
+
+  def IsDirectory(self, row):
+    """Determines if a row is a directory.
+
+    Args:
+      row (int): row.
+
+    Returns:
+      bool: True if the file entry is a directory.
+    """
+    return bool(self._entry_flags[row] & self.ENTRY_FLAG_DIRECTORY)
+
+  def IsLink(self, row):
+    """Determines if a row is a link.
+
+    Args:
+      row (int): row.
+
+    Returns:
+      bool: True if the file entry is a link.
+    """
+    return bool(self._entry_flags[row] & self.ENTRY_FLAG_LINK)
+
+  def IsRoot(self, row):
+    """Determines if a row is the root directory.
+
+    Args:
+      row (int): row.
+
+    Returns:
+      bool: True if the file entry is the root directory.
+    """
+    return row == self._root_row
+
+  def Read(self, resolver_context=None):
+    """Reads the MFT of the file system into the table.
+
+    Args:
+      resolver_context (Optional[dfvfs.Context]): resolver context.
+
+    Raises:
+      IOError: if the MFT cannot be read.
+      OSError: if the MFT cannot be read.
+    """
+    file_object = path_spec_resolver.Resolver.OpenFileObject(
+        self._path_spec.parent, resolver_context=resolver_context)
+
+    fsntfs_volume = pyfsntfs.volume()
+    try:
+      fsntfs_volume.open_file_object(file_object)
+
+      number_of_file_entries = fsntfs_volume.get_number_of_file_entries()
+      for mft_entry in range(number_of_file_entries):
+        try:
+          fsntfs_file_entry = fsntfs_volume.get_file_entry(mft_entry)
+          if not fsntfs_file_entry.is_allocated():
+            continue
+
+          # Attributes stored in extension MFT entries are part of the file
+          # entry of the base MFT entry.
+          if fsntfs_file_entry.base_record_file_reference:
+            continue
+
+          self._AddFileEntry(mft_entry, fsntfs_file_entry)
+
+        except IOError as exception:
+          logger.debug(
+              'Unable to read MFT entry: {0:d} with error: {1!s}'.format(
+                  mft_entry, exception))
+
+    finally:
+      fsntfs_volume.close()
+      file_object.close()
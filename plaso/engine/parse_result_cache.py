@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Content addressed cache of parse results."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import json
+import os
+import sqlite3
+import zlib
+
+import plaso
+
+from plaso.engine import logger
+
+
+class ParseResultCache(object):
+  """Content addressed cache of parse results.
+
+  The cache stores the events and event data produced by parsing a data
+  stream, keyed by the content digest of the data stream, its location,
+  the parser filter expression, the parser settings and the plaso version.
+  Identical data streams, for example the same Windows Registry file in
+  multiple Volume Shadow Snapshots, are parsed once and the cached parse
+  results are replayed for the other data streams.
+
+  The cache is stored in a SQLite database, which allows multiple worker
+  processes to share the cache.
+
+  Attributes:
+    number_of_hits (int): number of data streams with cached parse results.
+    number_of_misses (int): number of data streams without cached parse
+        results.
+  """
+
+  _CREATE_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS parse_results ('
+      'cache_key TEXT PRIMARY KEY, parse_results BLOB)')
+
+  _INSERT_QUERY = (
+      'INSERT OR IGNORE INTO parse_results (cache_key, parse_results) '
+      'VALUES (?, ?)')
+
+  _SELECT_QUERY = (
+      'SELECT parse_results FROM parse_results WHERE cache_key = ?')
+
+  # Maximum number of seconds to wait for another process to release a lock
+  # on the database.
+  _LOCK_TIMEOUT = 60.0
+
+  # Number of bytes to read at once when calculating the content digest.
+  _READ_BUFFER_SIZE = 4 * 1024 * 1024
+
+  def __init__(self, path, parser_filter_expression=None):
+    """Initializes a parse result cache.
+
+    Args:
+      path (str): path of the cache database file.
+      parser_filter_expression (Optional[str]): parser filter expression,
+          where None represents all parsers and plugins.
+    """
+    super(ParseResultCache, self).__init__()
+    self._connection = sqlite3.connect(path, timeout=self._LOCK_TIMEOUT)
+    self._connection.execute(self._CREATE_TABLE_QUERY)
+    self._connection.commit()
+    self._parser_filter_expression = parser_filter_expression or ''
+
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  def _CalculateContentDigest(self, file_object):
+    """Calculates the digest of the content of a data stream.
+
+    Args:
+      file_object (file): file-like object of the data stream.
+
+    Returns:
+      str: hexadecimal SHA-256 digest of the content.
+    """
+    file_object.seek(0, os.SEEK_SET)
+
+    hash_context = hashlib.sha256()
+    data = file_object.read(self._READ_BUFFER_SIZE)
+    while data:
+      hash_context.update(data)
+      data = file_object.read(self._READ_BUFFER_SIZE)
+
+    return hash_context.hexdigest()
+
+  def Close(self):
+    """Closes the cache."""
+    if self._connection:
+      self._connection.close()
+      self._connection = None
+
+  def GetCacheKey(
+      self, parser_mediator, file_entry, data_stream_name, file_object):
+    """Retrieves the cache key of a data stream.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (str): data stream name.
+      file_object (file): file-like object of the data stream.
+
+    Returns:
+      str: cache key.
+    """
+    content_digest = self._CalculateContentDigest(file_object)
+
+    # The location is part of the cache key since parser and plugin
+    # selection can depend on it.
+    location = getattr(file_entry.path_spec, 'location', None) or ''
+
+    key_values = [
+        plaso.__version__, self._parser_filter_expression, location,
+        data_stream_name or '', '{0!s}'.format(parser_mediator.timezone),
+        parser_mediator.codepage or '', content_digest]
+
+    key_string = '\x00'.join(key_values)
+    return hashlib.sha256(key_string.encode('utf-8')).hexdigest()
+
+  def GetParseResults(self, cache_key):
+    """Retrieves cached parse results.
+
+    Args:
+      cache_key (str): cache key.
+
+    Returns:
+      list[tuple[str, dict[str, object], dict[str, object]]]: parser chain,
+          JSON serialized event and JSON serialized event data, or None if
+          no parse results were cached. The JSON serialized event data is
+          None if it is the same as that of the previous event.
+    """
+    cursor = self._connection.execute(self._SELECT_QUERY, (cache_key, ))
+    row = cursor.fetchone()
+    if not row:
+      self.number_of_misses += 1
+      return None
+
+    self.number_of_hits += 1
+
+    json_string = zlib.decompress(row[0]).decode('utf-8')
+    return [tuple(parse_result) for parse_result in json.loads(json_string)]
+
+  def StoreParseResults(self, cache_key, parse_results):
+    """Stores parse results.
+
+    Args:
+      cache_key (str): cache key.
+      parse_results (list[tuple[str, dict[str, object], dict[str, object]]]):
+          parser chain, JSON serialized event and JSON serialized event data.
+    """
+    json_string = json.dumps(parse_results)
+    compressed_data = zlib.compress(json_string.encode('utf-8'))
+
+    try:
+      self._connection.execute(
+          self._INSERT_QUERY, (cache_key, sqlite3.Binary(compressed_data)))
+      self._connection.commit()
+
+    except sqlite3.Error as exception:
+      logger.warning('Unable to store parse results with error: {0!s}'.format(
+          exception))
@@ -10,11 +10,16 @@ class ProcessStatus(object):
   """The status of an individual process.
 
   Attributes:
+    cpu_time_per_parser (dict[str, float]): total CPU time in seconds spent
+        by the process per parser, which is only available when parsers are
+        profiled.
     display_name (str): human readable of the file entry currently being
         processed by the process.
     identifier (str): process identifier.
     last_running_time (int): timestamp of the last update when the process had
         a running process status.
+    number_of_bytes_read (int): total number of bytes read from data streams
+        by the process.
     number_of_consumed_event_tags (int): total number of event tags consumed by
         the process.
     number_of_consumed_event_tags_delta (int): number of event tags consumed by
@@ -35,6 +40,12 @@ class ProcessStatus(object):
         the process.
     number_of_consumed_warnings_delta (int): number of warnings consumed by
         the process since the last status update.
+    number_of_data_stream_bytes (int): total number of bytes of the data
+        streams read by the process.
+    number_of_parse_result_cache_hits (int): total number of data streams
+        with cached parse results.
+    number_of_parse_result_cache_misses (int): total number of data streams
+        without cached parse results.
     number_of_produced_event_tags (int): total number of event tags produced by
         the process.
     number_of_produced_event_tags_delta (int): number of event tags produced by
@@ -63,9 +74,11 @@ class ProcessStatus(object):
   def __init__(self):
     """Initializes a process status."""
     super(ProcessStatus, self).__init__()
+    self.cpu_time_per_parser = None
     self.display_name = None
     self.identifier = None
     self.last_running_time = 0
+    self.number_of_bytes_read = 0
     self.number_of_consumed_event_tags = 0
     self.number_of_consumed_event_tags_delta = 0
     self.number_of_consumed_events = 0
@@ -76,6 +89,9 @@ class ProcessStatus(object):
     self.number_of_consumed_sources_delta = 0
     self.number_of_consumed_warnings = 0
     self.number_of_consumed_warnings_delta = 0
+    self.number_of_data_stream_bytes = 0
+    self.number_of_parse_result_cache_hits = 0
+    self.number_of_parse_result_cache_misses = 0
     self.number_of_produced_event_tags = 0
     self.number_of_produced_event_tags_delta = 0
     self.number_of_produced_events = 0
@@ -315,6 +331,8 @@ class ProcessingStatus(object):
         caused critical errors during processing.
     events_status (EventsStatus): status information about events.
     foreman_status (ProcessingStatus): foreman processing status.
+    sources_status (list[SourceCollectionStatus]): collection status of
+        the sources.
     start_time (float): time that the processing was started. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     tasks_status (TasksStatus): status information about tasks.
@@ -329,6 +347,7 @@ class ProcessingStatus(object):
     self.error_path_specs = []
     self.events_status = None
     self.foreman_status = None
+    self.sources_status = None
     self.start_time = time.time()
     self.tasks_status = None
 
@@ -461,6 +480,15 @@ class ProcessingStatus(object):
     """
     self.events_status = events_status
 
+  def UpdateSourcesStatus(self, sources_status):
+    """Updates the collection status of the sources.
+
+    Args:
+      sources_status (list[SourceCollectionStatus]): collection status of
+          the sources.
+    """
+    self.sources_status = sources_status
+
   def UpdateTasksStatus(self, tasks_status):
     """Updates the tasks status.
 
@@ -476,7 +504,10 @@ class ProcessingStatus(object):
       number_of_consumed_events, number_of_produced_events,
       number_of_consumed_event_tags, number_of_produced_event_tags,
       number_of_consumed_reports, number_of_produced_reports,
-      number_of_consumed_warnings, number_of_produced_warnings):
+      number_of_consumed_warnings, number_of_produced_warnings,
+      number_of_bytes_read=None, number_of_data_stream_bytes=None,
+      number_of_parse_result_cache_hits=None,
+      number_of_parse_result_cache_misses=None, cpu_time_per_parser=None):
     """Updates the status of a worker.
 
     Args:
@@ -507,6 +538,16 @@ class ProcessingStatus(object):
           the worker.
       number_of_produced_warnings (int): total number of warnings produced by
           the worker.
+      number_of_bytes_read (Optional[int]): total number of bytes read from
+          data streams by the worker.
+      number_of_data_stream_bytes (Optional[int]): total number of bytes of
+          the data streams read by the worker.
+      number_of_parse_result_cache_hits (Optional[int]): total number of data
+          streams with cached parse results.
+      number_of_parse_result_cache_misses (Optional[int]): total number of
+          data streams without cached parse results.
+      cpu_time_per_parser (Optional[dict[str, float]]): total CPU time in
+          seconds spent by the worker per parser.
     """
     if identifier not in self._workers_status:
       self._workers_status[identifier] = ProcessStatus()
@@ -520,6 +561,23 @@ class ProcessingStatus(object):
         number_of_consumed_reports, number_of_produced_reports,
         number_of_consumed_warnings, number_of_produced_warnings)
 
+    if number_of_bytes_read is not None:
+      process_status.number_of_bytes_read = number_of_bytes_read
+
+    if number_of_data_stream_bytes is not None:
+      process_status.number_of_data_stream_bytes = number_of_data_stream_bytes
+
+    if number_of_parse_result_cache_hits is not None:
+      process_status.number_of_parse_result_cache_hits = (
+          number_of_parse_result_cache_hits)
+
+    if number_of_parse_result_cache_misses is not None:
+      process_status.number_of_parse_result_cache_misses = (
+          number_of_parse_result_cache_misses)
+
+    if cpu_time_per_parser is not None:
+      process_status.cpu_time_per_parser = cpu_time_per_parser
+
 
 class EventsStatus(object):
   """The status of the events.
@@ -531,6 +589,10 @@ class EventsStatus(object):
     number_of_filtered_events (int): number of events excluded by the event
         filter.
     number_of_macb_grouped_events (int): number of events grouped based on MACB.
+    number_of_sort_runs (int): number of runs written to the scratch directory
+        by the external memory event sorter.
+    number_of_sorted_events (int): number of events sorted by the external
+        memory event sorter.
     total_number_of_events (int): total number of events in the storage file.
   """
 
@@ -541,9 +603,32 @@ class EventsStatus(object):
     self.number_of_events_from_time_slice = 0
     self.number_of_filtered_events = 0
     self.number_of_macb_grouped_events = 0
+    self.number_of_sort_runs = 0
+    self.number_of_sorted_events = 0
     self.total_number_of_events = 0
 
 
+class SourceCollectionStatus(object):
+  """The collection status of a source.
+
+  Attributes:
+    display_name (str): human readable name of the source.
+    identifier (str): identifier of the source.
+    number_of_produced_sources (int): number of event sources produced from
+        the source.
+    status (str): human readable status indication such as "collecting" or
+        "completed".
+  """
+
+  def __init__(self):
+    """Initializes a source collection status."""
+    super(SourceCollectionStatus, self).__init__()
+    self.display_name = None
+    self.identifier = None
+    self.number_of_produced_sources = 0
+    self.status = None
+
+
 class TasksStatus(object):
   """The status of the tasks.
 
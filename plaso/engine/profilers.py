@@ -8,6 +8,12 @@ import gzip
 import os
 import time
 
+# time.clock() was removed in Python 3.8.
+if hasattr(time, 'process_time'):
+  _GetCPUTime = time.process_time  # pylint: disable=invalid-name
+else:
+  _GetCPUTime = time.clock  # pylint: disable=invalid-name
+
 
 class CPUTimeMeasurement(object):
   """The CPU time measurement.
@@ -26,14 +32,14 @@ class CPUTimeMeasurement(object):
 
   def SampleStart(self):
     """Starts measuring the CPU time."""
-    self._start_cpu_time = time.clock()
+    self._start_cpu_time = _GetCPUTime()
     self.start_sample_time = time.time()
     self.total_cpu_time = 0
 
   def SampleStop(self):
     """Stops measuring the CPU time."""
     if self._start_cpu_time is not None:
-      self.total_cpu_time += time.clock() - self._start_cpu_time
+      self.total_cpu_time += _GetCPUTime() - self._start_cpu_time
 
 
 class SampleFileProfiler(object):
@@ -106,6 +112,26 @@ class CPUTimeProfiler(SampleFileProfiler):
 
   _FILE_HEADER = 'Time\tName\tProcessing time\n'
 
+  def __init__(self, identifier, configuration):
+    """Initializes a CPU time profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(CPUTimeProfiler, self).__init__(identifier, configuration)
+    self._total_cpu_time_per_profile = {}
+
+  def GetTotalCPUTimes(self):
+    """Retrieves the total CPU time of every profile.
+
+    Returns:
+      dict[str, float]: total CPU time in seconds of all samples, per profile
+          name.
+    """
+    return dict(self._total_cpu_time_per_profile)
+
   def StartTiming(self, profile_name):
     """Starts timing CPU time.
 
@@ -127,6 +153,10 @@ class CPUTimeProfiler(SampleFileProfiler):
     if measurements:
       measurements.SampleStop()
 
+      self._total_cpu_time_per_profile[profile_name] = (
+          self._total_cpu_time_per_profile.get(profile_name, 0.0) +
+          measurements.total_cpu_time)
+
       sample = '{0:f}\t{1:s}\t{2:f}\n'.format(
           measurements.start_sample_time, profile_name,
           measurements.total_cpu_time)
@@ -106,6 +106,8 @@ class SingleProcessEngine(engine.BaseEngine):
         number_of_consumed_sources, storage_writer)
 
     display_name = ''
+    extraction_configuration = self._processing_configuration.extraction
+
     find_specs = None
     if self.collection_filters_helper:
       find_specs = (
@@ -113,7 +115,8 @@ class SingleProcessEngine(engine.BaseEngine):
 
     path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
         source_path_specs, find_specs=find_specs, recurse_file_system=False,
-        resolver_context=parser_mediator.resolver_context)
+        resolver_context=parser_mediator.resolver_context,
+        ntfs_mft_enumeration=extraction_configuration.ntfs_mft_enumeration)
 
     for path_spec in path_spec_generator:
       if self._abort:
@@ -295,6 +298,8 @@ class SingleProcessEngine(engine.BaseEngine):
       self._StopProfiling()
       parser_mediator.StopProfiling()
 
+      extraction_worker.Close()
+
     if self._abort:
       logger.debug('Processing aborted.')
       self._processing_status.aborted = True
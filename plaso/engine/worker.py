@@ -17,8 +17,10 @@ from dfvfs.resolver import resolver as path_spec_resolver
 from plaso.analyzers import hashing_analyzer
 from plaso.analyzers import manager as analyzers_manager
 from plaso.containers import event_sources
+from plaso.engine import data_stream_reader
 from plaso.engine import extractors
 from plaso.engine import logger
+from plaso.engine import parse_result_cache
 from plaso.lib import definitions
 from plaso.lib import errors
 
@@ -91,9 +93,13 @@ class EventExtractionWorker(object):
     super(EventExtractionWorker, self).__init__()
     self._abort = False
     self._analyzers = []
+    self._data_stream_reader = data_stream_reader.DataStreamReader()
     self._event_extractor = extractors.EventExtractor(
         parser_filter_expression=parser_filter_expression)
     self._hasher_file_size_limit = None
+    self._ntfs_mft_enumeration = False
+    self._parse_result_cache = None
+    self._parser_filter_expression = parser_filter_expression
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_archives = None
     self._process_compressed_streams = None
@@ -102,8 +108,32 @@ class EventExtractionWorker(object):
     self.last_activity_timestamp = 0.0
     self.processing_status = definitions.STATUS_INDICATOR_IDLE
 
-  def _AnalyzeDataStream(self, mediator, file_entry, data_stream_name):
-    """Analyzes the contents of a specific data stream of a file entry.
+  @property
+  def number_of_bytes_read(self):
+    """int: number of bytes read from data streams."""
+    return self._data_stream_reader.number_of_bytes_read
+
+  @property
+  def number_of_data_stream_bytes(self):
+    """int: number of bytes of data streams that were read."""
+    return self._data_stream_reader.number_of_data_stream_bytes
+
+  @property
+  def number_of_parse_result_cache_hits(self):
+    """int: number of data streams with cached parse results."""
+    if not self._parse_result_cache:
+      return 0
+    return self._parse_result_cache.number_of_hits
+
+  @property
+  def number_of_parse_result_cache_misses(self):
+    """int: number of data streams without cached parse results."""
+    if not self._parse_result_cache:
+      return 0
+    return self._parse_result_cache.number_of_misses
+
+  def _AnalyzeDataStream(self, mediator):
+    """Analyzes the contents of the data stream opened by the reader.
 
     The results of the analyzers are set in the parser mediator as attributes
     that are added to produced event objects. Note that some file systems
@@ -112,9 +142,6 @@ class EventExtractionWorker(object):
     Args:
       mediator (ParserMediator): mediates the interactions between
           parsers and other components, such as storage and abort signals.
-      file_entry (dfvfs.FileEntry): file entry whose data stream is to be
-          analyzed.
-      data_stream_name (str): name of the data stream.
 
     Raises:
       RuntimeError: if the file-like object cannot be retrieved from
@@ -128,7 +155,7 @@ class EventExtractionWorker(object):
       self._processing_profiler.StartTiming('analyzing')
 
     try:
-      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+      file_object = self._data_stream_reader.GetFileObject()
       if not file_object:
         raise RuntimeError((
             'Unable to retrieve file-like object for file entry: '
@@ -147,6 +174,23 @@ class EventExtractionWorker(object):
         '[AnalyzeDataStream] completed analyzing file: {0:s}'.format(
             display_name))
 
+  def _AnalyzeData(self, analyzers, data):
+    """Processes a block of data with analyzers.
+
+    Args:
+      analyzers (list[BaseAnalyzer]): analyzers.
+      data (bytes): block of data.
+    """
+    for analyzer_object in analyzers:
+      if self._abort:
+        break
+
+      self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
+
+      analyzer_object.Analyze(data)
+
+      self.last_activity_timestamp = time.time()
+
   def _AnalyzeFileObject(self, mediator, file_object):
     """Processes a file-like object with analyzers.
 
@@ -155,51 +199,52 @@ class EventExtractionWorker(object):
           parsers and other components, such as storage and abort signals.
       file_object (dfvfs.FileIO): file-like object to process.
     """
-    maximum_read_size = max([
-        analyzer_object.SIZE_LIMIT for analyzer_object in self._analyzers])
+    file_size = file_object.get_size()
 
-    hashers_only = True
+    incremental_analyzers = []
+    whole_data_stream_analyzers = []
     for analyzer_object in self._analyzers:
-      if not isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer):
-        hashers_only = False
-        break
+      if (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
+          self._hasher_file_size_limit and
+          file_size > self._hasher_file_size_limit):
+        continue
 
-    file_size = file_object.get_size()
+      if analyzer_object.INCREMENTAL_ANALYZER:
+        incremental_analyzers.append(analyzer_object)
+      elif file_size <= analyzer_object.SIZE_LIMIT:
+        whole_data_stream_analyzers.append(analyzer_object)
 
-    if (hashers_only and self._hasher_file_size_limit and
-        file_size > self._hasher_file_size_limit):
+    analyzers = whole_data_stream_analyzers + incremental_analyzers
+    if not analyzers:
       return
 
     file_object.seek(0, os.SEEK_SET)
 
-    data = file_object.read(maximum_read_size)
-    while data:
-      if self._abort:
-        break
+    if whole_data_stream_analyzers:
+      # Analyzers that are not incremental, such as Yara, analyze the whole
+      # data stream at once so that matches that span the boundary of a read
+      # are not missed. The data stream is within the size limit of these
+      # analyzers and is passed to the incremental analyzers as well, which
+      # prevents reading the data stream twice.
+      data = file_object.read()
+      self._AnalyzeData(analyzers, data)
 
-      for analyzer_object in self._analyzers:
+    else:
+      maximum_read_size = max([
+          analyzer_object.SIZE_LIMIT
+          for analyzer_object in incremental_analyzers])
+
+      data = file_object.read(maximum_read_size)
+      while data:
         if self._abort:
           break
 
-        if (not analyzer_object.INCREMENTAL_ANALYZER and
-            file_size > analyzer_object.SIZE_LIMIT):
-          continue
-
-        if (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
-            self._hasher_file_size_limit and
-            file_size > self._hasher_file_size_limit):
-          continue
-
-        self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
+        self._AnalyzeData(incremental_analyzers, data)
 
-        analyzer_object.Analyze(data)
-
-        self.last_activity_timestamp = time.time()
-
-      data = file_object.read(maximum_read_size)
+        data = file_object.read(maximum_read_size)
 
     display_name = mediator.GetDisplayName()
-    for analyzer_object in self._analyzers:
+    for analyzer_object in analyzers:
       if self._abort:
         break
 
@@ -323,8 +368,11 @@ class EventExtractionWorker(object):
     if self._processing_profiler:
       self._processing_profiler.StartTiming('extracting')
 
-    self._event_extractor.ParseDataStream(
-        mediator, file_entry, data_stream_name)
+    if self._parse_result_cache:
+      self._ExtractContentFromDataStreamWithCache(
+          mediator, file_entry, data_stream_name)
+    else:
+      self._ParseDataStream(mediator, file_entry, data_stream_name)
 
     if self._processing_profiler:
       self._processing_profiler.StopTiming('extracting')
@@ -333,6 +381,50 @@ class EventExtractionWorker(object):
 
     self.last_activity_timestamp = time.time()
 
+  def _ExtractContentFromDataStreamWithCache(
+      self, mediator, file_entry, data_stream_name):
+    """Extracts content from a data stream using the parse result cache.
+
+    If the parse result cache contains the parse results of a data stream
+    with the same content, the cached parse results are produced instead
+    of parsing the data stream.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      file_entry (dfvfs.FileEntry): file entry to extract its content.
+      data_stream_name (str): name of the data stream whose content is to be
+          extracted.
+    """
+    cache_key = None
+    file_object = self._data_stream_reader.GetFileObject()
+    if file_object:
+      try:
+        cache_key = self._parse_result_cache.GetCacheKey(
+            mediator, file_entry, data_stream_name, file_object)
+      finally:
+        file_object.close()
+
+    parse_results = None
+    if cache_key:
+      parse_results = self._parse_result_cache.GetParseResults(cache_key)
+
+    if parse_results is not None:
+      logger.debug('Using cached parse results for: {0:s}'.format(
+          mediator.GetDisplayName()))
+      mediator.ProduceParseResults(parse_results)
+      return
+
+    mediator.StartRecordingParseResults()
+    try:
+      self._ParseDataStream(mediator, file_entry, data_stream_name)
+
+    finally:
+      parse_results = mediator.StopRecordingParseResults()
+
+    if cache_key and parse_results is not None and not self._abort:
+      self._parse_result_cache.StoreParseResults(cache_key, parse_results)
+
   def _ExtractMetadataFromFileEntry(self, mediator, file_entry, data_stream):
     """Extracts metadata from a file entry.
 
@@ -435,6 +527,27 @@ class EventExtractionWorker(object):
 
     return False
 
+  def _ParseDataStream(self, mediator, file_entry, data_stream_name):
+    """Parses the data stream opened by the reader with the enabled parsers.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      file_entry (dfvfs.FileEntry): file entry to extract its content.
+      data_stream_name (str): name of the data stream whose content is to be
+          extracted.
+
+    Raises:
+      RuntimeError: if the file-like object is missing.
+    """
+    file_object = self._data_stream_reader.GetFileObject()
+    if not file_object:
+      raise RuntimeError(
+          'Unable to retrieve file-like object from file entry.')
+
+    self._event_extractor.ParseDataStream(
+        mediator, file_entry, data_stream_name, file_object=file_object)
+
   def _ProcessArchiveTypes(self, mediator, path_spec, type_indicators):
     """Processes a data stream containing archive types such as: TAR or ZIP.
 
@@ -678,10 +791,48 @@ class EventExtractionWorker(object):
 
     mediator.ClearEventAttributes()
 
+    # The data stream is read once by the data stream reader and shared by
+    # the analyzers, the signature scanner and the parsers.
+    self._data_stream_reader.Open(file_entry, data_stream_name)
+    try:
+      self._ProcessOpenedFileEntryDataStream(mediator, file_entry, data_stream)
+    finally:
+      self._data_stream_reader.Close()
+
+  def _ProcessMetadataFile(self, mediator, file_entry):
+    """Processes a metadata file.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      file_entry (dfvfs.FileEntry): file entry of the metadata file.
+    """
+    self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
+
+    self._event_extractor.ParseFileEntryMetadata(mediator, file_entry)
+    for data_stream in file_entry.data_streams:
+      if self._abort:
+        break
+      self.last_activity_timestamp = time.time()
+
+      self._event_extractor.ParseMetadataFile(
+          mediator, file_entry, data_stream.name)
+
+  def _ProcessOpenedFileEntryDataStream(
+      self, mediator, file_entry, data_stream):
+    """Processes a data stream of a file entry opened by the reader.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream (dfvfs.DataStream): data stream or None if the file entry
+          has no data stream.
+    """
     if data_stream and self._analyzers:
       # Since AnalyzeDataStream generates event attributes it needs to be
       # called before producing events.
-      self._AnalyzeDataStream(mediator, file_entry, data_stream.name)
+      self._AnalyzeDataStream(mediator)
 
     self._ExtractMetadataFromFileEntry(mediator, file_entry, data_stream)
 
@@ -730,25 +881,6 @@ class EventExtractionWorker(object):
       self._ExtractContentFromDataStream(
           mediator, file_entry, data_stream.name)
 
-  def _ProcessMetadataFile(self, mediator, file_entry):
-    """Processes a metadata file.
-
-    Args:
-      mediator (ParserMediator): mediates the interactions between
-          parsers and other components, such as storage and abort signals.
-      file_entry (dfvfs.FileEntry): file entry of the metadata file.
-    """
-    self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
-
-    self._event_extractor.ParseFileEntryMetadata(mediator, file_entry)
-    for data_stream in file_entry.data_streams:
-      if self._abort:
-        break
-      self.last_activity_timestamp = time.time()
-
-      self._event_extractor.ParseMetadataFile(
-          mediator, file_entry, data_stream.name)
-
   def _SetHashers(self, hasher_names_string):
     """Sets the hasher names.
 
@@ -764,20 +896,41 @@ class EventExtractionWorker(object):
     analyzer_object.SetHasherNames(hasher_names_string)
     self._analyzers.append(analyzer_object)
 
-  def _SetYaraRules(self, yara_rules_string):
+  def _SetYaraRules(self, yara_rules_string, yara_rules_path=None):
     """Sets the Yara rules.
 
     Args:
       yara_rules_string (str): unparsed Yara rule definitions.
+      yara_rules_path (Optional[str]): path of the file containing the Yara
+          rules compiled from the definitions, where None represents the
+          rules should be compiled from the definitions.
     """
-    if not yara_rules_string:
+    if not yara_rules_string and not yara_rules_path:
       return
 
     analyzer_object = analyzers_manager.AnalyzersManager.GetAnalyzerInstance(
         'yara')
-    analyzer_object.SetRules(yara_rules_string)
+    if yara_rules_path:
+      analyzer_object.LoadRules(
+          yara_rules_path, rules_string=yara_rules_string)
+    else:
+      analyzer_object.SetRules(yara_rules_string)
+
     self._analyzers.append(analyzer_object)
 
+  def Close(self):
+    """Closes the extraction worker."""
+    for analyzer_object in self._analyzers:
+      analyzer_object.Close()
+
+    if self._parse_result_cache:
+      logger.debug((
+          'Parse result cache hits: {0:d}, misses: {1:d}').format(
+              self._parse_result_cache.number_of_hits,
+              self._parse_result_cache.number_of_misses))
+
+      self._parse_result_cache.Close()
+
   def GetAnalyzerNames(self):
     """Gets the names of the active analyzers.
 
@@ -819,7 +972,11 @@ class EventExtractionWorker(object):
     mediator.SetFileEntry(file_entry)
 
     try:
-      if file_entry.IsDirectory():
+      # The file entries within directories of NTFS file systems have been
+      # enumerated from the MFT when NTFS MFT enumeration is enabled.
+      if file_entry.IsDirectory() and not (
+          self._ntfs_mft_enumeration and file_entry.type_indicator == (
+              dfvfs_definitions.TYPE_INDICATOR_NTFS)):
         self._ProcessDirectory(mediator, file_entry)
       self._ProcessFileEntry(mediator, file_entry)
 
@@ -838,9 +995,17 @@ class EventExtractionWorker(object):
     """
     self._hasher_file_size_limit = configuration.hasher_file_size_limit
     self._SetHashers(configuration.hasher_names_string)
+    self._ntfs_mft_enumeration = configuration.ntfs_mft_enumeration
     self._process_archives = configuration.process_archives
     self._process_compressed_streams = configuration.process_compressed_streams
-    self._SetYaraRules(configuration.yara_rules_string)
+    self._SetYaraRules(
+        configuration.yara_rules_string,
+        yara_rules_path=configuration.yara_rules_path)
+
+    if configuration.parse_result_cache_path:
+      self._parse_result_cache = parse_result_cache.ParseResultCache(
+          configuration.parse_result_cache_path,
+          parser_filter_expression=self._parser_filter_expression)
 
   def SetProcessingProfiler(self, processing_profiler):
     """Sets the parsers profiler.
@@ -850,6 +1015,9 @@ class EventExtractionWorker(object):
     """
     self._processing_profiler = processing_profiler
 
+    for analyzer_object in self._analyzers:
+      analyzer_object.SetProcessingProfiler(processing_profiler)
+
   def SignalAbort(self):
     """Signals the extraction worker to abort."""
     self._abort = True
@@ -48,7 +48,8 @@ class FormatterMediator(object):
 
       self._winevt_database_reader = (
           winevt_rc.WinevtResourcesSqlite3DatabaseReader())
-      if not self._winevt_database_reader.Open(database_path):
+      if not self._winevt_database_reader.Open(
+          database_path, preload_message_file_keys=True):
         self._winevt_database_reader = None
 
     return self._winevt_database_reader
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import collections
 import re
 
 try:
@@ -16,14 +17,16 @@ class Sqlite3DatabaseFile(object):
   """Class that defines a sqlite3 database file."""
 
   _HAS_TABLE_QUERY = (
-      'SELECT name FROM sqlite_master '
-      'WHERE type = "table" AND name = "{0:s}"')
+      'SELECT name FROM sqlite_master WHERE type = "table" AND name = ?')
+
+  _TABLE_NAMES_QUERY = 'SELECT name FROM sqlite_master WHERE type = "table"'
 
   def __init__(self):
     """Initializes the database file object."""
     super(Sqlite3DatabaseFile, self).__init__()
     self._connection = None
     self._cursor = None
+    self._table_names = None
     self.filename = None
     self.read_only = None
 
@@ -42,6 +45,7 @@ class Sqlite3DatabaseFile(object):
 
     self._connection = None
     self._cursor = None
+    self._table_names = None
     self.filename = None
     self.read_only = None
 
@@ -61,22 +65,31 @@ class Sqlite3DatabaseFile(object):
       raise RuntimeError(
           'Cannot determine if table exists database not opened.')
 
-    sql_query = self._HAS_TABLE_QUERY.format(table_name)
+    # Since the tables of a read-only database do not change, the table names
+    # are read once instead of querying them for every table.
+    if self.read_only:
+      if self._table_names is None:
+        self._cursor.execute(self._TABLE_NAMES_QUERY)
+        self._table_names = frozenset([row[0] for row in self._cursor])
+
+      return table_name in self._table_names
 
-    self._cursor.execute(sql_query)
+    self._cursor.execute(self._HAS_TABLE_QUERY, (table_name, ))
     if self._cursor.fetchone():
       return True
 
     return False
 
-  def GetValues(self, table_names, column_names, condition):
+  def GetValues(self, table_names, column_names, condition, parameters=None):
     """Retrieves values from a table.
 
     Args:
       table_names (list[str]): table names.
       column_names (list[str]): column names.
-      condition (str): query condition such as
-          "log_source == 'Application Error'".
+      condition (str): query condition such as "log_source == ?".
+      parameters (Optional[tuple[object]]): values of the parameters in
+          the query condition, such as ("Application Error", ). Parameterized
+          queries allow sqlite3 to reuse the prepared statement.
 
     Yields:
       sqlite3.row: row.
@@ -93,7 +106,7 @@ class Sqlite3DatabaseFile(object):
     sql_query = 'SELECT {1:s} FROM {0:s}{2:s}'.format(
         ', '.join(table_names), ', '.join(column_names), condition)
 
-    self._cursor.execute(sql_query)
+    self._cursor.execute(sql_query, parameters or ())
 
     # TODO: have a look at https://docs.python.org/2/library/
     # sqlite3.html#sqlite3.Row.
@@ -174,9 +187,26 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
   # Message string specifiers that expand to a variable place holder.
   _PLACE_HOLDER_SPECIFIER_RE = re.compile(r'%([1-9][0-9]?)[!]?[s]?[!]?')
 
+  # Maximum number of cached message strings.
+  _MAXIMUM_CACHED_MESSAGES = 16384
+
+  _MESSAGE_FILE_KEYS_QUERY_TABLE_NAMES = [
+      'event_log_providers', 'message_file_per_event_log_provider']
+
+  _MESSAGE_FILE_KEYS_QUERY_COLUMN_NAMES = [
+      'event_log_providers.log_source',
+      'message_file_per_event_log_provider.message_file_key']
+
+  _MESSAGE_FILE_KEYS_QUERY_CONDITION = (
+      'event_log_providers.event_log_provider_key == '
+      'message_file_per_event_log_provider.event_log_provider_key')
+
   def __init__(self):
     """Initializes the database reader object."""
     super(WinevtResourcesSqlite3DatabaseReader, self).__init__()
+    self._message_file_keys_per_log_source = {}
+    self._message_file_keys_preloaded = False
+    self._messages_cache = collections.OrderedDict()
     self._string_format = 'wrc'
 
   def _GetEventLogProviderKey(self, log_source):
@@ -193,10 +223,10 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
     """
     table_names = ['event_log_providers']
     column_names = ['event_log_provider_key']
-    condition = 'log_source == "{0:s}"'.format(log_source)
+    condition = 'log_source == ?'
 
     values_list = list(self._database_file.GetValues(
-        table_names, column_names, condition))
+        table_names, column_names, condition, parameters=(log_source, )))
 
     number_of_values = len(values_list)
     if number_of_values == 0:
@@ -229,10 +259,11 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
       return None
 
     column_names = ['message_string']
-    condition = 'message_identifier == "0x{0:08x}"'.format(message_identifier)
+    condition = 'message_identifier == ?'
+    parameters = ('0x{0:08x}'.format(message_identifier), )
 
     values = list(self._database_file.GetValues(
-        [table_name], column_names, condition))
+        [table_name], column_names, condition, parameters=parameters))
 
     number_of_values = len(values)
     if number_of_values == 0:
@@ -254,14 +285,59 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
     """
     table_names = ['message_file_per_event_log_provider']
     column_names = ['message_file_key']
-    condition = 'event_log_provider_key == {0:d}'.format(
-        event_log_provider_key)
+    condition = 'event_log_provider_key == ?'
 
     generator = self._database_file.GetValues(
-        table_names, column_names, condition)
+        table_names, column_names, condition,
+        parameters=(event_log_provider_key, ))
     for values in generator:
       yield values['message_file_key']
 
+  def _GetMessageFileKeysByLogSource(self, log_source):
+    """Retrieves the message file keys of a specific Event Log source.
+
+    The message file keys are cached per Event Log source, including
+    the Event Log sources that are not in the database.
+
+    Args:
+      log_source (str): Event Log source.
+
+    Returns:
+      list[int]: message file keys.
+    """
+    message_file_keys = self._message_file_keys_per_log_source.get(
+        log_source, None)
+    if message_file_keys is None:
+      if self._message_file_keys_preloaded:
+        message_file_keys = []
+      else:
+        event_log_provider_key = self._GetEventLogProviderKey(log_source)
+        if not event_log_provider_key:
+          message_file_keys = []
+        else:
+          message_file_keys = list(self._GetMessageFileKeys(
+              event_log_provider_key))
+
+      self._message_file_keys_per_log_source[log_source] = message_file_keys
+
+    return message_file_keys
+
+  def _PreloadMessageFileKeys(self):
+    """Preloads the message file keys of all Event Log sources."""
+    generator = self._database_file.GetValues(
+        self._MESSAGE_FILE_KEYS_QUERY_TABLE_NAMES,
+        self._MESSAGE_FILE_KEYS_QUERY_COLUMN_NAMES,
+        self._MESSAGE_FILE_KEYS_QUERY_CONDITION)
+
+    for values in generator:
+      log_source = values['event_log_providers.log_source']
+      message_file_keys = self._message_file_keys_per_log_source.setdefault(
+          log_source, [])
+      message_file_keys.append(
+          values['message_file_per_event_log_provider.message_file_key'])
+
+    self._message_file_keys_preloaded = True
+
   def _ReformatMessageString(self, message_string):
     """Reformats the message string.
 
@@ -294,9 +370,20 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
     return self._PLACE_HOLDER_SPECIFIER_RE.sub(
         _PlaceHolderSpecifierReplacer, message_string)
 
+  def Close(self):
+    """Closes the database reader object."""
+    super(WinevtResourcesSqlite3DatabaseReader, self).Close()
+
+    self._message_file_keys_per_log_source = {}
+    self._message_file_keys_preloaded = False
+    self._messages_cache = collections.OrderedDict()
+
   def GetMessage(self, log_source, lcid, message_identifier):
     """Retrieves a specific message for a specific Event Log source.
 
+    The most recently used message strings are cached, including the messages
+    that are not available.
+
     Args:
       log_source (str): Event Log source.
       lcid (int): language code identifier (LCID).
@@ -305,26 +392,31 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
     Returns:
       str: message string or None if not available.
     """
-    event_log_provider_key = self._GetEventLogProviderKey(log_source)
-    if not event_log_provider_key:
-      return None
+    lookup_key = (log_source, lcid, message_identifier)
 
-    generator = self._GetMessageFileKeys(event_log_provider_key)
-    if not generator:
-      return None
+    try:
+      message_string = self._messages_cache.pop(lookup_key)
+      self._messages_cache[lookup_key] = message_string
+      return message_string
+    except KeyError:
+      pass
 
-    # TODO: cache a number of message strings.
     message_string = None
-    for message_file_key in generator:
+    for message_file_key in self._GetMessageFileKeysByLogSource(log_source):
       message_string = self._GetMessage(
           message_file_key, lcid, message_identifier)
 
       if message_string:
         break
 
-    if self._string_format == 'wrc':
+    if message_string and self._string_format == 'wrc':
       message_string = self._ReformatMessageString(message_string)
 
+    if len(self._messages_cache) >= self._MAXIMUM_CACHED_MESSAGES:
+      self._messages_cache.popitem(last=False)
+
+    self._messages_cache[lookup_key] = message_string
+
     return message_string
 
   def GetMetadataAttribute(self, attribute_name):
@@ -346,10 +438,10 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
       return None
 
     column_names = ['value']
-    condition = 'name == "{0:s}"'.format(attribute_name)
+    condition = 'name == ?'
 
     values = list(self._database_file.GetValues(
-        [table_name], column_names, condition))
+        [table_name], column_names, condition, parameters=(attribute_name, )))
 
     number_of_values = len(values)
     if number_of_values == 0:
@@ -360,11 +452,14 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
 
     raise RuntimeError('More than one value found in database.')
 
-  def Open(self, filename):
+  def Open(self, filename, preload_message_file_keys=False):
     """Opens the database reader object.
 
     Args:
       filename (str): filename of the database.
+      preload_message_file_keys (Optional[bool]): True if the message file
+          keys of all Event Log sources should be read into memory, instead
+          of on first use per Event Log source.
 
     Returns:
       bool: True if successful.
@@ -389,4 +484,8 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
           string_format))
 
     self._string_format = string_format
+
+    if preload_message_file_keys:
+      self._PreloadMessageFileKeys()
+
     return True
@@ -150,3 +150,41 @@ TIME_DESCRIPTION_NOT_A_TIME = 'Not a time'
 # of which the exact meaning is unknown and being researched.
 # For most cases do not use this timestamp description.
 TIME_DESCRIPTION_UNKNOWN = 'Unknown Time'
+
+TIME_DESCRIPTIONS = frozenset([
+    TIME_DESCRIPTION_ACCOUNT_CREATED,
+    TIME_DESCRIPTION_ADDED,
+    TIME_DESCRIPTION_BACKUP,
+    TIME_DESCRIPTION_CHANGE,
+    TIME_DESCRIPTION_CONNECTION_ESTABLISHED,
+    TIME_DESCRIPTION_CONNECTION_FAILED,
+    TIME_DESCRIPTION_DELETED,
+    TIME_DESCRIPTION_DOWNGRADE,
+    TIME_DESCRIPTION_END,
+    TIME_DESCRIPTION_EXIT,
+    TIME_DESCRIPTION_EXPIRATION,
+    TIME_DESCRIPTION_FILE_DOWNLOADED,
+    TIME_DESCRIPTION_FIRST_CONNECTED,
+    TIME_DESCRIPTION_INSTALLATION,
+    TIME_DESCRIPTION_LAST_ACTIVE,
+    TIME_DESCRIPTION_LAST_ACCESS,
+    TIME_DESCRIPTION_LAST_CHECKED,
+    TIME_DESCRIPTION_LAST_CONNECTED,
+    TIME_DESCRIPTION_LAST_LOGIN,
+    TIME_DESCRIPTION_LAST_PASSWORD_RESET,
+    TIME_DESCRIPTION_LAST_PRINTED,
+    TIME_DESCRIPTION_LAST_RESUME,
+    TIME_DESCRIPTION_LAST_RUN,
+    TIME_DESCRIPTION_LAST_SHUTDOWN,
+    TIME_DESCRIPTION_LAST_USED,
+    TIME_DESCRIPTION_LAST_VISITED,
+    TIME_DESCRIPTION_MODIFICATION,
+    TIME_DESCRIPTION_NOT_A_TIME,
+    TIME_DESCRIPTION_RECORDED,
+    TIME_DESCRIPTION_SAMPLE,
+    TIME_DESCRIPTION_SCHEDULED_TO_END,
+    TIME_DESCRIPTION_SCHEDULED_TO_START,
+    TIME_DESCRIPTION_SENT,
+    TIME_DESCRIPTION_START,
+    TIME_DESCRIPTION_UNKNOWN,
+    TIME_DESCRIPTION_UPDATE])
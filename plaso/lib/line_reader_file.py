@@ -1,40 +1,94 @@
 # -*- coding: utf-8 -*-
-"""Binary line reader file-like object."""
+"""Line reader file-like objects."""
 
 from __future__ import unicode_literals
 
+import codecs
 import os
 
 
-class BinaryLineReader(object):
-  """Line reader for binary file-like objects.
+class LineReader(object):
+  """Line reader that reads and decodes a file-like object in blocks.
+
+  The file-like object is read in blocks, that grow from a small initial size,
+  such that determining if the first lines are supported does not require
+  reading much data, up to the maximum block size. The lines of a block are
+  split and decoded in bulk, instead of per line, where a block that cannot be
+  decoded in bulk, for example due to a decoding error, is decoded per line.
+  This ensures a decoding error is raised for the line that cannot be decoded.
 
   Attributes:
-    end_of_line (bytes): byte sequence that separates lines from each other.
+    end_of_line (bytes|str): sequence that separates lines from each other.
   """
 
-  # The size of the lines buffer.
-  _LINES_BUFFER_SIZE = 1024 * 1024
+  # The default maximum size of a block.
+  DEFAULT_BLOCK_SIZE = 1024 * 1024
 
   # The maximum allowed size of the read buffer.
   MAXIMUM_READ_BUFFER_SIZE = 16 * 1024 * 1024
 
-  def __init__(self, file_object, end_of_line=b'\n'):
+  # The size of the first block.
+  _INITIAL_BLOCK_SIZE = 4096
+
+  def __init__(
+      self, file_object, encoding=None, encoding_errors='strict',
+      end_of_line=None, block_size=None):
     """Initializes the line reader.
 
     Args:
       file_object (FileIO): a file-like object to read from.
-      end_of_line (Optional[bytes]): end of line indicator.
+      encoding (Optional[str]): encoding of the text, where None represents
+          lines are not decoded and are returned as bytes.
+      encoding_errors (Optional[str]): text encoding errors handler.
+      end_of_line (Optional[bytes|str]): end of line indicator, where None
+          represents a newline. The end of line indicator must be a string if
+          an encoding is specified and bytes otherwise.
+      block_size (Optional[int]): maximum size of a block, where None
+          represents the default.
     """
-    super(BinaryLineReader, self).__init__()
+    if end_of_line is None:
+      if encoding:
+        end_of_line = '\n'
+      else:
+        end_of_line = b'\n'
+
+    encoded_end_of_line = end_of_line
+    decoder = None
+    if encoding:
+      # Encoding an empty string results in the byte-order mark, if any,
+      # which is not part of the encoded end of line indicator.
+      byte_order_mark_size = len(''.encode(encoding))
+      encoded_end_of_line = end_of_line.encode(encoding)[
+          byte_order_mark_size:]
+
+      # Lines are only decoded in bulk if the end of line indicator is encoded
+      # as a single byte, such as in UTF-8 and single-byte encodings, where
+      # decoding in bulk and per line produce the same lines. In encodings such
+      # as UTF-16 a line with an odd number of bytes would affect how the lines
+      # that follow it are decoded.
+      if len(encoded_end_of_line) == 1:
+        decoder_class = codecs.getincrementaldecoder(encoding)
+        decoder = decoder_class(errors=encoding_errors)
+
+    maximum_block_size = block_size or self.DEFAULT_BLOCK_SIZE
+
+    super(LineReader, self).__init__()
+    self._block_size = min(self._INITIAL_BLOCK_SIZE, maximum_block_size)
+    self._byte_lines = []
+    self._current_offset = 0
+    self._decoder = decoder
+    self._encoded_end_of_line = encoded_end_of_line
+    self._encoding = encoding
+    self._encoding_errors = encoding_errors
     self._file_object = file_object
     self._file_object_size = file_object.get_size()
-    self.end_of_line = end_of_line
-    self._end_of_line_length = len(self.end_of_line)
+    self._line_index = 0
     self._lines = []
     self._lines_buffer = b''
     self._lines_buffer_offset = 0
-    self._current_offset = 0
+    self._maximum_block_size = maximum_block_size
+
+    self.end_of_line = end_of_line
 
   def __enter__(self):
     """Enters a with statement."""
@@ -49,12 +103,216 @@ class BinaryLineReader(object):
     """Returns a line of text.
 
     Yields:
-      bytes: line of text.
+      bytes|str: line of text.
     """
-    line = self.readline()
-    while line:
+    for _, line in self.GetLines():
       yield line
-      line = self.readline()
+
+  def _DecodeLine(self, byte_line, offset):
+    """Decodes a line.
+
+    Args:
+      byte_line (bytes): line.
+      offset (int): offset of the line.
+
+    Returns:
+      bytes|str: decoded line, or the line if no encoding is specified.
+
+    Raises:
+      UnicodeDecodeError: if the line cannot be decoded and encoding errors is
+          set to strict.
+    """
+    if not self._encoding:
+      return byte_line
+
+    line = byte_line.decode(self._encoding, self._encoding_errors)
+
+    # Remove a byte-order mark at the start of the file.
+    if offset == 0 and line.startswith('\ufeff'):
+      line = line[1:]
+
+    return line
+
+  def _DecodeLines(self, byte_lines, read_buffer, offset, final=False):
+    """Decodes lines in bulk.
+
+    Args:
+      byte_lines (list[bytes]): lines, including the end of line indicator.
+      read_buffer (bytes): data of the lines.
+      offset (int): offset of the first line.
+      final (Optional[bool]): True if the data is the end of the file.
+
+    Returns:
+      list[bytes|str]: decoded lines, or None if the lines could not be
+          decoded in bulk and should be decoded per line.
+    """
+    if not self._encoding:
+      return byte_lines
+
+    if not self._decoder:
+      return None
+
+    try:
+      text = self._decoder.decode(read_buffer, final=final)
+    except UnicodeDecodeError:
+      self._decoder.reset()
+      return None
+
+    lines = text.split(self.end_of_line)
+    if not lines[-1]:
+      lines.pop()
+
+    # The number of decoded lines differs if the encoded end of line
+    # indicator is part of another character.
+    if len(lines) != len(byte_lines):
+      return None
+
+    end_of_line = self.end_of_line
+    lines = [line + end_of_line for line in lines]
+
+    # The data of a partial last line does not end with an end of line
+    # indicator.
+    if not byte_lines[-1].endswith(self._encoded_end_of_line):
+      lines[-1] = lines[-1][:-len(end_of_line)]
+
+    # Remove a byte-order mark at the start of the file.
+    if offset == 0 and lines[0].startswith('\ufeff'):
+      lines[0] = lines[0][1:]
+
+    return lines
+
+  def _ReadBlock(self, maximum_line_length=None):
+    """Reads the lines of the next block.
+
+    Args:
+      maximum_line_length (Optional[int]): maximum size of a line in bytes,
+          where None represents the maximum read buffer size. Data without an
+          end of line indicator is read up to this size and then returned as
+          a partial line, such that reading a file without end of line
+          indicators does not require reading up to the maximum read buffer
+          size.
+
+    Returns:
+      bool: True if lines were read, False if the end of the file was reached.
+    """
+    self._byte_lines = []
+    self._line_index = 0
+    self._lines = []
+
+    maximum_partial_line_size = min(
+        maximum_line_length or self.MAXIMUM_READ_BUFFER_SIZE,
+        self.MAXIMUM_READ_BUFFER_SIZE)
+
+    offset = self._current_offset
+    while not self._byte_lines:
+      # Note that the lines buffer does not contain an end of line indicator.
+      if len(self._lines_buffer) >= maximum_partial_line_size:
+        # Return a line that exceeds the maximum line length or the maximum
+        # read buffer size as a partial line, where the remainder of the line
+        # is returned by the next block. A partial line can end with part of
+        # a character and therefore is decoded per line.
+        self._byte_lines = [self._lines_buffer[:maximum_partial_line_size]]
+        self._lines_buffer = self._lines_buffer[maximum_partial_line_size:]
+        self._lines = None
+        break
+
+      if self._lines_buffer_offset >= self._file_object_size:
+        if not self._lines_buffer:
+          return False
+
+        read_buffer = self._lines_buffer
+        self._byte_lines = [read_buffer]
+        self._lines_buffer = b''
+        self._lines = self._DecodeLines(
+            self._byte_lines, read_buffer, offset, final=True)
+        break
+
+      read_size = min(
+          self._block_size,
+          self._file_object_size - self._lines_buffer_offset)
+
+      self._file_object.seek(self._lines_buffer_offset, os.SEEK_SET)
+      read_buffer = self._file_object.read(read_size)
+      if not read_buffer:
+        # The file is smaller than its reported size.
+        self._file_object_size = self._lines_buffer_offset
+        continue
+
+      self._lines_buffer_offset += len(read_buffer)
+      self._block_size = min(self._block_size * 2, self._maximum_block_size)
+
+      if self._lines_buffer:
+        read_buffer = b''.join([self._lines_buffer, read_buffer])
+
+      byte_lines = read_buffer.split(self._encoded_end_of_line)
+      self._lines_buffer = byte_lines.pop()
+
+      if not byte_lines:
+        continue
+
+      end_of_line = self._encoded_end_of_line
+      byte_lines = [byte_line + end_of_line for byte_line in byte_lines]
+
+      if self._lines_buffer:
+        read_buffer = read_buffer[:-len(self._lines_buffer)]
+
+      self._byte_lines = byte_lines
+      self._lines = self._DecodeLines(byte_lines, read_buffer, offset)
+
+    # Lines that could not be decoded in bulk are decoded per line.
+    if self._lines is None:
+      self._lines = [None] * len(self._byte_lines)
+
+    return True
+
+  def GetLines(self, maximum_line_length=None):
+    """Retrieves the lines and their offsets.
+
+    Args:
+      maximum_line_length (Optional[int]): maximum size of a line in bytes,
+          including the end of line indicator, where lines that exceed this
+          size are returned as multiple partial lines.
+
+    Yields:
+      tuple[int, bytes|str]: offset and line.
+
+    Raises:
+      UnicodeDecodeError: if a line cannot be decoded and encoding errors is
+          set to strict.
+    """
+    while (self._line_index < len(self._byte_lines) or
+           self._ReadBlock(maximum_line_length=maximum_line_length)):
+      byte_lines = self._byte_lines
+      lines = self._lines
+
+      for index in range(self._line_index, len(byte_lines)):
+        byte_line = byte_lines[index]
+        line = lines[index]
+        offset = self._current_offset
+
+        if maximum_line_length and len(byte_line) > maximum_line_length:
+          byte_lines[index] = byte_line[maximum_line_length:]
+          byte_line = byte_line[:maximum_line_length]
+          if lines is not byte_lines:
+            lines[index] = None
+
+          self._current_offset = offset + maximum_line_length
+
+          yield offset, self._DecodeLine(byte_line, offset)
+          break
+
+        # Note that a line that cannot be decoded is considered read.
+        self._current_offset = offset + len(byte_line)
+        self._line_index = index + 1
+
+        if line is None:
+          line = self._DecodeLine(byte_line, offset)
+
+        yield offset, line
+
+        # Synchronize with lines read by readline.
+        if self._line_index != index + 1:
+          break
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the readline file-like object interface.
@@ -64,9 +322,9 @@ class BinaryLineReader(object):
     """Reads a single line of text.
 
     The functions reads one entire line from the file-like object. A trailing
-    end-of-line indicator (newline by default) is kept in the byte string (but
-    may be absent when a file ends with an incomplete line). An empty byte
-    string is returned only when end-of-file is encountered immediately.
+    end-of-line indicator (newline by default) is kept in the line (but
+    may be absent when a file ends with an incomplete line). An empty line
+    is returned only when end-of-file is encountered immediately.
 
     Args:
       size (Optional[int]): maximum byte size to read. If present and
@@ -74,9 +332,11 @@ class BinaryLineReader(object):
           end-of-line) and an incomplete line may be returned.
 
     Returns:
-      bytes: line of text.
+      bytes|str: line of text.
 
     Raises:
+      UnicodeDecodeError: if a line cannot be decoded and encoding errors is
+          set to strict.
       ValueError: if the specified size is less than zero or greater
           than the maximum size allowed.
     """
@@ -88,53 +348,13 @@ class BinaryLineReader(object):
           'Invalid size value exceeds maximum value {0:d}.'.format(
               self.MAXIMUM_READ_BUFFER_SIZE))
 
-    if not self._lines:
-      if self._lines_buffer_offset >= self._file_object_size:
-        return b''
+    for _, line in self.GetLines(maximum_line_length=size):
+      return line
 
-      read_size = size
-      if not read_size:
-        read_size = self.MAXIMUM_READ_BUFFER_SIZE
+    if self._encoding:
+      return ''
 
-      if self._lines_buffer_offset + read_size > self._file_object_size:
-        size = self._file_object_size - self._lines_buffer_offset
-
-      self._file_object.seek(self._lines_buffer_offset, os.SEEK_SET)
-      read_buffer = self._file_object.read(read_size)
-
-      self._lines_buffer_offset += len(read_buffer)
-
-      self._lines = read_buffer.split(self.end_of_line)
-      if self._lines_buffer:
-        self._lines[0] = b''.join([self._lines_buffer, self._lines[0]])
-        self._lines_buffer = b''
-
-      if read_buffer[self._end_of_line_length:] != self.end_of_line:
-        self._lines_buffer = self._lines.pop()
-
-      for index, line in enumerate(self._lines):
-        self._lines[index] = b''.join([line, self.end_of_line])
-
-      if (self._lines_buffer and
-          self._lines_buffer_offset >= self._file_object_size):
-        self._lines.append(self._lines_buffer)
-        self._lines_buffer = b''
-
-    if not self._lines:
-      line = self._lines_buffer
-      self._lines_buffer = b''
-
-    elif not size or size >= len(self._lines[0]):
-      line = self._lines.pop(0)
-
-    else:
-      line = self._lines[0]
-      self._lines[0] = line[size:]
-      line = line[:size]
-
-    self._current_offset += len(line)
-
-    return line
+    return b''
 
   def readlines(self, sizehint=None):
     """Reads lines of text.
@@ -147,25 +367,17 @@ class BinaryLineReader(object):
           of reading up to EOF, whole lines totalling sizehint bytes are read.
 
     Returns:
-      list[bytes]: lines of text.
+      list[bytes|str]: lines of text.
     """
     if sizehint is None or sizehint <= 0:
       sizehint = None
 
     lines = []
-    lines_byte_size = 0
-    line = self.readline()
-
-    while line:
+    for _, line in self.GetLines():
       lines.append(line)
 
-      if sizehint is not None:
-        lines_byte_size += len(line)
-
-        if lines_byte_size >= sizehint:
-          break
-
-      line = self.readline()
+      if sizehint is not None and self._current_offset >= sizehint:
+        break
 
     return lines
 
@@ -178,6 +390,20 @@ class BinaryLineReader(object):
     return self._current_offset
 
 
+class BinaryLineReader(LineReader):
+  """Line reader for binary file-like objects."""
+
+  def __init__(self, file_object, end_of_line=b'\n'):
+    """Initializes the line reader.
+
+    Args:
+      file_object (FileIO): a file-like object to read from.
+      end_of_line (Optional[bytes]): end of line indicator.
+    """
+    super(BinaryLineReader, self).__init__(
+        file_object, end_of_line=end_of_line)
+
+
 class BinaryDSVReader(object):
   """Basic reader for delimiter separated text files of unknown encoding.
 
@@ -15,6 +15,7 @@ from plaso.engine import engine
 from plaso.engine import process_info
 from plaso.lib import definitions
 from plaso.multi_processing import logger
+from plaso.multi_processing import metrics_server
 from plaso.multi_processing import plaso_xmlrpc
 
 
@@ -24,7 +25,8 @@ class MultiProcessEngine(engine.BaseEngine):
   This class contains functionality to:
   * monitor and manage worker processes;
   * retrieve a process status information via RPC;
-  * manage the status update thread.
+  * manage the status update thread;
+  * export processing metrics via HTTP.
   """
 
   # Note that on average Windows seems to require a longer wait.
@@ -36,6 +38,8 @@ class MultiProcessEngine(engine.BaseEngine):
   # process
   _REPLACEMENT_WORKER_RETRY_DELAY = 1
 
+  _METRICS_SERVER_HOSTNAME = 'localhost'
+
   _PROCESS_JOIN_TIMEOUT = 5.0
 
   _ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS = 300
@@ -46,6 +50,7 @@ class MultiProcessEngine(engine.BaseEngine):
     self._debug_output = False
     self._name = 'Main'
     self._log_filename = None
+    self._metrics_server = None
     self._pid = os.getpid()
     self._process_information = process_info.ProcessInfo(self._pid)
     self._process_information_per_pid = {}
@@ -287,6 +292,16 @@ class MultiProcessEngine(engine.BaseEngine):
       MultiProcessWorkerProcess: extraction worker process.
     """
 
+  def _StartMetricsServer(self, port):
+    """Starts the processing metrics server.
+
+    Args:
+      port (int): port of the processing metrics server on localhost.
+    """
+    self._metrics_server = metrics_server.ProcessingMetricsServer()
+    if not self._metrics_server.Start(self._METRICS_SERVER_HOSTNAME, port):
+      self._metrics_server = None
+
   def _StartMonitoringProcess(self, process):
     """Starts monitoring a process.
 
@@ -350,6 +365,12 @@ class MultiProcessEngine(engine.BaseEngine):
   def _StatusUpdateThreadMain(self):
     """Main function of the status update thread."""
 
+  def _StopMetricsServer(self):
+    """Stops the processing metrics server."""
+    if self._metrics_server:
+      self._metrics_server.Stop()
+      self._metrics_server = None
+
   def _StopMonitoringProcess(self, process):
     """Stops monitoring a process.
 
@@ -431,6 +452,11 @@ class MultiProcessEngine(engine.BaseEngine):
       logger.warning('Killing process: (PID: {0:d}).'.format(pid))
       self._KillProcess(pid)
 
+  def _UpdateMetrics(self):
+    """Updates the processing metrics from the processing status."""
+    if self._metrics_server:
+      self._metrics_server.UpdateMetrics(self._processing_status)
+
   @abc.abstractmethod
   def _UpdateProcessingStatus(self, pid, process_status, used_memory):
     """Updates the processing status.
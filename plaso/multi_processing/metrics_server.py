@@ -0,0 +1,435 @@
+# -*- coding: utf-8 -*-
+"""HTTP server that exports processing metrics in Prometheus text format."""
+
+from __future__ import unicode_literals
+
+import codecs
+import sys
+import threading
+import time
+
+# pylint: disable=import-error,wrong-import-order
+if sys.version_info[0] < 3:
+  import BaseHTTPServer
+  import SocketServer
+else:
+  from http import server as BaseHTTPServer
+  import socketserver as SocketServer
+
+# pylint: disable=wrong-import-position
+from plaso.multi_processing import logger
+
+
+class _MetricsHTTPServer(
+    SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+  """Threaded HTTP server that serves the most recent metrics.
+
+  Attributes:
+    metrics_data (bytes): UTF-8 encoded metrics in Prometheus text format.
+  """
+
+  daemon_threads = True
+
+  def __init__(self, server_address, request_handler_class):
+    """Initializes a metrics HTTP server.
+
+    Args:
+      server_address (tuple[str, int]): hostname and port to bind to.
+      request_handler_class (type): HTTP request handler class.
+    """
+    BaseHTTPServer.HTTPServer.__init__(
+        self, server_address, request_handler_class)
+    self.metrics_data = b''
+
+
+class _MetricsHTTPRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+  """HTTP request handler that serves the metrics."""
+
+  _CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+  # pylint: disable=invalid-name
+  def do_GET(self):
+    """Handles a HTTP GET request."""
+    path, _, _ = self.path.partition('?')
+    if path not in ('/', '/metrics'):
+      self.send_error(404)
+      return
+
+    metrics_data = self.server.metrics_data
+
+    self.send_response(200)
+    self.send_header('Content-Type', self._CONTENT_TYPE)
+    self.send_header('Content-Length', '{0:d}'.format(len(metrics_data)))
+    self.end_headers()
+    self.wfile.write(metrics_data)
+
+  def log_message(self, format, *args):  # pylint: disable=redefined-builtin,unused-argument
+    """Logs a HTTP request.
+
+    Requests are not logged since the metrics are typically scraped at
+    a regular interval.
+
+    Args:
+      format (str): format string.
+      args (list[object]): format string arguments.
+    """
+    return
+
+
+class ProcessingMetricsServer(object):
+  """HTTP server that exports processing metrics in Prometheus text format.
+
+  The metrics are formatted when the processing status is updated, which
+  is done by the status update thread of the foreman, hence serving the
+  metrics does not access the processing status concurrently.
+  """
+
+  _THREAD_NAME = 'processing_metrics_server'
+
+  # The metrics definitions, which consist of the name of the status
+  # attribute, the name, type and help text of the metric.
+  _EVENTS_METRICS = [
+      ('number_of_duplicate_events', 'plaso_events_duplicate_total',
+       'counter', 'Number of duplicate events, not including the original.'),
+      ('number_of_events_from_time_slice',
+       'plaso_events_from_time_slice_total', 'counter',
+       'Number of events from the time slice.'),
+      ('number_of_filtered_events', 'plaso_events_filtered_total', 'counter',
+       'Number of events excluded by the event filter.'),
+      ('number_of_macb_grouped_events', 'plaso_events_macb_grouped_total',
+       'counter', 'Number of events grouped based on MACB.'),
+      ('number_of_sort_runs', 'plaso_events_sort_runs_total', 'counter',
+       'Number of runs written to the scratch directory by the external '
+       'memory event sorter.'),
+      ('number_of_sorted_events', 'plaso_events_sorted_total', 'counter',
+       'Number of events sorted by the external memory event sorter.'),
+      ('total_number_of_events', 'plaso_events', 'gauge',
+       'Total number of events in the storage file.')]
+
+  _PROCESS_METRICS = [
+      ('used_memory', 'plaso_process_used_memory_bytes', 'gauge',
+       'Size of the memory used by the process.'),
+      ('number_of_consumed_sources', 'plaso_process_consumed_sources_total',
+       'counter', 'Number of event sources consumed by the process.'),
+      ('number_of_produced_sources', 'plaso_process_produced_sources_total',
+       'counter', 'Number of event sources produced by the process.'),
+      ('number_of_consumed_events', 'plaso_process_consumed_events_total',
+       'counter', 'Number of events consumed by the process.'),
+      ('number_of_produced_events', 'plaso_process_produced_events_total',
+       'counter', 'Number of events produced by the process.'),
+      ('number_of_consumed_event_tags',
+       'plaso_process_consumed_event_tags_total', 'counter',
+       'Number of event tags consumed by the process.'),
+      ('number_of_produced_event_tags',
+       'plaso_process_produced_event_tags_total', 'counter',
+       'Number of event tags produced by the process.'),
+      ('number_of_consumed_reports', 'plaso_process_consumed_reports_total',
+       'counter', 'Number of event reports consumed by the process.'),
+      ('number_of_produced_reports', 'plaso_process_produced_reports_total',
+       'counter', 'Number of event reports produced by the process.'),
+      ('number_of_consumed_warnings', 'plaso_process_consumed_warnings_total',
+       'counter', 'Number of warnings consumed by the process.'),
+      ('number_of_produced_warnings', 'plaso_process_produced_warnings_total',
+       'counter', 'Number of warnings produced by the process.'),
+      ('number_of_bytes_read', 'plaso_process_read_bytes_total', 'counter',
+       'Number of bytes read from data streams by the process.'),
+      ('number_of_data_stream_bytes', 'plaso_process_data_stream_bytes_total',
+       'counter', 'Number of bytes of the data streams read by the process.'),
+      ('number_of_parse_result_cache_hits',
+       'plaso_process_parse_result_cache_hits_total', 'counter',
+       'Number of data streams with cached parse results.'),
+      ('number_of_parse_result_cache_misses',
+       'plaso_process_parse_result_cache_misses_total', 'counter',
+       'Number of data streams without cached parse results.')]
+
+  _TASKS_METRICS = [
+      ('number_of_queued_tasks', 'plaso_tasks_queued', 'gauge',
+       'Number of tasks queued for processing.'),
+      ('number_of_tasks_processing', 'plaso_tasks_processing', 'gauge',
+       'Number of tasks being processed.'),
+      ('number_of_tasks_pending_merge', 'plaso_tasks_pending_merge', 'gauge',
+       'Number of processed tasks pending merge.'),
+      ('number_of_abandoned_tasks', 'plaso_tasks_abandoned', 'gauge',
+       'Number of abandoned tasks.'),
+      ('total_number_of_tasks', 'plaso_tasks_total', 'counter',
+       'Total number of tasks.')]
+
+  def __init__(self):
+    """Initializes a processing metrics server."""
+    super(ProcessingMetricsServer, self).__init__()
+    self._http_server = None
+    self._http_server_thread = None
+    self._produced_events_per_process = {}
+
+  @property
+  def port(self):
+    """int: port the server is bound to or None if not started."""
+    if not self._http_server:
+      return None
+
+    return self._http_server.server_address[1]
+
+  def _EscapeLabelValue(self, value):
+    """Escapes a label value.
+
+    Args:
+      value (object): label value.
+
+    Returns:
+      str: escaped label value.
+    """
+    value = '{0!s}'.format(value)
+    value = value.replace('\\', '\\\\')
+    value = value.replace('"', '\\"')
+    return value.replace('\n', '\\n')
+
+  def _FormatMetricFamily(self, name, metric_type, help_text, samples):
+    """Formats a metric family.
+
+    Args:
+      name (str): name of the metric.
+      metric_type (str): type of the metric, such as "counter" or "gauge".
+      help_text (str): description of the metric.
+      samples (list[tuple[dict[str, object], float]]): labels and value
+          of every sample of the metric.
+
+    Returns:
+      list[str]: lines of the metric family in Prometheus text format.
+    """
+    lines = [
+        '# HELP {0:s} {1:s}'.format(name, help_text),
+        '# TYPE {0:s} {1:s}'.format(name, metric_type)]
+
+    for labels, value in samples:
+      if labels:
+        labels_string = ','.join([
+            '{0:s}="{1:s}"'.format(
+                label_name, self._EscapeLabelValue(label_value))
+            for label_name, label_value in sorted(labels.items())])
+        labels_string = '{{{0:s}}}'.format(labels_string)
+      else:
+        labels_string = ''
+
+      if isinstance(value, float):
+        value_string = repr(value)
+      else:
+        value_string = '{0:d}'.format(value)
+
+      lines.append('{0:s}{1:s} {2:s}'.format(name, labels_string, value_string))
+
+    return lines
+
+  def _FormatMetrics(self, processing_status, timestamp):
+    """Formats the metrics of a processing status.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+      timestamp (float): time of the processing status update in number of
+          seconds since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      str: metrics in Prometheus text format.
+    """
+    lines = []
+
+    lines.extend(self._FormatMetricFamily(
+        'plaso_processing_start_time_seconds', 'gauge',
+        'Time that the processing was started.',
+        [({}, float(processing_status.start_time))]))
+
+    lines.extend(self._FormatMetricFamily(
+        'plaso_processing_aborted', 'gauge',
+        'Indicates if processing was aborted.',
+        [({}, int(processing_status.aborted))]))
+
+    processes_status = []
+    if processing_status.foreman_status:
+      processes_status.append(('foreman', processing_status.foreman_status))
+
+    for worker_status in processing_status.workers_status:
+      processes_status.append(('worker', worker_status))
+
+    if processes_status:
+      lines.extend(self._FormatProcessMetrics(processes_status, timestamp))
+
+    tasks_status = processing_status.tasks_status
+    if tasks_status:
+      for attribute_name, name, metric_type, help_text in self._TASKS_METRICS:
+        value = getattr(tasks_status, attribute_name, None) or 0
+        lines.extend(self._FormatMetricFamily(
+            name, metric_type, help_text, [({}, value)]))
+
+    events_status = processing_status.events_status
+    if events_status:
+      for attribute_name, name, metric_type, help_text in self._EVENTS_METRICS:
+        value = getattr(events_status, attribute_name, None) or 0
+        lines.extend(self._FormatMetricFamily(
+            name, metric_type, help_text, [({}, value)]))
+
+    sources_status = getattr(processing_status, 'sources_status', None)
+    if sources_status:
+      samples = [
+          ({'name': source_status.display_name or '',
+            'source': source_status.identifier,
+            'status': source_status.status or ''},
+           source_status.number_of_produced_sources)
+          for source_status in sources_status]
+
+      lines.extend(self._FormatMetricFamily(
+          'plaso_source_collected_path_specs_total', 'counter',
+          'Number of path specifications collected from the source.',
+          samples))
+
+    lines.append('')
+    return '\n'.join(lines)
+
+  def _FormatProcessMetrics(self, processes_status, timestamp):
+    """Formats the metrics of processes.
+
+    Args:
+      processes_status (list[tuple[str, ProcessStatus]]): role, such as
+          "foreman" or "worker", and status of every process.
+      timestamp (float): time of the processing status update in number of
+          seconds since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      list[str]: lines of the metrics in Prometheus text format.
+    """
+    lines = []
+
+    for attribute_name, name, metric_type, help_text in self._PROCESS_METRICS:
+      samples = []
+      for role, process_status in processes_status:
+        value = getattr(process_status, attribute_name, None) or 0
+        labels = {'process': process_status.identifier, 'role': role}
+        samples.append((labels, value))
+
+      lines.extend(self._FormatMetricFamily(
+          name, metric_type, help_text, samples))
+
+    samples = []
+    for role, process_status in processes_status:
+      labels = {'process': process_status.identifier, 'role': role}
+      samples.append((labels, self._GetEventsPerSecond(
+          process_status, timestamp)))
+
+    lines.extend(self._FormatMetricFamily(
+        'plaso_process_events_per_second', 'gauge',
+        'Number of events produced by the process per second since the '
+        'previous status update.', samples))
+
+    samples = []
+    for role, process_status in processes_status:
+      labels = {
+          'process': process_status.identifier, 'role': role,
+          'status': process_status.status or ''}
+      samples.append((labels, 1))
+
+    lines.extend(self._FormatMetricFamily(
+        'plaso_process_status', 'gauge',
+        'Status of the process, such as "extracting" or "idle".', samples))
+
+    samples = []
+    for role, process_status in processes_status:
+      cpu_time_per_parser = getattr(
+          process_status, 'cpu_time_per_parser', None) or {}
+      for parser_name, cpu_time in sorted(cpu_time_per_parser.items()):
+        labels = {
+            'parser': parser_name, 'process': process_status.identifier,
+            'role': role}
+        samples.append((labels, float(cpu_time)))
+
+    if samples:
+      lines.extend(self._FormatMetricFamily(
+          'plaso_parser_cpu_time_seconds_total', 'counter',
+          'CPU time spent by the process in the parser, which is only '
+          'available when profiling parsers.', samples))
+
+    return lines
+
+  def _GetEventsPerSecond(self, process_status, timestamp):
+    """Determines the number of events produced per second by a process.
+
+    Args:
+      process_status (ProcessStatus): status of the process.
+      timestamp (float): time of the processing status update in number of
+          seconds since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      float: number of events produced per second since the previous status
+          update.
+    """
+    number_of_produced_events = process_status.number_of_produced_events or 0
+
+    previous_timestamp, previous_number_of_produced_events = (
+        self._produced_events_per_process.get(
+            process_status.identifier, (None, None)))
+
+    self._produced_events_per_process[process_status.identifier] = (
+        timestamp, number_of_produced_events)
+
+    if previous_timestamp is None or timestamp <= previous_timestamp:
+      return 0.0
+
+    # The number of produced events is reset when a worker is replaced.
+    if number_of_produced_events < previous_number_of_produced_events:
+      return 0.0
+
+    return float(
+        number_of_produced_events - previous_number_of_produced_events) / (
+            timestamp - previous_timestamp)
+
+  def Start(self, hostname, port):
+    """Starts the processing metrics server.
+
+    Args:
+      hostname (str): hostname or IP address to bind to.
+      port (int): port to bind to, where 0 represents any available port.
+
+    Returns:
+      bool: True if the processing metrics server was successfully started.
+    """
+    try:
+      self._http_server = _MetricsHTTPServer(
+          (hostname, port), _MetricsHTTPRequestHandler)
+    except SocketServer.socket.error as exception:
+      logger.warning((
+          'Unable to bind a metrics server on {0:s}:{1:d} with error: '
+          '{2!s}').format(hostname, port, exception))
+      return False
+
+    self._produced_events_per_process = {}
+
+    self._http_server_thread = threading.Thread(
+        name=self._THREAD_NAME, target=self._http_server.serve_forever)
+    self._http_server_thread.daemon = True
+    self._http_server_thread.start()
+
+    logger.info(
+        'Processing metrics available at: http://{0:s}:{1:d}/metrics'.format(
+            hostname, self.port))
+    return True
+
+  def Stop(self):
+    """Stops the processing metrics server."""
+    if self._http_server:
+      self._http_server.shutdown()
+      self._http_server.server_close()
+      self._http_server = None
+
+    if self._http_server_thread:
+      if self._http_server_thread.is_alive():
+        self._http_server_thread.join()
+      self._http_server_thread = None
+
+  def UpdateMetrics(self, processing_status):
+    """Updates the metrics from the processing status.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+    """
+    metrics_string = self._FormatMetrics(processing_status, time.time())
+    metrics_data = codecs.encode(metrics_string, 'utf-8')
+
+    if self._http_server:
+      self._http_server.metrics_data = metrics_data
@@ -8,6 +8,7 @@ import heapq
 import os
 import time
 
+from plaso.analysis import mediator as analysis_mediator
 from plaso.engine import plaso_queue
 from plaso.engine import processing_status
 from plaso.engine import zeromq_queue
@@ -18,6 +19,7 @@ from plaso.lib import py2to3
 from plaso.multi_processing import analysis_process
 from plaso.multi_processing import engine as multi_process_engine
 from plaso.multi_processing import logger
+from plaso.storage import event_sorter
 from plaso.storage import event_tag_index
 from plaso.storage import time_range as storage_time_range
 
@@ -187,6 +189,9 @@ class PsortEventHeap(object):
 class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
   """Psort multi-processing engine."""
 
+  # Identifier of the task storage of the analysis plugins that run inline.
+  _INLINE_ANALYSIS_TASK_IDENTIFIER = 'inline_analysis'
+
   _PROCESS_JOIN_TIMEOUT = 5.0
   _PROCESS_WORKER_TIMEOUT = 15.0 * 60.0
 
@@ -200,12 +205,18 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     self._data_location = None
     self._event_filter_expression = None
     self._event_queues = {}
+    self._event_sorter = None
     self._event_tag_index = event_tag_index.EventTagIndex()
     self._events_status = processing_status.EventsStatus()
     # The export event heap is used to make sure the events are sorted in
     # a deterministic way.
     self._export_event_heap = PsortEventHeap()
     self._export_event_timestamp = 0
+    self._inline_analysis_mediator = None
+    self._inline_analysis_plugin_names = set()
+    self._inline_analysis_plugins = {}
+    self._inline_analysis_storage_writer = None
+    self._inline_analysis_task = None
     self._knowledge_base = None
     self._memory_profiler = None
     self._merge_task = None
@@ -263,9 +274,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       event_data = storage_writer.GetEventDataByIdentifier(
           event_data_identifier)
 
-      event_identifier = event.GetIdentifier()
-      event_tag = self._event_tag_index.GetEventTagByIdentifier(
-          storage_writer, event_identifier)
+      event_tag = self._event_tag_index.GetEventTagForEvent(
+          storage_writer, event)
 
       if event_filter:
         filter_match = event_filter.Match(event, event_data, event_tag)
@@ -281,6 +291,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         # TODO: Check for premature exit of analysis plugins.
         event_queue.PushItem((event, event_data))
 
+      if self._inline_analysis_plugins:
+        self._ExamineEventInline(event, event_data)
+
       self._number_of_consumed_events += 1
 
       if (event_filter and filter_limit and
@@ -292,10 +305,21 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     for event_queue in self._event_queues.values():
       event_queue.PushItem(plaso_queue.QueueAbort(), block=False)
 
+    if self._inline_analysis_task:
+      self._StopInlineAnalysis(storage_writer, abort=self._abort)
+
     logger.debug('Processing analysis plugin results.')
 
     # TODO: use a task based approach.
-    plugin_names = [plugin_name for plugin_name in analysis_plugins.keys()]
+    # Note that the names of inline analysis plugins that failed are excluded
+    # as well, since the inline analysis plugins share a single task storage.
+    plugin_names = [
+        plugin_name for plugin_name in analysis_plugins.keys()
+        if plugin_name not in self._inline_analysis_plugin_names]
+
+    if self._inline_analysis_plugin_names:
+      plugin_names.append(self._INLINE_ANALYSIS_TASK_IDENTIFIER)
+
     while plugin_names:
       for plugin_name in list(plugin_names):
         if self._abort:
@@ -311,10 +335,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
           storage_writer.PrepareMergeTaskStorage(task)
           self._status = definitions.STATUS_INDICATOR_MERGING
 
-          event_queue = self._event_queues[plugin_name]
-          del self._event_queues[plugin_name]
-
-          event_queue.Close()
+          event_queue = self._event_queues.pop(plugin_name, None)
+          if event_queue:
+            event_queue.Close()
 
           storage_merge_reader = storage_writer.StartMergeTaskStorage(task)
 
@@ -425,6 +448,30 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
       self._TerminateProcessByPid(pid)
 
+  def _ExamineEventInline(self, event, event_data):
+    """Examines an event with the analysis plugins that run inline.
+
+    An analysis plugin that raises an exception is not used to examine
+    subsequent events and does not produce an analysis report.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+    """
+    for plugin_name, analysis_plugin in list(
+        self._inline_analysis_plugins.items()):
+      try:
+        analysis_plugin.ExamineEvent(
+            self._inline_analysis_mediator, event, event_data)
+
+      except Exception as exception:  # pylint: disable=broad-except
+        logger.error((
+            'Analysis plugin: {0:s} failed to examine event with error: '
+            '{1!s}').format(plugin_name, exception))
+        logger.exception(exception)
+
+        del self._inline_analysis_plugins[plugin_name]
+
   def _ExportEvent(
       self, storage_reader, output_module, event, event_data,
       deduplicate_events=True):
@@ -448,7 +495,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
   def _ExportEvents(
       self, storage_reader, output_module, deduplicate_events=True,
-      event_filter=None, time_slice=None, use_time_slicer=False):
+      event_filter=None, time_slice=None, use_time_slicer=False,
+      watermark=None):
     """Exports events using an output module.
 
     Args:
@@ -462,6 +510,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
           used. The 'time slicer' will provide a context of events around
           an event of interest.
+      watermark (Optional[int]): event watermark, where only events that were
+          added to the store after the watermark are exported.
     """
     self._status = definitions.STATUS_INDICATOR_EXPORTING
 
@@ -482,14 +532,14 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     self._events_status.number_of_filtered_events = 0
     self._events_status.number_of_events_from_time_slice = 0
 
-    for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
+    for event in storage_reader.GetSortedEvents(
+        time_range=time_slice_range, watermark=watermark):
       event_data_identifier = event.GetEventDataIdentifier()
       event_data = storage_reader.GetEventDataByIdentifier(
           event_data_identifier)
 
-      event_identifier = event.GetIdentifier()
-      event_tag = self._event_tag_index.GetEventTagByIdentifier(
-          storage_reader, event_identifier)
+      event_tag = self._event_tag_index.GetEventTagForEvent(
+          storage_reader, event)
 
       if time_slice_range and event.timestamp != time_slice.event_timestamp:
         self._events_status.number_of_events_from_time_slice += 1
@@ -571,9 +621,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         self._events_status.number_of_duplicate_events += 1
         continue
 
-      event_identifier = event.GetIdentifier()
-      event_tag = self._event_tag_index.GetEventTagByIdentifier(
-          storage_reader, event_identifier)
+      event_tag = self._event_tag_index.GetEventTagForEvent(
+          storage_reader, event)
 
       if macb_group_identifier is None:
         if macb_group:
@@ -604,12 +653,16 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     If there is an existing event the provided event tag is updated with
     the contents of the existing one. After which the event tag index is
-    updated.
+    updated. Event tag intervals are added to the event tag index.
 
     Args:
       storage_writer (StorageWriter): storage writer.
       attribute_container (AttributeContainer): container.
     """
+    if attribute_container.CONTAINER_TYPE == 'event_tag_interval':
+      self._event_tag_index.SetEventTagInterval(attribute_container)
+      return
+
     if attribute_container.CONTAINER_TYPE != 'event_tag':
       return
 
@@ -647,6 +700,39 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     logger.info('Analysis plugins running')
 
+  def _StartInlineAnalysis(self, storage_writer, analysis_plugins):
+    """Starts the analysis plugins that run inline.
+
+    The analysis plugins that run inline examine the events in the main
+    process and share a single task storage, which avoids the overhead of
+    an analysis process and an event queue per analysis plugin.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage used
+          to create task storage.
+      analysis_plugins (dict[str, AnalysisPlugin]): analysis plugins that
+          should be run inline and their names.
+    """
+    logger.info('Starting inline analysis plugins: {0:s}'.format(
+        ', '.join(sorted(analysis_plugins.keys()))))
+
+    task = tasks.Task()
+    task.storage_format = definitions.STORAGE_FORMAT_SQLITE
+    task.identifier = self._INLINE_ANALYSIS_TASK_IDENTIFIER
+
+    task_storage_writer = storage_writer.CreateTaskStorage(
+        task, definitions.STORAGE_FORMAT_SQLITE)
+    task_storage_writer.Open()
+    task_storage_writer.WriteTaskStart()
+
+    self._inline_analysis_mediator = analysis_mediator.AnalysisMediator(
+        task_storage_writer, self._knowledge_base,
+        data_location=self._data_location)
+    self._inline_analysis_plugin_names = set(analysis_plugins.keys())
+    self._inline_analysis_plugins = dict(analysis_plugins)
+    self._inline_analysis_storage_writer = task_storage_writer
+    self._inline_analysis_task = task
+
   def _StatusUpdateThreadMain(self):
     """Main function of the status update thread."""
     while self._status_update_active:
@@ -657,6 +743,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
       self._UpdateForemanProcessStatus()
 
+      self._UpdateMetrics()
+
       if self._status_update_callback:
         self._status_update_callback(self._processing_status)
 
@@ -696,6 +784,51 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       for event_queue in self._event_queues.values():
         event_queue.Close(abort=True)
 
+  def _StopInlineAnalysis(self, storage_writer, abort=False):
+    """Stops the analysis plugins that run inline.
+
+    The analysis reports are produced and the task storage is finalized, such
+    that it can be merged with the session storage.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage used
+          to create the task storage.
+      abort (bool): True to indicated the stop is issued on abort.
+    """
+    logger.debug('Stopping inline analysis plugins.')
+
+    task_storage_writer = self._inline_analysis_storage_writer
+
+    try:
+      if not abort:
+        for plugin_name, analysis_plugin in sorted(
+            self._inline_analysis_plugins.items()):
+          try:
+            self._inline_analysis_mediator.ProduceAnalysisReport(
+                analysis_plugin)
+
+          except Exception as exception:  # pylint: disable=broad-except
+            logger.error((
+                'Analysis plugin: {0:s} failed to produce analysis report '
+                'with error: {1!s}').format(plugin_name, exception))
+            logger.exception(exception)
+
+    finally:
+      task_storage_writer.WriteTaskCompletion(aborted=abort)
+      task_storage_writer.Close()
+
+    try:
+      storage_writer.FinalizeTaskStorage(
+          self._inline_analysis_task)
+    except IOError as exception:
+      logger.error((
+          'Unable to finalize inline analysis task storage with error: '
+          '{0!s}').format(exception))
+
+    self._inline_analysis_mediator = None
+    self._inline_analysis_storage_writer = None
+    self._inline_analysis_task = None
+
   def _UpdateForemanProcessStatus(self):
     """Update the foreman process status."""
     used_memory = self._process_information.GetUsedMemory() or 0
@@ -711,6 +844,12 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         self._number_of_consumed_warnings, self._number_of_produced_warnings,
         self._number_of_consumed_reports, self._number_of_produced_reports)
 
+    if self._event_sorter:
+      self._events_status.number_of_sort_runs = (
+          self._event_sorter.number_of_runs)
+      self._events_status.number_of_sorted_events = (
+          self._event_sorter.number_of_sorted_entries)
+
     self._processing_status.UpdateEventsStatus(self._events_status)
 
   def _UpdateProcessingStatus(self, pid, process_status, used_memory):
@@ -891,7 +1030,22 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     # Set up the storage writer before the analysis processes.
     storage_writer.StartTaskStorage()
 
-    self._StartAnalysisProcesses(storage_writer, analysis_plugins)
+    inline_analysis_plugins = {}
+    process_analysis_plugins = {}
+    for plugin_name, analysis_plugin in analysis_plugins.items():
+      if (self._processing_configuration.inline_analysis and
+          analysis_plugin.ENABLE_INLINE_ANALYSIS):
+        inline_analysis_plugins[plugin_name] = analysis_plugin
+      else:
+        process_analysis_plugins[plugin_name] = analysis_plugin
+
+    self._StartAnalysisProcesses(storage_writer, process_analysis_plugins)
+
+    if inline_analysis_plugins:
+      self._StartInlineAnalysis(storage_writer, inline_analysis_plugins)
+
+    if self._processing_configuration.metrics_port is not None:
+      self._StartMetricsServer(self._processing_configuration.metrics_port)
 
     # Start the status update thread after open of the storage writer
     # so we don't have to clean up the thread if the open fails.
@@ -920,6 +1074,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
           self._status_update_callback(self._processing_status)
 
       finally:
+        if self._inline_analysis_task:
+          self._StopInlineAnalysis(storage_writer, abort=True)
+
         storage_writer.WriteSessionCompletion(aborted=self._abort)
 
         storage_writer.Close()
@@ -928,6 +1085,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
+      self._StopMetricsServer()
 
     try:
       self._StopAnalysisProcesses(abort=self._abort)
@@ -947,6 +1105,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     self._analysis_plugins = {}
     self._data_location = None
     self._event_filter_expression = None
+    self._inline_analysis_plugin_names = set()
+    self._inline_analysis_plugins = {}
     self._knowledge_base = None
     self._processing_configuration = None
     self._status_update_callback = None
@@ -961,7 +1121,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
   def ExportEvents(
       self, knowledge_base_object, storage_reader, output_module,
       processing_configuration, deduplicate_events=True, event_filter=None,
-      status_update_callback=None, time_slice=None, use_time_slicer=False):
+      status_update_callback=None, time_slice=None, use_time_slicer=False,
+      watermark=None):
     """Exports events using an output module.
 
     Args:
@@ -980,6 +1141,10 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
           used. The 'time slicer' will provide a context of events around
           an event of interest.
+      watermark (Optional[int]): event watermark, where only events that were
+          added to the store after the watermark are exported. This allows
+          to export only the events of sessions added since the last
+          incremental export.
     """
     self._events_status = processing_status.EventsStatus()
     self._processing_configuration = processing_configuration
@@ -987,15 +1152,32 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     storage_reader.ReadPreprocessingInformation(knowledge_base_object)
 
-    total_number_of_events = 0
-    for session in storage_reader.GetSessions():
-      total_number_of_events += session.parsers_counter['total']
+    if watermark:
+      # Event watermarks are sequential hence the difference is the number
+      # of events added after the watermark.
+      total_number_of_events = max(
+          0, storage_reader.GetEventWatermark() - watermark)
+
+    else:
+      total_number_of_events = 0
+      for session in storage_reader.GetSessions():
+        total_number_of_events += session.parsers_counter['total']
 
     self._events_status.total_number_of_events = total_number_of_events
 
+    if self._processing_configuration.sort_memory_limit:
+      self._event_sorter = event_sorter.ExternalEventSorter(
+          maximum_memory=self._processing_configuration.sort_memory_limit,
+          temporary_directory=(
+              self._processing_configuration.temporary_directory))
+      storage_reader.SetEventSorter(self._event_sorter)
+
     output_module.Open()
     output_module.WriteHeader()
 
+    if self._processing_configuration.metrics_port is not None:
+      self._StartMetricsServer(self._processing_configuration.metrics_port)
+
     self._StartStatusUpdateThread()
 
     self._StartProfiling(self._processing_configuration.profiling)
@@ -1004,12 +1186,16 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       self._ExportEvents(
           storage_reader, output_module, deduplicate_events=deduplicate_events,
           event_filter=event_filter, time_slice=time_slice,
-          use_time_slicer=use_time_slicer)
+          use_time_slicer=use_time_slicer, watermark=watermark)
 
     finally:
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
+      self._StopMetricsServer()
+
+      if self._event_sorter:
+        storage_reader.SetEventSorter(None)
 
     output_module.WriteFooter()
     output_module.Close()
@@ -1022,6 +1208,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       self._status_update_callback(self._processing_status)
 
     # Reset values.
+    self._event_sorter = None
     self._status_update_callback = None
     self._processing_configuration = None
     self._events_status = None
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""The parallel source collector."""
+
+from __future__ import unicode_literals
+
+import copy
+import threading
+
+try:
+  import Queue
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
+
+from dfvfs.lib import errors as dfvfs_errors
+from dfvfs.resolver import context
+
+from plaso.engine import extractors
+from plaso.engine import processing_status
+from plaso.lib import definitions
+from plaso.multi_processing import logger
+
+
+class SourceCollector(object):
+  """Collects path specifications from sources in parallel.
+
+  Every source path specification, such as that of a partition or a Volume
+  Shadow Snapshot (VSS) store, is collected independently by one of a pool
+  of collection threads. The collected path specifications are queued, so
+  that the foreman can add them as event sources to the storage writer
+  while collection is still in progress.
+
+  Every source is collected with its own resolver context, path
+  specification extractor and find specifications since these are not
+  thread-safe.
+  """
+
+  # Maximum number of collected path specifications that are queued.
+  _MAXIMUM_NUMBER_OF_QUEUED_PATH_SPECS = 10000
+
+  _DEFAULT_MAXIMUM_NUMBER_OF_THREADS = 4
+
+  _QUEUE_TIMEOUT_SECONDS = 1
+
+  def __init__(
+      self, find_specs=None, maximum_number_of_threads=None,
+      ntfs_mft_enumeration=False):
+    """Initializes a source collector.
+
+    Args:
+      find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
+          used in path specification extraction.
+      maximum_number_of_threads (Optional[int]): maximum number of collection
+          threads, where None represents the default of 4.
+      ntfs_mft_enumeration (Optional[bool]): True if the file entries of
+          NTFS file systems should be enumerated from the MFT.
+    """
+    if maximum_number_of_threads is None:
+      maximum_number_of_threads = self._DEFAULT_MAXIMUM_NUMBER_OF_THREADS
+
+    super(SourceCollector, self).__init__()
+    self._abort = False
+    self._find_specs = find_specs
+    self._lock = threading.Lock()
+    self._maximum_number_of_threads = maximum_number_of_threads
+    self._ntfs_mft_enumeration = ntfs_mft_enumeration
+    self._path_spec_queue = Queue.Queue(
+        maxsize=self._MAXIMUM_NUMBER_OF_QUEUED_PATH_SPECS)
+    self._sources = []
+    self._sources_status = []
+    self._threads = []
+
+  @property
+  def is_collecting(self):
+    """bool: True if sources are being collected or collected path
+        specifications are queued.
+    """
+    # The threads are checked before the queue, since a thread can queue
+    # a path specification right before it exits.
+    if any(thread.is_alive() for thread in self._threads):
+      return True
+
+    return not self._path_spec_queue.empty()
+
+  def _CollectSource(self, source_status, source_path_spec):
+    """Collects the path specifications from a source.
+
+    Args:
+      source_status (SourceCollectionStatus): collection status of the source.
+      source_path_spec (dfvfs.PathSpec): path specification of the source.
+    """
+    find_specs = copy.deepcopy(self._find_specs)
+    path_spec_extractor = extractors.PathSpecExtractor()
+    resolver_context = context.Context()
+
+    source_status.status = definitions.STATUS_INDICATOR_COLLECTING
+
+    path_spec_generator = path_spec_extractor.ExtractPathSpecs(
+        [source_path_spec], find_specs=find_specs, recurse_file_system=False,
+        resolver_context=resolver_context,
+        ntfs_mft_enumeration=self._ntfs_mft_enumeration)
+
+    for path_spec in path_spec_generator:
+      while not self._abort:
+        try:
+          self._path_spec_queue.put(
+              path_spec, block=True, timeout=self._QUEUE_TIMEOUT_SECONDS)
+          break
+
+        except Queue.Full:
+          pass
+
+      if self._abort:
+        source_status.status = definitions.STATUS_INDICATOR_ABORTED
+        return
+
+      source_status.number_of_produced_sources += 1
+
+    source_status.status = definitions.STATUS_INDICATOR_COMPLETED
+
+  def _CollectSources(self):
+    """Collects sources until no more sources are available."""
+    while not self._abort:
+      with self._lock:
+        if not self._sources:
+          break
+
+        source_status, source_path_spec = self._sources.pop(0)
+
+      try:
+        self._CollectSource(source_status, source_path_spec)
+
+      except (
+          IOError, dfvfs_errors.AccessError, dfvfs_errors.BackEndError,
+          dfvfs_errors.PathSpecError) as exception:
+        logger.error((
+            'Unable to collect source: {0:s} with error: {1!s}').format(
+                source_status.display_name, exception))
+        source_status.status = definitions.STATUS_INDICATOR_ERROR
+
+      # Any other exception would otherwise stop the collection thread and
+      # leave the source in the collecting state.
+      except Exception as exception:  # pylint: disable=broad-except
+        logger.error((
+            'Unhandled exception while collecting source: {0:s} with error: '
+            '{1!s}').format(source_status.display_name, exception))
+        logger.exception(exception)
+        source_status.status = definitions.STATUS_INDICATOR_ERROR
+
+  def _GetDisplayName(self, source_path_spec):
+    """Retrieves a display name of a source.
+
+    Args:
+      source_path_spec (dfvfs.PathSpec): path specification of the source.
+
+    Returns:
+      str: human readable name of the source, such as "TSK_PARTITION:/p1
+          VSHADOW:/vss2 NTFS".
+    """
+    path_segments = []
+
+    path_spec = source_path_spec
+    while path_spec.HasParent():
+      location = getattr(path_spec, 'location', None)
+      if location and path_spec is not source_path_spec:
+        path_segments.append('{0:s}:{1:s}'.format(
+            path_spec.type_indicator, location))
+      else:
+        path_segments.append(path_spec.type_indicator)
+
+      path_spec = path_spec.parent
+
+    if not path_segments:
+      path_segments.append(path_spec.type_indicator)
+
+    return ' '.join(reversed(path_segments))
+
+  def GetPathSpecs(self, maximum_number_of_path_specs, timeout=None):
+    """Retrieves collected path specifications.
+
+    Args:
+      maximum_number_of_path_specs (int): maximum number of path
+          specifications to retrieve.
+      timeout (Optional[float]): number of seconds to wait for a path
+          specification to be collected, where None represents not to wait.
+
+    Returns:
+      list[dfvfs.PathSpec]: path specifications that have been collected.
+    """
+    path_specs = []
+    while len(path_specs) < maximum_number_of_path_specs:
+      try:
+        if timeout and not path_specs:
+          path_spec = self._path_spec_queue.get(block=True, timeout=timeout)
+        else:
+          path_spec = self._path_spec_queue.get(block=False)
+
+      except Queue.Empty:
+        break
+
+      path_specs.append(path_spec)
+
+    return path_specs
+
+  def GetSourcesStatus(self):
+    """Retrieves the collection status of the sources.
+
+    Returns:
+      list[SourceCollectionStatus]: collection status of the sources.
+    """
+    return list(self._sources_status)
+
+  def SignalAbort(self):
+    """Signals the collection threads to abort."""
+    self._abort = True
+
+  def Start(self, source_path_specs):
+    """Starts collecting the sources.
+
+    Args:
+      source_path_specs (list[dfvfs.PathSpec]): path specifications of
+          the sources.
+    """
+    self._abort = False
+    self._sources = []
+    self._sources_status = []
+
+    for source_path_spec in source_path_specs:
+      source_status = processing_status.SourceCollectionStatus()
+      source_status.display_name = self._GetDisplayName(source_path_spec)
+      source_status.identifier = 'Source_{0:02d}'.format(
+          len(self._sources_status))
+      source_status.status = definitions.STATUS_INDICATOR_IDLE
+
+      self._sources.append((source_status, source_path_spec))
+      self._sources_status.append(source_status)
+
+    number_of_threads = min(
+        len(self._sources), self._maximum_number_of_threads)
+
+    self._threads = []
+    for thread_number in range(number_of_threads):
+      thread = threading.Thread(
+          name='Collector_{0:02d}'.format(thread_number),
+          target=self._CollectSources)
+      thread.daemon = True
+      thread.start()
+
+      self._threads.append(thread)
+
+  def Stop(self):
+    """Stops collecting the sources.
+
+    Collection threads that are still running are signaled to abort.
+    """
+    self._abort = True
+
+    for thread in self._threads:
+      if thread.is_alive():
+        thread.join()
+
+    self._threads = []
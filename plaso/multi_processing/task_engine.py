@@ -7,14 +7,15 @@ import heapq
 import logging
 import multiprocessing
 import os
+import tempfile
 import time
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 
+from plaso.analyzers import manager as analyzers_manager
 from plaso.containers import event_sources
 from plaso.containers import warnings
-from plaso.engine import extractors
 from plaso.engine import plaso_queue
 from plaso.engine import zeromq_queue
 from plaso.lib import definitions
@@ -22,6 +23,7 @@ from plaso.lib import errors
 from plaso.lib import loggers
 from plaso.multi_processing import engine
 from plaso.multi_processing import logger
+from plaso.multi_processing import source_collector
 from plaso.multi_processing import task_manager
 from plaso.multi_processing import worker_process
 
@@ -40,6 +42,14 @@ class _EventSourceHeap(object):
     self._heap = []
     self._maximum_number_of_items = maximum_number_of_items
 
+  def IsEmpty(self):
+    """Determines if the heap is empty.
+
+    Returns:
+      bool: True if the heap is empty, False otherwise.
+    """
+    return not self._heap
+
   def IsFull(self):
     """Determines if the heap is full.
 
@@ -86,9 +96,16 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   * merge results returned by extraction workers.
   """
 
+  # Maximum number of collected path specifications to add as event sources
+  # per loop.
+  _MAXIMUM_NUMBER_OF_COLLECTED_PATH_SPECS = 1000
+
   # Maximum number of attribute containers to merge per loop.
   _MAXIMUM_NUMBER_OF_CONTAINERS = 50
 
+  # Maximum number of threads that collect sources in parallel.
+  _MAXIMUM_NUMBER_OF_COLLECTION_THREADS = 4
+
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
 
@@ -100,6 +117,10 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
   _TASK_QUEUE_TIMEOUT_SECONDS = 2
 
+  # Number of seconds to wait for a path specification to be collected when
+  # there are no event sources to schedule.
+  _COLLECTION_TIMEOUT_SECONDS = 0.05
+
   _ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS = 10 * 60
 
   def __init__(
@@ -127,10 +148,10 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._number_of_produced_sources = 0
     self._number_of_produced_warnings = 0
     self._number_of_worker_processes = 0
-    self._path_spec_extractor = extractors.PathSpecExtractor()
     self._processing_configuration = None
     self._resolver_context = context.Context()
     self._session_identifier = None
+    self._source_collector = None
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._storage_merge_reader = None
     self._storage_merge_reader_on_hold = None
@@ -138,6 +159,63 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._task_queue_port = None
     self._task_manager = task_manager.TaskManager()
 
+  def _CollectEventSources(self, storage_writer, timeout=None):
+    """Adds the path specifications collected from the sources as event sources.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      timeout (Optional[float]): number of seconds to wait for a path
+          specification to be collected, where None represents not to wait.
+    """
+    path_specs = self._source_collector.GetPathSpecs(
+        self._MAXIMUM_NUMBER_OF_COLLECTED_PATH_SPECS, timeout=timeout)
+    if not path_specs:
+      return
+
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('collect_event_sources')
+
+    for path_spec in path_specs:
+      # TODO: determine if event sources should be DataStream or FileEntry
+      # or both.
+      event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+      storage_writer.AddEventSource(event_source)
+
+    self._number_of_produced_sources = storage_writer.number_of_event_sources
+
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('collect_event_sources')
+
+  def _CompileYaraRules(self):
+    """Compiles the Yara rules once for all worker processes.
+
+    The compiled Yara rules are saved to a temporary file, which the worker
+    processes load instead of compiling the rule definitions themselves.
+    """
+    extraction_configuration = self._processing_configuration.extraction
+    if not extraction_configuration.yara_rules_string:
+      return
+
+    file_descriptor, path = tempfile.mkstemp(
+        prefix='plaso-', suffix='.yarc',
+        dir=self._processing_configuration.temporary_directory)
+    os.close(file_descriptor)
+
+    analyzer_object = analyzers_manager.AnalyzersManager.GetAnalyzerInstance(
+        'yara')
+
+    try:
+      analyzer_object.SetRules(extraction_configuration.yara_rules_string)
+      analyzer_object.SaveRules(path)
+
+    except Exception:
+      # Remove the temporary file, since the path of the compiled Yara rules
+      # is not set and _RemoveCompiledYaraRules cannot remove it.
+      os.remove(path)
+      raise
+
+    extraction_configuration.yara_rules_path = path
+
   def _FillEventSourceHeap(
       self, storage_writer, event_source_heap, start_with_first=False):
     """Fills the event source heap with the available written event sources.
@@ -314,33 +392,24 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._number_of_produced_sources = 0
     self._number_of_produced_warnings = 0
 
+    extraction_configuration = self._processing_configuration.extraction
+
     find_specs = None
     if self.collection_filters_helper:
       find_specs = (
           self.collection_filters_helper.included_file_system_find_specs)
 
-    path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
-        source_path_specs, find_specs=find_specs, recurse_file_system=False,
-        resolver_context=self._resolver_context)
+    self._source_collector = source_collector.SourceCollector(
+        find_specs=find_specs,
+        maximum_number_of_threads=self._MAXIMUM_NUMBER_OF_COLLECTION_THREADS,
+        ntfs_mft_enumeration=extraction_configuration.ntfs_mft_enumeration)
+    self._source_collector.Start(source_path_specs)
 
-    for path_spec in path_spec_generator:
-      if self._abort:
-        break
-
-      # TODO: determine if event sources should be DataStream or FileEntry
-      # or both.
-      event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
-      storage_writer.AddEventSource(event_source)
-
-      self._number_of_produced_sources = storage_writer.number_of_event_sources
-
-      # Update the foreman process status in case we are using a filter file.
-      self._UpdateForemanProcessStatus()
-
-      if self._status_update_callback:
-        self._status_update_callback(self._processing_status)
+    try:
+      self._ScheduleTasks(storage_writer)
 
-    self._ScheduleTasks(storage_writer)
+    finally:
+      self._source_collector.Stop()
 
     if self._abort:
       self._status = definitions.STATUS_INDICATOR_ABORTED
@@ -367,6 +436,21 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _RemoveCompiledYaraRules(self):
+    """Removes the compiled Yara rules."""
+    extraction_configuration = self._processing_configuration.extraction
+    if not extraction_configuration.yara_rules_path:
+      return
+
+    try:
+      os.remove(extraction_configuration.yara_rules_path)
+    except OSError as exception:
+      logger.error((
+          'Unable to remove compiled Yara rules: {0:s} with error: '
+          '{1!s}').format(extraction_configuration.yara_rules_path, exception))
+
+    extraction_configuration.yara_rules_path = None
+
   def _ScheduleTask(self, task):
     """Schedules a task.
 
@@ -408,13 +492,17 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     event_source_heap = _EventSourceHeap()
 
+    self._CollectEventSources(
+        storage_writer, timeout=self._COLLECTION_TIMEOUT_SECONDS)
+
     self._FillEventSourceHeap(
         storage_writer, event_source_heap, start_with_first=True)
 
     event_source = event_source_heap.PopEventSource()
 
     task = None
-    while event_source or self._task_manager.HasPendingTasks():
+    while (event_source or self._task_manager.HasPendingTasks() or
+           self._source_collector.is_collecting):
       if self._abort:
         break
 
@@ -448,6 +536,17 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
         self._MergeTaskStorage(storage_writer)
 
+        # Sources are collected in parallel, hence tasks are scheduled while
+        # the collected path specifications are added as event sources.
+        # Wait for a path specification to be collected if there is nothing
+        # else to schedule, to prevent starving the collection threads.
+        timeout = None
+        if (not task and not event_source and event_source_heap.IsEmpty() and
+            self._source_collector.is_collecting):
+          timeout = self._COLLECTION_TIMEOUT_SECONDS
+
+        self._CollectEventSources(storage_writer, timeout=timeout)
+
         if not event_source_heap.IsFull():
           self._FillEventSourceHeap(storage_writer, event_source_heap)
         else:
@@ -552,6 +651,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
       self._processing_status.UpdateTasksStatus(tasks_status)
 
+      self._UpdateMetrics()
+
       if self._status_update_callback:
         self._status_update_callback(self._processing_status)
 
@@ -603,6 +704,10 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     display_name = getattr(self._merge_task, 'identifier', '')
 
+    if self._source_collector:
+      self._processing_status.UpdateSourcesStatus(
+          self._source_collector.GetSourcesStatus())
+
     self._processing_status.UpdateForemanStatus(
         self._name, self._status, self._pid, used_memory, display_name,
         self._number_of_consumed_sources, self._number_of_produced_sources,
@@ -662,6 +767,24 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     number_of_produced_warnings = process_status.get(
         'number_of_produced_warnings', None)
 
+    # XML RPC does not support integer values > 2 GiB so the worker formats
+    # the byte counts as a string.
+    number_of_bytes_read = process_status.get('number_of_bytes_read', None)
+    if number_of_bytes_read is not None:
+      number_of_bytes_read = int(number_of_bytes_read, 10)
+
+    number_of_data_stream_bytes = process_status.get(
+        'number_of_data_stream_bytes', None)
+    if number_of_data_stream_bytes is not None:
+      number_of_data_stream_bytes = int(number_of_data_stream_bytes, 10)
+
+    number_of_parse_result_cache_hits = process_status.get(
+        'number_of_parse_result_cache_hits', None)
+    number_of_parse_result_cache_misses = process_status.get(
+        'number_of_parse_result_cache_misses', None)
+
+    cpu_time_per_parser = process_status.get('cpu_time_per_parser', None)
+
     if processing_status != definitions.STATUS_INDICATOR_IDLE:
       last_activity_timestamp = process_status.get(
           'last_activity_timestamp', 0.0)
@@ -682,7 +805,13 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         number_of_consumed_events, number_of_produced_events,
         number_of_consumed_event_tags, number_of_produced_event_tags,
         number_of_consumed_reports, number_of_produced_reports,
-        number_of_consumed_warnings, number_of_produced_warnings)
+        number_of_consumed_warnings, number_of_produced_warnings,
+        number_of_bytes_read=number_of_bytes_read,
+        number_of_data_stream_bytes=number_of_data_stream_bytes,
+        number_of_parse_result_cache_hits=number_of_parse_result_cache_hits,
+        number_of_parse_result_cache_misses=(
+            number_of_parse_result_cache_misses),
+        cpu_time_per_parser=cpu_time_per_parser)
 
     task_identifier = process_status.get('task_identifier', '')
     if not task_identifier:
@@ -790,6 +919,10 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # Set up the storage writer before the worker processes.
     storage_writer.StartTaskStorage()
 
+    # Compile the Yara rules before the worker processes are started, since
+    # the worker processes load the compiled Yara rules.
+    self._CompileYaraRules()
+
     for worker_number in range(number_of_worker_processes):
       # First argument to _StartWorkerProcess is not used.
       extraction_process = self._StartWorkerProcess('', storage_writer)
@@ -797,6 +930,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         logger.error('Unable to create worker process: {0:d}'.format(
             worker_number))
 
+    if self._processing_configuration.metrics_port is not None:
+      self._StartMetricsServer(self._processing_configuration.metrics_port)
+
     self._StartStatusUpdateThread()
 
     try:
@@ -820,6 +956,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
+      self._StopMetricsServer()
 
       if self._serializers_profiler:
         storage_writer.SetSerializersProfiler(None)
@@ -844,6 +981,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # close is a failsafe.
     self._task_queue.Close(abort=True)
 
+    self._RemoveCompiledYaraRules()
+
     if self._processing_status.error_path_specs:
       task_storage_abort = True
     else:
@@ -62,6 +62,7 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       dict[str, object]: status attributes, indexed by name.
     """
     if self._parser_mediator:
+      cpu_time_per_parser = self._parser_mediator.GetCPUTimePerParser()
       number_of_produced_events = (
           self._parser_mediator.number_of_produced_events)
       number_of_produced_sources = (
@@ -69,6 +70,7 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       number_of_produced_warnings = (
           self._parser_mediator.number_of_produced_warnings)
     else:
+      cpu_time_per_parser = None
       number_of_produced_events = None
       number_of_produced_sources = None
       number_of_produced_warnings = None
@@ -82,6 +84,20 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       last_activity_timestamp = 0.0
       processing_status = self._status
 
+    if self._extraction_worker:
+      number_of_bytes_read = self._extraction_worker.number_of_bytes_read
+      number_of_data_stream_bytes = (
+          self._extraction_worker.number_of_data_stream_bytes)
+      number_of_parse_result_cache_hits = (
+          self._extraction_worker.number_of_parse_result_cache_hits)
+      number_of_parse_result_cache_misses = (
+          self._extraction_worker.number_of_parse_result_cache_misses)
+    else:
+      number_of_bytes_read = 0
+      number_of_data_stream_bytes = 0
+      number_of_parse_result_cache_hits = 0
+      number_of_parse_result_cache_misses = 0
+
     task_identifier = getattr(self._task, 'identifier', '')
 
     if self._process_information:
@@ -95,15 +111,23 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     # XML RPC does not support integer values > 2 GiB so we format them
     # as a string.
     used_memory = '{0:d}'.format(used_memory)
+    number_of_bytes_read = '{0:d}'.format(number_of_bytes_read)
+    number_of_data_stream_bytes = '{0:d}'.format(number_of_data_stream_bytes)
 
     status = {
+        'cpu_time_per_parser': cpu_time_per_parser,
         'display_name': self._current_display_name,
         'identifier': self._name,
         'last_activity_timestamp': last_activity_timestamp,
+        'number_of_bytes_read': number_of_bytes_read,
         'number_of_consumed_event_tags': None,
         'number_of_consumed_events': self._number_of_consumed_events,
         'number_of_consumed_sources': self._number_of_consumed_sources,
         'number_of_consumed_warnings': None,
+        'number_of_data_stream_bytes': number_of_data_stream_bytes,
+        'number_of_parse_result_cache_hits': number_of_parse_result_cache_hits,
+        'number_of_parse_result_cache_misses': (
+            number_of_parse_result_cache_misses),
         'number_of_produced_event_tags': None,
         'number_of_produced_events': number_of_produced_events,
         'number_of_produced_sources': number_of_produced_sources,
@@ -211,6 +235,8 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._StopProfiling()
     self._parser_mediator.StopProfiling()
 
+    self._extraction_worker.Close()
+
     self._extraction_worker = None
     self._parser_mediator = None
     self._storage_writer = None
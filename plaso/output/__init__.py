@@ -8,6 +8,7 @@ from plaso.output import json_out
 from plaso.output import kml
 from plaso.output import l2t_csv
 from plaso.output import null
+from plaso.output import parquet
 from plaso.output import rawpy
 from plaso.output import timesketch_out
 from plaso.output import tln
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Output module for the Apache Parquet columnar output format."""
+
+from __future__ import unicode_literals
+
+import json
+import os
+
+try:
+  import pyarrow
+  from pyarrow import parquet
+except ImportError:
+  pyarrow = None
+  parquet = None
+
+from plaso.output import interface
+from plaso.output import logger
+from plaso.output import manager
+from plaso.serializer import json_serializer
+
+
+class ParquetOutputModule(interface.OutputModule):
+  """Output module for the Apache Parquet columnar output format.
+
+  Events are buffered per column and written as typed row groups. Columns
+  with a low number of distinct values, such as data type and parser, are
+  dictionary encoded. Attributes that do not have a dedicated column are
+  stored as a JSON string in the "attributes" column.
+  """
+
+  NAME = 'parquet'
+  DESCRIPTION = 'Saves the events into an Apache Parquet columnar file.'
+
+  _DEFAULT_COMPRESSION = 'snappy'
+
+  _DEFAULT_ROW_GROUP_SIZE = 100000
+
+  _DICTIONARY_COLUMNS = frozenset([
+      'data_type', 'hostname', 'parser', 'source', 'source_long', 'tag',
+      'timestamp_desc', 'username'])
+
+  _COLUMNS = [
+      'timestamp', 'timestamp_desc', 'data_type', 'parser', 'source',
+      'source_long', 'hostname', 'username', 'tag', 'message', 'attributes']
+
+  # Event data attributes that are stored in a dedicated column or that are
+  # part of the serialized attribute container format.
+  _RESERVED_ATTRIBUTES = frozenset([
+      '__container_type__', '__type__', 'data_type', 'hostname', 'parser',
+      'username'])
+
+  _JSON_SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
+  def __init__(self, output_mediator):
+    """Initializes a Parquet output module.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfvfs.
+    """
+    super(ParquetOutputModule, self).__init__(output_mediator)
+    self._compression = self._DEFAULT_COMPRESSION
+    self._filename = None
+    self._row_group_size = self._DEFAULT_ROW_GROUP_SIZE
+    self._rows = None
+    self._number_of_buffered_rows = 0
+    self._schema = None
+    self._writer = None
+
+  def _FlushRowGroup(self):
+    """Writes the buffered rows as a row group."""
+    if not self._number_of_buffered_rows:
+      return
+
+    arrays = []
+    for column_name in self._COLUMNS:
+      column_values = self._rows[column_name]
+      if column_name == 'timestamp':
+        array = pyarrow.array(column_values, type=pyarrow.int64())
+      else:
+        array = pyarrow.array(column_values, type=pyarrow.string())
+        if column_name in self._DICTIONARY_COLUMNS:
+          array = array.dictionary_encode()
+
+      arrays.append(array)
+
+    table = pyarrow.Table.from_arrays(arrays, schema=self._schema)
+    self._writer.write_table(table, row_group_size=self._row_group_size)
+
+    logger.debug('Parquet row group of {0:d} rows written.'.format(
+        self._number_of_buffered_rows))
+
+    self._ResetRowBuffer()
+
+  def _GetSchema(self):
+    """Retrieves the Arrow schema of the output.
+
+    Returns:
+      pyarrow.Schema: schema.
+    """
+    dictionary_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+
+    fields = []
+    for column_name in self._COLUMNS:
+      if column_name == 'timestamp':
+        field_type = pyarrow.int64()
+      elif column_name in self._DICTIONARY_COLUMNS:
+        field_type = dictionary_type
+      else:
+        field_type = pyarrow.string()
+
+      fields.append(pyarrow.field(column_name, field_type))
+
+    return pyarrow.schema(fields)
+
+  def _ResetRowBuffer(self):
+    """Resets the row buffer."""
+    self._number_of_buffered_rows = 0
+    self._rows = {column_name: [] for column_name in self._COLUMNS}
+
+  def _SerializeAttributes(self, event_data):
+    """Serializes the event data attributes without a dedicated column.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      str: JSON string containing the remaining attributes.
+    """
+    json_dict = self._JSON_SERIALIZER.WriteSerializedDict(event_data)
+    attributes = {
+        name: value for name, value in json_dict.items()
+        if name not in self._RESERVED_ATTRIBUTES}
+
+    return json.dumps(attributes, sort_keys=True)
+
+  def Close(self):
+    """Closes the output."""
+    if self._writer:
+      self._FlushRowGroup()
+      self._writer.close()
+      self._writer = None
+
+  def Open(self):
+    """Opens the output file.
+
+    Raises:
+      IOError: if the specified output file already exists.
+      OSError: if the specified output file already exists.
+      ValueError: if the filename is not set.
+    """
+    if not self._filename:
+      raise ValueError('Missing filename.')
+
+    if os.path.isfile(self._filename):
+      raise IOError((
+          'Unable to use an already existing file for output '
+          '[{0:s}]').format(self._filename))
+
+    self._schema = self._GetSchema()
+    self._writer = parquet.ParquetWriter(
+        self._filename, self._schema, compression=self._compression)
+    self._ResetRowBuffer()
+
+  def SetCompression(self, compression):
+    """Sets the compression method.
+
+    Args:
+      compression (str): name of the compression method, such as "gzip",
+          "none", "snappy" or "zstd".
+    """
+    self._compression = compression
+
+  def SetFilename(self, filename):
+    """Sets the filename.
+
+    Args:
+      filename (str): filename.
+    """
+    self._filename = filename
+
+  def SetRowGroupSize(self, row_group_size):
+    """Sets the row group size.
+
+    Args:
+      row_group_size (int): number of events to buffer before writing
+          a row group.
+    """
+    self._row_group_size = row_group_size
+
+  def WriteEventBody(self, event, event_data, event_tag):
+    """Writes event values to the output.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_tag (EventTag): event tag.
+    """
+    message, _ = self._output_mediator.GetFormattedMessages(event_data)
+    source_short, source_long = self._output_mediator.GetFormattedSources(
+        event, event_data)
+
+    tag = None
+    if event_tag:
+      tag = ' '.join(event_tag.labels)
+
+    # All values are determined before they are added to the rows, such that
+    # an error, for example in serializing the attributes, does not result
+    # in columns with different numbers of values.
+    row_values = {
+        'attributes': self._SerializeAttributes(event_data),
+        'data_type': event_data.data_type,
+        'hostname': self._output_mediator.GetHostname(event_data),
+        'message': message,
+        'parser': getattr(event_data, 'parser', None),
+        'source': source_short,
+        'source_long': source_long,
+        'tag': tag,
+        'timestamp': event.timestamp,
+        'timestamp_desc': event.timestamp_desc,
+        'username': self._output_mediator.GetUsername(event_data)}
+
+    for column_name, value in row_values.items():
+      self._rows[column_name].append(value)
+
+    self._number_of_buffered_rows += 1
+    if self._number_of_buffered_rows >= self._row_group_size:
+      self._FlushRowGroup()
+
+
+manager.OutputManager.RegisterOutput(
+    ParquetOutputModule, disabled=pyarrow is None)
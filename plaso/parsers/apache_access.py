@@ -165,6 +165,38 @@ class ApacheAccessParser(text_parser.PyparsingSingleLineTextParser):
 
   _SUPPORTED_KEYS = frozenset([key for key, _ in LINE_STRUCTURES])
 
+  # Regular expression patterns that are equivalent to the line structures,
+  # where lines with an IPv6 address are parsed using the line structures.
+  _IP_ADDRESS_PATTERN = (
+      r'(?P<ip_address>(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})'
+      r'(?:\.(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3})')
+
+  _COMMON_LOG_FORMAT_PATTERN = (
+      r'(?P<remote_name>[A-Za-z0-9]+|-) +(?P<user_name>[A-Za-z0-9]+|-) +'
+      r'\[(?P<day>[0-9]{2})/(?P<month>[A-Za-z]{3})/(?P<year>[0-9]{4}):'
+      r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):(?P<seconds>[0-9]{2}) '
+      r'(?P<time_offset>[-+][0-9]{4})\] +'
+      r'"[ \t\r\n]*(?P<http_request>[^"]*)" +'
+      r'(?P<response_code>[0-9]+) +(?P<response_bytes>-|[0-9]+)')
+
+  _REFERER_AND_USER_AGENT_PATTERN = (
+      r' +"[ \t\r\n]*(?P<referer>[^"]*)"'
+      r' +"[ \t\r\n]*(?P<user_agent>[^"]*)"')
+
+  _LINE_END_PATTERN = r'[ \t\r]*(?:\n|\Z)'
+
+  LINE_STRUCTURE_REGULAR_EXPRESSIONS = [
+      ('combined_log_format', ''.join([
+          _IP_ADDRESS_PATTERN, ' +', _COMMON_LOG_FORMAT_PATTERN,
+          _REFERER_AND_USER_AGENT_PATTERN, _LINE_END_PATTERN])),
+      ('common_log_format', ''.join([
+          _IP_ADDRESS_PATTERN, ' +', _COMMON_LOG_FORMAT_PATTERN,
+          _LINE_END_PATTERN])),
+      ('vhost_combined_log_format', ''.join([
+          r'(?P<server_name>[A-Za-z0-9.-]+):(?P<port_number>[0-9]+) +',
+          _IP_ADDRESS_PATTERN, ' +', _COMMON_LOG_FORMAT_PATTERN,
+          _REFERER_AND_USER_AGENT_PATTERN, _LINE_END_PATTERN]))]
+
   # TODO: migrate function after dfdatetime issue #47 is fixed.
   def _GetISO8601String(self, structure):
     """Normalize date time parsed format to an ISO 8601 date time string.
@@ -218,6 +250,39 @@ class ApacheAccessParser(text_parser.PyparsingSingleLineTextParser):
 
     return date_time_string
 
+  def _GetStructureFromRegularExpressionMatch(self, key, values):
+    """Retrieves a structure from the values of a regular expression match.
+
+    Args:
+      key (str): name of the line structure that the regular expression is
+          equivalent to.
+      values (dict[str, str]): values of the named groups of the regular
+          expression.
+
+    Returns:
+      dict[str, object]: structure of values.
+    """
+    date_time = {
+        'day': int(values.pop('day'), 10),
+        'hours': int(values.pop('hours'), 10),
+        'minutes': int(values.pop('minutes'), 10),
+        'month': values.pop('month'),
+        'seconds': int(values.pop('seconds'), 10),
+        'time_offset': values.pop('time_offset'),
+        'year': int(values.pop('year'), 10)}
+
+    structure = values
+    structure['date_time'] = date_time
+    structure['response_code'] = int(values['response_code'], 10)
+
+    if values['response_bytes'] != '-':
+      structure['response_bytes'] = int(values['response_bytes'], 10)
+
+    if 'port_number' in values:
+      structure['port_number'] = int(values['port_number'], 10)
+
+    return structure
+
   def ParseRecord(self, parser_mediator, key, structure):
     """Parses a matching entry.
 
@@ -6,8 +6,6 @@ from __future__ import unicode_literals
 import abc
 import csv
 
-from dfvfs.helpers import text_file
-
 from plaso.lib import errors
 from plaso.lib import line_reader_file
 from plaso.lib import py2to3
@@ -15,10 +13,10 @@ from plaso.lib import specification
 from plaso.parsers import interface
 
 
-# The Python 2 version of the csv module does not support Unicode input
-# and we cannot use dfvfs.TextFile. csv.DictReader requires a file-like
-# object that implements readline. BinaryLineReader provides readline on top
-# of dfvfs.FileIO objects.
+# The Python 2 version of the csv module does not support Unicode input.
+# csv.DictReader requires a file-like object that implements readline.
+# LineReader and BinaryLineReader provide readline on top of dfvfs.FileIO
+# objects.
 
 
 class DSVParser(interface.FileObjectParser):
@@ -39,6 +37,11 @@ class DSVParser(interface.FileObjectParser):
   # starts.
   NUMBER_OF_HEADER_LINES = 0
 
+  # The number of rows to pass to ParseRows at once, where 0 represents that
+  # the rows are passed to ParseRow one at a time. Parsers that set this
+  # should override ParseRows to process the rows of a batch per column.
+  NUMBER_OF_ROWS_PER_BATCH = 0
+
   # If there is a special quote character used inside the structured text
   # it can be defined here.
   QUOTE_CHAR = b'"'
@@ -67,6 +70,37 @@ class DSVParser(interface.FileObjectParser):
         len(self._end_of_line) +
         len(self.COLUMNS) * (self.FIELD_SIZE_LIMIT + len(self.DELIMITER)))
 
+  def _ConvertColumnsToUnicode(self, parser_mediator, columns):
+    """Converts all strings in DSV columns to Unicode.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      columns (dict[str, list[bytes]]): values of rows from a DSV file, where
+          the dictionary key contains the column name and the value binary
+          strings.
+
+    Returns:
+      dict[str, list[str]]: values of rows from the DSV file, where the
+          dictionary key contains the column name and the value Unicode
+          strings.
+    """
+    for key, values in iter(columns.items()):
+      for index, value in enumerate(values):
+        if isinstance(value, py2to3.UNICODE_TYPE):
+          continue
+
+        try:
+          values[index] = value.decode(self._encoding)
+        except UnicodeDecodeError:
+          replaced_value = value.decode(self._encoding, errors='replace')
+          parser_mediator.ProduceExtractionWarning(
+              'error decoding DSV value: {0:s} as {1:s}, characters have been '
+              'replaced in {2:s}'.format(key, self._encoding, replaced_value))
+          values[index] = replaced_value
+
+    return columns
+
   def _ConvertRowToUnicode(self, parser_mediator, row):
     """Converts all strings in a DSV row dict to Unicode.
 
@@ -132,8 +166,8 @@ class DSVParser(interface.FileObjectParser):
       file_object (dfvfs.FileIO): file-like object.
 
     Returns:
-      TextFile|BinaryLineReader: an object that implements an iterator
-          over lines in a text file.
+      LineReader: an object that implements an iterator over lines in a text
+          file.
 
     Raises:
       UnicodeDecodeError: if the file cannot be read with the specified
@@ -142,17 +176,14 @@ class DSVParser(interface.FileObjectParser):
     # The Python 2 csv module reads bytes and the Python 3 csv module Unicode
     # reads strings.
     if py2to3.PY_3:
-      line_reader = text_file.TextFile(
+      line_reader = line_reader_file.LineReader(
           file_object, encoding=self._encoding, end_of_line=self._end_of_line)
 
-      # pylint: disable=protected-access
-      maximum_read_buffer_size = line_reader._MAXIMUM_READ_BUFFER_SIZE
-
     else:
       line_reader = line_reader_file.BinaryLineReader(
           file_object, end_of_line=self._end_of_line)
 
-      maximum_read_buffer_size = line_reader.MAXIMUM_READ_BUFFER_SIZE
+    maximum_read_buffer_size = line_reader.MAXIMUM_READ_BUFFER_SIZE
 
     # Line length is one less than the maximum read buffer size so that we
     # tell if there's a line that doesn't end at the end before the end of
@@ -165,6 +196,28 @@ class DSVParser(interface.FileObjectParser):
       line_reader.readline(self._maximum_line_length)
     return line_reader
 
+  def _CreateRowReader(self, line_reader):
+    """Returns a reader that processes each row and yields lists of values.
+
+    csv.reader does this job well for single-character delimiters; parsers
+    that need multi-character delimiters and process rows in batches need to
+    override this method.
+
+    Args:
+      line_reader (iter): yields lines from a file-like object.
+
+    Returns:
+      iter: a reader of lists of values, as returned by csv.reader().
+    """
+    delimiter = self.DELIMITER
+    quotechar = self.QUOTE_CHAR
+    # Python 3 csv module requires arguments to constructor to be of type str.
+    if py2to3.PY_3:
+      delimiter = delimiter.decode(self._encoding)
+      quotechar = quotechar.decode(self._encoding)
+
+    return csv.reader(line_reader, delimiter=delimiter, quotechar=quotechar)
+
   def _HasExpectedLineLength(self, file_object):
     """Determines if a file begins with lines of the expected length.
 
@@ -190,6 +243,74 @@ class DSVParser(interface.FileObjectParser):
     file_object.seek(original_file_position)
     return True
 
+  def _ParseRowsBatch(self, parser_mediator, row_offsets, rows):
+    """Parses a batch of rows.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      row_offsets (list[int]): offsets of the rows.
+      rows (list[list[str]]): values of the rows, in the order specified in
+          COLUMNS.
+    """
+    columns = {
+        column_name: list(values)
+        for column_name, values in zip(self.COLUMNS, zip(*rows))}
+
+    if py2to3.PY_2:
+      columns = self._ConvertColumnsToUnicode(parser_mediator, columns)
+
+    self.ParseRows(parser_mediator, row_offsets, columns)
+
+  def _ParseRowsInBatches(
+      self, parser_mediator, line_reader, row_offset, row):
+    """Parses the rows of a DSV file in batches.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      line_reader (LineReader): line reader positioned after the first row.
+      row_offset (int): offset of the first row.
+      row (dict[str, str]): fields of the first row, as specified in COLUMNS.
+    """
+    number_of_columns = len(self.COLUMNS)
+
+    row_offsets = [row_offset]
+    rows = [[row[column_name] for column_name in self.COLUMNS]]
+
+    row_reader = self._CreateRowReader(line_reader)
+    row_offset = line_reader.tell()
+
+    try:
+      for values in row_reader:
+        if parser_mediator.abort:
+          break
+
+        if len(values) == number_of_columns:
+          row_offsets.append(row_offset)
+          rows.append(values)
+
+        elif values:
+          parser_mediator.ProduceExtractionWarning((
+              'unable to parse row at offset: {0:d} with error: wrong number '
+              'of values (expected: {1:d}, got: {2:d})').format(
+                  row_offset, number_of_columns, len(values)))
+
+        row_offset = line_reader.tell()
+
+        if len(rows) >= self.NUMBER_OF_ROWS_PER_BATCH:
+          self._ParseRowsBatch(parser_mediator, row_offsets, rows)
+          row_offsets = []
+          rows = []
+
+    except (csv.Error, UnicodeDecodeError) as exception:
+      parser_mediator.ProduceExtractionWarning(
+          'unable to read row at offset: {0:d} with error: {1!s}'.format(
+              row_offset, exception))
+
+    if rows and not parser_mediator.abort:
+      self._ParseRowsBatch(parser_mediator, row_offsets, rows)
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -264,6 +385,10 @@ class DSVParser(interface.FileObjectParser):
           '[{0:s}] Unable to parse DSV file: {1:s}. Verification '
           'failed.').format(self.NAME, display_name))
 
+    if self.NUMBER_OF_ROWS_PER_BATCH:
+      self._ParseRowsInBatches(parser_mediator, line_reader, row_offset, row)
+      return
+
     self.ParseRow(parser_mediator, row_offset, row)
     row_offset = line_reader.tell()
 
@@ -285,6 +410,27 @@ class DSVParser(interface.FileObjectParser):
       row (dict[str, str]): fields of a single row, as specified in COLUMNS.
     """
 
+  def ParseRows(self, parser_mediator, row_offsets, columns):
+    """Parses a batch of lines of the log file and produces events.
+
+    This method is only used if NUMBER_OF_ROWS_PER_BATCH is set. The default
+    implementation passes the rows to ParseRow one at a time, parsers that
+    set NUMBER_OF_ROWS_PER_BATCH should override it to process the values of
+    the rows per column.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      row_offsets (list[int]): offsets of the rows.
+      columns (dict[str, list[str]]): values of the rows per column, as
+          specified in COLUMNS, in the same order as the row offsets.
+    """
+    for index, row_offset in enumerate(row_offsets):
+      row = {
+          column_name: values[index]
+          for column_name, values in iter(columns.items())}
+      self.ParseRow(parser_mediator, row_offset, row)
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def VerifyRow(self, parser_mediator, row):
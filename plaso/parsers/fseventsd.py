@@ -175,6 +175,10 @@ class FseventsdParser(dtfabric_parser.DtFabricBaseParser):
 
     current_page_end = page_header.page_size
 
+    # The parse results depend on the modification time of the parent
+    # directory.
+    parser_mediator.MarkParseResultsNotCacheable()
+
     file_entry = parser_mediator.GetFileEntry()
     date_time = self._GetParentModificationTime(file_entry)
     # TODO: Change this to use a more representative time definition (time span)
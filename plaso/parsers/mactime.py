@@ -60,6 +60,8 @@ class MactimeParser(dsv_parser.DSVParser):
       'atime', 'mtime', 'ctime', 'btime']
   DELIMITER = b'|'
 
+  NUMBER_OF_ROWS_PER_BATCH = 1024
+
   _MD5_RE = re.compile(r'^[0-9a-fA-F]{32}$')
 
   # Mapping according to:
@@ -71,21 +73,47 @@ class MactimeParser(dsv_parser.DSVParser):
       'mtime': definitions.TIME_DESCRIPTION_MODIFICATION,
   }
 
-  def _GetIntegerValue(self, row, value_name):
-    """Converts a specific value of the row to an integer.
+  def _GetIntegerValues(self, values):
+    """Converts values to integers.
 
     Args:
-      row (dict[str, str]): fields of a single row, as specified in COLUMNS.
-      value_name (str): name of the value within the row.
+      values (list[str]): values.
 
     Returns:
-      int: value or None if the value cannot be converted.
+      list[int]: integer values, where a value that cannot be converted
+          is None.
     """
-    value = row.get(value_name, None)
     try:
-      return int(value, 10)
+      return [int(value, 10) for value in values]
     except (TypeError, ValueError):
-      return None
+      pass
+
+    integer_values = []
+    for value in values:
+      try:
+        integer_value = int(value, 10)
+      except (TypeError, ValueError):
+        integer_value = None
+
+      integer_values.append(integer_value)
+
+    return integer_values
+
+  def _GetInodeNumbers(self, values):
+    """Converts "inode" values to integers.
+
+    Args:
+      values (list[str]): "inode" values, which can contain an MFT entry
+          index value and a sequence number, such as "64-128-1".
+
+    Returns:
+      list[int]: "inode" numbers, where a value that cannot be converted
+          is None.
+    """
+    values = [
+        value.partition('-')[0] if '-' in value else value
+        for value in values]
+    return self._GetIntegerValues(values)
 
   def ParseRow(self, parser_mediator, row_offset, row):
     """Parses a line of the log file and produces events.
@@ -96,48 +124,65 @@ class MactimeParser(dsv_parser.DSVParser):
       row_offset (int): number of the corresponding line.
       row (dict[str, str]): fields of a single row, as specified in COLUMNS.
     """
-    filename = row.get('name', None)
-    md5_hash = row.get('md5', None)
-    mode = row.get('mode_as_string', None)
-
-    inode_number = row.get('inode', None)
-    if '-' in inode_number:
-      inode_number, _, _ = inode_number.partition('-')
+    columns = {
+        column_name: [row.get(column_name, None)]
+        for column_name in self.COLUMNS}
+    self.ParseRows(parser_mediator, [row_offset], columns)
 
-    try:
-      inode_number = int(inode_number, 10)
-    except (TypeError, ValueError):
-      inode_number = None
-
-    data_size = self._GetIntegerValue(row, 'size')
-    user_uid = self._GetIntegerValue(row, 'uid')
-    user_gid = self._GetIntegerValue(row, 'gid')
-
-    event_data = MactimeEventData()
-    event_data.filename = filename
-    event_data.inode = inode_number
-    event_data.md5 = md5_hash
-    event_data.mode_as_string = mode
-    event_data.offset = row_offset
-    event_data.size = data_size
-    event_data.user_gid = user_gid
-
-    if user_uid is None:
-      event_data.user_sid = None
-    else:
-      # Note that the user_sid value is expected to be a string.
-      event_data.user_sid = '{0:d}'.format(user_uid)
-
-    for value_name, timestamp_description in iter(
-        self._TIMESTAMP_DESC_MAP.items()):
-      posix_time = self._GetIntegerValue(row, value_name)
-      # mactime will return 0 if the timestamp is not set.
-      if not posix_time:
-        continue
+  def ParseRows(self, parser_mediator, row_offsets, columns):
+    """Parses a batch of lines of the log file and produces events.
 
-      date_time = dfdatetime_posix_time.PosixTime(timestamp=posix_time)
-      event = time_events.DateTimeValuesEvent(date_time, timestamp_description)
-      parser_mediator.ProduceEventWithEventData(event, event_data)
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      row_offsets (list[int]): numbers of the corresponding lines.
+      columns (dict[str, list[str]]): values of the rows per column, as
+          specified in COLUMNS, in the same order as the row offsets.
+    """
+    filenames = columns['name']
+    md5_hashes = columns['md5']
+    modes = columns['mode_as_string']
+
+    inode_numbers = self._GetInodeNumbers(columns['inode'])
+    data_sizes = self._GetIntegerValues(columns['size'])
+    user_uids = self._GetIntegerValues(columns['uid'])
+    user_gids = self._GetIntegerValues(columns['gid'])
+
+    timestamps = [
+        (timestamp_description, self._GetIntegerValues(columns[value_name]))
+        for value_name, timestamp_description in iter(
+            self._TIMESTAMP_DESC_MAP.items())]
+
+    events_with_event_data = []
+    for index, row_offset in enumerate(row_offsets):
+      event_data = MactimeEventData()
+      event_data.filename = filenames[index]
+      event_data.inode = inode_numbers[index]
+      event_data.md5 = md5_hashes[index]
+      event_data.mode_as_string = modes[index]
+      event_data.offset = row_offset
+      event_data.size = data_sizes[index]
+      event_data.user_gid = user_gids[index]
+
+      user_uid = user_uids[index]
+      if user_uid is None:
+        event_data.user_sid = None
+      else:
+        # Note that the user_sid value is expected to be a string.
+        event_data.user_sid = '{0:d}'.format(user_uid)
+
+      for timestamp_description, posix_times in timestamps:
+        posix_time = posix_times[index]
+        # mactime will return 0 if the timestamp is not set.
+        if not posix_time:
+          continue
+
+        date_time = dfdatetime_posix_time.PosixTime(timestamp=posix_time)
+        event = time_events.DateTimeValuesEvent(
+            date_time, timestamp_description)
+        events_with_event_data.append((event, event_data))
+
+    parser_mediator.ProduceEventsWithEventData(events_with_event_data)
 
   # pylint: disable=unused-argument
   def VerifyRow(self, parser_mediator, row):
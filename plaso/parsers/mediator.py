@@ -16,6 +16,7 @@ from plaso.lib import errors
 from plaso.lib import py2to3
 from plaso.lib import timelib
 from plaso.parsers import logger
+from plaso.serializer import json_serializer
 
 
 class ParserMediator(object):
@@ -35,6 +36,13 @@ class ParserMediator(object):
   _INT64_MIN = -1 << 63
   _INT64_MAX = (1 << 63) - 1
 
+  # Maximum number of parse results recorded for a data stream, where the
+  # parse results of a data stream that produces more events are not cached
+  # to bound the memory used for recording them.
+  _MAXIMUM_NUMBER_OF_RECORDED_PARSE_RESULTS = 100000
+
+  _SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
   def __init__(
       self, storage_writer, knowledge_base, collection_filters_helper=None,
       preferred_year=None, resolver_context=None, temporary_directory=None):
@@ -54,16 +62,21 @@ class ParserMediator(object):
     super(ParserMediator, self).__init__()
     self._abort = False
     self._cpu_time_profiler = None
+    self._evtx_xml_templates = False
     self._extra_event_attributes = {}
     self._file_entry = None
+    self._file_entry_values = None
     self._knowledge_base = knowledge_base
     self._last_event_data_hash = None
     self._last_event_data_identifier = None
+    self._last_recorded_event_data_hash = None
     self._memory_profiler = None
     self._mount_path = None
     self._number_of_event_sources = 0
     self._number_of_events = 0
     self._number_of_warnings = 0
+    self._parse_results = None
+    self._parse_results_cacheable = False
     self._parser_chain_components = []
     self._preferred_year = preferred_year
     self._process_information = None
@@ -85,6 +98,11 @@ class ParserMediator(object):
     """str: codepage."""
     return self._knowledge_base.codepage
 
+  @property
+  def evtx_xml_templates(self):
+    """bool: True if EVTX record XML should be stored as XML templates."""
+    return self._evtx_xml_templates
+
   @property
   def hostname(self):
     """str: hostname."""
@@ -174,6 +192,41 @@ class ParserMediator(object):
           'error: {0!s}').format(exception))
       return None
 
+  def _GetFileEntryValues(self, file_entry):
+    """Retrieves the event data values that are derived from a file entry.
+
+    The values are cached for the last file entry since they are the same for
+    all the event data produced for a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      tuple[str, str, int]: relative path, display name and inode of the file
+          entry, where the inode is None if not available.
+    """
+    if self._file_entry_values and self._file_entry_values[0] is file_entry:
+      return self._file_entry_values[1]
+
+    path_spec = getattr(file_entry, 'path_spec', None)
+    relative_path = path_helper.PathHelper.GetRelativePathForPathSpec(
+        path_spec, mount_path=self._mount_path)
+
+    # TODO: dfVFS refactor: move display name to output since the path
+    # specification contains the full information.
+    display_name = self.GetDisplayName(file_entry)
+
+    stat_object = file_entry.GetStat()
+    inode_value = getattr(stat_object, 'ino', None)
+    inode = None
+    if inode_value is not None:
+      inode = self._GetInode(inode_value)
+
+    values = (relative_path, display_name, inode)
+    self._file_entry_values = (file_entry, values)
+
+    return values
+
   def _GetInode(self, inode_value):
     """Retrieves the inode from the inode value.
 
@@ -234,6 +287,78 @@ class ParserMediator(object):
           'information with error: {0!s}').format(exception))
       return None
 
+  def _ProduceEventWithEventData(
+      self, event, event_data, event_data_hash, parser_chain,
+      copy_event_data=True):
+    """Produces an event.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_hash (int): hash of the event data attribute values.
+      parser_chain (str): parser chain.
+      copy_event_data (Optional[bool]): True if the event data should be copied
+          before it is processed, False if it can be processed in place.
+
+    Raises:
+      InvalidEvent: if the event timestamp value is not set or out of bounds.
+    """
+    if event.timestamp is None:
+      raise errors.InvalidEvent('Event timestamp value not set.')
+
+    if event.timestamp < self._INT64_MIN or event.timestamp > self._INT64_MAX:
+      raise errors.InvalidEvent('Event timestamp value out of bounds.')
+
+    if self._parse_results is not None:
+      self._RecordParseResult(event, event_data, event_data_hash)
+
+    if event_data_hash != self._last_event_data_hash:
+      if copy_event_data:
+        # Make a copy of the event data before adding additional values.
+        event_data = copy.deepcopy(event_data)
+
+      self.ProcessEventData(
+          event_data, parser_chain=parser_chain, file_entry=self._file_entry)
+
+      self._storage_writer.AddEventData(event_data)
+
+      self._last_event_data_hash = event_data_hash
+      self._last_event_data_identifier = event_data.GetIdentifier()
+
+    if self._last_event_data_identifier:
+      event.SetEventDataIdentifier(self._last_event_data_identifier)
+
+    # TODO: remove this after structural fix is in place
+    # https://github.com/log2timeline/plaso/issues/1691
+    event.parser = parser_chain
+
+    self._storage_writer.AddEvent(event)
+    self._number_of_events += 1
+
+  def _RecordParseResult(self, event, event_data, event_data_hash):
+    """Records a parse result for the parse result cache.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data, before the event data is processed.
+      event_data_hash (int): hash of the event data attribute values.
+    """
+    if len(self._parse_results) >= (
+        self._MAXIMUM_NUMBER_OF_RECORDED_PARSE_RESULTS):
+      self._parse_results = None
+      self._parse_results_cacheable = False
+      return
+
+    serialized_event_data = None
+    if event_data_hash != self._last_recorded_event_data_hash:
+      serialized_event_data = self._SERIALIZER.WriteSerializedDict(event_data)
+      self._last_recorded_event_data_hash = event_data_hash
+
+    serialized_event = self._SERIALIZER.WriteSerializedDict(event)
+
+    self._parse_results.append((
+        self.GetParserChain(), serialized_event, serialized_event_data))
+
   def AddEventAttribute(self, attribute_name, attribute_value):
     """Adds an attribute that will be set on all events produced.
 
@@ -270,6 +395,18 @@ class ParserMediator(object):
     """Clears the parser chain."""
     self._parser_chain_components = []
 
+  def GetCPUTimePerParser(self):
+    """Retrieves the CPU time spent per parser.
+
+    Returns:
+      dict[str, float]: total CPU time in seconds per parser name or None if
+          parsers are not profiled.
+    """
+    if not self._cpu_time_profiler:
+      return None
+
+    return self._cpu_time_profiler.GetTotalCPUTimes()
+
   def GetDisplayName(self, file_entry=None):
     """Retrieves the display name for a file entry.
 
@@ -322,6 +459,9 @@ class ParserMediator(object):
     Returns:
       int: estimated year.
     """
+    # The estimated year can depend on the file entry metadata.
+    self._parse_results_cacheable = False
+
     # TODO: improve this method to get a more reliable estimate.
     # Preserve the year-less date and sort this out in the psort phase.
     if self._preferred_year:
@@ -372,6 +512,8 @@ class ParserMediator(object):
     Returns:
       int: year of the file entry or the current year.
     """
+    self._parse_results_cacheable = False
+
     year = self._GetLatestYearFromFileEntry()
     if not year:
       year = timelib.GetCurrentYear()
@@ -386,6 +528,14 @@ class ParserMediator(object):
     """
     return '/'.join(self._parser_chain_components)
 
+  def MarkParseResultsNotCacheable(self):
+    """Marks the parse results of the current data stream as not cacheable.
+
+    Parsers should call this method when the parse results depend on more
+    than the content of the data stream, for example on another file.
+    """
+    self._parse_results_cacheable = False
+
   def PopFromParserChain(self):
     """Removes the last added parser or parser plugin from the parser chain."""
     self._parser_chain_components.pop()
@@ -420,20 +570,14 @@ class ParserMediator(object):
     if file_entry:
       event_data.pathspec = file_entry.path_spec
 
-      if not getattr(event_data, 'filename', None):
-        path_spec = getattr(file_entry, 'path_spec', None)
-        event_data.filename = path_helper.PathHelper.GetRelativePathForPathSpec(
-            path_spec, mount_path=self._mount_path)
+      relative_path, display_name, inode = self._GetFileEntryValues(
+          file_entry)
 
-      if not display_name:
-        # TODO: dfVFS refactor: move display name to output since the path
-        # specification contains the full information.
-        display_name = self.GetDisplayName(file_entry)
+      if not getattr(event_data, 'filename', None):
+        event_data.filename = relative_path
 
-      stat_object = file_entry.GetStat()
-      inode_value = getattr(stat_object, 'ino', None)
-      if getattr(event_data, 'inode', None) is None and inode_value is not None:
-        event_data.inode = self._GetInode(inode_value)
+      if getattr(event_data, 'inode', None) is None and inode is not None:
+        event_data.inode = inode
 
     if not getattr(event_data, 'display_name', None) and display_name:
       event_data.display_name = display_name
@@ -468,6 +612,9 @@ class ParserMediator(object):
     if not self._storage_writer:
       raise RuntimeError('Storage writer not set.')
 
+    # Event sources are not stored in the parse result cache.
+    self._parse_results_cacheable = False
+
     self._storage_writer.AddEventSource(event_source)
     self._number_of_event_sources += 1
 
@@ -483,35 +630,44 @@ class ParserMediator(object):
     Raises:
       InvalidEvent: if the event timestamp value is not set or out of bounds.
     """
-    if event.timestamp is None:
-      raise errors.InvalidEvent('Event timestamp value not set.')
+    event_data_hash = event_data.GetAttributeValuesHash()
+    self._ProduceEventWithEventData(
+        event, event_data, event_data_hash, self.GetParserChain())
 
-    if event.timestamp < self._INT64_MIN or event.timestamp > self._INT64_MAX:
-      raise errors.InvalidEvent('Event timestamp value out of bounds.')
+    self.last_activity_timestamp = time.time()
 
-    event_data_hash = event_data.GetAttributeValuesHash()
-    if event_data_hash != self._last_event_data_hash:
-      # Make a copy of the event data before adding additional values.
-      event_data = copy.deepcopy(event_data)
+  def ProduceEventsWithEventData(self, events_with_event_data):
+    """Produces events.
 
-      self.ProcessEventData(
-          event_data, parser_chain=self.GetParserChain(),
-          file_entry=self._file_entry)
+    Producing a batch of events is more efficient than producing the events
+    one at a time, since values that are the same for all events, such as
+    the parser chain, are only determined once per batch. Also see
+    ProduceEventWithEventData.
 
-      self._storage_writer.AddEventData(event_data)
+    Note that the event data is processed in place, so it should not be
+    modified or reused after it has been passed to this method. The hash of
+    the attribute values of event data that is shared by consecutive events
+    is only determined once.
 
-      self._last_event_data_hash = event_data_hash
-      self._last_event_data_identifier = event_data.GetIdentifier()
+    Args:
+      events_with_event_data (list[tuple[EventObject, EventData]]): events and
+          their event data.
 
-    if self._last_event_data_identifier:
-      event.SetEventDataIdentifier(self._last_event_data_identifier)
+    Raises:
+      InvalidEvent: if an event timestamp value is not set or out of bounds.
+    """
+    parser_chain = self.GetParserChain()
 
-    # TODO: remove this after structural fix is in place
-    # https://github.com/log2timeline/plaso/issues/1691
-    event.parser = self.GetParserChain()
+    event_data_hash = None
+    last_event_data = None
+    for event, event_data in events_with_event_data:
+      if event_data is not last_event_data:
+        event_data_hash = event_data.GetAttributeValuesHash()
+        last_event_data = event_data
 
-    self._storage_writer.AddEvent(event)
-    self._number_of_events += 1
+      self._ProduceEventWithEventData(
+          event, event_data, event_data_hash, parser_chain,
+          copy_event_data=False)
 
     self.last_activity_timestamp = time.time()
 
@@ -533,6 +689,9 @@ class ParserMediator(object):
     if not path_spec and self._file_entry:
       path_spec = self._file_entry.path_spec
 
+    # Extraction warnings are not stored in the parse result cache.
+    self._parse_results_cacheable = False
+
     parser_chain = self.GetParserChain()
     warning = warnings.ExtractionWarning(
         message=message, parser_chain=parser_chain, path_spec=path_spec)
@@ -541,6 +700,59 @@ class ParserMediator(object):
 
     self.last_activity_timestamp = time.time()
 
+  def ProduceParseResults(self, parse_results):
+    """Produces events from cached parse results.
+
+    The event data is processed as if it was produced by the parser, which
+    anchors the events to the current file entry.
+
+    Args:
+      parse_results (list[tuple[str, dict[str, object], dict[str, object]]]):
+          parser chain, JSON serialized event and JSON serialized event data,
+          where the JSON serialized event data is None if it is the same as
+          that of the previous event.
+    """
+    parser_chain_components = self._parser_chain_components
+
+    event_data = None
+    try:
+      for parser_chain, serialized_event, serialized_event_data in (
+          parse_results):
+        if self._abort:
+          break
+
+        event = self._SERIALIZER.ReadSerializedDict(serialized_event)
+        if serialized_event_data is not None:
+          event_data = self._SERIALIZER.ReadSerializedDict(
+              serialized_event_data)
+
+        self._parser_chain_components = (
+            parser_chain.split('/') if parser_chain else [])
+
+        self.ProduceEventWithEventData(event, event_data)
+
+    finally:
+      self._parser_chain_components = parser_chain_components
+
+  def ProduceWindowsEventLogXMLTemplate(self, xml_template):
+    """Produces a Windows XML EventLog (EVTX) XML template.
+
+    Args:
+      xml_template (WindowsEventLogXMLTemplate): XML template.
+
+    Raises:
+      RuntimeError: when storage writer is not set.
+    """
+    if not self._storage_writer:
+      raise RuntimeError('Storage writer not set.')
+
+    # XML templates are not stored in the parse result cache.
+    self._parse_results_cacheable = False
+
+    self._storage_writer.AddWindowsEventLogXMLTemplate(xml_template)
+
+    self.last_activity_timestamp = time.time()
+
   def RemoveEventAttribute(self, attribute_name):
     """Removes an attribute from being set on all events produced.
 
@@ -594,6 +806,7 @@ class ParserMediator(object):
       configuration (EventExtractionConfiguration): event extraction
           configuration.
     """
+    self._evtx_xml_templates = configuration.evtx_xml_templates
     self._text_prepend = configuration.text_prepend
 
   def SetInputSourceConfiguration(self, configuration):
@@ -609,6 +822,7 @@ class ParserMediator(object):
     if mount_path and mount_path.endswith(os.sep):
       mount_path = mount_path[:-1]
 
+    self._file_entry_values = None
     self._mount_path = mount_path
 
   def SetFileEntry(self, file_entry):
@@ -661,6 +875,12 @@ class ParserMediator(object):
 
     self._process_information = process_information
 
+  def StartRecordingParseResults(self):
+    """Starts recording parse results for the parse result cache."""
+    self._last_recorded_event_data_hash = None
+    self._parse_results = []
+    self._parse_results_cacheable = True
+
   def StopProfiling(self):
     """Stops profiling."""
     if self._cpu_time_profiler:
@@ -672,3 +892,21 @@ class ParserMediator(object):
       self._memory_profiler = None
 
     self._process_information = None
+
+  def StopRecordingParseResults(self):
+    """Stops recording parse results for the parse result cache.
+
+    Returns:
+      list[tuple[str, dict[str, object], dict[str, object]]]: parser chain,
+          JSON serialized event and JSON serialized event data, or None if
+          the parse results are not cacheable.
+    """
+    parse_results = None
+    if self._parse_results_cacheable:
+      parse_results = self._parse_results
+
+    self._last_recorded_event_data_hash = None
+    self._parse_results = None
+    self._parse_results_cacheable = False
+
+    return parse_results
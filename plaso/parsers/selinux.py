@@ -106,6 +106,29 @@ class SELinuxParser(text_parser.PyparsingSingleLineTextParser):
 
   LINE_STRUCTURES = [('line', _SELINUX_LOG_LINE)]
 
+  LINE_STRUCTURE_REGULAR_EXPRESSIONS = [
+      ('line', (
+          r'type=(?P<type>UNKNOWN\[[0-9]+\]|[A-Z_]+) +'
+          r'msg=audit\((?P<seconds>[0-9]+)\.(?P<milliseconds>[0-9]+):'
+          r'(?P<serial>[0-9]+)\):[ \t\r\n]*(?P<body>[^\n]*)'))]
+
+  def _GetStructureFromRegularExpressionMatch(self, key, values):
+    """Retrieves a structure from the values of a regular expression match.
+
+    Args:
+      key (str): name of the line structure that the regular expression is
+          equivalent to.
+      values (dict[str, str]): values of the named groups of the regular
+          expression.
+
+    Returns:
+      dict[str, object]: structure of values.
+    """
+    msg_value = (
+        values['seconds'], values['milliseconds'], values['serial'])
+
+    return {'body': values['body'], 'msg': msg_value, 'type': values['type']}
+
   def ParseRecord(self, parser_mediator, key, structure):
     """Parses a structure of tokens derived from a line of a text file.
 
@@ -146,7 +169,12 @@ class SELinuxParser(text_parser.PyparsingSingleLineTextParser):
       return
 
     timestamp = ((seconds * 1000) + milliseconds) * 1000
-    body_text = structure[2][0]
+    # The body is not named in the line structure, only in the structure
+    # of a regular expression match.
+    if isinstance(structure, pyparsing.ParseResults):
+      body_text = structure[2][0]
+    else:
+      body_text = self._GetValueFromStructure(structure, 'body')
 
     try:
       # Try to parse the body text as key value pairs. Note that not
@@ -324,6 +324,17 @@ class SkyDriveOldLogParser(text_parser.PyparsingSingleLineTextParser):
       ('no_header_single_line', _NO_HEADER_SINGLE_LINE),
   ]
 
+  # Lines without a header are parsed using the line structures.
+  LINE_STRUCTURE_REGULAR_EXPRESSIONS = [
+      ('logline', (
+          r'(?P<month>[0-9]{2})-(?P<day_of_month>[0-9]{2})-'
+          r'(?P<year>[0-9]{4}) +(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):'
+          r'(?P<seconds>[0-9]{2})[.,](?P<microseconds>[0-9]+) +'
+          r'(?P<source_file>[^:\s][^:]*):(?P<source_line>[0-9]+)!'
+          r'(?P<source_function>[!-~]+) +'
+          r'\([ \t\r\n]*(?P<log_level>[^)]*)\)[ \t]*:'
+          r'[ \t\r\n]*(?P<text>[^\n]*)'))]
+
   def __init__(self):
     """Initializes a parser object."""
     super(SkyDriveOldLogParser, self).__init__()
@@ -331,6 +342,34 @@ class SkyDriveOldLogParser(text_parser.PyparsingSingleLineTextParser):
     self._last_event_data = None
     self.offset = 0
 
+  def _GetStructureFromRegularExpressionMatch(self, key, values):
+    """Retrieves a structure from the values of a regular expression match.
+
+    Args:
+      key (str): name of the line structure that the regular expression is
+          equivalent to.
+      values (dict[str, str]): values of the named groups of the regular
+          expression.
+
+    Returns:
+      dict[str, object]: structure of values.
+    """
+    date_time = (
+        int(values['month'], 10), int(values['day_of_month'], 10),
+        int(values['year'], 10), int(values['hours'], 10),
+        int(values['minutes'], 10), int(values['seconds'], 10),
+        int(values['microseconds'], 10))
+
+    source_code = '{0:s}:{1:d}!{2:s}'.format(
+        values['source_file'], int(values['source_line'], 10),
+        values['source_function'])
+
+    return {
+        'date_time': date_time,
+        'log_level': values['log_level'],
+        'source_code': source_code,
+        'text': values['text']}
+
   def _ParseLogline(self, parser_mediator, structure):
     """Parse a logline and store appropriate attributes.
 
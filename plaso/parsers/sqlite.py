@@ -382,6 +382,9 @@ class SQLiteParser(interface.FileEntryParser):
     if not wal_file_entry:
       return None, None
 
+    # The parse results depend on the content of the WAL file.
+    parser_mediator.MarkParseResultsNotCacheable()
+
     wal_file_object = wal_file_entry.GetFileObject()
     if not wal_file_object:
       return None, None
@@ -9,12 +9,13 @@ parser.
 from __future__ import unicode_literals
 
 import abc
+import functools
+import re
 
 import pyparsing
 
-from dfvfs.helpers import text_file
-
 from plaso.lib import errors
+from plaso.lib import line_reader_file
 from plaso.lib import py2to3
 from plaso.parsers import interface
 from plaso.parsers import logger
@@ -225,6 +226,18 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
   # The value is the actual pyparsing structure.
   LINE_STRUCTURES = []
 
+  # Optional regular expressions that are equivalent to the line structures
+  # and are used as a fast path, since matching a regular expression is
+  # significantly faster than parsing with pyparsing. This is defined as
+  # a list of tuples of the key of the line structure and a regular expression
+  # pattern, in order of priority. The patterns are combined into a single
+  # regular expression, such that a line is classified in a single pass.
+  # The values of the named groups of a matching pattern are converted into
+  # a structure by _GetStructureFromRegularExpressionMatch. Lines that do not
+  # match any of the patterns are parsed using the line structures. Note that
+  # named groups cannot be referenced by name within a pattern.
+  LINE_STRUCTURE_REGULAR_EXPRESSIONS = []
+
   # In order for the tool to not read too much data into a buffer to evaluate
   # whether or not the parser is the right one for this file or not we
   # specifically define a maximum amount of bytes a single line can occupy. This
@@ -240,6 +253,8 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
 
   _EMPTY_LINES = frozenset(['\n', '\r', '\r\n'])
 
+  _REGULAR_EXPRESSION_GROUP_NAME_RE = re.compile(r'\(\?P<([A-Za-z_]\w*)>')
+
   # Allow for a maximum of 40 empty lines before we bail out.
   _MAXIMUM_DEPTH = 40
 
@@ -250,6 +265,57 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     # TODO: self._line_structures is a work-around and this needs
     # a structural fix.
     self._line_structures = list(self.LINE_STRUCTURES)
+    self._line_structure_regular_expression = None
+    self._line_structure_regular_expression_groups = {}
+
+    if self.LINE_STRUCTURE_REGULAR_EXPRESSIONS:
+      self._CompileLineStructureRegularExpressions()
+
+  def _CompileLineStructureRegularExpressions(self):
+    """Compiles the line structure regular expressions.
+
+    The patterns are combined into an alternation, where the named groups of
+    every pattern are renamed to be unique within the combined regular
+    expression.
+    """
+    patterns = []
+    for index, (key, pattern) in enumerate(
+        self.LINE_STRUCTURE_REGULAR_EXPRESSIONS):
+      pattern_group_name = '_pattern{0:d}'.format(index)
+      group_names = []
+
+      rename_group = functools.partial(
+          self._RenameRegularExpressionGroup, index, group_names)
+
+      pattern = self._REGULAR_EXPRESSION_GROUP_NAME_RE.sub(
+          rename_group, pattern)
+      patterns.append('(?P<{0:s}>{1:s})'.format(pattern_group_name, pattern))
+
+      self._line_structure_regular_expression_groups[pattern_group_name] = (
+          key, group_names)
+
+    self._line_structure_regular_expression = re.compile('|'.join(patterns))
+
+  def _GetStructureFromRegularExpressionMatch(self, key, values):
+    """Retrieves a structure from the values of a regular expression match.
+
+    Parsers that define line structure regular expressions override this
+    method to convert the values into the same types as the corresponding
+    line structure, such that ParseRecord can handle either.
+
+    Args:
+      key (str): name of the line structure that the regular expression is
+          equivalent to.
+      values (dict[str, str]): values of the named groups of the regular
+          expression, where groups that did not participate in the match
+          are omitted.
+
+    Returns:
+      dict[str, object]: structure of values, or None if the values cannot be
+          converted and the line should be parsed using the line structures
+          instead.
+    """
+    return values
 
   def _GetValueFromStructure(self, structure, name, default_value=None):
     """Retrieves a token value from a Pyparsing structure.
@@ -259,7 +325,8 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     the Pyparsing default value of an empty byte stream (b'').
 
     Args:
-      structure (pyparsing.ParseResults): tokens from a parsed log line.
+      structure (pyparsing.ParseResults|dict[str, object]): tokens from
+          a parsed log line.
       name (str): name of the token.
       default_value (Optional[object]): default value.
 
@@ -269,6 +336,39 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     """
     return structure.get(name, default_value)
 
+  def _MatchLineStructureRegularExpressions(self, line):
+    """Matches a line against the line structure regular expressions.
+
+    Args:
+      line (str): line from a text file.
+
+    Returns:
+      tuple[str, dict[str, object]]: name of the line structure and structure
+          of values, or None and None if the line does not match any of the
+          regular expressions.
+    """
+    # Pyparsing replaces tabs with spaces before parsing a line, unless
+    # parseWithTabs() is used, hence the regular expressions are matched
+    # against the line with the tabs expanded.
+    match = self._line_structure_regular_expression.match(line.expandtabs())
+    if not match:
+      return None, None
+
+    key, group_names = self._line_structure_regular_expression_groups[
+        match.lastgroup]
+
+    values = {}
+    for name, group_name in group_names:
+      value = match.group(group_name)
+      if value is not None:
+        values[name] = value
+
+    structure = self._GetStructureFromRegularExpressionMatch(key, values)
+    if structure is None:
+      return None, None
+
+    return key, structure
+
   # Pylint is confused by the formatting of the bytes_in argument.
   # pylint: disable=missing-param-doc,missing-type-doc
   def _IsText(self, bytes_in, encoding=None):
@@ -330,35 +430,55 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
 
     return False
 
-  def _ReadLine(self, text_file_object, max_len=None, depth=0):
-    """Reads a line from a text file.
+  def _ReadLines(self, line_reader):
+    """Reads the lines that are not empty from a line reader.
 
     Args:
-      text_file_object (dfvfs.TextFile): text file.
-      max_len (Optional[int]): maximum number of bytes a single line can take,
-          where None means all remaining bytes should be read.
-      depth (Optional[int]): number of new lines the parser encountered.
+      line_reader (LineReader): line reader.
 
-    Returns:
-      str: single line read from the file-like object, or the maximum number of
-          characters, if max_len defined and line longer than the defined size.
+    Yields:
+      tuple[int, str]: offset and line, where lines are read up to the maximum
+          line length. Lines longer than the maximum line length are returned
+          as multiple partial lines.
 
     Raises:
       UnicodeDecodeError: if the text cannot be decoded using the specified
           encoding.
     """
-    line = text_file_object.readline(size=max_len)
+    number_of_empty_lines = 0
+    for offset, line in line_reader.GetLines(
+        maximum_line_length=self.MAX_LINE_LENGTH):
+      if line in self._EMPTY_LINES:
+        number_of_empty_lines += 1
+        if number_of_empty_lines > self._MAXIMUM_DEPTH:
+          break
 
-    if not line:
-      return ''
+        continue
 
-    if line in self._EMPTY_LINES:
-      if depth == self._MAXIMUM_DEPTH:
-        return ''
+      if not line:
+        continue
 
-      return self._ReadLine(text_file_object, max_len=max_len, depth=depth + 1)
+      number_of_empty_lines = 0
+      yield offset, line
 
-    return line
+  def _RenameRegularExpressionGroup(self, index, group_names, match):
+    """Renames a named group to be unique in the combined regular expression.
+
+    Args:
+      index (int): index of the pattern in the line structure regular
+          expressions.
+      group_names (list[tuple[str, str]]): original and renamed names of
+          the named groups in the pattern, to which the name of the group
+          is appended.
+      match (re.Match): match of the named group in the pattern.
+
+    Returns:
+      str: start of the renamed named group.
+    """
+    name = match.group(1)
+    group_name = '{0:s}_{1:d}'.format(name, index)
+    group_names.append((name, group_name))
+    return '(?P<{0:s}>'.format(group_name)
 
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a text file-like object using a pyparsing definition.
@@ -378,10 +498,11 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
           'Line structure undeclared, unable to proceed.')
 
     encoding = self._ENCODING or parser_mediator.codepage
-    text_file_object = text_file.TextFile(file_object, encoding=encoding)
+    line_reader = line_reader_file.LineReader(file_object, encoding=encoding)
+    lines = self._ReadLines(line_reader)
 
     try:
-      line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
+      self._current_offset, line = next(lines, (0, ''))
     except UnicodeDecodeError:
       raise errors.UnableToParseFile(
           'Not a text file or encoding not supported.')
@@ -404,24 +525,28 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
       raise errors.UnableToParseFile('Wrong file structure.')
 
     consecutive_line_failures = 0
-    index = None
-    # Set the offset to the beginning of the file.
-    self._current_offset = 0
     # Read every line in the text file.
     while line:
       if parser_mediator.abort:
         break
       parsed_structure = None
       use_key = None
-      # Try to parse the line using all the line structures.
-      for index, (key, structure) in enumerate(self._line_structures):
-        try:
-          parsed_structure = structure.parseString(line)
-        except pyparsing.ParseException:
-          pass
-        if parsed_structure:
-          use_key = key
-          break
+      index = None
+
+      if self._line_structure_regular_expression:
+        use_key, parsed_structure = (
+            self._MatchLineStructureRegularExpressions(line))
+
+      if not parsed_structure:
+        # Try to parse the line using all the line structures.
+        for index, (key, structure) in enumerate(self._line_structures):
+          try:
+            parsed_structure = structure.parseString(line)
+          except pyparsing.ParseException:
+            pass
+          if parsed_structure:
+            use_key = key
+            break
 
       if parsed_structure:
         self.ParseRecord(parser_mediator, use_key, parsed_structure)
@@ -442,14 +567,13 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
               'more than {0:d} consecutive failures to parse lines.'.format(
                   self.MAXIMUM_CONSECUTIVE_LINE_FAILURES))
 
-      self._current_offset = text_file_object.get_offset()
-
+      offset = line_reader.tell()
       try:
-        line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
+        self._current_offset, line = next(lines, (offset, ''))
       except UnicodeDecodeError:
         parser_mediator.ProduceExtractionWarning(
             'unable to read and decode log line at offset {0:d}'.format(
-                self._current_offset))
+                offset))
         break
 
   # pylint: disable=redundant-returns-doc
@@ -464,7 +588,9 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfvfs.
       key (str): name of the parsed structure.
-      structure (pyparsing.ParseResults): tokens from a parsed log line.
+      structure (pyparsing.ParseResults|dict[str, object]): tokens from
+          a parsed log line, or values of a line structure regular expression
+          match.
     """
 
   # pylint: disable=redundant-returns-doc
@@ -496,10 +622,9 @@ class EncodedTextReader(object):
       buffer_size (Optional[int]): buffer size.
     """
     super(EncodedTextReader, self).__init__()
-    self._buffer = ''
     self._buffer_size = buffer_size
-    self._current_offset = 0
     self._encoding = encoding
+    self._line_reader = None
     self.lines = ''
 
   def _ReadLine(self, file_object):
@@ -511,17 +636,17 @@ class EncodedTextReader(object):
     Returns:
       str: line read from the file-like object.
     """
-    if len(self._buffer) < self._buffer_size:
-      content = file_object.read(self._buffer_size)
-      content = content.decode(self._encoding)
-      self._buffer = ''.join([self._buffer, content])
+    if not self._line_reader:
+      self._line_reader = line_reader_file.LineReader(
+          file_object, encoding=self._encoding)
 
-    line, new_line, self._buffer = self._buffer.partition('\n')
-    if not line and not new_line:
-      line = self._buffer
-      self._buffer = ''
+    # The size of the line is bounded by the buffer size, such that data
+    # without end of line characters is not read in its entirety.
+    line = self._line_reader.readline(size=self._buffer_size)
 
-    self._current_offset += len(line)
+    new_line = line.endswith('\n')
+    if new_line:
+      line = line[:-len('\n')]
 
     # Strip carriage returns from the text.
     if line.endswith('\r'):
@@ -529,7 +654,6 @@ class EncodedTextReader(object):
 
     if new_line:
       line = ''.join([line, '\n'])
-      self._current_offset += len('\n')
 
     return line
 
@@ -557,19 +681,23 @@ class EncodedTextReader(object):
     """
     lines_size = len(self.lines)
     if lines_size < self._buffer_size:
+      lines = [self.lines]
       lines_size = self._buffer_size - lines_size
-      while lines_size > 0:
-        line = self._ReadLine(file_object)
-        if not line:
-          break
+      try:
+        while lines_size > 0:
+          line = self._ReadLine(file_object)
+          if not line:
+            break
+
+          lines.append(line)
+          lines_size -= len(line)
 
-        self.lines = ''.join([self.lines, line])
-        lines_size -= len(line)
+      finally:
+        self.lines = ''.join(lines)
 
   def Reset(self):
     """Resets the encoded text reader."""
-    self._buffer = ''
-    self._current_offset = 0
+    self._line_reader = None
     self.lines = ''
 
   def SkipAhead(self, file_object, number_of_characters):
@@ -60,6 +60,14 @@ class VsftpdLogParser(text_parser.PyparsingSingleLineTextParser):
       ('logline', _LOG_LINE),
   ]
 
+  LINE_STRUCTURE_REGULAR_EXPRESSIONS = [
+      ('logline', (
+          r'(?P<day>[A-Za-z]{3}) +(?P<month>[A-Za-z]{3}) +'
+          r'(?P<day_of_month>[0-9]{1,2}) +'
+          r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):(?P<seconds>[0-9]{2}) +'
+          r'(?P<year>[0-9]{4}) +(?P<text>[^\s][^\n]*)')),
+  ]
+
   def _GetTimeElementsTuple(self, structure):
     """Retrieves a time elements tuple from the structure.
 
@@ -81,6 +89,24 @@ class VsftpdLogParser(text_parser.PyparsingSingleLineTextParser):
     month = timelib.MONTH_DICT.get(month.lower(), 0)
     return (year, month, day_of_month, hours, minutes, seconds)
 
+  def _GetStructureFromRegularExpressionMatch(self, key, values):
+    """Retrieves a structure from the values of a regular expression match.
+
+    Args:
+      key (str): name of the line structure that the regular expression is
+          equivalent to.
+      values (dict[str, str]): values of the named groups of the regular
+          expression.
+
+    Returns:
+      dict[str, object]: structure of values.
+    """
+    date_time = (
+        values['day'], values['month'], int(values['day_of_month'], 10),
+        int(values['hours'], 10), int(values['minutes'], 10),
+        int(values['seconds'], 10), int(values['year'], 10))
+
+    return {'date_time': date_time, 'text': values['text']}
 
   def _ParseLogLine(self, parser_mediator, structure):
     """Parses a log line.
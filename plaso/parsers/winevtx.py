@@ -3,6 +3,9 @@
 
 from __future__ import unicode_literals
 
+import hashlib
+import re
+
 from collections import namedtuple
 
 import pyevtx
@@ -14,6 +17,7 @@ from dfdatetime import time_elements as dfdatetime_time_elements
 
 from plaso.containers import events
 from plaso.containers import time_events
+from plaso.containers import windows_events
 from plaso.lib import definitions
 from plaso.lib import py2to3
 from plaso.lib import specification
@@ -36,6 +40,12 @@ class WinEvtxRecordEventData(events.EventData):
     strings_parsed ([dict]): parsed information from event strings.
     user_sid (str): user security identifier (SID) stored in the event record.
     xml_string (str): XML representation of the event.
+    xml_template_identifier (str): identifier of the XML template of
+        the event, which is set instead of the XML string when the XML
+        representation is stored as XML template.
+    xml_template_values (list[int|str]): values of the replacement fields
+        of the XML template, where an integer value is the index of an event
+        string.
   """
 
   DATA_TYPE = 'windows:evtx:record'
@@ -54,6 +64,8 @@ class WinEvtxRecordEventData(events.EventData):
     self.strings_parsed = None
     self.user_sid = None
     self.xml_string = None
+    self.xml_template_identifier = None
+    self.xml_template_values = None
 
 
 class WinEvtxParser(interface.FileObjectParser):
@@ -70,6 +82,10 @@ class WinEvtxParser(interface.FileObjectParser):
 
   Rule = namedtuple('Rule', ['index', 'name'])
 
+  # Regular expression that matches the attribute values and the element text
+  # in the XML representation of an event record.
+  _XML_VALUE_RE = re.compile(r'(?<==")[^"]*(?=")|(?<=>)[^<]+(?=<)')
+
   _EVTX_FIELD_MAP = {
       4624: [
           Rule(0, 'source_user_id'),
@@ -88,6 +104,11 @@ class WinEvtxParser(interface.FileObjectParser):
       ]
   }
 
+  def __init__(self):
+    """Initializes a Windows XML EventLog (EVTX) parser."""
+    super(WinEvtxParser, self).__init__()
+    self._xml_template_identifiers = set()
+
   def _GetCreationTimeFromXMLString(
       self, parser_mediator, record_index, xml_string):
     """Retrieves the creationg time from the XML string.
@@ -126,7 +147,8 @@ class WinEvtxParser(interface.FileObjectParser):
     return time_created_xml_element.get('SystemTime')
 
   def _GetEventDataFromRecord(
-      self, parser_mediator, record_index, evtx_record, recovered=False):
+      self, parser_mediator, record_index, evtx_record, xml_string,
+      recovered=False):
     """Extract data from a Windows XML EventLog (EVTX) record.
 
     Args:
@@ -134,6 +156,7 @@ class WinEvtxParser(interface.FileObjectParser):
           and other components, such as storage and dfvfs.
       record_index (int): event record index.
       evtx_record (pyevtx.record): event record.
+      xml_string (str): XML representation of the event record.
       recovered (Optional[bool]): True if the record was recovered.
 
     Return:
@@ -184,24 +207,109 @@ class WinEvtxParser(interface.FileObjectParser):
     event_data.computer_name = evtx_record.computer_name
     event_data.user_sid = evtx_record.user_security_identifier
 
-    event_data.strings = list(evtx_record.strings)
+    # Every access of evtx_record.strings retrieves the strings from
+    # the event record hence they are only retrieved once.
+    strings = list(evtx_record.strings)
+    event_data.strings = strings
 
     event_data.strings_parsed = {}
     if event_identifier in self._EVTX_FIELD_MAP.keys():
       rules = self._EVTX_FIELD_MAP.get(event_identifier, [])
       for rule in rules:
-        if len(evtx_record.strings) <= rule.index:
+        if len(strings) <= rule.index:
           parser_mediator.ProduceExtractionWarning((
               'evtx_record.strings has unexpected length of {0:d} '
-              '(expected at least {1:d})'.format(
-                  len(evtx_record.strings), rule.index)))
+              '(expected at least {1:d})'.format(len(strings), rule.index)))
+
+        event_data.strings_parsed[rule.name] = strings[rule.index]
+
+    if not parser_mediator.evtx_xml_templates:
+      event_data.xml_string = xml_string
+
+    else:
+      xml_skeleton, xml_template_values = self._GetXMLTemplateValues(
+          xml_string, strings)
 
-        event_data.strings_parsed[rule.name] = evtx_record.strings[rule.index]
+      template_identifier = self._GetXMLTemplateIdentifier(
+          event_data.source_name, event_identifier, xml_skeleton)
 
-    event_data.xml_string = evtx_record.xml_string
+      if template_identifier not in self._xml_template_identifiers:
+        xml_template = windows_events.WindowsEventLogXMLTemplate(
+            event_identifier=event_identifier,
+            identifier=template_identifier,
+            source_name=event_data.source_name, xml_skeleton=xml_skeleton)
+        parser_mediator.ProduceWindowsEventLogXMLTemplate(xml_template)
+
+        self._xml_template_identifiers.add(template_identifier)
+
+      event_data.xml_template_identifier = template_identifier
+      event_data.xml_template_values = xml_template_values
 
     return event_data
 
+  def _GetXMLTemplateIdentifier(
+      self, source_name, event_identifier, xml_skeleton):
+    """Retrieves the identifier of an XML template.
+
+    Args:
+      source_name (str): name of the event source.
+      event_identifier (int): event identifier.
+      xml_skeleton (str): XML skeleton of the XML template.
+
+    Returns:
+      str: identifier of the XML template.
+    """
+    template_string = '{0!s}\x00{1!s}\x00{2:s}'.format(
+        source_name, event_identifier, xml_skeleton)
+
+    hash_context = hashlib.sha256()
+    hash_context.update(template_string.encode('utf-8'))
+    return hash_context.hexdigest()
+
+  def _GetXMLTemplateValues(self, xml_string, strings):
+    """Splits the XML representation of an event record into an XML template.
+
+    The attribute values and the element text, other than whitespace, are
+    replaced by str.format() replacement fields in the XML skeleton. Values
+    that are the same as an event string are stored as the index of the event
+    string, so that the event strings are not stored twice.
+
+    Args:
+      xml_string (str): XML representation of the event record.
+      strings (list[str]): event strings.
+
+    Returns:
+      tuple[str, list[int|str]]: XML skeleton and the values of its
+          replacement fields.
+    """
+    string_indexes = {}
+    for string_index, string in reversed(list(enumerate(strings))):
+      if string:
+        string_indexes[string] = string_index
+
+    xml_skeleton_segments = []
+    xml_template_values = []
+    segment_start = 0
+    for match in self._XML_VALUE_RE.finditer(xml_string):
+      value = match.group(0)
+      if not value.strip():
+        continue
+
+      segment = xml_string[segment_start:match.start()]
+      xml_skeleton_segments.append(
+          segment.replace('{', '{{').replace('}', '}}'))
+      xml_skeleton_segments.append(
+          '{{{0:d}}}'.format(len(xml_template_values)))
+
+      xml_template_values.append(string_indexes.get(value, value))
+
+      segment_start = match.end()
+
+    segment = xml_string[segment_start:]
+    xml_skeleton_segments.append(segment.replace('{', '{{').replace('}', '}}'))
+
+    return ''.join(xml_skeleton_segments), xml_template_values
+
   def _ParseRecord(
       self, parser_mediator, record_index, evtx_record, recovered=False):
     """Extract data from a Windows XML EventLog (EVTX) record.
@@ -213,8 +321,13 @@ class WinEvtxParser(interface.FileObjectParser):
       evtx_record (pyevtx.record): event record.
       recovered (Optional[bool]): True if the record was recovered.
     """
+    # Every access of evtx_record.xml_string renders the XML representation
+    # of the event record hence it is only retrieved once.
+    xml_string = evtx_record.xml_string
+
     event_data = self._GetEventDataFromRecord(
-        parser_mediator, record_index, evtx_record, recovered=recovered)
+        parser_mediator, record_index, evtx_record, xml_string,
+        recovered=recovered)
 
     try:
       written_time = evtx_record.get_written_time_as_integer()
@@ -235,7 +348,7 @@ class WinEvtxParser(interface.FileObjectParser):
     parser_mediator.ProduceEventWithEventData(event, event_data)
 
     creation_time_string = self._GetCreationTimeFromXMLString(
-        parser_mediator, record_index, event_data.xml_string)
+        parser_mediator, record_index, xml_string)
     if creation_time_string:
       date_time = dfdatetime_time_elements.TimeElementsInMicroseconds()
 
@@ -311,6 +424,10 @@ class WinEvtxParser(interface.FileObjectParser):
           and other components, such as storage and dfvfs.
       file_object (dfvfs.FileIO): a file-like object.
     """
+    # XML templates are produced once per file, since the events of a file
+    # are stored in the same task storage.
+    self._xml_template_identifiers = set()
+
     evtx_file = pyevtx.file()
     evtx_file.set_ascii_codepage(parser_mediator.codepage)
 
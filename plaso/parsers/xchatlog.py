@@ -145,6 +145,19 @@ class XChatLogParser(text_parser.PyparsingSingleLineTextParser):
       ('header_signature', _HEADER_SIGNATURE),
   ]
 
+  LINE_STRUCTURE_REGULAR_EXPRESSIONS = [
+      ('logline', (
+          r'[ \t]*(?P<month>[A-Za-z]{3}) +(?P<day>[0-9]{1,2}) +'
+          r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):'
+          r'(?P<seconds>[0-9]{2})(?![0-9])'
+          r'(?:[ \t\r\n]*<(?P<nickname>[^>\r\n]*)>)?(?P<text>[^\n]*)')),
+      ('header', (
+          r'\*\*\*\* +(?P<log_action>[!-~]+ +[!-~]+ +[!-~]+) +'
+          r'(?P<weekday>Sun|Mon|Tue|Wed|Thu|Fri|Sat) +'
+          r'(?P<month>[A-Za-z]{3}) +(?P<day>[0-9]{1,2}) +'
+          r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):(?P<seconds>[0-9]{2}) +'
+          r'(?P<year>[0-9]{4})(?![0-9])'))]
+
   def __init__(self):
     """Initializes a parser object."""
     super(XChatLogParser, self).__init__()
@@ -180,6 +193,35 @@ class XChatLogParser(text_parser.PyparsingSingleLineTextParser):
 
     return (self._xchat_year, month, day, hours, minutes, seconds)
 
+  def _GetStructureFromRegularExpressionMatch(self, key, values):
+    """Retrieves a structure from the values of a regular expression match.
+
+    Args:
+      key (str): name of the line structure that the regular expression is
+          equivalent to.
+      values (dict[str, str]): values of the named groups of the regular
+          expression.
+
+    Returns:
+      dict[str, object]: structure of values.
+    """
+    date_time = [
+        values['month'], int(values['day'], 10), int(values['hours'], 10),
+        int(values['minutes'], 10), int(values['seconds'], 10)]
+
+    if key == 'header':
+      date_time.insert(0, values['weekday'])
+      date_time.append(int(values['year'], 10))
+
+      return {
+          'date_time': tuple(date_time),
+          'log_action': values['log_action'].split()}
+
+    return {
+        'date_time': tuple(date_time),
+        'nickname': values.get('nickname', None),
+        'text': values['text']}
+
   def _ParseHeader(self, parser_mediator, structure):
     """Parses a log header.
 
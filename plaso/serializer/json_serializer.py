@@ -220,26 +220,38 @@ class JSONAttributeContainerSerializer(interface.AttributeContainerSerializer):
 
     container_object = container_class()
     supported_attribute_names = container_object.GetAttributeNames()
+
+    # Event data attribute values that require conversion, such as path
+    # specifications, are deserialized on first access.
+    deserialize_lazily = container_type == 'event_data'
+    serialized_attributes = {}
+
     for attribute_name, attribute_value in iter(json_dict.items()):
+      # The class and container type are not stored as attributes.
+      if attribute_name in ('__container_type__', '__type__'):
+        continue
+
       # Be strict about which attributes to set in non event values.
       if (container_type not in ('event', 'event_data') and
           attribute_name not in supported_attribute_names):
-
-        if attribute_name not in ('__container_type__', '__type__'):
-          logger.debug((
-              '[ConvertDictToObject] unsupported attribute name: '
-              '{0:s}.{1:s}').format(container_type, attribute_name))
-
+        logger.debug((
+            '[ConvertDictToObject] unsupported attribute name: '
+            '{0:s}.{1:s}').format(container_type, attribute_name))
         continue
 
-      if isinstance(attribute_value, dict):
-        attribute_value = cls._ConvertDictToObject(attribute_value)
+      if isinstance(attribute_value, (dict, list)):
+        if deserialize_lazily:
+          serialized_attributes[attribute_name] = attribute_value
+          continue
 
-      elif isinstance(attribute_value, list):
-        attribute_value = cls._ConvertListToObject(attribute_value)
+        attribute_value = cls._ConvertJSONValueToObject(attribute_value)
 
       setattr(container_object, attribute_name, attribute_value)
 
+    if serialized_attributes:
+      container_object.SetSerializedAttributes(
+          serialized_attributes, cls._ConvertJSONValueToObject)
+
     return container_object
 
   @classmethod
@@ -271,6 +283,26 @@ class JSONAttributeContainerSerializer(interface.AttributeContainerSerializer):
 
     return collections_counter
 
+  # Pylint is confused by the formatting of the return type.
+  # pylint: disable=missing-return-type-doc
+  @classmethod
+  def _ConvertJSONValueToObject(cls, json_value):
+    """Converts a JSON value into an object.
+
+    Args:
+      json_value (dict|list|object): JSON serialized value.
+
+    Returns:
+      object: deserialized value.
+    """
+    if isinstance(json_value, dict):
+      return cls._ConvertDictToObject(json_value)
+
+    if isinstance(json_value, list):
+      return cls._ConvertListToObject(json_value)
+
+    return json_value
+
   @classmethod
   def _ConvertListToObject(cls, json_list):
     """Converts a JSON list into an object.
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""External memory sorter of events in chronological order."""
+
+from __future__ import unicode_literals
+
+import array
+import heapq
+import os
+import shutil
+import tempfile
+
+from plaso.storage import logger
+
+
+class ExternalEventSorter(object):
+  """External memory sorter of events in chronological order.
+
+  The sorter operates on (timestamp, row identifier) pairs instead of events,
+  which allows a storage file to retrieve the sorted events by row identifier
+  without having to rely on the database engine for sorting.
+
+  Pairs are read in chunks that fit the memory budget. Every chunk is sorted
+  in memory and, if the pairs do not fit in a single chunk, written as a run
+  to the scratch directory. The runs are subsequently merged with a k-way
+  merge.
+
+  Attributes:
+    number_of_runs (int): number of runs written to the scratch directory.
+    number_of_sorted_entries (int): number of entries sorted into a run
+        or chunk.
+  """
+
+  # Default memory budget of 256 MiB.
+  _DEFAULT_MAXIMUM_MEMORY = 256 * 1024 * 1024
+
+  # Estimated memory used per entry while sorting a chunk in memory, which
+  # consists of a tuple with 2 integers and a list item.
+  _ESTIMATED_ENTRY_SIZE = 136
+
+  # Minimum number of entries per chunk.
+  _MINIMUM_CHUNK_SIZE = 1024
+
+  # Number of entries read at once from a run file.
+  _RUN_READ_SIZE = 4096
+
+  def __init__(self, maximum_memory=None, temporary_directory=None):
+    """Initializes an external memory event sorter.
+
+    Args:
+      maximum_memory (Optional[int]): maximum amount of memory in bytes used
+          for sorting, where None represents the default of 256 MiB.
+      temporary_directory (Optional[str]): path of the scratch directory to
+          store runs, where None represents the default temporary directory.
+
+    Raises:
+      ValueError: if the maximum amount of memory is out of bounds.
+    """
+    if maximum_memory is not None and maximum_memory <= 0:
+      raise ValueError('Maximum memory value out of bounds.')
+
+    super(ExternalEventSorter, self).__init__()
+    self._chunk_size = max(
+        self._MINIMUM_CHUNK_SIZE,
+        (maximum_memory or self._DEFAULT_MAXIMUM_MEMORY) //
+        self._ESTIMATED_ENTRY_SIZE)
+    self._temporary_directory = temporary_directory
+
+    self.number_of_runs = 0
+    self.number_of_sorted_entries = 0
+
+  def _ReadRun(self, path):
+    """Reads a run file.
+
+    Args:
+      path (str): path of the run file.
+
+    Yields:
+      tuple[int, int]: timestamp and row identifier.
+    """
+    read_size = self._RUN_READ_SIZE * 2 * 8
+
+    with open(path, 'rb') as file_object:
+      data = file_object.read(read_size)
+      while data:
+        values = array.array('q')
+        values.frombytes(data)
+
+        for index in range(0, len(values), 2):
+          yield values[index], values[index + 1]
+
+        data = file_object.read(read_size)
+
+  def _WriteRun(self, scratch_path, entries):
+    """Writes sorted entries to a run file.
+
+    Args:
+      scratch_path (str): path of the scratch directory.
+      entries (list[tuple[int, int]]): sorted timestamp and row identifier
+          pairs.
+
+    Returns:
+      str: path of the run file.
+    """
+    path = os.path.join(
+        scratch_path, 'run{0:06d}.bin'.format(self.number_of_runs))
+
+    values = array.array('q')
+    for timestamp, row_identifier in entries:
+      values.append(timestamp)
+      values.append(row_identifier)
+
+    with open(path, 'wb') as file_object:
+      values.tofile(file_object)
+
+    self.number_of_runs += 1
+
+    logger.debug('Wrote sort run: {0:s} with {1:d} entries.'.format(
+        path, len(entries)))
+
+    return path
+
+  def SortEntries(self, entries):
+    """Sorts entries in increasing chronological order.
+
+    Args:
+      entries (iterable[tuple[int, int]]): timestamp and row identifier pairs.
+
+    Yields:
+      tuple[int, int]: timestamp and row identifier in increasing order of
+          timestamp and row identifier.
+    """
+    self.number_of_runs = 0
+    self.number_of_sorted_entries = 0
+
+    scratch_path = None
+    run_paths = []
+
+    try:
+      chunk = []
+      for entry in entries:
+        chunk.append(entry)
+        if len(chunk) < self._chunk_size:
+          continue
+
+        chunk.sort()
+        self.number_of_sorted_entries += len(chunk)
+
+        if not scratch_path:
+          scratch_path = tempfile.mkdtemp(
+              prefix='plaso-sort-', dir=self._temporary_directory)
+
+        run_paths.append(self._WriteRun(scratch_path, chunk))
+        chunk = []
+
+      chunk.sort()
+      self.number_of_sorted_entries += len(chunk)
+
+      if not run_paths:
+        for entry in chunk:
+          yield entry
+
+      else:
+        runs = [self._ReadRun(path) for path in run_paths]
+        runs.append(iter(chunk))
+
+        for entry in heapq.merge(*runs):
+          yield entry
+
+    finally:
+      if scratch_path:
+        shutil.rmtree(scratch_path, True)
@@ -3,6 +3,10 @@
 
 from __future__ import unicode_literals
 
+import bisect
+
+from plaso.containers import events
+
 
 class EventTagIndex(object):
   """Event tag index.
@@ -11,12 +15,20 @@ class EventTagIndex(object):
 
   It is necessary for the ZIP storage files since previously
   stored event tags cannot be altered.
+
+  The event tag index also maps event tag intervals, which apply labels to
+  all events within a time range, to events by their timestamp.
   """
 
   def __init__(self):
     """Initializes an event tag index."""
     super(EventTagIndex, self).__init__()
     self._index = None
+    self._interval_end_timestamps = []
+    self._interval_start_timestamps = []
+    self._intervals = []
+    self._intervals_sorted = True
+    self._last_interval_lookup = (None, [])
 
   def _Build(self, storage_file):
     """Builds the event tag index.
@@ -28,6 +40,75 @@ class EventTagIndex(object):
     for event_tag in storage_file.GetEventTags():
       self.SetEventTag(event_tag)
 
+    self._intervals = []
+    for event_tag_interval in storage_file.GetEventTagIntervals():
+      self.SetEventTagInterval(event_tag_interval)
+
+  def _GetEventTagIntervals(self, timestamp):
+    """Retrieves the event tag intervals that contain a specific timestamp.
+
+    Args:
+      timestamp (int): timestamp, which contains the number of micro seconds
+          since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      list[EventTagInterval]: event tag intervals that contain the timestamp,
+          in order of start timestamp.
+    """
+    if not self._intervals:
+      return []
+
+    if not self._intervals_sorted:
+      self._SortEventTagIntervals()
+
+    # Events are mostly looked up in chronological order, hence consecutive
+    # events often have the same timestamp.
+    last_timestamp, last_intervals = self._last_interval_lookup
+    if timestamp == last_timestamp:
+      return last_intervals
+
+    intervals = []
+
+    # The end timestamps are the maximum end timestamp of all preceding
+    # intervals, which allows to stop scanning once no preceding interval
+    # can contain the timestamp.
+    interval_index = bisect.bisect_right(
+        self._interval_start_timestamps, timestamp) - 1
+    while (interval_index >= 0 and
+           self._interval_end_timestamps[interval_index] >= timestamp):
+      event_tag_interval = self._intervals[interval_index]
+      if event_tag_interval.end_timestamp >= timestamp:
+        intervals.append(event_tag_interval)
+
+      interval_index -= 1
+
+    # The intervals were scanned backwards and are reversed once, instead of
+    # inserting every interval at the front of the list.
+    intervals.reverse()
+
+    self._last_interval_lookup = (timestamp, intervals)
+
+    return intervals
+
+  def _SortEventTagIntervals(self):
+    """Sorts the event tag intervals by start timestamp."""
+    self._intervals.sort(key=lambda interval: interval.start_timestamp)
+
+    self._interval_start_timestamps = []
+    self._interval_end_timestamps = []
+
+    maximum_end_timestamp = None
+    for event_tag_interval in self._intervals:
+      if (maximum_end_timestamp is None or
+          event_tag_interval.end_timestamp > maximum_end_timestamp):
+        maximum_end_timestamp = event_tag_interval.end_timestamp
+
+      self._interval_start_timestamps.append(
+          event_tag_interval.start_timestamp)
+      self._interval_end_timestamps.append(maximum_end_timestamp)
+
+    self._intervals_sorted = True
+
   def GetEventTagByIdentifier(self, storage_file, event_identifier):
     """Retrieves the most recently updated event tag for an event.
 
@@ -39,7 +120,7 @@ class EventTagIndex(object):
     Returns:
       EventTag: event tag or None if the event has no event tag.
     """
-    if not self._index:
+    if self._index is None:
       self._Build(storage_file)
 
     lookup_key = event_identifier.CopyToString()
@@ -49,6 +130,40 @@ class EventTagIndex(object):
 
     return storage_file.GetEventTagByIdentifier(event_tag_identifier)
 
+  def GetEventTagForEvent(self, storage_file, event):
+    """Retrieves the event tag for an event.
+
+    The event tag combines the most recently updated event tag of the event
+    with the event tag intervals that contain the timestamp of the event.
+
+    Args:
+      storage_file (BaseStorageFile): storage file.
+      event (EventObject): event.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag and is not
+          contained in an event tag interval.
+    """
+    event_identifier = event.GetIdentifier()
+    event_tag = self.GetEventTagByIdentifier(storage_file, event_identifier)
+
+    intervals = self._GetEventTagIntervals(event.timestamp)
+    if not intervals:
+      return event_tag
+
+    combined_event_tag = events.EventTag()
+    combined_event_tag.SetEventIdentifier(event_identifier)
+
+    if event_tag:
+      combined_event_tag.AddComment(event_tag.comment)
+      combined_event_tag.AddLabels(event_tag.labels)
+
+    for event_tag_interval in intervals:
+      combined_event_tag.AddComment(event_tag_interval.comment)
+      combined_event_tag.AddLabels(event_tag_interval.labels)
+
+    return combined_event_tag
+
   def SetEventTag(self, event_tag):
     """Sets an event tag in the index.
 
@@ -59,3 +174,13 @@ class EventTagIndex(object):
 
     lookup_key = event_identifier.CopyToString()
     self._index[lookup_key] = event_tag.GetIdentifier()
+
+  def SetEventTagInterval(self, event_tag_interval):
+    """Sets an event tag interval in the index.
+
+    Args:
+      event_tag_interval (EventTagInterval): event tag interval.
+    """
+    self._intervals.append(event_tag_interval)
+    self._intervals_sorted = False
+    self._last_interval_lookup = (None, [])
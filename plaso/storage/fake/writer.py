@@ -16,6 +16,8 @@ class FakeStorageWriter(interface.StorageWriter):
 
   Attributes:
     analysis_reports (list[AnalysisReport]): analysis reports.
+    export_watermark (int): event watermark of the last incremental export
+        or None if not set.
     session_completion (SessionCompletion): session completion attribute
         container.
     session_start (SessionStart): session start attribute container.
@@ -36,12 +38,15 @@ class FakeStorageWriter(interface.StorageWriter):
         session, storage_type=storage_type, task=task)
     self._event_data = {}
     self._event_sources = []
+    self._event_tag_intervals = []
     self._event_tags = []
     self._events = []
     self._warnings = []
     self._is_open = False
     self._task_storage_writers = {}
+    self._windows_eventlog_xml_templates = {}
     self.analysis_reports = []
+    self.export_watermark = None
     self.session_completion = None
     self.session_start = None
     self.task_completion = None
@@ -174,6 +179,22 @@ class FakeStorageWriter(interface.StorageWriter):
     self._event_tags.append(event_tag)
     self.number_of_event_tags += 1
 
+  def AddEventTagInterval(self, event_tag_interval):
+    """Adds an event tag interval.
+
+    Args:
+      event_tag_interval (EventTagInterval): event tag interval.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    event_tag_interval = self._PrepareAttributeContainer(event_tag_interval)
+
+    self._event_tag_intervals.append(event_tag_interval)
+
   def AddWarning(self, warning):
     """Adds a warnings.
 
@@ -191,6 +212,23 @@ class FakeStorageWriter(interface.StorageWriter):
     self._warnings.append(warning)
     self.number_of_warnings += 1
 
+  def AddWindowsEventLogXMLTemplate(self, xml_template):
+    """Adds a Windows XML EventLog (EVTX) XML template.
+
+    Args:
+      xml_template (WindowsEventLogXMLTemplate): XML template.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    xml_template = self._PrepareAttributeContainer(xml_template)
+
+    self._windows_eventlog_xml_templates[xml_template.identifier] = (
+        xml_template)
+
   def CheckTaskReadyForMerge(self, task):
     """Checks if a task is ready for merging into the session store.
 
@@ -284,7 +322,22 @@ class FakeStorageWriter(interface.StorageWriter):
       EventData: event data or None if not available.
     """
     lookup_key = identifier.CopyToString()
-    return self._event_data.get(lookup_key, None)
+    event_data = self._event_data.get(lookup_key, None)
+
+    template_identifier = getattr(
+        event_data, 'xml_template_identifier', None)
+    xml_template = self._windows_eventlog_xml_templates.get(
+        template_identifier, None)
+    if xml_template:
+      # Make sure the fake storage preserves the state of the event data.
+      event_data = copy.deepcopy(event_data)
+      event_data.xml_string = xml_template.FormatXMLString(
+          event_data.xml_template_values, strings=event_data.strings)
+
+      del event_data.xml_template_identifier
+      del event_data.xml_template_values
+
+    return event_data
 
   def GetEventSources(self):
     """Retrieves the event sources.
@@ -302,6 +355,14 @@ class FakeStorageWriter(interface.StorageWriter):
     """
     return iter(self._event_tags)
 
+  def GetEventTagIntervals(self):
+    """Retrieves the event tag intervals.
+
+    Returns:
+      generator(EventTagInterval): event tag interval generator.
+    """
+    return iter(self._event_tag_intervals)
+
   def GetFirstWrittenEventSource(self):
     """Retrieves the first event source that was written after open.
 
@@ -377,6 +438,14 @@ class FakeStorageWriter(interface.StorageWriter):
 
     return iter(event_heap.PopEvents())
 
+  def GetWindowsEventLogXMLTemplates(self):
+    """Retrieves the Windows XML EventLog (EVTX) XML templates.
+
+    Returns:
+      generator(WindowsEventLogXMLTemplate): XML template generator.
+    """
+    return iter(self._windows_eventlog_xml_templates.values())
+
   def FinalizeTaskStorage(self, task):
     """Finalizes a processed task storage.
 
@@ -477,6 +546,20 @@ class FakeStorageWriter(interface.StorageWriter):
     """
     return
 
+  def WriteExportWatermark(self, watermark):
+    """Writes the export watermark.
+
+    Args:
+      watermark (int): event watermark of the last incremental export.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    self.export_watermark = watermark
+
   # pylint: disable=unused-argument
   def WritePreprocessingInformation(self, knowledge_base):
     """Writes preprocessing information.
@@ -342,6 +342,30 @@ class StorageFileReader(interface.StorageReader):
     """
     return self._storage_file.GetEventTags()
 
+  def GetEventTagIntervals(self):
+    """Retrieves the event tag intervals.
+
+    Returns:
+      generator(EventTagInterval): event tag interval generator.
+    """
+    return self._storage_file.GetEventTagIntervals()
+
+  def GetEventWatermark(self):
+    """Retrieves the event watermark.
+
+    Returns:
+      int: event watermark or 0 if the store contains no events.
+    """
+    return self._storage_file.GetEventWatermark()
+
+  def GetExportWatermark(self):
+    """Retrieves the export watermark.
+
+    Returns:
+      int: export watermark or 0 if no incremental export was recorded.
+    """
+    return self._storage_file.GetExportWatermark()
+
   def GetNumberOfAnalysisReports(self):
     """Retrieves the number analysis reports.
 
@@ -366,7 +390,7 @@ class StorageFileReader(interface.StorageReader):
     """
     return self._storage_file.GetSessions()
 
-  def GetSortedEvents(self, time_range=None):
+  def GetSortedEvents(self, time_range=None, watermark=None):
     """Retrieves the events in increasing chronological order.
 
     This includes all events written to the storage including those pending
@@ -375,11 +399,14 @@ class StorageFileReader(interface.StorageReader):
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      watermark (Optional[int]): event watermark, where only events that were
+          added to the store after the watermark are retrieved.
 
     Returns:
       generator(EventObject): event generator.
     """
-    return self._storage_file.GetSortedEvents(time_range=time_range)
+    return self._storage_file.GetSortedEvents(
+        time_range=time_range, watermark=watermark)
 
   def HasAnalysisReports(self):
     """Determines if a store contains analysis reports.
@@ -418,6 +445,16 @@ class StorageFileReader(interface.StorageReader):
     """
     self._storage_file.ReadPreprocessingInformation(knowledge_base)
 
+  def SetEventSorter(self, event_sorter):
+    """Sets the event sorter.
+
+    Args:
+      event_sorter (ExternalEventSorter): external memory event sorter used
+          to sort events, where None represents the default sorting of
+          the storage file.
+    """
+    self._storage_file.SetEventSorter(event_sorter)
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
@@ -456,6 +493,7 @@ class StorageFileWriter(interface.StorageWriter):
     self._processed_task_storage_path = ''
     self._storage_file = None
     self._task_storage_path = None
+    self._windows_eventlog_xml_template_identifiers = set()
 
   @abc.abstractmethod
   def _CreateStorageFile(self):
@@ -647,6 +685,43 @@ class StorageFileWriter(interface.StorageWriter):
       self._session.event_labels_counter[label] += 1
     self.number_of_event_tags += 1
 
+  def AddEventTagInterval(self, event_tag_interval):
+    """Adds an event tag interval.
+
+    Args:
+      event_tag_interval (EventTagInterval): event tag interval.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    self._storage_file.AddEventTagInterval(event_tag_interval)
+
+  def AddWindowsEventLogXMLTemplate(self, xml_template):
+    """Adds a Windows XML EventLog (EVTX) XML template.
+
+    XML templates that were already added by the storage writer, for example
+    by another task, are not added again.
+
+    Args:
+      xml_template (WindowsEventLogXMLTemplate): XML template.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    if (xml_template.identifier in
+        self._windows_eventlog_xml_template_identifiers):
+      return
+
+    self._storage_file.AddWindowsEventLogXMLTemplate(xml_template)
+    self._windows_eventlog_xml_template_identifiers.add(
+        xml_template.identifier)
+
   def Close(self):
     """Closes the storage writer.
 
@@ -701,6 +776,14 @@ class StorageFileWriter(interface.StorageWriter):
     """
     return self._storage_file.GetEventTags()
 
+  def GetEventTagIntervals(self):
+    """Retrieves the event tag intervals.
+
+    Returns:
+      generator(EventTagInterval): event tag interval generator.
+    """
+    return self._storage_file.GetEventTagIntervals()
+
   def GetFirstWrittenEventSource(self):
     """Retrieves the first event source that was written after open.
 
@@ -1037,6 +1120,20 @@ class StorageFileWriter(interface.StorageWriter):
     self._processed_task_storage_path = None
     self._task_storage_path = None
 
+  def WriteExportWatermark(self, watermark):
+    """Writes the export watermark.
+
+    Args:
+      watermark (int): event watermark of the last incremental export.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    self._storage_file.WriteExportWatermark(watermark)
+
   def WritePreprocessingInformation(self, knowledge_base):
     """Writes preprocessing information.
 
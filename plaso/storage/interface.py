@@ -12,6 +12,7 @@ from plaso.containers import reports
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.containers import warnings
+from plaso.containers import windows_events
 from plaso.lib import definitions
 from plaso.serializer import json_serializer
 
@@ -30,6 +31,7 @@ class BaseStore(object):
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_TAG_INTERVAL = events.EventTagInterval.CONTAINER_TYPE
   _CONTAINER_TYPE_EXTRACTION_ERROR = (
       warnings.ExtractionError.CONTAINER_TYPE)
   _CONTAINER_TYPE_EXTRACTION_WARNING = warnings.ExtractionWarning.CONTAINER_TYPE
@@ -39,6 +41,8 @@ class BaseStore(object):
       artifacts.SystemConfigurationArtifact.CONTAINER_TYPE)
   _CONTAINER_TYPE_TASK_COMPLETION = tasks.TaskCompletion.CONTAINER_TYPE
   _CONTAINER_TYPE_TASK_START = tasks.TaskStart.CONTAINER_TYPE
+  _CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE = (
+      windows_events.WindowsEventLogXMLTemplate.CONTAINER_TYPE)
 
   _CONTAINER_TYPES = (
       _CONTAINER_TYPE_ANALYSIS_REPORT,
@@ -48,11 +52,13 @@ class BaseStore(object):
       _CONTAINER_TYPE_EVENT_DATA,
       _CONTAINER_TYPE_EVENT_SOURCE,
       _CONTAINER_TYPE_EVENT_TAG,
+      _CONTAINER_TYPE_EVENT_TAG_INTERVAL,
       _CONTAINER_TYPE_SESSION_COMPLETION,
       _CONTAINER_TYPE_SESSION_START,
       _CONTAINER_TYPE_SYSTEM_CONFIGURATION,
       _CONTAINER_TYPE_TASK_COMPLETION,
-      _CONTAINER_TYPE_TASK_START)
+      _CONTAINER_TYPE_TASK_START,
+      _CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE)
 
   def __init__(self):
     """Initializes a store."""
@@ -63,6 +69,7 @@ class BaseStore(object):
     self._serializers_profiler = None
     self._storage_profiler = None
     self._serializer = json_serializer.JSONAttributeContainerSerializer
+    self._windows_eventlog_xml_templates = None
 
   @abc.abstractmethod
   def _AddAttributeContainer(self, container_type, container):
@@ -150,6 +157,44 @@ class BaseStore(object):
       attribute_container (AttributeContainer): attribute container.
     """
 
+  def _ResolveWindowsEventLogXMLTemplate(self, event_data):
+    """Resolves the XML string of event data stored as an XML template.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      EventData: event data.
+    """
+    if not event_data:
+      return event_data
+
+    template_identifier = getattr(event_data, 'xml_template_identifier', None)
+    if not template_identifier:
+      return event_data
+
+    if self._windows_eventlog_xml_templates is None:
+      self._windows_eventlog_xml_templates = {}
+
+      if self._HasAttributeContainers(
+          self._CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE):
+        for xml_template in self._GetAttributeContainers(
+            self._CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE):
+          self._windows_eventlog_xml_templates[xml_template.identifier] = (
+              xml_template)
+
+    xml_template = self._windows_eventlog_xml_templates.get(
+        template_identifier, None)
+    if xml_template:
+      event_data.xml_string = xml_template.FormatXMLString(
+          event_data.xml_template_values,
+          strings=getattr(event_data, 'strings', None))
+
+      del event_data.xml_template_identifier
+      del event_data.xml_template_values
+
+    return event_data
+
   def AddAnalysisReport(self, analysis_report):
     """Adds an analysis report.
 
@@ -202,6 +247,17 @@ class BaseStore(object):
 
     self._AddAttributeContainer(self._CONTAINER_TYPE_EVENT_TAG, event_tag)
 
+  def AddEventTagInterval(self, event_tag_interval):
+    """Adds an event tag interval.
+
+    Args:
+      event_tag_interval (EventTagInterval): event tag interval.
+    """
+    self._RaiseIfNotWritable()
+
+    self._AddAttributeContainer(
+        self._CONTAINER_TYPE_EVENT_TAG_INTERVAL, event_tag_interval)
+
   def AddWarning(self, warning):
     """Adds a warning.
 
@@ -213,6 +269,21 @@ class BaseStore(object):
     self._AddAttributeContainer(
         self._CONTAINER_TYPE_EXTRACTION_WARNING, warning)
 
+  def AddWindowsEventLogXMLTemplate(self, xml_template):
+    """Adds a Windows XML EventLog (EVTX) XML template.
+
+    Args:
+      xml_template (WindowsEventLogXMLTemplate): XML template.
+    """
+    self._RaiseIfNotWritable()
+
+    self._AddAttributeContainer(
+        self._CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE, xml_template)
+
+    if self._windows_eventlog_xml_templates is not None:
+      self._windows_eventlog_xml_templates[xml_template.identifier] = (
+          xml_template)
+
   @abc.abstractmethod
   def Close(self):
     """Closes the store."""
@@ -228,22 +299,28 @@ class BaseStore(object):
   def GetEventData(self):
     """Retrieves the event data.
 
-    Returns:
-      generator(EventData): event data generator.
+    Yields:
+      EventData: event data.
     """
-    return self._GetAttributeContainers(self._CONTAINER_TYPE_EVENT_DATA)
+    for event_data in self._GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_DATA):
+      yield self._ResolveWindowsEventLogXMLTemplate(event_data)
 
   def GetEventDataByIdentifier(self, identifier):
     """Retrieves specific event data.
 
+    The XML string of event data that was stored as an XML template is
+    rebuilt from the XML template.
+
     Args:
       identifier (AttributeContainerIdentifier): event data identifier.
 
     Returns:
       EventData: event data or None if not available.
     """
-    return self._GetAttributeContainerByIdentifier(
+    event_data = self._GetAttributeContainerByIdentifier(
         self._CONTAINER_TYPE_EVENT_DATA, identifier)
+    return self._ResolveWindowsEventLogXMLTemplate(event_data)
 
   def GetEvents(self):
     """Retrieves the events.
@@ -285,6 +362,18 @@ class BaseStore(object):
     """
     return self._GetAttributeContainers(self._CONTAINER_TYPE_EVENT_TAG)
 
+  def GetEventTagIntervals(self):
+    """Retrieves the event tag intervals.
+
+    Yields:
+      EventTagInterval: event tag interval.
+    """
+    # Older storage files do not contain event tag intervals.
+    if self._HasAttributeContainers(self._CONTAINER_TYPE_EVENT_TAG_INTERVAL):
+      for event_tag_interval in self._GetAttributeContainers(
+          self._CONTAINER_TYPE_EVENT_TAG_INTERVAL):
+        yield event_tag_interval
+
   def GetNumberOfAnalysisReports(self):
     """Retrieves the number analysis reports.
 
@@ -312,7 +401,7 @@ class BaseStore(object):
     """
 
   @abc.abstractmethod
-  def GetSortedEvents(self, time_range=None):
+  def GetSortedEvents(self, time_range=None, watermark=None):
     """Retrieves the events in increasing chronological order.
 
     This includes all events written to the store including those pending
@@ -321,6 +410,8 @@ class BaseStore(object):
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      watermark (Optional[int]): event watermark, where only events that were
+          added to the store after the watermark are retrieved.
 
     Yields:
       EventObject: event.
@@ -691,6 +782,35 @@ class StorageReader(object):
       EventTag: event tag.
     """
 
+  @abc.abstractmethod
+  def GetEventTagIntervals(self):
+    """Retrieves the event tag intervals.
+
+    Yields:
+      EventTagInterval: event tag interval.
+    """
+
+  @abc.abstractmethod
+  def GetEventWatermark(self):
+    """Retrieves the event watermark.
+
+    The event watermark identifies the last event added to the store.
+
+    Returns:
+      int: event watermark or 0 if the store contains no events.
+    """
+
+  @abc.abstractmethod
+  def GetExportWatermark(self):
+    """Retrieves the export watermark.
+
+    The export watermark is the event watermark of the store at the time of
+    the last incremental export.
+
+    Returns:
+      int: export watermark or 0 if no incremental export was recorded.
+    """
+
   @abc.abstractmethod
   def GetNumberOfAnalysisReports(self):
     """Retrieves the number analysis reports.
@@ -716,7 +836,7 @@ class StorageReader(object):
     """
 
   @abc.abstractmethod
-  def GetSortedEvents(self, time_range=None):
+  def GetSortedEvents(self, time_range=None, watermark=None):
     """Retrieves the events in increasing chronological order.
 
     This includes all events written to the storage including those pending
@@ -725,6 +845,8 @@ class StorageReader(object):
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      watermark (Optional[int]): event watermark, where only events that were
+          added to the store after the watermark are retrieved.
 
     Yields:
       EventObject: event.
@@ -767,6 +889,16 @@ class StorageReader(object):
           information.
     """
 
+  @abc.abstractmethod
+  def SetEventSorter(self, event_sorter):
+    """Sets the event sorter.
+
+    Args:
+      event_sorter (ExternalEventSorter): external memory event sorter used
+          to sort events, where None represents the default sorting of
+          the storage.
+    """
+
   @abc.abstractmethod
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
@@ -859,6 +991,14 @@ class StorageWriter(object):
       event_tag (EventTag): an event tag.
     """
 
+  @abc.abstractmethod
+  def AddEventTagInterval(self, event_tag_interval):
+    """Adds an event tag interval.
+
+    Args:
+      event_tag_interval (EventTagInterval): event tag interval.
+    """
+
   @abc.abstractmethod
   def AddWarning(self, warning):
     """Adds an warning.
@@ -867,6 +1007,14 @@ class StorageWriter(object):
       warning (ExtractionWarning): a warning.
     """
 
+  @abc.abstractmethod
+  def AddWindowsEventLogXMLTemplate(self, xml_template):
+    """Adds a Windows XML EventLog (EVTX) XML template.
+
+    Args:
+      xml_template (WindowsEventLogXMLTemplate): XML template.
+    """
+
   @abc.abstractmethod
   def Close(self):
     """Closes the storage writer."""
@@ -1020,6 +1168,14 @@ class StorageWriter(object):
       storage_profiler (StorageProfiler): storage profiler.
     """
 
+  @abc.abstractmethod
+  def WriteExportWatermark(self, watermark):
+    """Writes the export watermark.
+
+    Args:
+      watermark (int): event watermark of the last incremental export.
+    """
+
   @abc.abstractmethod
   def WritePreprocessingInformation(self, knowledge_base):
     """Writes preprocessing information.
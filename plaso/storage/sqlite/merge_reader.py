@@ -12,6 +12,7 @@ from plaso.containers import events
 from plaso.containers import reports
 from plaso.containers import tasks
 from plaso.containers import warnings
+from plaso.containers import windows_events
 from plaso.lib import definitions
 from plaso.storage import interface
 from plaso.storage import identifiers
@@ -25,18 +26,23 @@ class SQLiteStorageMergeReader(interface.StorageMergeReader):
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_TAG_INTERVAL = events.EventTagInterval.CONTAINER_TYPE
   _CONTAINER_TYPE_EXTRACTION_WARNING = warnings.ExtractionWarning.CONTAINER_TYPE
   _CONTAINER_TYPE_TASK_COMPLETION = tasks.TaskCompletion.CONTAINER_TYPE
   _CONTAINER_TYPE_TASK_START = tasks.TaskStart.CONTAINER_TYPE
+  _CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE = (
+      windows_events.WindowsEventLogXMLTemplate.CONTAINER_TYPE)
 
   # Some container types reference other container types, such as event
   # referencing event_data. Container types in this tuple must be ordered after
   # all the container types they reference.
   _CONTAINER_TYPES = (
       _CONTAINER_TYPE_EVENT_SOURCE,
+      _CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE,
       _CONTAINER_TYPE_EVENT_DATA,
       _CONTAINER_TYPE_EVENT,
       _CONTAINER_TYPE_EVENT_TAG,
+      _CONTAINER_TYPE_EVENT_TAG_INTERVAL,
       _CONTAINER_TYPE_EXTRACTION_WARNING,
       _CONTAINER_TYPE_ANALYSIS_REPORT)
 
@@ -46,7 +52,10 @@ class SQLiteStorageMergeReader(interface.StorageMergeReader):
       _CONTAINER_TYPE_EVENT_DATA: '_AddEventData',
       _CONTAINER_TYPE_EVENT_SOURCE: '_AddEventSource',
       _CONTAINER_TYPE_EVENT_TAG: '_AddEventTag',
+      _CONTAINER_TYPE_EVENT_TAG_INTERVAL: '_AddEventTagInterval',
       _CONTAINER_TYPE_EXTRACTION_WARNING: '_AddWarning',
+      _CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE: (
+          '_AddWindowsEventLogXMLTemplate'),
   }
 
   _TABLE_NAMES_QUERY = (
@@ -145,6 +154,14 @@ class SQLiteStorageMergeReader(interface.StorageMergeReader):
     """
     self._storage_writer.AddEventTag(event_tag)
 
+  def _AddEventTagInterval(self, event_tag_interval):
+    """Adds an event tag interval.
+
+    Args:
+      event_tag_interval (EventTagInterval): event tag interval.
+    """
+    self._storage_writer.AddEventTagInterval(event_tag_interval)
+
   def _AddWarning(self, warning):
     """Adds a warning.
 
@@ -153,6 +170,14 @@ class SQLiteStorageMergeReader(interface.StorageMergeReader):
     """
     self._storage_writer.AddWarning(warning)
 
+  def _AddWindowsEventLogXMLTemplate(self, xml_template):
+    """Adds a Windows XML EventLog (EVTX) XML template.
+
+    Args:
+      xml_template (WindowsEventLogXMLTemplate): XML template.
+    """
+    self._storage_writer.AddWindowsEventLogXMLTemplate(xml_template)
+
   def _Close(self):
     """Closes the task storage after reading."""
     self._connection.close()
@@ -51,6 +51,8 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
       '_timestamp BIGINT,'
       '_data {1:s});')
 
+  _EXPORT_WATERMARK_METADATA_KEY = 'export_watermark'
+
   _HAS_TABLE_QUERY = (
       'SELECT name FROM sqlite_master '
       'WHERE type = "table" AND name = "{0:s}"')
@@ -83,6 +85,7 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
     super(SQLiteStorageFile, self).__init__()
     self._connection = None
     self._cursor = None
+    self._event_sorter = None
     self._last_session = 0
     self._maximum_buffer_size = maximum_buffer_size
     self._serialized_event_heap = event_heaps.SerializedEventHeap()
@@ -197,6 +200,37 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
       raise IOError('Unsupported storage type: {0:s}'.format(
           storage_type))
 
+  def _GetExternallySortedEvents(self, filter_expression=None):
+    """Retrieves the events sorted by the external memory event sorter.
+
+    Args:
+      filter_expression (Optional[str]): expression to filter results by.
+
+    Yields:
+      EventObject: event.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    query = 'SELECT _timestamp, _identifier FROM {0:s}'.format(
+        self._CONTAINER_TYPE_EVENT)
+    if filter_expression:
+      query = '{0:s} WHERE {1:s}'.format(query, filter_expression)
+
+    # Use a local cursor to prevent another query interrupting the generator.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query)
+    except sqlite3.OperationalError as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    for _, row_identifier in self._event_sorter.SortEntries(cursor):
+      yield self._GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_EVENT, row_identifier - 1)
+
   def _GetNumberOfAttributeContainers(self, container_type):
     """Counts the number of attribute containers of the given type.
 
@@ -636,8 +670,12 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
       self._WriteSerializedAttributeContainerList(self._CONTAINER_TYPE_EVENT)
       self._WriteSerializedAttributeContainerList(
           self._CONTAINER_TYPE_EVENT_TAG)
+      self._WriteSerializedAttributeContainerList(
+          self._CONTAINER_TYPE_EVENT_TAG_INTERVAL)
       self._WriteSerializedAttributeContainerList(
           self._CONTAINER_TYPE_EXTRACTION_WARNING)
+      self._WriteSerializedAttributeContainerList(
+          self._CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE)
 
     if self._connection:
       # We need to run commit or not all data is stored in the database.
@@ -751,6 +789,41 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
 
       yield event_tag
 
+  def GetEventWatermark(self):
+    """Retrieves the event watermark.
+
+    The event watermark identifies the last event added to the store and
+    corresponds to the row identifier of the last event in the event table.
+
+    Returns:
+      int: event watermark or 0 if the store contains no events.
+    """
+    return self._GetNumberOfAttributeContainers(self._CONTAINER_TYPE_EVENT)
+
+  def GetExportWatermark(self):
+    """Retrieves the export watermark.
+
+    The export watermark is the event watermark of the store at the time of
+    the last incremental export.
+
+    Returns:
+      int: export watermark or 0 if no incremental export was recorded.
+
+    Raises:
+      IOError: if the export watermark stored in the metadata is invalid.
+      OSError: if the export watermark stored in the metadata is invalid.
+    """
+    query = 'SELECT value FROM metadata WHERE key = ?'
+    self._cursor.execute(query, (self._EXPORT_WATERMARK_METADATA_KEY, ))
+    row = self._cursor.fetchone()
+    if not row:
+      return 0
+
+    try:
+      return int(row[0], 10)
+    except (TypeError, ValueError):
+      raise IOError('Invalid export watermark: {0!s}.'.format(row[0]))
+
   def GetNumberOfEventSources(self):
     """Retrieves the number event sources.
 
@@ -797,20 +870,20 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
 
       yield session
 
-  def GetSortedEvents(self, time_range=None):
+  def GetSortedEvents(self, time_range=None, watermark=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      watermark (Optional[int]): event watermark, where only events that were
+          added to the store after the watermark are retrieved.
 
     Yield:
       EventObject: event.
     """
-    filter_expression = None
+    filter_expression = []
     if time_range:
-      filter_expression = []
-
       if time_range.start_timestamp:
         filter_expression.append(
             '_timestamp >= {0:d}'.format(time_range.start_timestamp))
@@ -819,11 +892,18 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
         filter_expression.append(
             '_timestamp <= {0:d}'.format(time_range.end_timestamp))
 
-      filter_expression = ' AND '.join(filter_expression)
+    if watermark:
+      filter_expression.append('_identifier > {0:d}'.format(watermark))
 
-    event_generator = self._GetAttributeContainers(
-        self._CONTAINER_TYPE_EVENT, filter_expression=filter_expression,
-        order_by='_timestamp')
+    filter_expression = ' AND '.join(filter_expression) or None
+
+    if self._event_sorter:
+      event_generator = self._GetExternallySortedEvents(
+          filter_expression=filter_expression)
+    else:
+      event_generator = self._GetAttributeContainers(
+          self._CONTAINER_TYPE_EVENT, filter_expression=filter_expression,
+          order_by='_timestamp')
 
     for event in event_generator:
       if hasattr(event, 'event_data_row_identifier'):
@@ -919,3 +999,36 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
       logger.warning('Detected unclosed session.')
 
     self._last_session = last_session_completion
+
+  def SetEventSorter(self, event_sorter):
+    """Sets the event sorter.
+
+    Args:
+      event_sorter (ExternalEventSorter): external memory event sorter used
+          to sort events instead of the database engine, where None
+          represents sorting by the database engine.
+    """
+    self._event_sorter = event_sorter
+
+  def WriteExportWatermark(self, watermark):
+    """Writes the export watermark.
+
+    Args:
+      watermark (int): event watermark of the last incremental export.
+
+    Raises:
+      IOError: when the storage file is closed or read-only.
+      OSError: when the storage file is closed or read-only.
+    """
+    self._RaiseIfNotWritable()
+
+    value = '{0:d}'.format(watermark)
+
+    query = 'SELECT value FROM metadata WHERE key = ?'
+    self._cursor.execute(query, (self._EXPORT_WATERMARK_METADATA_KEY, ))
+    if self._cursor.fetchone():
+      query = 'UPDATE metadata SET value = ? WHERE key = ?'
+    else:
+      query = 'INSERT INTO metadata (value, key) VALUES (?, ?)'
+
+    self._cursor.execute(query, (value, self._EXPORT_WATERMARK_METADATA_KEY))
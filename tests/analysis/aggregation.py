@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the aggregation of analysis results."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from plaso.analysis import aggregation
+
+from tests import test_lib as shared_test_lib
+
+
+class DiskBackedCounterTest(shared_test_lib.BaseTestCase):
+  """Tests for the disk backed counter."""
+
+  _KEYS = [
+      'www.example.com', 'example.net', 'www.example.com', 'bär.de',
+      'example.org', 'line\nbreak', 'example.net', 'www.example.com']
+
+  _EXPECTED_ITEMS = [
+      ('bär.de', 1),
+      ('example.net', 2),
+      ('example.org', 1),
+      ('line\nbreak', 1),
+      ('www.example.com', 3)]
+
+  def testGetItems(self):
+    """Tests the GetItems function."""
+    counter = aggregation.DiskBackedCounter()
+    for key in self._KEYS:
+      counter.Increment(key)
+
+    self.assertEqual(list(counter.GetItems()), self._EXPECTED_ITEMS)
+    self.assertEqual(counter.number_of_runs, 0)
+
+    counter.Close()
+    self.assertEqual(list(counter.GetItems()), [])
+
+  def testGetItemsWithMaximumNumberOfKeysInMemory(self):
+    """Tests the GetItems function with a maximum number of keys in memory."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      counter = aggregation.DiskBackedCounter(
+          maximum_number_of_keys_in_memory=2,
+          temporary_directory=temp_directory)
+      for key in self._KEYS:
+        counter.Increment(key)
+
+      counter.Increment('example.org', count=5)
+
+      expected_items = list(self._EXPECTED_ITEMS)
+      expected_items[2] = ('example.org', 6)
+
+      self.assertEqual(list(counter.GetItems()), expected_items)
+      self.assertEqual(counter.number_of_runs, 4)
+
+      counter.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -7,8 +7,11 @@ from __future__ import unicode_literals
 import unittest
 
 from plaso.analysis import browser_search
+from plaso.lib import definitions
+from plaso.lib import timelib
 from plaso.parsers import sqlite
 
+from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
@@ -45,6 +48,69 @@ class BrowserSearchAnalysisTest(test_lib.AnalysisPluginTestCase):
     expected_keys = set(['Google Search'])
     self.assertEqual(set(analysis_report.report_dict.keys()), expected_keys)
 
+    self.assertEqual(len(analysis_report.report_array), 4)
+
+  def testExamineEventWithMultipleEngines(self):
+    """Tests the ExamineEvent function with an URL of multiple engines."""
+    plugin = browser_search.BrowserSearchPlugin()
+
+    test_events = [
+        {'data_type': 'chrome:history:page_visited',
+         'parser': 'sqlite/chrome_27_history',
+         'timestamp': timelib.Timestamp.CopyFromString('2015-01-01 01:00:00'),
+         'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN,
+         'url': 'https://www.google.com/search?q=youtube.com+cats'},
+        {'data_type': 'chrome:history:page_visited',
+         'parser': 'sqlite/chrome_27_history',
+         'timestamp': timelib.Timestamp.CopyFromString('2015-01-01 02:00:00'),
+         'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN,
+         'url': 'https://www.example.com/search?q=cats'}]
+
+    storage_writer = self._AnalyzeEvents(test_events, plugin)
+
+    analysis_report = storage_writer.analysis_reports[0]
+
+    # The URL of the first event matches both the Google Search and YouTube
+    # filters.
+    expected_report_dict = {
+        'Google Search': {'youtube.com cats': 1},
+        'Youtube': {'youtube.com cats': 1}}
+    self.assertEqual(analysis_report.report_dict, expected_report_dict)
+
+  def testExamineEventAndCompileReportWithMaximumInMemory(self):
+    """Tests the ExamineEvent and CompileReport with a maximum in memory."""
+    parser = sqlite.SQLiteParser()
+    plugin = browser_search.BrowserSearchPlugin()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      plugin.SetMaximumNumberOfSearchTermsInMemory(
+          2, temporary_directory=temp_directory)
+
+      storage_writer = self._ParseAndAnalyzeFile(['History'], parser, plugin)
+
+    self.assertEqual(len(storage_writer.analysis_reports), 1)
+
+    analysis_report = storage_writer.analysis_reports[0]
+
+    # The report only contains the most frequent search terms, up to
+    # the maximum.
+    expected_text = '\n'.join([
+        ' == ENGINE: Google Search ==',
+        '1 really really funny cats',
+        '1 java plugin',
+        '2 less frequent search terms omitted',
+        '',
+        ''])
+
+    self.assertEqual(analysis_report.text, expected_text)
+
+    expected_report_dict = {
+        'Google Search': {'java plugin': 1, 'really really funny cats': 1}}
+    self.assertEqual(analysis_report.report_dict, expected_report_dict)
+
+    # The search term timeline is not stored with a maximum in memory.
+    self.assertEqual(analysis_report.report_array, [])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the hash lookup cache."""
+
+from __future__ import unicode_literals
+
+import os
+import sqlite3
+import unittest
+
+from plaso.analysis import hash_lookup_cache
+from plaso.analysis import interface
+
+from tests import test_lib as shared_test_lib
+
+
+class HashLookupCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the hash lookup cache."""
+
+  # pylint: disable=protected-access
+
+  _MD5_HASH = 'd41d8cd98f00b204e9800998ecf8427e'
+
+  def testGetAndSetHashAnalysis(self):
+    """Tests the GetHashAnalysis and SetHashAnalysis functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      lookup_cache.Open()
+
+      hash_analysis = lookup_cache.GetHashAnalysis(
+          'nsrlsvr', 'md5', self._MD5_HASH)
+      self.assertIsNone(hash_analysis)
+
+      hash_analysis = interface.HashAnalysis(self._MD5_HASH, True)
+      lookup_cache.SetHashAnalysis('nsrlsvr', 'md5', hash_analysis)
+
+      hash_analysis = interface.HashAnalysis(
+          self._MD5_HASH, {'response_code': 1, 'positives': 0})
+      lookup_cache.SetHashAnalysis('virustotal', 'md5', hash_analysis)
+
+      # Hash information that cannot be serialized as JSON is not cached.
+      hash_analysis = interface.HashAnalysis(self._MD5_HASH, object())
+      lookup_cache.SetHashAnalysis('bogus', 'md5', hash_analysis)
+
+      lookup_cache.Close()
+
+      # Test if the hash analysis results persist.
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      lookup_cache.Open()
+
+      try:
+        hash_analysis = lookup_cache.GetHashAnalysis(
+            'nsrlsvr', 'md5', self._MD5_HASH.upper())
+        self.assertIsNotNone(hash_analysis)
+        self.assertEqual(hash_analysis.subject_hash, self._MD5_HASH.upper())
+        self.assertTrue(hash_analysis.hash_information)
+
+        hash_analysis = lookup_cache.GetHashAnalysis(
+            'virustotal', 'md5', self._MD5_HASH)
+        self.assertIsNotNone(hash_analysis)
+        self.assertEqual(
+            hash_analysis.hash_information,
+            {'response_code': 1, 'positives': 0})
+
+        hash_analysis = lookup_cache.GetHashAnalysis(
+            'nsrlsvr', 'sha1', self._MD5_HASH)
+        self.assertIsNone(hash_analysis)
+
+        hash_analysis = lookup_cache.GetHashAnalysis(
+            'bogus', 'md5', self._MD5_HASH)
+        self.assertIsNone(hash_analysis)
+
+      finally:
+        lookup_cache.Close()
+
+  def testGetAndSetHashAnalysisConcurrently(self):
+    """Tests the GetHashAnalysis and SetHashAnalysis functions concurrently."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+
+      # Caches that share the same file, such as those of the analysis
+      # processes of different hash analysis plugins.
+      first_lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      first_lookup_cache._LOCK_TIMEOUT = 1.0
+      first_lookup_cache.Open()
+
+      second_lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      second_lookup_cache._LOCK_TIMEOUT = 1.0
+      second_lookup_cache.Open()
+
+      try:
+        hash_analysis = interface.HashAnalysis(self._MD5_HASH, True)
+        first_lookup_cache.SetHashAnalysis('nsrlsvr', 'md5', hash_analysis)
+
+        hash_analysis = interface.HashAnalysis(
+            self._MD5_HASH, {'response_code': 1, 'positives': 0})
+        second_lookup_cache.SetHashAnalysis(
+            'virustotal', 'md5', hash_analysis)
+
+        hash_analysis = second_lookup_cache.GetHashAnalysis(
+            'nsrlsvr', 'md5', self._MD5_HASH)
+        self.assertIsNotNone(hash_analysis)
+
+        hash_analysis = first_lookup_cache.GetHashAnalysis(
+            'virustotal', 'md5', self._MD5_HASH)
+        self.assertIsNotNone(hash_analysis)
+
+        third_lookup_cache = hash_lookup_cache.HashLookupCache(
+            path, maximum_age=3600)
+        third_lookup_cache._LOCK_TIMEOUT = 1.0
+        third_lookup_cache.Open()
+        third_lookup_cache.Close()
+
+      finally:
+        first_lookup_cache.Close()
+        second_lookup_cache.Close()
+
+  def testMaximumAge(self):
+    """Tests the maximum age of cached hash analysis results."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+
+      lookup_cache = hash_lookup_cache.HashLookupCache(path, maximum_age=3600)
+      lookup_cache.Open()
+
+      hash_analysis = interface.HashAnalysis(self._MD5_HASH, True)
+      lookup_cache.SetHashAnalysis('nsrlsvr', 'md5', hash_analysis)
+      lookup_cache.Close()
+
+      lookup_cache.Open()
+      hash_analysis = lookup_cache.GetHashAnalysis(
+          'nsrlsvr', 'md5', self._MD5_HASH)
+      self.assertIsNotNone(hash_analysis)
+      lookup_cache.Close()
+
+      # Make the cached hash analysis result expire.
+      connection = sqlite3.connect(path)
+      connection.execute(
+          'UPDATE hash_analysis SET timestamp = timestamp - 7200')
+      connection.commit()
+      connection.close()
+
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      lookup_cache.Open()
+      hash_analysis = lookup_cache.GetHashAnalysis(
+          'nsrlsvr', 'md5', self._MD5_HASH)
+      self.assertIsNotNone(hash_analysis)
+      lookup_cache.Close()
+
+      lookup_cache = hash_lookup_cache.HashLookupCache(path, maximum_age=3600)
+      lookup_cache.Open()
+      hash_analysis = lookup_cache.GetHashAnalysis(
+          'nsrlsvr', 'md5', self._MD5_HASH)
+      self.assertIsNone(hash_analysis)
+      lookup_cache.Close()
+
+  def testOpenClose(self):
+    """Tests the Open and Close functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+
+      with self.assertRaises(IOError):
+        lookup_cache.GetHashAnalysis('nsrlsvr', 'md5', self._MD5_HASH)
+
+      lookup_cache.Open()
+
+      with self.assertRaises(IOError):
+        lookup_cache.Open()
+
+      lookup_cache.Close()
+
+      with self.assertRaises(IOError):
+        lookup_cache.Close()
+
+      path = os.path.join(temp_directory, 'missing', 'cache.db')
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+
+      with self.assertRaises(IOError):
+        lookup_cache.Open()
+
+
+if __name__ == '__main__':
+  unittest.main()
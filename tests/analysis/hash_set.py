@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the hash set analysis plugin."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+try:
+  import Queue  # pylint: disable=import-error
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
+
+from dfvfs.path import fake_path_spec
+
+from plaso.analysis import hash_set
+from plaso.lib import definitions
+from plaso.lib import timelib
+
+from tests import test_lib as shared_test_lib
+from tests.analysis import test_lib
+
+
+class HashSetTestCase(test_lib.AnalysisPluginTestCase):
+  """Shared functionality for hash set tests."""
+
+  _MD5_HASHES = [
+      'd41d8cd98f00b204e9800998ecf8427e',
+      '0cc175b9c0f1b6a831c399e269772661',
+      '92eb5ffee6ae2fec3ad71c777531578f',
+      '4a8a08f09d37b73795649038408b5f33',
+      '8277e0910d750195b448797616e091ad']
+
+  def _WriteHashSetFile(self, path, hashes, label='known', lookup_hash='md5'):
+    """Writes a hash set file for testing.
+
+    Args:
+      path (str): path of the hash set file.
+      hashes (list[str]): hexadecimal formatted hashes.
+      label (Optional[str]): label.
+      lookup_hash (Optional[str]): name of the hash.
+
+    Returns:
+      int: number of digests in the hash set file.
+    """
+    writer = hash_set.HashSetFileWriter(
+        lookup_hash, label, maximum_number_of_digests_in_memory=2)
+    return writer.WriteFile(path, hashes)
+
+
+class HashSetFileTest(HashSetTestCase):
+  """Tests for the hash set file."""
+
+  def testContainsHash(self):
+    """Tests the ContainsHash function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'test.hashset')
+      self._WriteHashSetFile(path, self._MD5_HASHES[:4])
+
+      hash_set_file = hash_set.HashSetFile()
+      hash_set_file.Open(path)
+
+      try:
+        for hash_string in self._MD5_HASHES[:4]:
+          self.assertTrue(hash_set_file.ContainsHash(hash_string))
+
+        self.assertFalse(hash_set_file.ContainsHash(self._MD5_HASHES[4]))
+        self.assertFalse(hash_set_file.ContainsHash('00' * 16))
+        self.assertFalse(hash_set_file.ContainsHash('ff' * 16))
+
+        # Hashes of a different type or that are not hexadecimal formatted.
+        self.assertFalse(hash_set_file.ContainsHash('00' * 20))
+        self.assertFalse(hash_set_file.ContainsHash('bogus'))
+
+      finally:
+        hash_set_file.Close()
+
+  def testOpenClose(self):
+    """Tests the Open and Close functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'test.hashset')
+      self._WriteHashSetFile(path, self._MD5_HASHES, label='nsrl_present')
+
+      hash_set_file = hash_set.HashSetFile()
+      hash_set_file.Open(path)
+
+      self.assertEqual(hash_set_file.label, 'nsrl_present')
+      self.assertEqual(hash_set_file.lookup_hash, 'md5')
+      self.assertEqual(hash_set_file.number_of_digests, 5)
+
+      with self.assertRaises(IOError):
+        hash_set_file.Open(path)
+
+      hash_set_file.Close()
+
+      with self.assertRaises(IOError):
+        hash_set_file.Close()
+
+      # Test with a file that is not a hash set file.
+      path = os.path.join(temp_directory, 'bogus.hashset')
+      with open(path, 'wb') as file_object:
+        file_object.write(b'\x00' * 128)
+
+      with self.assertRaises(IOError):
+        hash_set_file.Open(path)
+
+      # Test with a truncated hash set file.
+      path = os.path.join(temp_directory, 'truncated.hashset')
+      self._WriteHashSetFile(path, self._MD5_HASHES)
+
+      with open(path, 'ab') as file_object:
+        file_object.truncate(os.path.getsize(path) - 1)
+
+      with self.assertRaises(IOError):
+        hash_set_file.Open(path)
+
+
+class HashSetFileWriterTest(HashSetTestCase):
+  """Tests for the hash set file writer."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    writer = hash_set.HashSetFileWriter('sha256', 'known')
+    self.assertIsNotNone(writer)
+
+    with self.assertRaises(ValueError):
+      hash_set.HashSetFileWriter('crc32', 'known')
+
+    with self.assertRaises(ValueError):
+      hash_set.HashSetFileWriter('md5', 'known bad')
+
+    with self.assertRaises(ValueError):
+      hash_set.HashSetFileWriter('md5', 'x' * 33)
+
+  def testWriteFile(self):
+    """Tests the WriteFile function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'test.hashset')
+
+      # Duplicate hashes are stored once.
+      hashes = list(reversed(self._MD5_HASHES))
+      hashes.extend(self._MD5_HASHES[:2])
+
+      number_of_digests = self._WriteHashSetFile(path, hashes)
+      self.assertEqual(number_of_digests, 5)
+
+      hash_set_file = hash_set.HashSetFile()
+      hash_set_file.Open(path)
+
+      try:
+        self.assertEqual(hash_set_file.number_of_digests, 5)
+        for hash_string in self._MD5_HASHES:
+          self.assertTrue(hash_set_file.ContainsHash(hash_string))
+
+      finally:
+        hash_set_file.Close()
+
+      with self.assertRaises(ValueError):
+        self._WriteHashSetFile(path, ['00' * 20])
+
+      with self.assertRaises(ValueError):
+        self._WriteHashSetFile(path, ['bogus'])
+
+
+class HashSetAnalyzerTest(HashSetTestCase):
+  """Tests for the hash set analyzer."""
+
+  # pylint: disable=protected-access
+
+  def testAnalyze(self):
+    """Tests the Analyze function."""
+    analyzer = hash_set.HashSetAnalyzer(Queue.Queue(), Queue.Queue())
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      known_path = os.path.join(temp_directory, 'known.hashset')
+      self._WriteHashSetFile(known_path, self._MD5_HASHES[:3], label='known')
+
+      bad_path = os.path.join(temp_directory, 'bad.hashset')
+      self._WriteHashSetFile(bad_path, self._MD5_HASHES[2:4], label='bad')
+
+      analyzer.OpenHashSetFiles([known_path, bad_path])
+
+      try:
+        self.assertEqual(analyzer.lookup_hash, 'md5')
+
+        hash_analyses = analyzer.Analyze(self._MD5_HASHES)
+
+      finally:
+        analyzer.Close()
+
+    self.assertEqual(len(hash_analyses), 5)
+
+    labels = [
+        hash_analysis.hash_information for hash_analysis in hash_analyses]
+    self.assertEqual(
+        labels, [['known'], ['known'], ['known', 'bad'], ['bad'], []])
+
+  def testOpenHashSetFiles(self):
+    """Tests the OpenHashSetFiles function."""
+    analyzer = hash_set.HashSetAnalyzer(Queue.Queue(), Queue.Queue())
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      md5_path = os.path.join(temp_directory, 'md5.hashset')
+      self._WriteHashSetFile(md5_path, self._MD5_HASHES)
+
+      sha1_path = os.path.join(temp_directory, 'sha1.hashset')
+      self._WriteHashSetFile(sha1_path, ['00' * 20], lookup_hash='sha1')
+
+      with self.assertRaises(IOError):
+        analyzer.OpenHashSetFiles([md5_path, sha1_path])
+
+      self.assertEqual(analyzer._hash_set_files, [])
+
+      analyzer.OpenHashSetFiles([sha1_path])
+      self.assertEqual(len(analyzer._hash_set_files), 1)
+      self.assertEqual(analyzer.lookup_hash, 'sha1')
+
+      analyzer.Close()
+
+
+class HashSetAnalysisPluginTest(HashSetTestCase):
+  """Tests for the hash set analysis plugin."""
+
+  # pylint: disable=protected-access
+
+  _TEST_EVENTS = [
+      {'data_type': 'fs:stat',
+       'md5_hash': HashSetTestCase._MD5_HASHES[0],
+       'pathspec': fake_path_spec.FakePathSpec(
+           location='C:\\WINDOWS\\system32\\good.exe'),
+       'timestamp': timelib.Timestamp.CopyFromString('2015-01-01 17:00:00'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CREATION},
+      {'data_type': 'fs:stat:ntfs',
+       'md5_hash': HashSetTestCase._MD5_HASHES[4],
+       'pathspec': fake_path_spec.FakePathSpec(
+           location='C:\\WINDOWS\\system32\\evil.exe'),
+       'timestamp': timelib.Timestamp.CopyFromString('2016-01-01 17:00:00'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CREATION}]
+
+  def testExamineEventAndCompileReport(self):
+    """Tests the ExamineEvent and CompileReport functions."""
+    plugin = hash_set.HashSetAnalysisPlugin()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'nsrl.hashset')
+      self._WriteHashSetFile(path, self._MD5_HASHES[:4], label='nsrl_present')
+
+      plugin.OpenHashSetFiles([path])
+
+      storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+
+    self.assertFalse(plugin._analyzer.is_alive())
+
+    self.assertEqual(len(storage_writer.analysis_reports), 1)
+    self.assertEqual(storage_writer.number_of_event_tags, 1)
+
+    report = storage_writer.analysis_reports[0]
+    self.assertIsNotNone(report)
+
+    expected_text = (
+        'hash_set hash tagging results\n'
+        '1 path specifications tagged with label: nsrl_present\n')
+    self.assertEqual(report.text, expected_text)
+
+    labels = []
+    for event_tag in storage_writer.GetEventTags():
+      labels.extend(event_tag.labels)
+
+    self.assertEqual(labels, ['nsrl_present'])
+
+
+if __name__ == '__main__':
+  unittest.main()
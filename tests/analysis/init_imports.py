@@ -16,7 +16,7 @@ class AnalysisImportTest(test_lib.ImportCheckTestCase):
   _ANALYSIS_PATH = os.path.join(os.getcwd(), 'plaso', 'analysis')
   _IGNORABLE_FILES = frozenset([
       'logger.py', 'manager.py', 'definitions.py', 'mediator.py',
-      'interface.py'])
+      'interface.py', 'aggregation.py', 'hash_lookup_cache.py'])
 
   def testAnalysisPluginsImported(self):
     """Tests that all parsers are imported."""
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the analysis plugin interface."""
+
+from __future__ import unicode_literals
+
+import threading
+import time
+import unittest
+
+try:
+  import Queue  # pylint: disable=import-error
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
+
+from plaso.analysis import interface
+from plaso.lib import errors
+
+from tests.analysis import test_lib
+
+
+class TestHTTPHashAnalyzer(interface.HTTPHashAnalyzer):
+  """HTTP hash analyzer for testing.
+
+  Attributes:
+    url (str): URL of the server to look up hashes.
+  """
+
+  def __init__(self, hash_queue, hash_analysis_queue, **kwargs):
+    """Initializes a HTTP hash analyzer for testing.
+
+    Args:
+      hash_queue (Queue.queue): contains hashes to be analyzed.
+      hash_analysis_queue (Queue.queue): queue that the analyzer will append
+          HashAnalysis objects to.
+    """
+    super(TestHTTPHashAnalyzer, self).__init__(
+        hash_queue, hash_analysis_queue, **kwargs)
+    self.url = None
+
+  def Analyze(self, hashes):
+    """Looks up hashes.
+
+    Args:
+      hashes (list[str]): hashes to look up.
+
+    Returns:
+      list[HashAnalysis]: analysis results.
+    """
+    hash_analyses = []
+    for digest in hashes:
+      json_response = self.MakeRequestAndDecodeJSON(
+          '{0:s}/{1:s}'.format(self.url, digest), 'GET')
+      hash_analyses.append(interface.HashAnalysis(digest, json_response))
+
+    return hash_analyses
+
+
+class TokenBucketRateLimiterTest(unittest.TestCase):
+  """Tests for the token bucket rate limiter."""
+
+  def testAcquire(self):
+    """Tests the Acquire function."""
+    rate_limiter = interface.TokenBucketRateLimiter(20.0, capacity=2)
+
+    # The bucket starts full.
+    start_time = time.time()
+    self.assertEqual(rate_limiter.Acquire(), 0.0)
+    self.assertEqual(rate_limiter.Acquire(), 0.0)
+
+    wait_time = rate_limiter.Acquire()
+    self.assertGreater(wait_time, 0.0)
+    self.assertLessEqual(wait_time, 0.05)
+
+    for _ in range(0, 3):
+      rate_limiter.Acquire()
+
+    # 6 tokens were taken, of which 4 had to be added at 20 tokens per second.
+    self.assertGreaterEqual(time.time() - start_time, 0.19)
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    with self.assertRaises(ValueError):
+      interface.TokenBucketRateLimiter(0)
+
+    with self.assertRaises(ValueError):
+      interface.TokenBucketRateLimiter(1.0, capacity=0)
+
+
+class HTTPHashAnalyzerTest(unittest.TestCase):
+  """Tests for the HTTP hash analyzer interface."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    self._lock = threading.Lock()
+    self._maximum_number_of_concurrent_requests = 0
+    self._number_of_concurrent_requests = 0
+    self._number_of_failed_requests = {}
+
+  def _GetResponse(self, unused_method, path, unused_body):
+    """Determines the response of the stub server.
+
+    Paths that start with "/fail" result in a transient error the first
+    time they are requested and paths that start with "/missing" result in
+    a HTTP 404 error.
+
+    Args:
+      unused_method (str): HTTP method of the request.
+      path (str): path of the request.
+      unused_body (bytes): body of the request.
+
+    Returns:
+      tuple[int, object, dict[str, str]]: HTTP status code, response to encode
+          as JSON and additional HTTP headers.
+    """
+    if path.startswith('/missing'):
+      return 404, {}, None
+
+    if path.startswith('/fail'):
+      with self._lock:
+        number_of_failed_requests = self._number_of_failed_requests.get(
+            path, 0)
+        self._number_of_failed_requests[path] = number_of_failed_requests + 1
+
+      if path.startswith('/failalways') or not number_of_failed_requests:
+        return 503, {}, None
+
+    with self._lock:
+      self._number_of_concurrent_requests += 1
+      self._maximum_number_of_concurrent_requests = max(
+          self._maximum_number_of_concurrent_requests,
+          self._number_of_concurrent_requests)
+
+    time.sleep(0.05)
+
+    with self._lock:
+      self._number_of_concurrent_requests -= 1
+
+    return 200, {'path': path}, None
+
+  def testMakeRequestAndDecodeJSON(self):
+    """Tests the MakeRequestAndDecodeJSON function."""
+    analyzer = TestHTTPHashAnalyzer(Queue.Queue(), Queue.Queue())
+    analyzer.retry_backoff = 0.0
+
+    with test_lib.StubHTTPServer(self._GetResponse) as http_server:
+      json_response = analyzer.MakeRequestAndDecodeJSON(
+          http_server.GetURL('/hash1'), 'GET')
+      self.assertEqual(json_response, {'path': '/hash1'})
+
+      # A transient error is retried.
+      json_response = analyzer.MakeRequestAndDecodeJSON(
+          http_server.GetURL('/fail1'), 'GET')
+      self.assertEqual(json_response, {'path': '/fail1'})
+      self.assertEqual(self._number_of_failed_requests['/fail1'], 2)
+
+      # A transient error is not retried more than the maximum.
+      with self.assertRaises(errors.ConnectionError):
+        analyzer.MakeRequestAndDecodeJSON(
+            http_server.GetURL('/failalways'), 'GET')
+
+      self.assertEqual(self._number_of_failed_requests['/failalways'], 4)
+
+      # A transient error is not retried if retries are disabled.
+      with self.assertRaises(errors.ConnectionError):
+        analyzer.MakeRequestAndDecodeJSON(
+            http_server.GetURL('/fail2'), 'GET', retry=False)
+
+      self.assertEqual(self._number_of_failed_requests['/fail2'], 1)
+
+      # Other HTTP errors are not retried.
+      number_of_requests = len(http_server.requests)
+      with self.assertRaises(errors.ConnectionError):
+        analyzer.MakeRequestAndDecodeJSON(
+            http_server.GetURL('/missing'), 'GET')
+
+      self.assertEqual(len(http_server.requests), number_of_requests + 1)
+
+      # Connections are kept alive between requests.
+      self.assertEqual(http_server.number_of_connections, 1)
+
+      with self.assertRaises(ValueError):
+        analyzer.MakeRequestAndDecodeJSON(
+            http_server.GetURL('/hash1'), 'DELETE')
+
+    analyzer._CloseSession()
+
+  def testRun(self):
+    """Tests the run function with concurrent requesters."""
+    hash_queue = Queue.Queue()
+    hash_analysis_queue = Queue.Queue()
+
+    analyzer = TestHTTPHashAnalyzer(hash_queue, hash_analysis_queue)
+    analyzer.SetNumberOfRequesters(4)
+    analyzer.EMPTY_QUEUE_WAIT_TIME = 0.1
+    analyzer.retry_backoff = 0.0
+
+    hashes = ['hash{0:d}'.format(index) for index in range(0, 16)]
+    hashes.append('fail3')
+
+    with test_lib.StubHTTPServer(self._GetResponse) as http_server:
+      analyzer.url = http_server.GetURL('')
+
+      for digest in hashes:
+        hash_queue.put(digest)
+
+      analyzer.start()
+      try:
+        hash_analyses = []
+        for _ in hashes:
+          hash_analyses.append(hash_analysis_queue.get(timeout=30))
+
+      finally:
+        analyzer.SignalAbort()
+        analyzer.join()
+
+      number_of_connections = http_server.number_of_connections
+
+    subject_hashes = sorted(
+        hash_analysis.subject_hash for hash_analysis in hash_analyses)
+    self.assertEqual(subject_hashes, sorted(hashes))
+
+    self.assertEqual(analyzer.analyses_performed, len(hashes))
+    self.assertGreater(self._maximum_number_of_concurrent_requests, 1)
+    self.assertLessEqual(self._maximum_number_of_concurrent_requests, 4)
+    self.assertLessEqual(number_of_connections, 4)
+
+  def testSetNumberOfRequesters(self):
+    """Tests the SetNumberOfRequesters function."""
+    analyzer = TestHTTPHashAnalyzer(Queue.Queue(), Queue.Queue())
+
+    analyzer.SetNumberOfRequesters(8)
+    self.assertEqual(analyzer.number_of_requesters, 8)
+
+    with self.assertRaises(ValueError):
+      analyzer.SetNumberOfRequesters(0)
+
+  def testSetRateLimit(self):
+    """Tests the SetRateLimit function."""
+    analyzer = TestHTTPHashAnalyzer(Queue.Queue(), Queue.Queue())
+
+    analyzer.SetRateLimit(4.0)
+    self.assertEqual(analyzer.requests_per_second, 4.0)
+    self.assertIsNotNone(analyzer._rate_limiter)
+
+    analyzer.SetRateLimit(None)
+    self.assertIsNone(analyzer.requests_per_second)
+    self.assertIsNone(analyzer._rate_limiter)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 try:
@@ -13,10 +14,12 @@ except ImportError:
 
 from dfvfs.path import fake_path_spec
 
+from plaso.analysis import hash_lookup_cache
 from plaso.analysis import nsrlsvr
 from plaso.lib import definitions
 from plaso.lib import timelib
 
+from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
@@ -91,10 +94,12 @@ class NsrlSvrTest(test_lib.AnalysisPluginTestCase):
       _MockNsrlsvrSocket: a socket that mocks an open socket to an nsrlsvr
           instance.
     """
+    self._number_of_connections += 1
     return _MockNsrlsvrSocket()
 
   def setUp(self):
     """Makes preparations before running an individual test."""
+    self._number_of_connections = 0
     self._socket_patcher = mock.patch(
         'socket.create_connection', self._MockCreateConnection)
     self._socket_patcher.start()
@@ -131,6 +136,48 @@ class NsrlSvrTest(test_lib.AnalysisPluginTestCase):
     expected_labels = ['nsrl_present']
     self.assertEqual(labels, expected_labels)
 
+  def testExamineEventAndCompileReportWithLookupCache(self):
+    """Tests the ExamineEvent and CompileReport functions with a cache."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+
+      plugin = nsrlsvr.NsrlsvrAnalysisPlugin()
+      plugin.SetHost('localhost')
+      plugin.SetPort(9120)
+      plugin.SetLabel('nsrl_present')
+      plugin.SetLookupCache(hash_lookup_cache.HashLookupCache(path))
+
+      storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+
+      self.assertEqual(self._number_of_connections, 1)
+      self.assertEqual(storage_writer.number_of_event_tags, 1)
+
+      report = storage_writer.analysis_reports[0]
+      expected_text = (
+          'nsrlsvr hash tagging results\n'
+          '1 path specifications tagged with label: nsrl_present\n'
+          'Lookup cache: 0 hits, 2 misses, hit rate: 0.0%\n')
+      self.assertEqual(report.text, expected_text)
+
+      # The hashes are not looked up again, since they are in the cache.
+      plugin = nsrlsvr.NsrlsvrAnalysisPlugin()
+      plugin.SetHost('localhost')
+      plugin.SetPort(9120)
+      plugin.SetLabel('nsrl_present')
+      plugin.SetLookupCache(hash_lookup_cache.HashLookupCache(path))
+
+      storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+
+      self.assertEqual(self._number_of_connections, 1)
+      self.assertEqual(storage_writer.number_of_event_tags, 1)
+
+      report = storage_writer.analysis_reports[0]
+      expected_text = (
+          'nsrlsvr hash tagging results\n'
+          '1 path specifications tagged with label: nsrl_present\n'
+          'Lookup cache: 2 hits, 0 misses, hit rate: 100.0%\n')
+      self.assertEqual(report.text, expected_text)
+
 
 if __name__ == '__main__':
   unittest.main()
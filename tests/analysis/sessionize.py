@@ -41,11 +41,31 @@ class SessionizeAnalysisPluginTest(test_lib.AnalysisPluginTestCase):
     storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
 
     self.assertEqual(len(storage_writer.analysis_reports), 1)
-    self.assertEqual(storage_writer.number_of_event_tags, 5)
+    self.assertEqual(storage_writer.number_of_event_tags, 0)
+
+    event_tag_intervals = list(storage_writer.GetEventTagIntervals())
+    self.assertEqual(len(event_tag_intervals), 2)
+
+    self.assertEqual(event_tag_intervals[0].labels, ['session_0'])
+    self.assertEqual(
+        event_tag_intervals[0].start_timestamp,
+        timelib.Timestamp.CopyFromString('2015-05-01 00:00:00'))
+    self.assertEqual(
+        event_tag_intervals[0].end_timestamp,
+        timelib.Timestamp.CopyFromString('2015-05-01 00:18:00'))
+
+    self.assertEqual(event_tag_intervals[1].labels, ['session_1'])
+    self.assertEqual(
+        event_tag_intervals[1].start_timestamp,
+        timelib.Timestamp.CopyFromString('2015-05-01 01:00:00'))
+    self.assertEqual(
+        event_tag_intervals[1].end_timestamp,
+        timelib.Timestamp.CopyFromString('2015-05-01 01:09:00'))
 
     report = storage_writer.analysis_reports[0]
     expected_report_text = (
-        'Sessionize plugin identified 2 sessions and applied 5 tags.\n'
+        'Sessionize plugin identified 2 sessions and applied 2 session '
+        'labels.\n'
         '\tSession 0: 3 events\n'
         '\tSession 1: 2 events')
     self.assertEqual(report.text, expected_report_text)
@@ -3,6 +3,19 @@
 
 from __future__ import unicode_literals
 
+import json
+import sys
+import threading
+
+# pylint: disable=import-error,wrong-import-order
+if sys.version_info[0] < 3:
+  import BaseHTTPServer
+  import SocketServer
+else:
+  from http import server as BaseHTTPServer
+  import socketserver as SocketServer
+
+# pylint: disable=wrong-import-position
 from plaso.analysis import mediator as analysis_mediator
 from plaso.containers import artifacts
 from plaso.containers import sessions
@@ -15,6 +28,144 @@ from tests import test_lib as shared_test_lib
 from tests.containers import test_lib as containers_test_lib
 
 
+class _StubHTTPServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+  """Threaded HTTP server that serves stub responses.
+
+  Attributes:
+    number_of_connections (int): number of connections accepted.
+    requests (list[tuple[str, str, bytes]]): HTTP method, path and body of
+        the requests received.
+    response_callback (function): callback that determines the response to
+        a request.
+  """
+
+  daemon_threads = True
+
+  def __init__(self, server_address, request_handler_class, response_callback):
+    """Initializes a stub HTTP server.
+
+    Args:
+      server_address (tuple[str, int]): hostname and port to bind to.
+      request_handler_class (type): HTTP request handler class.
+      response_callback (function): callback that determines the response to
+          a request.
+    """
+    BaseHTTPServer.HTTPServer.__init__(
+        self, server_address, request_handler_class)
+    self.lock = threading.Lock()
+    self.number_of_connections = 0
+    self.requests = []
+    self.response_callback = response_callback
+
+
+class _StubHTTPRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+  """HTTP request handler that serves stub responses."""
+
+  # Keep connections alive between requests.
+  protocol_version = 'HTTP/1.1'
+
+  def _HandleRequest(self):
+    """Handles a HTTP request."""
+    content_length = int(self.headers.get('Content-Length', None) or 0)
+    body = self.rfile.read(content_length)
+
+    with self.server.lock:
+      self.server.requests.append((self.command, self.path, body))
+
+    status_code, json_response, headers = self.server.response_callback(
+        self.command, self.path, body)
+
+    response_data = json.dumps(json_response).encode('utf-8')
+
+    self.send_response(status_code)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', '{0:d}'.format(len(response_data)))
+    for name, value in iter((headers or {}).items()):
+      self.send_header(name, value)
+    self.end_headers()
+
+    self.wfile.write(response_data)
+
+  def setup(self):
+    """Sets up the handler of a connection."""
+    BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+    with self.server.lock:
+      self.server.number_of_connections += 1
+
+  # pylint: disable=invalid-name
+  def do_GET(self):
+    """Handles a HTTP GET request."""
+    self._HandleRequest()
+
+  def do_POST(self):
+    """Handles a HTTP POST request."""
+    self._HandleRequest()
+
+  def log_message(self, format, *args):  # pylint: disable=redefined-builtin,unused-argument
+    """Suppresses logging of requests."""
+    return
+
+
+class StubHTTPServer(object):
+  """Local HTTP server that serves stub responses for testing.
+
+  The response to a request is determined by a callback that is passed
+  the HTTP method, path and body of the request and returns the HTTP status
+  code, the response to encode as JSON and additional HTTP headers.
+  """
+
+  def __init__(self, response_callback):
+    """Initializes a stub HTTP server.
+
+    Args:
+      response_callback (function): callback that determines the response to
+          a request.
+    """
+    super(StubHTTPServer, self).__init__()
+    self._http_server = _StubHTTPServer(
+        ('127.0.0.1', 0), _StubHTTPRequestHandler, response_callback)
+    self._thread = None
+
+  @property
+  def number_of_connections(self):
+    """int: number of connections accepted."""
+    return self._http_server.number_of_connections
+
+  @property
+  def port(self):
+    """int: port the server listens on."""
+    return self._http_server.server_address[1]
+
+  @property
+  def requests(self):
+    """list[tuple[str, str, bytes]]: method, path and body of requests."""
+    return self._http_server.requests
+
+  def __enter__(self):
+    """Starts the server when entering a with statement."""
+    self._thread = threading.Thread(target=self._http_server.serve_forever)
+    self._thread.daemon = True
+    self._thread.start()
+    return self
+
+  def __exit__(self, exception_type, value, traceback):
+    """Stops the server when exiting a with statement."""
+    self._http_server.shutdown()
+    self._http_server.server_close()
+    self._thread.join()
+
+  def GetURL(self, path):
+    """Retrieves the URL of a path on the server.
+
+    Args:
+      path (str): path, such as "/file/find".
+
+    Returns:
+      str: URL.
+    """
+    return 'http://127.0.0.1:{0:d}{1:s}'.format(self.port, path)
+
+
 class AnalysisPluginTestCase(shared_test_lib.BaseTestCase):
   """The unit test case for an analysis plugin."""
 
@@ -10,6 +10,7 @@ from plaso.analysis import unique_domains_visited
 from plaso.lib import definitions
 from plaso.lib import timelib
 
+from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
@@ -56,6 +57,30 @@ class UniqueDomainsPluginTest(test_lib.AnalysisPluginTestCase):
       domain = event_dictionary.get('domain', '')
       self.assertIn(domain, report_text)
 
+  def testExamineEventAndCompileReportWithMaximumInMemory(self):
+    """Tests the ExamineEvent and CompileReport with a maximum in memory."""
+    plugin = unique_domains_visited.UniqueDomainsVisitedPlugin()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      plugin.SetMaximumNumberOfDomainsInMemory(
+          2, temporary_directory=temp_directory)
+
+      test_events = self._TEST_EVENTS + self._TEST_EVENTS[:2]
+      storage_writer = self._AnalyzeEvents(test_events, plugin)
+
+    self.assertEqual(len(storage_writer.analysis_reports), 1)
+
+    analysis_report = storage_writer.analysis_reports[0]
+
+    expected_text = '\n'.join([
+        'Listing domains visited by all users',
+        'firstevent.com',
+        'fourthevent.co',
+        'secondevent.net',
+        'thirdevent.org',
+        ''])
+    self.assertEqual(analysis_report.text, expected_text)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,12 +4,12 @@
 
 from __future__ import unicode_literals
 
-import unittest
-
 try:
-  import mock  # pylint: disable=import-error
+  from urllib import parse as urllib_parse
 except ImportError:
-  from unittest import mock
+  import urlparse as urllib_parse  # pylint: disable=import-error
+
+import unittest
 
 from dfvfs.path import fake_path_spec
 
@@ -20,22 +20,6 @@ from plaso.lib import timelib
 from tests.analysis import test_lib
 
 
-class MockResponse(dict):
-  """A mock object to simulate a response object from the requests library."""
-
-  # Note: that the following functions do not follow the style guide
-  # because they are part of the requests response interface.
-  # pylint: disable=invalid-name
-
-  def json(self):
-    """Provided for compatibility with the requests library."""
-    return self
-
-  def raise_for_status(self):
-    """Provided for compatibility with the requests library."""
-    return
-
-
 class ViperTest(test_lib.AnalysisPluginTestCase):
   """Tests for the Viper analysis plugin."""
 
@@ -51,24 +35,25 @@ class ViperTest(test_lib.AnalysisPluginTestCase):
       'timestamp': timelib.Timestamp.CopyFromString('2015-01-01 17:00:00'),
       'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
 
-  # pylint: disable=unused-argument
-  def _MockPost(self, url, data=None):
-    """Mock function to simulate a Viper API request.
+  def _GetResponse(self, method, path, body):
+    """Determines the response of the stub Viper server.
 
     Args:
-      url (str): URL being requested.
-      data (dict[str, object]): simulated form data for the Viper API request.
+      method (str): HTTP method of the request.
+      path (str): path of the request.
+      body (bytes): body of the request.
 
     Returns:
-      MockResponse: mocked response that simulates a real response object
-          returned by the requests library from the Viper API.
+      tuple[int, object, dict[str, str]]: HTTP status code, response to encode
+          as JSON and additional HTTP headers.
     """
-    sha256_hash = data.get('sha256', None)
-    if sha256_hash != self._EVENT_1_HASH:
-      self.fail('Unexpected data in request.post().')
+    form_data = urllib_parse.parse_qs(body.decode('ascii'))
+    if (method != 'POST' or path != '/file/find' or
+        form_data.get('sha256', None) != [self._EVENT_1_HASH]):
+      return 400, {}, None
 
-    response = MockResponse()
-    response['default'] = ({
+    json_response = {}
+    json_response['default'] = [{
         'sha1': '13da502ab0d75daca5e5075c60e81bfe3b7a637f',
         'name': 'darkcomet.exe',
         'tags': [
@@ -86,27 +71,22 @@ class ViperTest(test_lib.AnalysisPluginTestCase):
         'type': 'PE32 executable (GUI) Intel 80386, for MS Windows',
         'id': 10,
         'md5': '9f2520a3056543d49bb0f822d85ce5dd',
-        'size': 774144},)
-
-    return response
+        'size': 774144}]
 
-  def setUp(self):
-    """Makes preparations before running an individual test."""
-    self.requests_patcher = mock.patch('requests.post', self._MockPost)
-    self.requests_patcher.start()
-
-  def tearDown(self):
-    """Cleans up after running an individual test."""
-    self.requests_patcher.stop()
+    return 200, json_response, None
 
   def testExamineEventAndCompileReport(self):
     """Tests the ExamineEvent and CompileReport functions."""
     plugin = viper.ViperAnalysisPlugin()
-    plugin.SetHost('localhost')
-    plugin.SetPort(8080)
+    plugin.SetHost('127.0.0.1')
     plugin.SetProtocol('http')
 
-    storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+    with test_lib.StubHTTPServer(self._GetResponse) as http_server:
+      plugin.SetPort(http_server.port)
+
+      storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+
+    self.assertEqual(len(http_server.requests), 1)
 
     self.assertEqual(len(storage_writer.analysis_reports), 1)
     self.assertEqual(storage_writer.number_of_event_tags, 1)
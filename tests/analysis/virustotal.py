@@ -4,12 +4,12 @@
 
 from __future__ import unicode_literals
 
-import unittest
-
 try:
-  import mock  # pylint: disable=import-error
+  from urllib import parse as urllib_parse
 except ImportError:
-  from unittest import mock
+  import urlparse as urllib_parse  # pylint: disable=import-error
+
+import unittest
 
 from dfvfs.path import fake_path_spec
 
@@ -20,22 +20,6 @@ from plaso.lib import timelib
 from tests.analysis import test_lib
 
 
-class MockResponse(dict):
-  """A mock object to simulate a response object from the requests library."""
-
-  # Note: that the following functions do not follow the style guide
-  # because they are part of the requests response interface.
-  # pylint: disable=invalid-name
-
-  def json(self):
-    """Provided for compatibility with the requests library."""
-    return self
-
-  def raise_for_status(self):
-    """Provided for compatibility with the requests library."""
-    return
-
-
 class VirusTotalTest(test_lib.AnalysisPluginTestCase):
   """Tests for the VirusTotal analysis plugin."""
 
@@ -52,46 +36,70 @@ class VirusTotalTest(test_lib.AnalysisPluginTestCase):
       'timestamp': timelib.Timestamp.CopyFromString('2015-01-01 17:00:00'),
       'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
 
-  def _MockGet(self, url, params):
-    """Mock function to simulate a VirusTotal API request.
+  def _GetResponse(self, method, path, unused_body):
+    """Determines the response of the stub VirusTotal API server.
 
     Args:
-      url (str): URL being requested.
-      params (dict[str, object]): HTTP parameters for the VirusTotal API
-          request.
+      method (str): HTTP method of the request.
+      path (str): path, including the query, of the request.
+      unused_body (bytes): body of the request.
 
     Returns:
-      MockResponse: mocked response that simulates a real response object
-          returned by the requests library from the VirusTotal API.
+      tuple[int, object, dict[str, str]]: HTTP status code, response to encode
+          as JSON and additional HTTP headers.
     """
-    # pylint: disable=protected-access
-    self.assertEqual(
-        url, virustotal.VirusTotalAnalyzer._VIRUSTOTAL_API_REPORT_URL)
+    path, _, query = path.partition('?')
+    url_parameters = urllib_parse.parse_qs(query)
 
-    if params['resource'] != self._EVENT_1_HASH:
-      self.fail('Unexpected parameters to request.get()')
+    if (method != 'GET' or path != '/vtapi/v2/file/report' or
+        url_parameters.get('apikey', None) != [self._FAKE_API_KEY] or
+        url_parameters.get('resource', None) != [self._EVENT_1_HASH]):
+      return 400, {}, None
 
-    response = MockResponse()
-    response['resource'] = self._EVENT_1_HASH
-    response['response_code'] = 1
-    response['positives'] = 10
-    return response
+    # Simulate a transient error to test that the request is retried.
+    self._number_of_requests += 1
+    if self._number_of_requests == 1:
+      return 503, {}, {'Retry-After': '0'}
+
+    json_response = {
+        'positives': 10,
+        'resource': self._EVENT_1_HASH,
+        'response_code': 1}
+    return 200, json_response, None
 
   def setUp(self):
     """Makes preparations before running an individual test."""
-    self.requests_patcher = mock.patch('requests.get', self._MockGet)
-    self.requests_patcher.start()
+    self._number_of_requests = 0
+
+  def testEstimateTimeRemaining(self):
+    """Tests the EstimateTimeRemaining function."""
+    plugin = virustotal.VirusTotalAnalysisPlugin()
+    plugin.EnableFreeAPIKeyRateLimit()
+
+    for index in range(0, 9):
+      plugin.hash_queue.put('{0:d}'.format(index))
+
+    # 9 hashes are looked up in 3 batches of 4 hashes at 1 request per minute.
+    self.assertEqual(plugin.EstimateTimeRemaining(), 180)
 
-  def tearDown(self):
-    """Cleans up after running an individual test."""
-    self.requests_patcher.stop()
+    plugin.SetNumberOfRequesters(3)
+    self.assertEqual(plugin.EstimateTimeRemaining(), 180)
 
   def testExamineEventAndCompileReport(self):
     """Tests the ExamineEvent and CompileReport functions."""
     plugin = virustotal.VirusTotalAnalysisPlugin()
     plugin.SetAPIKey(self._FAKE_API_KEY)
 
-    storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+    # pylint: disable=protected-access
+    plugin._analyzer.retry_backoff = 0.0
+
+    with test_lib.StubHTTPServer(self._GetResponse) as http_server:
+      plugin._analyzer._VIRUSTOTAL_API_REPORT_URL = http_server.GetURL(
+          '/vtapi/v2/file/report')
+
+      storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+
+    self.assertEqual(self._number_of_requests, 2)
 
     self.assertEqual(len(storage_writer.analysis_reports), 1)
     self.assertEqual(storage_writer.number_of_event_tags, 1)
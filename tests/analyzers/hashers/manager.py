@@ -82,7 +82,12 @@ class HashersManagerTest(shared_test_lib.BaseTestCase):
     names = manager.HashersManager.GetHasherNamesFromString(test_strings)
     self.assertEqual(2, len(names))
     names = manager.HashersManager.GetHasherNamesFromString('all')
-    self.assertEqual(len(names), len(manager.HashersManager._hasher_classes))
+    self.assertEqual(
+        len(names), len(manager.HashersManager._hasher_classes) - 1)
+    self.assertNotIn('entropy', names)
+
+    names = manager.HashersManager.GetHasherNamesFromString('entropy,md5')
+    self.assertEqual(sorted(names), ['entropy', 'md5'])
 
   def testGetHasher(self):
     """Tests the GetHasher function."""
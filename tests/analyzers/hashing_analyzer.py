@@ -48,6 +48,30 @@ class HashingAnalyzerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(first_result.attribute_value, '4')
     self.assertEqual(len(results), 1)
 
+  def testHashFileConcurrently(self):
+    """Tests that hashers that run concurrently produce the same results."""
+    test_data = b'test data' * 1024
+
+    analyzer = hashing_analyzer.HashingAnalyzer()
+    analyzer.SetHasherNames('md5,sha1,sha256')
+    analyzer.Analyze(test_data)
+    expected_results = [
+        (result.attribute_name, result.attribute_value)
+        for result in analyzer.GetResults()]
+
+    analyzer.Reset()
+    analyzer._CONCURRENT_UPDATE_MINIMUM_SIZE = 1024
+    analyzer.Analyze(test_data)
+    self.assertIsNotNone(analyzer._thread_pool)
+
+    results = [
+        (result.attribute_name, result.attribute_value)
+        for result in analyzer.GetResults()]
+    self.assertEqual(results, expected_results)
+
+    analyzer.Close()
+    self.assertIsNone(analyzer._thread_pool)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from plaso.containers import analyzer_result
@@ -12,6 +13,35 @@ from plaso.analyzers import yara_analyzer
 from tests import test_lib as shared_test_lib
 
 
+class TestProcessingProfiler(object):
+  """Processing profiler for testing.
+
+  Attributes:
+    profile_names (list[str]): names of the profiles that were timed.
+  """
+
+  def __init__(self):
+    """Initializes a processing profiler for testing."""
+    super(TestProcessingProfiler, self).__init__()
+    self.profile_names = []
+
+  def StartTiming(self, profile_name):
+    """Starts timing CPU time.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+    """
+    self.profile_names.append(profile_name)
+
+  def StopTiming(self, profile_name):
+    """Stops timing CPU time.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+    """
+    return
+
+
 class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
   """Test the Yara analyzer."""
 
@@ -66,6 +96,106 @@ class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(first_result.analyzer_name, 'yara')
     self.assertEqual(first_result.attribute_value, 'PEfileBasic,PEfile')
 
+  def testMatchFileWithProcessingProfiler(self):
+    """Tests that the Yara analyzer matches a file when profiling rules."""
+    test_yara_rules = self._ReadTestRuleFile()
+
+    test_file_path = self._GetTestFilePath(['test_pe.exe'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      test_data = file_object.read()
+
+    test_profiler = TestProcessingProfiler()
+
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(test_yara_rules)
+    analyzer.SetProcessingProfiler(test_profiler)
+
+    analyzer.Analyze(test_data)
+
+    self.assertEqual(
+        test_profiler.profile_names,
+        ['yara_rule_PEfileBasic', 'yara_rule_PEfile'])
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'PEfileBasic,PEfile')
+
+  def testSaveAndLoadRules(self):
+    """Tests the SaveRules and LoadRules functions."""
+    test_yara_rules = self._ReadTestRuleFile()
+
+    test_file_path = self._GetTestFilePath(['test_pe.exe'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      test_data = file_object.read()
+
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(test_yara_rules)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      compiled_rules_path = os.path.join(temp_directory, 'rules.yarc')
+      analyzer.SaveRules(compiled_rules_path)
+
+      analyzer = yara_analyzer.YaraAnalyzer()
+      analyzer.LoadRules(compiled_rules_path)
+
+    analyzer.Analyze(test_data)
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'PEfileBasic,PEfile')
+
+  def testSplitRules(self):
+    """Tests the _SplitRules function."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+
+    rules_string = '\n'.join([
+        'import "pe"',
+        '// rule Comment {',
+        'private rule First : tag {',
+        '  strings:',
+        '    $a = "}{"',
+        '    $b = { 4D 5A }',
+        '  condition:',
+        '    $a or $b',
+        '}',
+        '/* } */',
+        'rule Second { condition: pe.is_dll() }'])
+
+    rule_definitions = analyzer._SplitRules(rules_string)
+    self.assertEqual(len(rule_definitions), 2)
+
+    identifiers = [identifier for identifier, _ in rule_definitions]
+    self.assertEqual(identifiers, ['First', 'Second'])
+
+    _, rule_definition = rule_definitions[1]
+    self.assertTrue(rule_definition.startswith('import "pe"'))
+
+    rules_per_identifier = analyzer._CompileRulesPerIdentifier(rules_string)
+    self.assertEqual(len(rules_per_identifier), 2)
+
+    rule_definitions = analyzer._SplitRules(
+        'global rule First { condition: true }')
+    self.assertIsNone(rule_definitions)
+
+    rule_definitions = analyzer._SplitRules(
+        'include "other.yar"\nrule First { condition: true }')
+    self.assertIsNone(rule_definitions)
+
+    # Rule definitions that do not compile after splitting are not compiled
+    # individually.
+    rules_per_identifier = analyzer._CompileRulesPerIdentifier(
+        'rule First { condition: true')
+    self.assertIsNone(rules_per_identifier)
+
+    rules_per_identifier = analyzer._CompileRulesPerIdentifier('\n'.join([
+        '/*',
+        'rule Disabled { condition: true }',
+        '*/',
+        'rule First { condition: true }']))
+    self.assertIsNone(rules_per_identifier)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -19,6 +19,9 @@ class ExtractionToolTest(test_lib.CLIToolTestCase):
 
   _EXPECTED_PERFORMANCE_OPTIONS = '\n'.join([
       'usage: extraction_tool_test.py [--buffer_size BUFFER_SIZE]',
+      ('                               [--evtx_xml_templates] '
+       '[--ntfs_mft_enumeration]'),
+      '                               [--parse_result_cache PATH]',
       '                               [--queue_size QUEUE_SIZE]',
       '',
       'Test argument parser.',
@@ -28,6 +31,42 @@ class ExtractionToolTest(test_lib.CLIToolTestCase):
        '--bs BUFFER_SIZE'),
       ('                        The buffer size for the output (defaults to '
        '196MiB).'),
+      '  --evtx_xml_templates, --evtx-xml-templates',
+      ('                        Store the XML representation of Windows XML '
+       'EventLog'),
+      ('                        (EVTX) records as the values of an XML '
+       'template per'),
+      ('                        event source and identifier, instead of the '
+       'full XML'),
+      ('                        representation of every record, to reduce the '
+       'size of'),
+      ('                        the storage file. The XML representation is '
+       'rebuilt'),
+      '                        when the event data is read.',
+      '  --ntfs_mft_enumeration, --ntfs-mft-enumeration',
+      ('                        Enumerate the file entries of NTFS file '
+       'systems by'),
+      ('                        reading the MFT sequentially, instead of '
+       'traversing'),
+      ('                        the file system one directory at a time, '
+       'which is'),
+      ('                        faster for volumes with a large number of '
+       'files.'),
+      ('                        Filter files and artifact filters are '
+       'applied to the'),
+      '                        file entries read from the MFT.',
+      '  --parse_result_cache PATH, --parse-result-cache PATH',
+      ('                        Path of a parse result cache database file. '
+       'The events'),
+      ('                        of a parsed data stream are stored in the '
+       'cache by'),
+      ('                        content digest and are reused for data '
+       'streams with'),
+      ('                        the same content, for example in Volume '
+       'Shadow'),
+      ('                        Snapshots or re-imaged systems, instead of '
+       'parsing'),
+      '                        these again.',
       '  --queue_size QUEUE_SIZE, --queue-size QUEUE_SIZE',
       '                        The maximum number of queued items per worker',
       '                        (defaults to 125000)',
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the browser search analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.analysis import browser_search
+from plaso.cli.helpers import browser_search_analysis
+from plaso.lib import errors
+
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class BrowserSearchAnalysisArgumentsHelperTest(
+    test_lib.AnalysisPluginArgumentsHelperTest):
+  """Tests the browser search analysis plugin CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--browser-search-maximum-in-memory NUMBER]
+
+Test argument parser.
+
+optional arguments:
+  --browser-search-maximum-in-memory NUMBER, --browser_search_maximum_in_memory NUMBER
+                        Maximum number of search terms to keep in memory,
+                        before they are written to the temporary directory.
+                        This bounds the memory usage of analyzing large
+                        numbers of URLs, but the report will not contain the
+                        search term timeline and will only contain the most
+                        frequent search terms of every search engine, up to
+                        the maximum. By default all search terms are kept in
+                        memory.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    browser_search_analysis.BrowserSearchAnalysisArgumentsHelper.AddArguments(
+        argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+    analysis_plugin = browser_search.BrowserSearchPlugin()
+
+    browser_search_analysis.BrowserSearchAnalysisArgumentsHelper.ParseOptions(
+        options, analysis_plugin)
+    self.assertTrue(analysis_plugin._store_search_term_timeline)
+
+    options.browser_search_maximum_in_memory = 1000
+
+    browser_search_analysis.BrowserSearchAnalysisArgumentsHelper.ParseOptions(
+        options, analysis_plugin)
+    self.assertFalse(analysis_plugin._store_search_term_timeline)
+
+    options.browser_search_maximum_in_memory = -1
+
+    with self.assertRaises(errors.BadConfigOption):
+      browser_search_analysis.BrowserSearchAnalysisArgumentsHelper.ParseOptions(
+          options, analysis_plugin)
+
+    with self.assertRaises(errors.BadConfigObject):
+      browser_search_analysis.BrowserSearchAnalysisArgumentsHelper.ParseOptions(
+          options, None)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the hash lookup cache CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.analysis import nsrlsvr
+from plaso.analysis import tagging
+from plaso.lib import errors
+from plaso.cli.helpers import hash_lookup_cache
+
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class HashLookupCacheArgumentsHelperTest(
+    test_lib.AnalysisPluginArgumentsHelperTest):
+  """Tests the hash lookup cache CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--hash-lookup-cache PATH]
+                     [--hash-lookup-cache-maximum-age DAYS]
+
+Test argument parser.
+
+optional arguments:
+  --hash-lookup-cache PATH, --hash_lookup_cache PATH
+                        Path of a SQLite database file to cache the results of
+                        hash lookups in, such that hashes looked up in
+                        previous runs are not looked up again. The cache can
+                        be shared across runs and cases. By default no cache
+                        is used.
+  --hash-lookup-cache-maximum-age DAYS, --hash_lookup_cache_maximum_age DAYS
+                        Maximum age, in days, of cached hash lookup results,
+                        where 0 represents no maximum. The default is: 30.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    hash_lookup_cache.HashLookupCacheArgumentsHelper.AddArguments(
+        argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+    analysis_plugin = nsrlsvr.NsrlsvrAnalysisPlugin()
+
+    hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+        options, analysis_plugin)
+    self.assertIsNone(analysis_plugin._lookup_cache)
+
+    options.hash_lookup_cache = 'cache.db'
+    options.hash_lookup_cache_maximum_age = 7
+
+    hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+        options, analysis_plugin)
+
+    lookup_cache = analysis_plugin._lookup_cache
+    self.assertIsNotNone(lookup_cache)
+    self.assertEqual(lookup_cache.path, 'cache.db')
+    self.assertEqual(lookup_cache.maximum_age, 7 * 24 * 60 * 60)
+
+    options.hash_lookup_cache_maximum_age = 0
+
+    hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+        options, analysis_plugin)
+    self.assertIsNone(analysis_plugin._lookup_cache.maximum_age)
+
+    options.hash_lookup_cache_maximum_age = -1
+
+    with self.assertRaises(errors.BadConfigOption):
+      hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+          options, analysis_plugin)
+
+    with self.assertRaises(errors.BadConfigObject):
+      hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+          options, tagging.TaggingAnalysisPlugin())
+
+
+if __name__ == '__main__':
+  unittest.main()
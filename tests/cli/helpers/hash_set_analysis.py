@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the hash set analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import os
+import unittest
+
+from plaso.analysis import hash_set
+from plaso.lib import errors
+from plaso.cli.helpers import hash_set_analysis
+
+from tests import test_lib as shared_test_lib
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class HashSetAnalysisArgumentsHelperTest(
+    test_lib.AnalysisPluginArgumentsHelperTest):
+  """Tests the hash set analysis plugin CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--hash-set-files PATHS]
+
+Test argument parser.
+
+optional arguments:
+  --hash-set-files PATHS, --hash_set_files PATHS
+                        Comma separated paths of the hash set files to look up
+                        hashes in. Hash set files can be built from text hash
+                        lists with utils/build_hash_set.py and contain the
+                        label that is applied to events of files in the hash
+                        set. All hash set files must contain the same type of
+                        hash.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    hash_set_analysis.HashSetAnalysisArgumentsHelper.AddArguments(
+        argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+    analysis_plugin = hash_set.HashSetAnalysisPlugin()
+
+    with self.assertRaises(errors.BadConfigOption):
+      hash_set_analysis.HashSetAnalysisArgumentsHelper.ParseOptions(
+          options, analysis_plugin)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'test.hashset')
+
+      options.hash_set_files = path
+
+      with self.assertRaises(errors.BadConfigOption):
+        hash_set_analysis.HashSetAnalysisArgumentsHelper.ParseOptions(
+            options, analysis_plugin)
+
+      writer = hash_set.HashSetFileWriter('sha1', 'known')
+      writer.WriteFile(path, ['00' * 20])
+
+      hash_set_analysis.HashSetAnalysisArgumentsHelper.ParseOptions(
+          options, analysis_plugin)
+
+      self.assertEqual(analysis_plugin._analyzer.lookup_hash, 'sha1')
+
+      analysis_plugin._analyzer.Close()
+
+    with self.assertRaises(errors.BadConfigObject):
+      hash_set_analysis.HashSetAnalysisArgumentsHelper.ParseOptions(
+          options, None)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the Parquet output module CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.cli.helpers import parquet_output
+from plaso.lib import errors
+from plaso.output import parquet
+
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class ParquetOutputArgumentsHelperTest(
+    test_lib.OutputModuleArgumentsHelperTest):
+  """Tests the Parquet output module CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py
+                     [--parquet_compression {brotli,gzip,lz4,none,snappy,zstd}]
+                     [--row_group_size ROW_GROUP_SIZE]
+
+Test argument parser.
+
+optional arguments:
+  --parquet_compression {brotli,gzip,lz4,none,snappy,zstd}
+                        Compression method of the Parquet columns.
+  --row_group_size ROW_GROUP_SIZE
+                        Number of events to buffer before writing a Parquet
+                        row group.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    parquet_output.ParquetOutputArgumentsHelper.AddArguments(argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+    output_mediator = self._CreateOutputMediator()
+    output_module = parquet.ParquetOutputModule(output_mediator)
+
+    with self.assertRaises(errors.BadConfigOption):
+      parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+          options, output_module)
+
+    options.write = 'plaso.parquet'
+    parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+        options, output_module)
+
+    options.row_group_size = 0
+    with self.assertRaises(errors.BadConfigOption):
+      parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+          options, output_module)
+
+    with self.assertRaises(errors.BadConfigObject):
+      parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+          options, None)
+
+
+if __name__ == '__main__':
+  unittest.main()
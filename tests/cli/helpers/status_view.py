@@ -21,11 +21,17 @@ class StatusViewArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--status_view TYPE]
+usage: cli_helper.py [--status_view TYPE] [--metrics_port PORT]
 
 Test argument parser.
 
 optional arguments:
+  --metrics_port PORT, --metrics-port PORT
+                        Port of a HTTP endpoint on localhost that exports
+                        processing metrics, such as the number of events per
+                        second per worker, in Prometheus text format. Use 0 to
+                        select any available port. The endpoint is only
+                        available when using multiple processes.
   --status_view TYPE, --status-view TYPE
                         The processing status view mode: "linear", "none" or
                         "window".
@@ -51,11 +57,21 @@ optional arguments:
     test_tool = tools.CLITool()
     status_view.StatusViewArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertIsNone(test_tool._metrics_port)
     self.assertEqual(test_tool._status_view_mode, options.status_view_mode)
 
+    options.metrics_port = 9100
+    status_view.StatusViewArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._metrics_port, 9100)
+
     with self.assertRaises(errors.BadConfigObject):
       status_view.StatusViewArgumentsHelper.ParseOptions(options, None)
 
+    options.metrics_port = 65536
+    with self.assertRaises(errors.BadConfigOption):
+      status_view.StatusViewArgumentsHelper.ParseOptions(options, test_tool)
+
 
 if __name__ == '__main__':
   unittest.main()
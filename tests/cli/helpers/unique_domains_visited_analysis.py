@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the unique domains visited analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.analysis import unique_domains_visited
+from plaso.cli.helpers import unique_domains_visited_analysis
+from plaso.lib import errors
+
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class UniqueDomainsVisitedAnalysisArgumentsHelperTest(
+    test_lib.AnalysisPluginArgumentsHelperTest):
+  """Tests the unique domains visited analysis plugin CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--unique-domains-maximum-in-memory NUMBER]
+
+Test argument parser.
+
+optional arguments:
+  --unique-domains-maximum-in-memory NUMBER, --unique_domains_maximum_in_memory NUMBER
+                        Maximum number of domains to keep in memory, before
+                        they are written to the temporary directory. This
+                        bounds the memory usage of analyzing large numbers of
+                        URLs. By default all domains are kept in memory.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    helper = (
+        unique_domains_visited_analysis.
+        UniqueDomainsVisitedAnalysisArgumentsHelper)
+    helper.AddArguments(argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    helper = (
+        unique_domains_visited_analysis.
+        UniqueDomainsVisitedAnalysisArgumentsHelper)
+
+    options = cli_test_lib.TestOptions()
+    analysis_plugin = unique_domains_visited.UniqueDomainsVisitedPlugin()
+
+    helper.ParseOptions(options, analysis_plugin)
+    self.assertIsNone(
+        analysis_plugin._domains._maximum_number_of_keys_in_memory)
+
+    options.unique_domains_maximum_in_memory = 1000
+
+    helper.ParseOptions(options, analysis_plugin)
+    self.assertEqual(
+        analysis_plugin._domains._maximum_number_of_keys_in_memory, 1000)
+
+    options.unique_domains_maximum_in_memory = -1
+
+    with self.assertRaises(errors.BadConfigOption):
+      helper.ParseOptions(options, analysis_plugin)
+
+    with self.assertRaises(errors.BadConfigObject):
+      helper.ParseOptions(options, None)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -24,6 +24,7 @@ class ViperAnalysisArgumentsHelperTest(
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--viper-hash HASH] [--viper-host HOST]
                      [--viper-port PORT] [--viper-protocol PROTOCOL]
+                     [--viper-requesters NUMBER]
 
 Test argument parser.
 
@@ -40,6 +41,9 @@ optional arguments:
   --viper-protocol PROTOCOL, --viper_protocol PROTOCOL
                         Protocol to use to query Viper, the default is: http.
                         Supported options: http, https
+  --viper-requesters NUMBER, --viper_requesters NUMBER
+                        Number of requests to make to the Viper server
+                        concurrently, the default is: 1.
 """
 
   def testAddArguments(self):
@@ -36,6 +36,7 @@ class VirusTotalAnalysisArgumentsHelperTest(
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--virustotal-api-key API_KEY]
                      [--virustotal-free-rate-limit] [--virustotal-hash HASH]
+                     [--virustotal-requesters NUMBER]
 
 Test argument parser.
 
@@ -49,6 +50,11 @@ optional arguments:
   --virustotal-hash HASH, --virustotal_hash HASH
                         Type of hash to query VirusTotal, the default is:
                         sha256
+  --virustotal-requesters NUMBER, --virustotal_requesters NUMBER
+                        Number of requests to make to VirusTotal concurrently,
+                        the default is: 1. Only useful with a key for the
+                        private API, since the free API key rate limit applies
+                        to all requests.
 """
 
   def testAddArguments(self):
@@ -121,12 +121,26 @@ class PsortToolTest(test_lib.CLIToolTestCase):
 
   if resource is None:
     _EXPECTED_PROCESSING_OPTIONS = """\
-usage: psort_test.py [--temporary_directory DIRECTORY]
-                     [--worker-memory-limit SIZE]
+usage: psort_test.py [--temporary_directory DIRECTORY] [--inline-analysis]
+                     [--sort-memory-limit SIZE] [--worker-memory-limit SIZE]
 
 Test argument parser.
 
 optional arguments:
+  --inline-analysis, --inline_analysis
+                        Run analysis plugins that do little work per event,
+                        such as tagging and sessionize, in the main process
+                        instead of in a separate analysis process per plugin.
+                        These plugins share a single storage writer and
+                        examine the events while they are read from the
+                        storage file.
+  --sort-memory-limit SIZE, --sort_memory_limit SIZE
+                        Maximum amount of memory in bytes used to sort events
+                        before they are exported. If set, events are sorted in
+                        chunks that are written to the temporary directory and
+                        merged, instead of being sorted by SQLite, which
+                        allows exporting storage files with more events than
+                        fit in memory. By default events are sorted by SQLite.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -140,12 +154,19 @@ optional arguments:
   else:
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--process_memory_limit SIZE]
-                     [--temporary_directory DIRECTORY]
-                     [--worker-memory-limit SIZE]
+                     [--temporary_directory DIRECTORY] [--inline-analysis]
+                     [--sort-memory-limit SIZE] [--worker-memory-limit SIZE]
 
 Test argument parser.
 
 optional arguments:
+  --inline-analysis, --inline_analysis
+                        Run analysis plugins that do little work per event,
+                        such as tagging and sessionize, in the main process
+                        instead of in a separate analysis process per plugin.
+                        These plugins share a single storage writer and
+                        examine the events while they are read from the
+                        storage file.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -154,6 +175,13 @@ optional arguments:
                         worker processes. This limit is enforced by the
                         operating system and will supersede the worker memory
                         limit (--worker_memory_limit).
+  --sort-memory-limit SIZE, --sort_memory_limit SIZE
+                        Maximum amount of memory in bytes used to sort events
+                        before they are exported. If set, events are sorted in
+                        chunks that are written to the temporary directory and
+                        merged, instead of being sorted by SQLite, which
+                        allows exporting storage files with more events than
+                        fit in memory. By default events are sorted by SQLite.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
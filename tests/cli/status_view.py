@@ -178,6 +178,55 @@ class StatusViewTest(test_lib.CLIToolTestCase):
     output = output_writer.ReadOutput()
     self._CheckOutput(output, expected_output)
 
+    process_status.UpdateWorkerStatus(
+        'w_identifier', 'w_status', 123, 0,
+        'w_test_file', 1, 2, 3, 4, 5, 6, 9, 10, 7, 8,
+        number_of_bytes_read=3072, number_of_data_stream_bytes=2048)
+    test_view._PrintExtractionStatusUpdateWindow(process_status)
+
+    read_table_header = (
+        'Identifier      '
+        'Evidence        '
+        'Read            '
+        'Ratio')
+
+    if not sys.platform.startswith('win'):
+      read_table_header = '\x1b[1m{0:s}\x1b[0m'.format(read_table_header)
+
+    expected_output = [
+        'plaso - test_tool version {0:s}'.format(plaso.__version__),
+        '',
+        'Source path\t\t: /test/source/path',
+        'Source type\t\t: directory',
+        'Processing time\t\t: 00:00:00',
+        '',
+        table_header,
+        ('f_identifier    '
+         '123     '
+         'f_status        '
+         '0 B             '
+         '29 (29)         '
+         '456 (456)       '
+         'f_test_file'),
+        ('w_identifier    '
+         '123     '
+         'w_status        '
+         '0 B             '
+         '2 (0)           '
+         '4 (0)           '
+         'w_test_file'),
+        '',
+        read_table_header,
+        ('w_identifier    '
+         '2.0 KiB         '
+         '3.0 KiB         '
+         '1.50'),
+        '',
+        '']
+
+    output = output_writer.ReadOutput()
+    self._CheckOutput(output, expected_output)
+
   def testPrintProcessingTime(self):
     """Tests the _PrintProcessingTime function."""
     output_writer = test_lib.TestOutputWriter()
@@ -212,6 +261,42 @@ class StatusViewTest(test_lib.CLIToolTestCase):
     output = output_writer.ReadOutput()
     self.assertEqual(output, expected_output)
 
+  def testPrintSourcesStatus(self):
+    """Tests the _PrintSourcesStatus function."""
+    output_writer = test_lib.TestOutputWriter()
+
+    source_status = processing_status.SourceCollectionStatus()
+    source_status.display_name = 'TSK_PARTITION:/p1 VSHADOW:/vss2 NTFS'
+    source_status.identifier = 'Source_00'
+    source_status.number_of_produced_sources = 1234
+    source_status.status = 'collecting'
+
+    process_status = processing_status.ProcessingStatus()
+    process_status.UpdateSourcesStatus([source_status])
+
+    test_view = status_view.StatusView(output_writer, 'test_tool')
+    test_view._PrintSourcesStatus(process_status)
+
+    table_header = (
+        'Identifier      '
+        'Status          '
+        'Sources         '
+        'Source')
+
+    if not sys.platform.startswith('win'):
+      table_header = '\x1b[1m{0:s}\x1b[0m'.format(table_header)
+
+    table_row = (
+        'Source_00       '
+        'collecting      '
+        '1234            '
+        'TSK_PARTITION:/p1 VSHADOW:/vss2 NTFS')
+
+    expected_output = '\n'.join([table_header, table_row, '', ''])
+
+    output = output_writer.ReadOutput()
+    self.assertEqual(output, expected_output)
+
   # TODO: add tests for _PrintTasksStatus
   # TODO: add tests for GetAnalysisStatusUpdateCallback
   # TODO: add tests for GetExtractionStatusUpdateCallback
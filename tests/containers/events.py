@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import unittest
 
 from plaso.containers import events
+from plaso.lib import definitions
 
 from tests import test_lib as shared_test_lib
 
@@ -27,6 +28,25 @@ class EventDataTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(attribute_names, expected_attribute_names)
 
+  def testSetSerializedAttributes(self):
+    """Tests the SetSerializedAttributes function."""
+    attribute_container = events.EventData()
+    attribute_container.SetSerializedAttributes(
+        {'my_list': [1, 2], 'offset': [3]}, tuple)
+
+    self.assertEqual(attribute_container.offset, (3, ))
+
+    expected_attribute_names = [
+        'data_type',
+        'my_list',
+        'offset',
+        'query']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+    self.assertEqual(attribute_container.my_list, (1, 2))
+
 
 class EventObjectTest(shared_test_lib.BaseTestCase):
   """Tests for the event attribute container."""
@@ -51,6 +71,35 @@ class EventObjectTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(attribute_names, expected_attribute_names)
 
+    attribute_container.parser = 'filestat'
+    attribute_container.my_attribute = 'value'
+
+    expected_attribute_names.extend(['my_attribute', 'parser'])
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, sorted(expected_attribute_names))
+
+  def testTimestampDescription(self):
+    """Tests the timestamp_desc property."""
+    attribute_container = events.EventObject()
+    self.assertIsNone(attribute_container.timestamp_desc)
+
+    attribute_container.timestamp_desc = (
+        definitions.TIME_DESCRIPTION_MODIFICATION)
+    self.assertEqual(
+        attribute_container.timestamp_desc,
+        definitions.TIME_DESCRIPTION_MODIFICATION)
+
+    attribute_container.timestamp_desc = 'mtime'
+    self.assertEqual(attribute_container.timestamp_desc, 'mtime')
+
+    expected_attributes = [('timestamp_desc', 'mtime')]
+
+    attributes = list(attribute_container.GetAttributes())
+
+    self.assertEqual(attributes, expected_attributes)
+
 
 class EventTagTest(shared_test_lib.BaseTestCase):
   """Tests for the event tag attribute container."""
@@ -70,6 +119,39 @@ class EventTagTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(attribute_names, expected_attribute_names)
 
+  def testIsValidLabel(self):
+    """Tests the IsValidLabel function."""
+    self.assertTrue(events.EventTag.IsValidLabel('session_1'))
+    self.assertFalse(events.EventTag.IsValidLabel('session 1'))
+
+
+class EventTagIntervalTest(shared_test_lib.BaseTestCase):
+  """Tests for the event tag interval attribute container."""
+
+  def testAddLabels(self):
+    """Tests the AddLabels function."""
+    attribute_container = events.EventTagInterval()
+
+    attribute_container.AddLabels(['session_1', 'session_1', 'interesting'])
+    self.assertEqual(attribute_container.labels, ['session_1', 'interesting'])
+
+    with self.assertRaises(ValueError):
+      attribute_container.AddLabels(['session 2'])
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = events.EventTagInterval()
+
+    expected_attribute_names = [
+        'comment',
+        'end_timestamp',
+        'labels',
+        'start_timestamp']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -29,6 +29,41 @@ class WindowsDistributedLinkTrackingEventDataTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class WindowsEventLogXMLTemplateTest(shared_test_lib.BaseTestCase):
+  """Tests for the Windows XML EventLog (EVTX) XML template."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = windows_events.WindowsEventLogXMLTemplate()
+
+    expected_attribute_names = [
+        'event_identifier', 'identifier', 'source_name', 'xml_skeleton']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+  def testFormatXMLString(self):
+    """Tests the FormatXMLString function."""
+    attribute_container = windows_events.WindowsEventLogXMLTemplate(
+        xml_skeleton=(
+            '<Event><System><EventID>{0}</EventID></System>'
+            '<EventData><Data Name="{1}">{2}</Data></EventData>'
+            '<Binary>{{}}</Binary></Event>'))
+
+    xml_string = attribute_container.FormatXMLString(
+        ['7036', 'param1', 0], strings=['stopped'])
+
+    expected_xml_string = (
+        '<Event><System><EventID>7036</EventID></System>'
+        '<EventData><Data Name="param1">stopped</Data></EventData>'
+        '<Binary>{}</Binary></Event>')
+    self.assertEqual(xml_string, expected_xml_string)
+
+    with self.assertRaises(IndexError):
+      attribute_container.FormatXMLString(['7036', 'param1', 1], strings=[])
+
+
 class WindowsVolumeEventDataTest(shared_test_lib.BaseTestCase):
   """Tests for the Windows volume event data attribute container."""
 
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the data stream reader."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import data_stream_reader
+
+from tests import test_lib as shared_test_lib
+
+
+class BufferedDataStreamFileObjectTest(shared_test_lib.BaseTestCase):
+  """Tests for the buffered data stream file-like object."""
+
+  def testReadAndSeek(self):
+    """Tests the read and seek functions."""
+    test_file_path = self._GetTestFilePath(['NeroInfoTool.lnk'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    reader = data_stream_reader.DataStreamReader()
+    reader.Open(file_entry, '')
+
+    file_object = data_stream_reader.BufferedDataStreamFileObject(reader)
+
+    with self.assertRaises(IOError):
+      file_object.read(4)
+
+    file_object = reader.GetFileObject()
+    self.assertIsInstance(
+        file_object, data_stream_reader.BufferedDataStreamFileObject)
+
+    self.assertEqual(file_object.get_size(), len(expected_data))
+    self.assertEqual(file_object.read(4), expected_data[:4])
+    self.assertEqual(file_object.get_offset(), 4)
+
+    file_object.seek(2, os.SEEK_CUR)
+    self.assertEqual(file_object.read(), expected_data[6:])
+    self.assertEqual(file_object.read(), b'')
+
+    file_object.seek(-3, os.SEEK_END)
+    self.assertEqual(file_object.tell(), len(expected_data) - 3)
+    self.assertEqual(file_object.read(16), expected_data[-3:])
+
+    file_object.seek(len(expected_data) + 16, os.SEEK_SET)
+    self.assertEqual(file_object.read(1), b'')
+
+    with self.assertRaises(IOError):
+      file_object.seek(-1, os.SEEK_SET)
+
+    with self.assertRaises(IOError):
+      file_object.read(-1)
+
+    reader.Close()
+
+
+class DataStreamReaderTest(shared_test_lib.BaseTestCase):
+  """Tests for the data stream reader."""
+
+  # pylint: disable=protected-access
+
+  def _GetTestFileEntry(self, path_segments):
+    """Retrieves a file entry of a test file.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+
+    Returns:
+      dfvfs.FileEntry: file entry.
+    """
+    test_file_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    return path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+  def testGetFileObjectBuffered(self):
+    """Tests the GetFileObject function with a buffered data stream."""
+    file_entry = self._GetTestFileEntry(['NeroInfoTool.lnk'])
+
+    reader = data_stream_reader.DataStreamReader()
+
+    with self.assertRaises(IOError):
+      reader.GetFileObject()
+
+    reader.Open(file_entry, '')
+
+    file_object = reader.GetFileObject()
+    self.assertIsInstance(
+        file_object, data_stream_reader.BufferedDataStreamFileObject)
+    data = file_object.read()
+    file_object.close()
+
+    file_object = reader.GetFileObject()
+    self.assertEqual(file_object.read(), data)
+    file_object.close()
+
+    reader.Close()
+
+    self.assertEqual(reader.number_of_data_stream_bytes, len(data))
+    self.assertEqual(reader.number_of_bytes_read, len(data))
+
+  def testGetFileObjectPartiallyBuffered(self):
+    """Tests the GetFileObject function with a partially read data stream."""
+    file_entry = self._GetTestFileEntry(['NeroInfoTool.lnk'])
+
+    reader = data_stream_reader.DataStreamReader()
+    reader._READ_BUFFER_SIZE = 16
+    reader.Open(file_entry, '')
+
+    file_object = reader.GetFileObject()
+    self.assertEqual(len(file_object.read(4)), 4)
+    file_object.close()
+
+    self.assertEqual(reader.number_of_bytes_read, 16)
+
+    file_object = reader.GetFileObject()
+    file_object.seek(8, os.SEEK_SET)
+    self.assertEqual(len(file_object.read(16)), 16)
+    file_object.close()
+
+    reader.Close()
+
+    self.assertEqual(reader.number_of_bytes_read, 32)
+
+  def testGetFileObjectUnbuffered(self):
+    """Tests the GetFileObject function with an unbuffered data stream."""
+    file_entry = self._GetTestFileEntry(['NeroInfoTool.lnk'])
+
+    reader = data_stream_reader.DataStreamReader(maximum_buffer_size=0)
+    reader.Open(file_entry, '')
+
+    file_object = reader.GetFileObject()
+    self.assertIsInstance(
+        file_object, data_stream_reader.ReadCountingFileObject)
+    data = file_object.read()
+    file_object.close()
+
+    file_object = reader.GetFileObject()
+    self.assertEqual(file_object.read(), data)
+    file_object.close()
+
+    reader.Close()
+
+    self.assertEqual(reader.number_of_data_stream_bytes, len(data))
+    self.assertEqual(reader.number_of_bytes_read, 2 * len(data))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -8,6 +8,11 @@ import os
 import shutil
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from dfvfs.helpers import file_system_searcher
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
@@ -15,6 +20,7 @@ from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.engine import extractors
+from plaso.engine import ntfs_mft
 
 from tests import test_lib as shared_test_lib
 
@@ -204,6 +210,105 @@ class PathSpecExtractorTest(shared_test_lib.BaseTestCase):
     expected_path = os.path.join(current_directory, 'AUTHORS')
     self.assertTrue(expected_path in paths)
 
+  def testExtractPathSpecsNTFSMFTEnumeration(self):
+    """Tests the ExtractPathSpecs function with NTFS MFT enumeration."""
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=qcow_path_spec)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+        parent=qcow_path_spec)
+
+    resolver_context = context.Context()
+    test_extractor = extractors.PathSpecExtractor()
+
+    path_specs = list(test_extractor.ExtractPathSpecs(
+        [source_path_spec], resolver_context=resolver_context))
+    expected_paths = sorted(self._GetFilePaths(path_specs))
+
+    path_specs = list(test_extractor.ExtractPathSpecs(
+        [source_path_spec], resolver_context=resolver_context,
+        ntfs_mft_enumeration=True))
+
+    self.assertEqual(len(path_specs), 33)
+
+    paths = self._GetFilePaths(path_specs)
+    self.assertEqual(paths[0], '\\$MFT')
+    self.assertEqual(sorted(paths), expected_paths)
+
+    # Without recursion the file entries within the directories are included
+    # since these are not traversed by the extraction worker.
+    path_specs = list(test_extractor.ExtractPathSpecs(
+        [source_path_spec], recurse_file_system=False,
+        resolver_context=resolver_context, ntfs_mft_enumeration=True))
+
+    self.assertEqual(len(path_specs), 30)
+
+    find_specs = self._GetFindSpecs([
+        '/System Volume Information', '/password.txt'])
+    path_specs = list(test_extractor.ExtractPathSpecs(
+        [source_path_spec], find_specs=find_specs,
+        resolver_context=resolver_context, ntfs_mft_enumeration=True))
+
+    paths = self._GetFilePaths(path_specs)
+    self.assertEqual(paths, [
+        '\\System Volume Information', '\\password.txt'])
+
+    find_specs = self._GetFindSpecs([
+        '/System Volume Information', '/password.txt'])
+    path_specs = list(test_extractor.ExtractPathSpecs(
+        [source_path_spec], find_specs=find_specs, recurse_file_system=False,
+        resolver_context=resolver_context, ntfs_mft_enumeration=True))
+
+    self.assertEqual(len(path_specs), 5)
+
+  def testExtractPathSpecsNTFSMFTEnumerationWithReadError(self):
+    """Tests the ExtractPathSpecs function with an unreadable NTFS MFT."""
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=qcow_path_spec)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+        parent=qcow_path_spec)
+
+    resolver_context = context.Context()
+    test_extractor = extractors.PathSpecExtractor()
+
+    # The directories of the file system are traversed instead, which
+    # results in the same path specifications.
+    for recurse_file_system in (True, False):
+      for location in (None, '/System Volume Information'):
+        find_specs = None
+        if location:
+          find_specs = self._GetFindSpecs([location, '/password.txt'])
+
+        path_specs = list(test_extractor.ExtractPathSpecs(
+            [source_path_spec], find_specs=find_specs,
+            recurse_file_system=recurse_file_system,
+            resolver_context=resolver_context, ntfs_mft_enumeration=True))
+        expected_paths = sorted(self._GetFilePaths(path_specs))
+
+        if location:
+          find_specs = self._GetFindSpecs([location, '/password.txt'])
+
+        with mock.patch.object(
+            ntfs_mft.NTFSMFTTable, 'Read', side_effect=IOError('bogus')):
+          path_specs = list(test_extractor.ExtractPathSpecs(
+              [source_path_spec], find_specs=find_specs,
+              recurse_file_system=recurse_file_system,
+              resolver_context=resolver_context, ntfs_mft_enumeration=True))
+
+        paths = sorted(self._GetFilePaths(path_specs))
+        self.assertEqual(paths, expected_paths)
+
   def testExtractPathSpecsStorageMediaImage(self):
     """Tests the ExtractPathSpecs function an image file.
 
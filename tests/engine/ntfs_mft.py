@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the NTFS MFT table."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.helpers import file_system_searcher
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import ntfs_mft
+
+from tests import test_lib as shared_test_lib
+
+
+class NTFSMFTTableTest(shared_test_lib.BaseTestCase):
+  """Tests for the NTFS MFT table."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestMFTTable(self):
+    """Creates a MFT table of the NTFS file system in the test image.
+
+    Returns:
+      NTFSMFTTable: MFT table.
+    """
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=path_spec)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+        parent=path_spec)
+
+    resolver_context = context.Context()
+    file_system = path_spec_resolver.Resolver.OpenFileSystem(
+        path_spec, resolver_context=resolver_context)
+
+    mft_table = ntfs_mft.NTFSMFTTable(file_system, path_spec)
+    mft_table.Read(resolver_context=resolver_context)
+
+    return mft_table
+
+  def testRead(self):
+    """Tests the Read function."""
+    mft_table = self._CreateTestMFTTable()
+
+    self.assertEqual(mft_table.number_of_rows, 30)
+
+  def testGetLocation(self):
+    """Tests the GetLocation function."""
+    mft_table = self._CreateTestMFTTable()
+
+    locations = [
+        mft_table.GetLocation(row) for row in mft_table.GetRows()]
+    self.assertEqual(locations[0], '\\$MFT')
+    self.assertIn('\\', locations)
+    self.assertIn('\\$Extend\\$RmMetadata\\$TxfLog\\$TxfLog.blf', locations)
+    self.assertIn('\\another_file', locations)
+
+  def testGetPathSpec(self):
+    """Tests the GetPathSpec function."""
+    mft_table = self._CreateTestMFTTable()
+
+    path_specs = [
+        mft_table.GetPathSpec(row) for row in mft_table.GetRows()]
+    path_specs = [
+        path_spec for path_spec in path_specs
+        if path_spec.location == '\\another_file']
+    self.assertEqual(len(path_specs), 1)
+    self.assertEqual(path_specs[0].mft_attribute, 2)
+    self.assertEqual(path_specs[0].mft_entry, 39)
+
+  def testGetRows(self):
+    """Tests the GetRows function."""
+    mft_table = self._CreateTestMFTTable()
+
+    find_specs = [
+        file_system_searcher.FindSpec(
+            case_sensitive=False, location_regex=location_expression,
+            location_separator='/')
+        for location_expression in [
+            '/\\$Extend/\\$RmMetadata', '/password.txt']]
+
+    rows = mft_table.GetRows(find_specs=find_specs)
+    locations = [mft_table.GetLocation(row) for row in rows]
+    self.assertEqual(locations, ['\\$Extend\\$RmMetadata', '\\password.txt'])
+
+    rows = mft_table.GetRows(
+        find_specs=find_specs, include_sub_directories=True)
+    self.assertEqual(len(rows), 9)
+    self.assertEqual(rows, sorted(rows))
+
+    locations = [mft_table.GetLocation(row) for row in rows]
+    self.assertIn('\\$Extend\\$RmMetadata\\$TxfLog\\$Tops', locations)
+
+    file_entry = mft_table._GetFileEntry(rows[0])
+    self.assertTrue(file_entry.IsDirectory())
+    self.assertFalse(file_entry.IsFile())
+
+
+if __name__ == '__main__':
+  unittest.main()
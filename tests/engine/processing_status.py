@@ -99,6 +99,14 @@ class ProcessingStatusTest(unittest.TestCase):
         'test', 'Idle', 12345, 2000000, 'test process',
         0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
 
+  def testUpdateSourcesStatus(self):
+    """Tests the UpdateSourcesStatus function."""
+    source_status = processing_status.SourceCollectionStatus()
+
+    status = processing_status.ProcessingStatus()
+    status.UpdateSourcesStatus([source_status])
+    self.assertEqual(status.sources_status, [source_status])
+
   def testUpdateTasksStatus(self):
     """Tests the UpdateTasksStatus function."""
     task_status = processing_status.TasksStatus()
@@ -113,6 +121,22 @@ class ProcessingStatusTest(unittest.TestCase):
         'test', 'Idle', 12345, 2000000, 'test process', 0,
         0, 0, 0, 0, 0, 0, 0, 0, 0)
 
+    status.UpdateWorkerStatus(
+        'test', 'Idle', 12345, 2000000, 'test process', 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, cpu_time_per_parser={'filestat': 0.5})
+
+    worker_status = status.workers_status[0]
+    self.assertEqual(worker_status.cpu_time_per_parser, {'filestat': 0.5})
+
+
+class SourceCollectionStatusTest(unittest.TestCase):
+  """Tests the source collection status."""
+
+  def testInitialization(self):
+    """Tests the __init__ function."""
+    source_status = processing_status.SourceCollectionStatus()
+    self.assertIsNotNone(source_status)
+
 
 class TasksStatusTest(unittest.TestCase):
   """Tests the task status."""
@@ -75,6 +75,29 @@ class CPUTimeProfilerTest(shared_test_lib.BaseTestCase):
 
       test_profiler.Stop()
 
+  def testGetTotalCPUTimes(self):
+    """Tests the GetTotalCPUTimes function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.CPUTimeProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        test_profiler.StartTiming('test_profile')
+        sum(range(10000))
+        test_profiler.StopTiming('test_profile')
+
+      test_profiler.Stop()
+
+    total_cpu_times = test_profiler.GetTotalCPUTimes()
+    self.assertEqual(list(total_cpu_times.keys()), ['test_profile'])
+    self.assertGreaterEqual(total_cpu_times['test_profile'], 0.0)
+
 
 class MemoryProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the memory profiler."""
@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -153,6 +154,64 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(storage_writer.number_of_events, 19)
 
+  def testProcessPathSpecFileWithParseResultCache(self):
+    """Tests the ProcessPathSpec function with a parse result cache."""
+    path_spec = self._GetTestFilePathSpec(['NeroInfoTool.lnk'])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ExtractionConfiguration()
+      configuration.parse_result_cache_path = os.path.join(
+          temp_directory, 'cache.db')
+
+      extraction_worker = worker.EventExtractionWorker()
+      extraction_worker.SetExtractionConfiguration(configuration)
+
+      parse_result_cache = extraction_worker._parse_result_cache
+
+      session = sessions.Session()
+      storage_writer = fake_writer.FakeStorageWriter(session)
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, extraction_worker=extraction_worker)
+
+      self.assertEqual(parse_result_cache.number_of_hits, 0)
+      self.assertEqual(parse_result_cache.number_of_misses, 1)
+
+      storage_writer.Open()
+      expected_events = [
+          (event.timestamp, event.timestamp_desc, event.parser)
+          for event in storage_writer.GetSortedEvents()]
+      storage_writer.Close()
+
+      session = sessions.Session()
+      storage_writer = fake_writer.FakeStorageWriter(session)
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, extraction_worker=extraction_worker)
+
+      self.assertEqual(parse_result_cache.number_of_hits, 1)
+      self.assertEqual(parse_result_cache.number_of_misses, 1)
+
+      self.assertEqual(extraction_worker.number_of_parse_result_cache_hits, 1)
+      self.assertEqual(
+          extraction_worker.number_of_parse_result_cache_misses, 1)
+
+      storage_writer.Open()
+      events = list(storage_writer.GetSortedEvents())
+
+      self.assertEqual(len(events), len(expected_events))
+
+      for event, expected_event in zip(events, expected_events):
+        self.assertEqual(
+            (event.timestamp, event.timestamp_desc, event.parser),
+            expected_event)
+
+        event_data = self._GetEventDataOfEvent(storage_writer, event)
+        self.assertEqual(
+            event_data.pathspec.comparable, path_spec.comparable)
+
+      storage_writer.Close()
+
+      extraction_worker.Close()
+
   def testProcessPathSpecCompressedFileGZIP(self):
     """Tests the ProcessPathSpec function on a gzip compressed file."""
     knowledge_base_values = {'year': 2016}
@@ -325,6 +384,12 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
     storage_writer.Close()
 
+    # The analyzers and parsers share a single read of the data stream.
+    self.assertGreater(extraction_worker.number_of_data_stream_bytes, 0)
+    self.assertEqual(
+        extraction_worker.number_of_bytes_read,
+        extraction_worker.number_of_data_stream_bytes)
+
 
 if __name__ == '__main__':
   unittest.main()
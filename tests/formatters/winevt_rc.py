@@ -4,6 +4,8 @@
 
 from __future__ import unicode_literals
 
+import os
+import sqlite3
 import unittest
 
 from plaso.formatters import winevt_rc
@@ -11,9 +13,160 @@ from plaso.formatters import winevt_rc
 from tests import test_lib as shared_test_lib
 
 
+class Sqlite3DatabaseFileTest(shared_test_lib.BaseTestCase):
+  """Tests for the sqlite3 database file."""
+
+  # pylint: disable=protected-access
+
+  def testHasTable(self):
+    """Tests the HasTable function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_path = os.path.join(temp_directory, 'test.db')
+
+      database_file = winevt_rc.Sqlite3DatabaseFile()
+      database_file.Open(database_path)
+
+      database_file._cursor.execute('CREATE TABLE test (value TEXT)')
+      self.assertTrue(database_file.HasTable('test'))
+      self.assertFalse(database_file.HasTable('bogus'))
+
+      database_file.Close()
+
+      database_file.Open(database_path, read_only=True)
+
+      self.assertTrue(database_file.HasTable('test'))
+      self.assertFalse(database_file.HasTable('bogus'))
+
+      database_file.Close()
+
+  def testGetValues(self):
+    """Tests the GetValues function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_path = os.path.join(temp_directory, 'test.db')
+
+      database_file = winevt_rc.Sqlite3DatabaseFile()
+      database_file.Open(database_path)
+
+      database_file._cursor.execute('CREATE TABLE test (value TEXT)')
+      database_file._cursor.execute(
+          'INSERT INTO test VALUES ("first"), ("second")')
+
+      values = list(database_file.GetValues(
+          ['test'], ['value'], 'value == ?', parameters=('second', )))
+      self.assertEqual(values, [{'value': 'second'}])
+
+      database_file.Close()
+
+
 class WinevtResourcesSqlite3DatabaseReaderTest(shared_test_lib.BaseTestCase):
   """Tests for the Event Log resources sqlite3 database reader."""
 
+  # pylint: disable=protected-access
+
+  def _CreateTestDatabase(self, path):
+    """Creates an Event Log resources database for testing.
+
+    Args:
+      path (str): path of the database.
+    """
+    connection = sqlite3.connect(path)
+    connection.executescript((
+        'CREATE TABLE metadata (name TEXT, value TEXT);'
+        'INSERT INTO metadata VALUES ("version", "20150315");'
+        'CREATE TABLE event_log_providers ('
+        'event_log_provider_key INTEGER PRIMARY KEY, log_source TEXT, '
+        'provider_guid TEXT);'
+        'INSERT INTO event_log_providers VALUES (1, "Test", NULL);'
+        'CREATE TABLE message_file_per_event_log_provider ('
+        'message_file_key INTEGER, event_log_provider_key INTEGER);'
+        'INSERT INTO message_file_per_event_log_provider VALUES (2, 1);'
+        'CREATE TABLE message_table_2_0x00000409 ('
+        'message_identifier TEXT, message_string TEXT);'
+        'INSERT INTO message_table_2_0x00000409 VALUES ('
+        '"0x00000001", "Service %1 entered the %2 state.");'))
+    connection.commit()
+    connection.close()
+
+  def testGetMessageCached(self):
+    """Tests the GetMessage function with cached messages."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_path = os.path.join(temp_directory, 'winevt-rc.db')
+      self._CreateTestDatabase(database_path)
+
+      database_reader = winevt_rc.WinevtResourcesSqlite3DatabaseReader()
+      database_reader.Open(database_path)
+
+      expected_message_string = 'Service {0:s} entered the {1:s} state.'
+
+      message_string = database_reader.GetMessage('Test', 0x00000409, 1)
+      self.assertEqual(message_string, expected_message_string)
+
+      message_string = database_reader.GetMessage('Test', 0x00000409, 2)
+      self.assertIsNone(message_string)
+
+      message_string = database_reader.GetMessage('Bogus', 0x00000409, 1)
+      self.assertIsNone(message_string)
+
+      self.assertEqual(
+          database_reader._message_file_keys_per_log_source,
+          {'Bogus': [], 'Test': [2]})
+
+      # Cached messages, including messages that are not available, are not
+      # looked up in the database.
+      database_reader._database_file = None
+
+      message_string = database_reader.GetMessage('Test', 0x00000409, 1)
+      self.assertEqual(message_string, expected_message_string)
+
+      message_string = database_reader.GetMessage('Test', 0x00000409, 2)
+      self.assertIsNone(message_string)
+
+      message_string = database_reader.GetMessage('Bogus', 0x00000409, 1)
+      self.assertIsNone(message_string)
+
+  def testGetMessageCacheSize(self):
+    """Tests that GetMessage evicts the least recently used messages."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_path = os.path.join(temp_directory, 'winevt-rc.db')
+      self._CreateTestDatabase(database_path)
+
+      database_reader = winevt_rc.WinevtResourcesSqlite3DatabaseReader()
+      database_reader._MAXIMUM_CACHED_MESSAGES = 2
+      database_reader.Open(database_path)
+
+      database_reader.GetMessage('Test', 0x00000409, 1)
+      database_reader.GetMessage('Test', 0x00000409, 2)
+      database_reader.GetMessage('Test', 0x00000409, 1)
+      database_reader.GetMessage('Test', 0x00000409, 3)
+
+      self.assertEqual(list(database_reader._messages_cache.keys()), [
+          ('Test', 0x00000409, 1), ('Test', 0x00000409, 3)])
+
+      database_reader.Close()
+
+  def testOpenWithPreload(self):
+    """Tests the Open function with preloading of the message file keys."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_path = os.path.join(temp_directory, 'winevt-rc.db')
+      self._CreateTestDatabase(database_path)
+
+      database_reader = winevt_rc.WinevtResourcesSqlite3DatabaseReader()
+      database_reader.Open(database_path, preload_message_file_keys=True)
+
+      self.assertEqual(
+          database_reader._message_file_keys_per_log_source, {'Test': [2]})
+
+      message_string = database_reader.GetMessage('Test', 0x00000409, 1)
+      self.assertEqual(
+          message_string, 'Service {0:s} entered the {1:s} state.')
+
+      message_string = database_reader.GetMessage('Bogus', 0x00000409, 1)
+      self.assertIsNone(message_string)
+
+      database_reader.Close()
+
+      self.assertEqual(database_reader._message_file_keys_per_log_source, {})
+
   def testGetMessage(self):
     """Tests the GetMessage function."""
     database_path = self._GetTestFilePath(['winevt-rc.db'])
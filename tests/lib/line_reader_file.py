@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Tests for the binary line reader file-like object."""
+"""Tests for the line reader file-like objects."""
 
 from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.file_io import fake_file_io
 from dfvfs.file_io import os_file_io
+from dfvfs.path import fake_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 
@@ -15,6 +17,171 @@ from plaso.lib import line_reader_file
 from tests import test_lib as shared_test_lib
 
 
+class ReadCountingFakeFile(fake_file_io.FakeFile):
+  """Fake file-like object that counts the number of bytes read.
+
+  Attributes:
+    number_of_bytes_read (int): number of bytes read.
+  """
+
+  def __init__(self, resolver_context, file_data):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      file_data (bytes): data of the file.
+    """
+    super(ReadCountingFakeFile, self).__init__(resolver_context, file_data)
+    self.number_of_bytes_read = 0
+
+  # pylint: disable=redefined-builtin
+  def read(self, size=None):
+    """Reads a byte string from the file-like object.
+
+    Args:
+      size (Optional[int]): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    data = super(ReadCountingFakeFile, self).read(size=size)
+    self.number_of_bytes_read += len(data)
+    return data
+
+
+class LineReaderTest(shared_test_lib.BaseTestCase):
+  """Tests for the line reader."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+  def _OpenFakeFile(self, file_data):
+    """Opens a fake file-like object.
+
+    Args:
+      file_data (bytes): data of the file.
+
+    Returns:
+      FakeFile: file-like object.
+    """
+    path_spec = fake_path_spec.FakePathSpec(location='/test.txt')
+    file_object = fake_file_io.FakeFile(self._resolver_context, file_data)
+    file_object.open(path_spec)
+    return file_object
+
+  def testGetLines(self):
+    """Tests the GetLines function."""
+    file_object = self._OpenFakeFile(
+        '\ufefffirst\r\nsecond \u20ac\n\nlast'.encode('utf-8'))
+    line_reader = line_reader_file.LineReader(file_object, encoding='utf-8')
+
+    lines = list(line_reader.GetLines())
+    self.assertEqual(lines, [
+        (0, 'first\r\n'), (10, 'second \u20ac\n'), (21, '\n'),
+        (22, 'last')])
+
+    self.assertEqual(line_reader.tell(), 26)
+
+    file_object = self._OpenFakeFile(b'0123456789\nabc\n')
+    line_reader = line_reader_file.LineReader(file_object, encoding='ascii')
+
+    lines = list(line_reader.GetLines(maximum_line_length=4))
+    self.assertEqual(lines, [
+        (0, '0123'), (4, '4567'), (8, '89\n'), (11, 'abc\n')])
+
+  def testGetLinesWithBlocks(self):
+    """Tests the GetLines function with lines that cross blocks."""
+    expected_lines = [
+        '{0:d} {1:s}\n'.format(index, '\u00e9' * index)
+        for index in range(0, 200)]
+    file_data = ''.join(expected_lines).encode('utf-8')
+
+    for block_size in (1, 7, 4096):
+      file_object = self._OpenFakeFile(file_data)
+      line_reader = line_reader_file.LineReader(
+          file_object, encoding='utf-8', block_size=block_size)
+
+      offset = 0
+      lines = []
+      for line_offset, line in line_reader.GetLines():
+        self.assertEqual(line_offset, offset)
+        offset += len(line.encode('utf-8'))
+        lines.append(line)
+
+      self.assertEqual(lines, expected_lines)
+      self.assertEqual(line_reader.tell(), len(file_data))
+
+  def testGetLinesWithDecodeError(self):
+    """Tests the GetLines function with a line that cannot be decoded."""
+    file_object = self._OpenFakeFile(b'first\nsec\xffond\nthird\n')
+    line_reader = line_reader_file.LineReader(file_object, encoding='utf-8')
+
+    line = line_reader.readline()
+    self.assertEqual(line, 'first\n')
+
+    with self.assertRaises(UnicodeDecodeError):
+      line_reader.readline()
+
+    self.assertEqual(line_reader.tell(), 14)
+
+    line = line_reader.readline()
+    self.assertEqual(line, 'third\n')
+
+    file_object = self._OpenFakeFile(b'first\nsec\xffond\nthird\n')
+    line_reader = line_reader_file.LineReader(
+        file_object, encoding='utf-8', encoding_errors='replace')
+
+    lines = list(line_reader.GetLines())
+    self.assertEqual(lines, [
+        (0, 'first\n'), (6, 'sec\ufffdond\n'), (14, 'third\n')])
+
+  def testGetLinesWithoutEndOfLine(self):
+    """Tests the GetLines function with data without end of line."""
+    path_spec = fake_path_spec.FakePathSpec(location='/test.bin')
+    file_object = ReadCountingFakeFile(
+        self._resolver_context, b'A' * (32 * 1024 * 1024))
+    file_object.open(path_spec)
+
+    line_reader = line_reader_file.LineReader(file_object, encoding='ascii')
+
+    lines = line_reader.GetLines(maximum_line_length=400)
+    offset, line = next(lines)
+    self.assertEqual(offset, 0)
+    self.assertEqual(line, 'A' * 400)
+
+    # Only the initial block is read.
+    self.assertEqual(file_object.number_of_bytes_read, 4096)
+
+    offset, line = next(lines)
+    self.assertEqual(offset, 400)
+    self.assertEqual(line, 'A' * 400)
+
+    self.assertEqual(file_object.number_of_bytes_read, 4096)
+
+  def testGetLinesWithUTF16(self):
+    """Tests the GetLines function with UTF-16 encoded text."""
+    file_object = self._OpenFakeFile('first\nsecond\n'.encode('utf-16-le'))
+    line_reader = line_reader_file.LineReader(
+        file_object, encoding='utf-16-le')
+
+    lines = list(line_reader.GetLines())
+    self.assertEqual(lines, [(0, 'first\n'), (12, 'second\n')])
+
+  def testIterator(self):
+    """Tests the iterator functionality."""
+    file_object = self._OpenFakeFile(b'first;line\nsecond;line\n')
+    line_reader = line_reader_file.LineReader(
+        file_object, encoding='ascii', end_of_line=';')
+
+    line = line_reader.readline()
+    self.assertEqual(line, 'first;')
+
+    lines = list(line_reader)
+    self.assertEqual(lines, ['line\nsecond;', 'line\n'])
+    self.assertEqual(line_reader.tell(), 23)
+
+
 class BinaryLineReaderTest(shared_test_lib.BaseTestCase):
   """Tests for the binary line reader."""
 
@@ -167,11 +334,6 @@ class BinaryLineReaderTest(shared_test_lib.BaseTestCase):
 
     file_object.close()
 
-  # TODO: Add a test which tests reading a file which is
-  # larger than the buffer size, and read lines until it crosses
-  # that original buffer size (to test if the buffer is correctly
-  # filled).
-
 
 class BinaryDSVReaderTest(shared_test_lib.BaseTestCase):
   """Tests for the binary delimited separated values reader."""
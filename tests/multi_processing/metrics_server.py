@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the processing metrics server."""
+
+from __future__ import unicode_literals
+
+import sys
+import unittest
+
+# pylint: disable=import-error,no-name-in-module,wrong-import-order
+if sys.version_info[0] < 3:
+  import urllib2 as urllib_request
+  from urllib2 import HTTPError
+else:
+  from urllib import request as urllib_request
+  from urllib.error import HTTPError
+
+# pylint: disable=wrong-import-position
+from plaso.engine import processing_status
+from plaso.multi_processing import metrics_server
+
+from tests import test_lib as shared_test_lib
+
+
+class ProcessingMetricsServerTest(shared_test_lib.BaseTestCase):
+  """Tests for the processing metrics server."""
+
+  # pylint: disable=protected-access
+
+  def _CreateProcessingStatus(self):
+    """Creates a processing status for testing.
+
+    Returns:
+      ProcessingStatus: processing status.
+    """
+    status = processing_status.ProcessingStatus()
+    status.start_time = 1600000000.0
+
+    status.UpdateForemanStatus(
+        'Main', 'running', 1234, 1048576, '', 10, 20, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    status.UpdateWorkerStatus(
+        'Worker_00', 'extracting', 1235, 2097152, 'OS:/tmp/"test"', 5, 2,
+        0, 100, 0, 0, 0, 0, 0, 1, number_of_bytes_read=4096,
+        number_of_data_stream_bytes=8192, number_of_parse_result_cache_hits=3,
+        cpu_time_per_parser={'filestat': 0.25, 'winreg': 1.5})
+
+    tasks_status = processing_status.TasksStatus()
+    tasks_status.number_of_queued_tasks = 3
+    tasks_status.number_of_tasks_pending_merge = 2
+    tasks_status.number_of_tasks_processing = 1
+    tasks_status.total_number_of_tasks = 6
+    status.UpdateTasksStatus(tasks_status)
+
+    return status
+
+  def testEscapeLabelValue(self):
+    """Tests the _EscapeLabelValue function."""
+    test_server = metrics_server.ProcessingMetricsServer()
+
+    label_value = test_server._EscapeLabelValue('C:\\"test"\n')
+    self.assertEqual(label_value, 'C:\\\\\\"test\\"\\n')
+
+  def testFormatMetrics(self):
+    """Tests the _FormatMetrics function."""
+    test_server = metrics_server.ProcessingMetricsServer()
+
+    status = self._CreateProcessingStatus()
+    metrics_string = test_server._FormatMetrics(status, 1600000010.0)
+    lines = metrics_string.split('\n')
+
+    self.assertIn(
+        '# TYPE plaso_process_produced_events_total counter', lines)
+    self.assertIn((
+        'plaso_process_produced_events_total{process="Worker_00",'
+        'role="worker"} 100'), lines)
+    self.assertIn((
+        'plaso_process_used_memory_bytes{process="Main",role="foreman"} '
+        '1048576'), lines)
+    self.assertIn((
+        'plaso_process_read_bytes_total{process="Worker_00",role="worker"} '
+        '4096'), lines)
+    self.assertIn((
+        'plaso_process_parse_result_cache_hits_total{process="Worker_00",'
+        'role="worker"} 3'), lines)
+    self.assertIn((
+        'plaso_process_status{process="Worker_00",role="worker",'
+        'status="extracting"} 1'), lines)
+    self.assertIn((
+        'plaso_parser_cpu_time_seconds_total{parser="winreg",'
+        'process="Worker_00",role="worker"} 1.5'), lines)
+    self.assertIn('plaso_tasks_queued 3', lines)
+    self.assertIn('plaso_tasks_pending_merge 2', lines)
+    self.assertIn('plaso_tasks_total 6', lines)
+
+    self.assertNotIn('# TYPE plaso_events gauge', lines)
+
+    # The number of events per second is relative to the previous update.
+    self.assertIn((
+        'plaso_process_events_per_second{process="Worker_00",'
+        'role="worker"} 0.0'), lines)
+
+    status.UpdateWorkerStatus(
+        'Worker_00', 'extracting', 1235, 2097152, '', 5, 2,
+        0, 150, 0, 0, 0, 0, 0, 1)
+
+    metrics_string = test_server._FormatMetrics(status, 1600000020.0)
+    lines = metrics_string.split('\n')
+
+    self.assertIn((
+        'plaso_process_events_per_second{process="Worker_00",'
+        'role="worker"} 5.0'), lines)
+
+  def testGetEventsPerSecond(self):
+    """Tests the _GetEventsPerSecond function."""
+    test_server = metrics_server.ProcessingMetricsServer()
+
+    process_status = processing_status.ProcessStatus()
+    process_status.identifier = 'Worker_00'
+    process_status.number_of_produced_events = 100
+
+    events_per_second = test_server._GetEventsPerSecond(process_status, 10.0)
+    self.assertEqual(events_per_second, 0.0)
+
+    process_status.number_of_produced_events = 300
+    events_per_second = test_server._GetEventsPerSecond(process_status, 12.0)
+    self.assertEqual(events_per_second, 100.0)
+
+    # A replaced worker starts counting from 0 again.
+    process_status.number_of_produced_events = 10
+    events_per_second = test_server._GetEventsPerSecond(process_status, 14.0)
+    self.assertEqual(events_per_second, 0.0)
+
+  def testStartStop(self):
+    """Tests the Start and Stop functions."""
+    test_server = metrics_server.ProcessingMetricsServer()
+
+    result = test_server.Start('localhost', 0)
+    self.assertTrue(result)
+
+    try:
+      self.assertIsNotNone(test_server.port)
+
+      test_server.UpdateMetrics(self._CreateProcessingStatus())
+
+      url = 'http://localhost:{0:d}/metrics'.format(test_server.port)
+      response = urllib_request.urlopen(url)
+      try:
+        content_type = response.info().get('Content-Type')
+        metrics_data = response.read()
+      finally:
+        response.close()
+
+      self.assertEqual(
+          content_type, 'text/plain; version=0.0.4; charset=utf-8')
+      self.assertIn(b'plaso_tasks_queued 3\n', metrics_data)
+
+      url = 'http://localhost:{0:d}/bogus'.format(test_server.port)
+      with self.assertRaises(HTTPError):
+        urllib_request.urlopen(url)
+
+    finally:
+      test_server.Stop()
+
+    self.assertIsNone(test_server.port)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -10,6 +10,7 @@ import shutil
 import unittest
 
 from plaso.analysis import interface as analysis_interface
+from plaso.analysis import sessionize
 from plaso.analysis import tagging
 from plaso.containers import sessions
 from plaso.engine import configurations
@@ -64,6 +65,28 @@ class TestAnalysisPlugin(analysis_interface.AnalysisPlugin):
     return
 
 
+class TestFailingInlineAnalysisPlugin(TestAnalysisPlugin):
+  """Inline analysis plugin that fails to examine events for testing."""
+
+  NAME = 'test_failing_inline'
+
+  ENABLE_INLINE_ANALYSIS = True
+
+  def ExamineEvent(self, mediator, event, event_data):
+    """Analyzes an event object.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+      event (EventObject): event.
+      event_data (EventData): event data.
+
+    Raises:
+      RuntimeError: always.
+    """
+    raise RuntimeError('Failed to examine event.')
+
+
 class TestEventFormatter(formatters_interface.EventFormatter):
   """Event formatter for testing."""
 
@@ -426,6 +449,42 @@ class PsortMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
     self.assertEqual(len(output_module.events), 15)
     self.assertEqual(len(output_module.macb_groups), 3)
 
+  def testInternalExportEventsWithWatermark(self):
+    """Tests the _ExportEvents function with an event watermark."""
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    output_writer = cli_test_lib.TestBinaryOutputWriter()
+
+    formatter_mediator = formatters_mediator.FormatterMediator()
+
+    output_mediator_object = output_mediator.OutputMediator(
+        knowledge_base_object, formatter_mediator)
+
+    output_module = TestOutputModule(output_mediator_object)
+    output_module.SetOutputWriter(output_writer)
+
+    test_engine = psort.PsortMultiProcessEngine()
+
+    formatters_manager.FormattersManager.RegisterFormatter(TestEventFormatter)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+      storage_reader.ReadPreprocessingInformation(knowledge_base_object)
+
+      event_watermark = storage_reader.GetEventWatermark()
+      self.assertEqual(storage_reader.GetExportWatermark(), 0)
+
+      test_engine._ExportEvents(
+          storage_reader, output_module, deduplicate_events=False,
+          watermark=event_watermark - 5)
+
+    formatters_manager.FormattersManager.DeregisterFormatter(TestEventFormatter)
+
+    self.assertEqual(len(output_module.events), 5)
+
   # TODO: add test for _FlushExportBuffer.
   # TODO: add test for _StartAnalysisProcesses.
   # TODO: add test for _StatusUpdateThreadMain.
@@ -489,6 +548,85 @@ class PsortMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
 
     # TODO: add bogus data location test.
 
+  def testAnalyzeEventsWithInlineAnalysis(self):
+    """Tests the AnalyzeEvents function with inline analysis."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    session = sessions.Session()
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+
+    data_location = ''
+    analysis_plugin = sessionize.SessionizeAnalysisPlugin()
+    analysis_plugins = {'sessionize': analysis_plugin}
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.inline_analysis = True
+
+    test_engine = psort.PsortMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      shutil.copyfile(test_file_path, temp_file)
+
+      storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+          definitions.DEFAULT_STORAGE_FORMAT, session, temp_file)
+
+      test_engine.AnalyzeEvents(
+          knowledge_base_object, storage_writer, data_location,
+          analysis_plugins, configuration)
+
+      # The inline analysis plugins do not run in an analysis process.
+      self.assertEqual(test_engine._processes_per_pid, {})
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+      try:
+        analysis_reports = list(storage_reader.GetAnalysisReports())
+        event_tag_intervals = list(storage_reader.GetEventTagIntervals())
+      finally:
+        storage_reader.Close()
+
+    plugin_names = [
+        analysis_report.plugin_name for analysis_report in analysis_reports]
+    self.assertEqual(plugin_names.count('sessionize'), 1)
+    self.assertEqual(len(event_tag_intervals), 10)
+
+  def testAnalyzeEventsWithFailingInlineAnalysis(self):
+    """Tests the AnalyzeEvents function with a failing inline analysis."""
+    session = sessions.Session()
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+
+    data_location = ''
+    analysis_plugin = TestFailingInlineAnalysisPlugin()
+    analysis_plugins = {'test_failing_inline': analysis_plugin}
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.inline_analysis = True
+
+    test_engine = psort.PsortMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+          definitions.DEFAULT_STORAGE_FORMAT, session, temp_file)
+
+      test_engine.AnalyzeEvents(
+          knowledge_base_object, storage_writer, data_location,
+          analysis_plugins, configuration)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+      try:
+        analysis_reports = list(storage_reader.GetAnalysisReports())
+      finally:
+        storage_reader.Close()
+
+    # The failing analysis plugin does not produce an analysis report.
+    self.assertEqual(analysis_reports, [])
+
   def testExportEvents(self):
     """Tests the ExportEvents function."""
     test_file_path = self._GetTestFilePath(['psort_test.plaso'])
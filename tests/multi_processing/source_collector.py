@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the parallel source collector."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.lib import definitions
+from plaso.multi_processing import source_collector
+
+from tests import test_lib as shared_test_lib
+
+
+class SourceCollectorTest(shared_test_lib.BaseTestCase):
+  """Tests for the parallel source collector."""
+
+  # pylint: disable=protected-access
+
+  def _GetSourcePathSpecs(self):
+    """Retrieves the path specifications of the sources in the test image.
+
+    Returns:
+      list[dfvfs.PathSpec]: path specifications of the NTFS file system in
+          the test image and in its Volume Shadow Snapshot (VSS) stores.
+    """
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=qcow_path_spec)
+
+    source_path_specs = [path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+        parent=qcow_path_spec)]
+
+    for store_index in range(1, 3):
+      vshadow_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_VSHADOW,
+          location='/vss{0:d}'.format(store_index), store_index=store_index - 1,
+          parent=qcow_path_spec)
+      source_path_specs.append(path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+          parent=vshadow_path_spec))
+
+    return source_path_specs
+
+  def testCollect(self):
+    """Tests collecting sources in parallel."""
+    source_path_specs = self._GetSourcePathSpecs()
+
+    collector = source_collector.SourceCollector(
+        maximum_number_of_threads=2, ntfs_mft_enumeration=True)
+    collector.Start(source_path_specs)
+
+    path_specs = []
+    while collector.is_collecting:
+      path_specs.extend(collector.GetPathSpecs(100, timeout=0.1))
+
+    collector.Stop()
+
+    sources_status = collector.GetSourcesStatus()
+    self.assertEqual(len(sources_status), 3)
+
+    for source_status in sources_status:
+      self.assertEqual(
+          source_status.status, definitions.STATUS_INDICATOR_COMPLETED)
+
+    number_of_produced_sources = sum(
+        source_status.number_of_produced_sources
+        for source_status in sources_status)
+    self.assertEqual(len(path_specs), number_of_produced_sources)
+
+    self.assertEqual(sources_status[0].display_name, 'QCOW NTFS')
+    self.assertEqual(sources_status[0].number_of_produced_sources, 30)
+    self.assertEqual(
+        sources_status[2].display_name, 'QCOW VSHADOW:/vss2 NTFS')
+
+  def testCollectWithError(self):
+    """Tests collecting a source that raises an exception."""
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/')
+
+    collector = source_collector.SourceCollector()
+
+    def _CollectSource(unused_source_status, unused_source_path_spec):
+      """Collects the path specifications from a source."""
+      raise TypeError('Unsupported source.')
+
+    collector._CollectSource = _CollectSource
+    collector.Start([source_path_spec])
+
+    while collector.is_collecting:
+      collector.GetPathSpecs(100, timeout=0.1)
+
+    collector.Stop()
+
+    sources_status = collector.GetSourcesStatus()
+    self.assertEqual(len(sources_status), 1)
+    self.assertEqual(
+        sources_status[0].status, definitions.STATUS_INDICATOR_ERROR)
+
+  def testGetDisplayName(self):
+    """Tests the _GetDisplayName function."""
+    source_path_specs = self._GetSourcePathSpecs()
+
+    collector = source_collector.SourceCollector()
+
+    display_name = collector._GetDisplayName(source_path_specs[1])
+    self.assertEqual(display_name, 'QCOW VSHADOW:/vss1 NTFS')
+
+  def testGetPathSpecs(self):
+    """Tests the GetPathSpecs function."""
+    source_path_specs = self._GetSourcePathSpecs()
+
+    collector = source_collector.SourceCollector()
+    collector.Start(source_path_specs[:1])
+
+    path_specs = collector.GetPathSpecs(1, timeout=5.0)
+    self.assertEqual(len(path_specs), 1)
+
+    collector.Stop()
+
+
+if __name__ == '__main__':
+  unittest.main()
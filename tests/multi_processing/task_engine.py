@@ -12,6 +12,8 @@ from artifacts import registry as artifacts_registry
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+import yara
+
 from plaso.containers import sessions
 from plaso.lib import definitions
 from plaso.engine import configurations
@@ -24,6 +26,51 @@ from tests import test_lib as shared_test_lib
 class TaskMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task multi-process engine."""
 
+  # pylint: disable=protected-access
+
+  def testCompileYaraRules(self):
+    """Tests the _CompileYaraRules and _RemoveCompiledYaraRules functions."""
+    yara_rules_path = self._GetTestFilePath(['yara.rules'])
+    self._SkipIfPathNotExists(yara_rules_path)
+
+    with open(yara_rules_path, 'r') as file_object:
+      rules_string = file_object.read()
+
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.extraction.yara_rules_string = rules_string
+      configuration.temporary_directory = temp_directory
+      test_engine._processing_configuration = configuration
+
+      test_engine._CompileYaraRules()
+
+      compiled_rules_path = configuration.extraction.yara_rules_path
+      self.assertIsNotNone(compiled_rules_path)
+      self.assertTrue(os.path.isfile(compiled_rules_path))
+
+      test_engine._RemoveCompiledYaraRules()
+
+      self.assertIsNone(configuration.extraction.yara_rules_path)
+      self.assertFalse(os.path.exists(compiled_rules_path))
+
+  def testCompileYaraRulesWithError(self):
+    """Tests the _CompileYaraRules function with invalid rules."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.extraction.yara_rules_string = 'rule Bogus {'
+      configuration.temporary_directory = temp_directory
+      test_engine._processing_configuration = configuration
+
+      with self.assertRaises(yara.SyntaxError):
+        test_engine._CompileYaraRules()
+
+      self.assertIsNone(configuration.extraction.yara_rules_path)
+      self.assertEqual(os.listdir(temp_directory), [])
+
   def testProcessSources(self):
     """Tests the PreprocessSources and ProcessSources function."""
     artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the Parquet output module."""
+
+from __future__ import unicode_literals
+
+import json
+import os
+import unittest
+
+from plaso.formatters import manager as formatters_manager
+from plaso.lib import definitions
+from plaso.lib import timelib
+from plaso.output import parquet
+
+from tests import test_lib as shared_test_lib
+from tests.containers import test_lib as containers_test_lib
+from tests.output import test_lib
+
+
+@unittest.skipIf(parquet.pyarrow is None, 'missing pyarrow')
+class ParquetOutputModuleTest(test_lib.OutputModuleTestCase):
+  """Tests the Parquet output module."""
+
+  # pylint: disable=protected-access
+
+  _TEST_EVENTS = [
+      {'data_type': 'test:output',
+       'hostname': 'ubuntu',
+       'filename': 'log/syslog.1',
+       'parser': 'test_parser',
+       'text': (
+           'Reporter <CRON> PID: |8442| (pam_unix(cron:session): session\n '
+           'closed for user root)'),
+       'timestamp': timelib.Timestamp.CopyFromString('2012-06-27 18:17:01'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN,
+       'username': 'root'},
+      {'data_type': 'test:output',
+       'hostname': 'ubuntu',
+       'filename': 'log/syslog.1',
+       'parser': 'test_parser',
+       'text': 'Second event',
+       'timestamp': timelib.Timestamp.CopyFromString('2012-06-27 18:18:23'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN,
+       'username': 'root'}]
+
+  def testWriteEventBody(self):
+    """Tests the WriteEventBody function."""
+    formatters_manager.FormattersManager.RegisterFormatter(
+        test_lib.TestEventFormatter)
+
+    output_mediator = self._CreateOutputMediator()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_module = parquet.ParquetOutputModule(output_mediator)
+
+      filename = os.path.join(temp_directory, 'parquet.out')
+      output_module.SetFilename(filename)
+      output_module.SetRowGroupSize(1)
+
+      output_module.Open()
+      output_module.WriteHeader()
+
+      for event_values in self._TEST_EVENTS:
+        event, event_data = containers_test_lib.CreateEventFromValues(
+            event_values)
+        output_module.WriteEvent(event, event_data, None)
+
+      output_module.WriteFooter()
+      output_module.Close()
+
+      parquet_file = parquet.parquet.ParquetFile(filename)
+      table = parquet_file.read()
+
+      self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        test_lib.TestEventFormatter)
+
+    self.assertEqual(table.num_rows, 2)
+
+    rows = table.to_pylist()
+
+    expected_timestamp = timelib.Timestamp.CopyFromString(
+        '2012-06-27 18:17:01')
+    self.assertEqual(rows[0]['timestamp'], expected_timestamp)
+    self.assertEqual(rows[0]['data_type'], 'test:output')
+    self.assertEqual(rows[0]['hostname'], 'ubuntu')
+    self.assertEqual(rows[0]['parser'], 'test_parser')
+    self.assertEqual(rows[0]['source'], 'LOG')
+    self.assertEqual(rows[0]['source_long'], 'Syslog')
+    self.assertEqual(rows[0]['username'], 'root')
+    self.assertIsNone(rows[0]['tag'])
+
+    expected_message = (
+        'Reporter <CRON> PID: |8442| (pam_unix(cron:session): session '
+        'closed for user root)')
+    self.assertEqual(rows[0]['message'], expected_message)
+
+    attributes = json.loads(rows[0]['attributes'])
+    self.assertEqual(attributes['filename'], 'log/syslog.1')
+    self.assertNotIn('data_type', attributes)
+
+    field = table.schema.field('data_type')
+    self.assertEqual(field.type.value_type, parquet.pyarrow.string())
+
+  def testWriteEventBodyWithError(self):
+    """Tests the WriteEventBody function with an error."""
+    formatters_manager.FormattersManager.RegisterFormatter(
+        test_lib.TestEventFormatter)
+
+    output_mediator = self._CreateOutputMediator()
+
+    def _FailingSerializeAttributes(unused_event_data):
+      """Raises an error instead of serializing the attributes."""
+      raise ValueError('Unable to serialize attributes.')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_module = parquet.ParquetOutputModule(output_mediator)
+      output_module._SerializeAttributes = _FailingSerializeAttributes
+
+      filename = os.path.join(temp_directory, 'parquet.out')
+      output_module.SetFilename(filename)
+
+      output_module.Open()
+
+      event, event_data = containers_test_lib.CreateEventFromValues(
+          self._TEST_EVENTS[0])
+
+      with self.assertRaises(ValueError):
+        output_module.WriteEventBody(event, event_data, None)
+
+      for column_values in output_module._rows.values():
+        self.assertEqual(column_values, [])
+
+      output_module.Close()
+
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        test_lib.TestEventFormatter)
+
+  def testOpen(self):
+    """Tests the Open function."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = parquet.ParquetOutputModule(output_mediator)
+
+    with self.assertRaises(ValueError):
+      output_module.Open()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -56,6 +56,35 @@ class TestDSVParser(dsv_parser.DSVParser):
     return True
 
 
+class TestBatchDSVParser(TestDSVParser):
+  """Delimiter separated values (DSV) parser for testing batches of rows.
+
+  Attribute:
+    batches[list[tuple[list[int], dict[str, list[str]]]]]: row offsets and
+        columns of the batches of rows extracted by the DSV parser.
+  """
+
+  NUMBER_OF_ROWS_PER_BATCH = 3
+
+  def __init__(self):
+    """Initializes a DSV parser."""
+    super(TestBatchDSVParser, self).__init__()
+    self.batches = []
+
+  # pylint: disable=unused-argument
+  def ParseRows(self, parser_mediator, row_offsets, columns):
+    """Parses a batch of lines of the log file and extract events.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between
+          parsers and other components, such as storage and dfvfs.
+      row_offsets (list[int]): offsets of the rows.
+      columns (dict[str, list[str]]): values of the rows per column, as
+          denoted in COLUMNS.
+    """
+    self.batches.append((row_offsets, columns))
+
+
 class DSVParserTest(test_lib.ParserTestCase):
   """Tests the delimiter separated values (DSV) parser."""
 
@@ -105,6 +134,43 @@ class DSVParserTest(test_lib.ParserTestCase):
     self.assertEqual(row['user'], 'joesmith')
     self.assertEqual(row['password'], 'superrich')
 
+  def testParseFileObjectWithBatches(self):
+    """Tests the ParseFileObject function with batches of rows."""
+    parser = TestBatchDSVParser()
+
+    self._ParseFile(['password.csv'], parser)
+
+    self.assertEqual(len(parser.rows), 0)
+    self.assertEqual(len(parser.batches), 2)
+
+    row_offsets, columns = parser.batches[0]
+    self.assertEqual(row_offsets, [20, 44, 64])
+    self.assertEqual(
+        columns['place'], ['bank', 'alarm system', 'treasure chest'])
+    self.assertEqual(columns['user'], ['joesmith', '-', '-'])
+    self.assertEqual(columns['password'], ['superrich', '1234', '1111'])
+
+    row_offsets, columns = parser.batches[1]
+    self.assertEqual(row_offsets, [86])
+    self.assertEqual(columns['place'], ['uber secret laire'])
+
+  def testParseRows(self):
+    """Tests the ParseRows function."""
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+    parser = TestDSVParser()
+
+    columns = {
+        'place': ['bank', 'alarm system'],
+        'user': ['joesmith', '-'],
+        'password': ['superrich', '1234']}
+    parser.ParseRows(parser_mediator, [20, 44], columns)
+
+    self.assertEqual(parser.row_offsets, [20, 44])
+    self.assertEqual(parser.rows, [
+        {'place': 'bank', 'user': 'joesmith', 'password': 'superrich'},
+        {'place': 'alarm system', 'user': '-', 'password': '1234'}])
+
   def testHasExpectedLineLength(self):
     """Tests the _HasExpectedLineLength function."""
     parser = TestDSVParser()
@@ -201,6 +201,35 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
       parsers_mediator.ProduceEventWithEventData(
           event_without_timestamp, event_data)
 
+  def testProduceEventsWithEventData(self):
+    """Tests the ProduceEventsWithEventData method."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    event_data1 = events.EventData()
+    event_data1.offset = 0
+    event_data2 = events.EventData()
+    event_data2.offset = 1
+
+    events_with_event_data = []
+    for event_data in (event_data1, event_data1, event_data2):
+      date_time = fake_time.FakeTime()
+      event = time_events.DateTimeValuesEvent(
+          date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+      events_with_event_data.append((event, event_data))
+
+    parsers_mediator.ProduceEventsWithEventData(events_with_event_data)
+    self.assertEqual(storage_writer.number_of_warnings, 0)
+    self.assertEqual(storage_writer.number_of_events, 3)
+    self.assertEqual(len(list(storage_writer.GetEventData())), 2)
+
+    event_without_timestamp = events.EventObject()
+    with self.assertRaises(errors.InvalidEvent):
+      parsers_mediator.ProduceEventsWithEventData([
+          (event_without_timestamp, event_data1)])
+
   # TODO: add tests for ProduceExtractionWarning.
   # TODO: add tests for RemoveEventAttribute.
 
@@ -239,6 +268,43 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
 
     parsers_mediator.SignalAbort()
 
+  def testStartAndStopRecordingParseResults(self):
+    """Tests the StartRecordingParseResults and StopRecordingParseResults."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    parsers_mediator._MAXIMUM_NUMBER_OF_RECORDED_PARSE_RESULTS = 2
+
+    event_data = events.EventData()
+
+    parsers_mediator.StartRecordingParseResults()
+
+    for _ in range(2):
+      date_time = fake_time.FakeTime()
+      event = time_events.DateTimeValuesEvent(
+          date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+      parsers_mediator.ProduceEventWithEventData(event, event_data)
+
+    parse_results = parsers_mediator.StopRecordingParseResults()
+    self.assertEqual(len(parse_results), 2)
+
+    # The parse results of a data stream that produces more events than
+    # the maximum are not recorded.
+    parsers_mediator.StartRecordingParseResults()
+
+    for _ in range(3):
+      date_time = fake_time.FakeTime()
+      event = time_events.DateTimeValuesEvent(
+          date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+      parsers_mediator.ProduceEventWithEventData(event, event_data)
+
+    parse_results = parsers_mediator.StopRecordingParseResults()
+    self.assertIsNone(parse_results)
+
+    self.assertEqual(storage_writer.number_of_events, 5)
+
 
 if __name__ == '__main__':
   unittest.main()
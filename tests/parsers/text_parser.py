@@ -8,11 +8,82 @@ import unittest
 
 import pyparsing
 
+from dfvfs.file_io import fake_file_io
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+
+from plaso.parsers import apache_access
+from plaso.parsers import selinux
+from plaso.parsers import skydrivelog
 from plaso.parsers import text_parser
+from plaso.parsers import vsftpd
+from plaso.parsers import xchatlog
 
 from tests.parsers import test_lib
 
 
+class TestPyparsingSingleLineTextParser(
+    text_parser.PyparsingSingleLineTextParser):
+  """Single line PyParsing-based text parser for testing."""
+
+  NAME = 'test_single_line_text'
+
+  LINE_STRUCTURES = [
+      ('number', pyparsing.Word(pyparsing.nums).setResultsName('value')),
+      ('word', pyparsing.Word(pyparsing.alphas).setResultsName('value')),
+      ('words', (
+          pyparsing.Word(pyparsing.alphas).setResultsName('first') +
+          pyparsing.Word(pyparsing.alphas).setResultsName('second')))]
+
+  LINE_STRUCTURE_REGULAR_EXPRESSIONS = [
+      ('number', r'(?P<value>[0-9]+)(?P<suffix>!)?$'),
+      ('word', r'(?P<value>[A-Za-z]+)$'),
+      ('words', r'(?P<first>[A-Za-z]+) +(?P<second>[A-Za-z]+)$')]
+
+  def _GetStructureFromRegularExpressionMatch(self, key, values):
+    """Retrieves a structure from the values of a regular expression match.
+
+    Args:
+      key (str): name of the line structure that the regular expression is
+          equivalent to.
+      values (dict[str, str]): values of the named groups of the regular
+          expression.
+
+    Returns:
+      dict[str, object]: structure of values or None if the value is not
+          supported.
+    """
+    if values.get('value', None) == 'unsupported':
+      return None
+
+    return values
+
+  def ParseRecord(self, parser_mediator, key, structure):
+    """Parses a log record structure and produces events.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      key (str): name of the parsed structure.
+      structure (pyparsing.ParseResults|dict[str, object]): tokens from
+          a parsed log line.
+    """
+    return
+
+  def VerifyStructure(self, parser_mediator, line):
+    """Verify the structure of the file and return boolean based on that check.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      line (str): single line from the text file.
+
+    Returns:
+      bool: True if this is the correct parser, False otherwise.
+    """
+    return True
+
+
 class PyparsingConstantsTest(test_lib.ParserTestCase):
   """Tests the PyparsingConstants text parser."""
 
@@ -54,6 +125,33 @@ class PyparsingConstantsTest(test_lib.ParserTestCase):
       text_parser.PyparsingConstants.IPV4_ADDRESS.parseString('34.258')
 
 
+class EncodedTextReaderTest(unittest.TestCase):
+  """Tests for the encoded text reader."""
+
+  def testReadLines(self):
+    """Tests the ReadLines function."""
+    resolver_context = context.Context()
+    path_spec = fake_path_spec.FakePathSpec(location='/test.txt')
+
+    file_object = fake_file_io.FakeFile(
+        resolver_context, b'first\r\nsecond\n')
+    file_object.open(path_spec)
+
+    encoded_text_reader = text_parser.EncodedTextReader('ascii')
+    encoded_text_reader.ReadLines(file_object)
+    self.assertEqual(encoded_text_reader.lines, 'first\nsecond\n')
+
+    file_object = fake_file_io.FakeFile(
+        resolver_context, b'A' * (1024 * 1024))
+    file_object.open(path_spec)
+
+    # Data without end of line characters is read up to the buffer size.
+    encoded_text_reader = text_parser.EncodedTextReader(
+        'ascii', buffer_size=2048)
+    encoded_text_reader.ReadLines(file_object)
+    self.assertEqual(encoded_text_reader.lines, 'A' * 2048)
+
+
 class PyparsingSingleLineTextParserTest(unittest.TestCase):
   """Tests for the single line PyParsing-based text parser."""
 
@@ -81,6 +179,88 @@ class PyparsingSingleLineTextParserTest(unittest.TestCase):
     bytes_in = b'Ascii Open then...\x00\x99\x23'
     self.assertFalse(parser._IsText(bytes_in))
 
+  def testMatchLineStructureRegularExpressions(self):
+    """Tests the _MatchLineStructureRegularExpressions function."""
+    parser = TestPyparsingSingleLineTextParser()
+
+    key, structure = parser._MatchLineStructureRegularExpressions('123!')
+    self.assertEqual(key, 'number')
+    self.assertEqual(structure, {'suffix': '!', 'value': '123'})
+
+    key, structure = parser._MatchLineStructureRegularExpressions('123')
+    self.assertEqual(key, 'number')
+    self.assertEqual(structure, {'value': '123'})
+
+    key, structure = parser._MatchLineStructureRegularExpressions('abc')
+    self.assertEqual(key, 'word')
+    self.assertEqual(structure, {'value': 'abc'})
+
+    key, structure = parser._MatchLineStructureRegularExpressions('abc123')
+    self.assertIsNone(key)
+    self.assertIsNone(structure)
+
+    key, structure = parser._MatchLineStructureRegularExpressions(
+        'unsupported')
+    self.assertIsNone(key)
+    self.assertIsNone(structure)
+
+    # Tabs are expanded to spaces, as pyparsing does.
+    key, structure = parser._MatchLineStructureRegularExpressions('abc\tdef')
+    self.assertEqual(key, 'words')
+    self.assertEqual(structure, {'first': 'abc', 'second': 'def'})
+
+
+class LineStructureRegularExpressionsTest(test_lib.ParserTestCase):
+  """Tests the line structure regular expressions of the text parsers."""
+
+  # pylint: disable=protected-access
+
+  _PARSERS = [
+      (apache_access.ApacheAccessParser, 'access.log'),
+      (selinux.SELinuxParser, 'selinux.log'),
+      (skydrivelog.SkyDriveOldLogParser, 'skydrive_old.log'),
+      (vsftpd.VsftpdLogParser, 'vsftpd.log'),
+      (xchatlog.XChatLogParser, 'xchat.log')]
+
+  def _GetEventValues(self, storage_writer):
+    """Retrieves the values of the events and event data.
+
+    Args:
+      storage_writer (FakeStorageWriter): storage writer.
+
+    Returns:
+      list[tuple[int, str, dict[str, object]]]: timestamp, timestamp
+          description and event data values of the events.
+    """
+    event_values = []
+    for event in storage_writer.GetSortedEvents():
+      event_data = self._GetEventDataOfEvent(storage_writer, event)
+      event_data_values = event_data.CopyToDict()
+      event_data_values.pop('pathspec', None)
+
+      event_values.append(
+          (event.timestamp, event.timestamp_desc, event_data_values))
+
+    return event_values
+
+  def testParseWithLineStructureRegularExpressions(self):
+    """Tests that the regular expressions are equivalent to pyparsing."""
+    for parser_class, filename in self._PARSERS:
+      parser = parser_class()
+      self.assertIsNotNone(parser._line_structure_regular_expression)
+
+      storage_writer = self._ParseFile([filename], parser)
+      event_values = self._GetEventValues(storage_writer)
+      self.assertGreater(len(event_values), 0)
+
+      parser = parser_class()
+      parser._line_structure_regular_expression = None
+
+      storage_writer = self._ParseFile([filename], parser)
+      expected_event_values = self._GetEventValues(storage_writer)
+
+      self.assertEqual(event_values, expected_event_values)
+
 
 if __name__ == '__main__':
   unittest.main()
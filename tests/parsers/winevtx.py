@@ -6,6 +6,11 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import configurations
 from plaso.formatters import winevtx as _  # pylint: disable=unused-import
 from plaso.lib import definitions
 from plaso.parsers import winevtx
@@ -123,6 +128,49 @@ class WinEvtxParserTest(test_lib.ParserTestCase):
     self._TestGetMessageStrings(
         event_data, expected_message, expected_short_message)
 
+  def testParseWithXMLTemplates(self):
+    """Tests the Parse function with XML templates."""
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(
+        storage_writer, file_entry=file_entry)
+
+    configuration = configurations.EventExtractionConfiguration()
+    configuration.evtx_xml_templates = True
+    parser_mediator.SetEventExtractionConfiguration(configuration)
+
+    parser = winevtx.WinEvtxParser()
+    file_object = file_entry.GetFileObject()
+    try:
+      parser.Parse(parser_mediator, file_object)
+    finally:
+      file_object.close()
+
+    self.assertEqual(storage_writer.number_of_warnings, 0)
+    self.assertEqual(storage_writer.number_of_events, 3202)
+
+    xml_templates = list(storage_writer.GetWindowsEventLogXMLTemplates())
+    self.assertEqual(len(xml_templates), 45)
+
+    # The XML string is rebuilt from the XML template when the event data
+    # is read.
+    expected_storage_writer = self._ParseFile(['System.evtx'], parser)
+
+    for event, expected_event in zip(
+        storage_writer.GetEvents(), expected_storage_writer.GetEvents()):
+      event_data = self._GetEventDataOfEvent(storage_writer, event)
+      expected_event_data = self._GetEventDataOfEvent(
+          expected_storage_writer, expected_event)
+
+      self.assertEqual(event_data.xml_string, expected_event_data.xml_string)
+      self.assertIsNone(getattr(event_data, 'xml_template_identifier', None))
+
   def testParseTruncated(self):
     """Tests the Parse function on a truncated file."""
     parser = winevtx.WinEvtxParser()
@@ -130,6 +130,55 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
 
   # TODO: add ExtractionWarning tests.
 
+  def testReadAndWriteSerializedEventData(self):
+    """Test ReadSerialized and WriteSerialized of EventData."""
+    test_path_spec = fake_path_spec.FakePathSpec(location='/opt/plaso.txt')
+
+    expected_event_data = events.EventData(data_type='test:event_data')
+    expected_event_data.binary_string = b'\xc0\x90\x90binary'
+    expected_event_data.my_list = ['asf', 4234, 2, 54, 'asf']
+    expected_event_data.pathspec = test_path_spec
+    expected_event_data.string = 'Normal string'
+
+    json_string = (
+        json_serializer.JSONAttributeContainerSerializer.WriteSerialized(
+            expected_event_data))
+
+    self.assertIsNotNone(json_string)
+
+    event_data = (
+        json_serializer.JSONAttributeContainerSerializer.ReadSerialized(
+            json_string))
+
+    self.assertIsNotNone(event_data)
+    self.assertIsInstance(event_data, events.EventData)
+
+    # Attributes that require conversion are deserialized on first access.
+    self.assertNotIn('pathspec', event_data.__dict__)
+    self.assertEqual(event_data.data_type, 'test:event_data')
+    self.assertEqual(event_data.pathspec.comparable, test_path_spec.comparable)
+    self.assertIn('pathspec', event_data.__dict__)
+    self.assertNotIn('my_list', event_data.__dict__)
+
+    event_data.my_list = ['overwritten']
+
+    expected_event_data_dict = {
+        'binary_string': b'\xc0\x90\x90binary',
+        'data_type': 'test:event_data',
+        'my_list': ['overwritten'],
+        'pathspec': test_path_spec.comparable,
+        'string': 'Normal string'}
+
+    event_data_dict = event_data.CopyToDict()
+    event_data_dict['pathspec'] = event_data_dict['pathspec'].comparable
+
+    self.assertEqual(
+        sorted(event_data_dict.items()),
+        sorted(expected_event_data_dict.items()))
+
+    with self.assertRaises(AttributeError):
+      _ = event_data.bogus
+
   def testReadAndWriteSerializedEventObject(self):
     """Test ReadSerialized and WriteSerialized of EventObject."""
     test_file = self._GetTestFilePath(['ímynd.dd'])
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the external memory event sorter."""
+
+from __future__ import unicode_literals
+
+import os
+import random
+import unittest
+
+from plaso.storage import event_sorter
+
+from tests import test_lib as shared_test_lib
+from tests.storage import test_lib
+
+
+class ExternalEventSorterTest(test_lib.StorageTestCase):
+  """Tests for the external memory event sorter."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestEntries(self, number_of_entries):
+    """Creates test entries.
+
+    Args:
+      number_of_entries (int): number of entries.
+
+    Returns:
+      list[tuple[int, int]]: timestamp and row identifier pairs.
+    """
+    random_generator = random.Random(1)
+    return [
+        (random_generator.randint(-1000, 1000), row_identifier)
+        for row_identifier in range(1, number_of_entries + 1)]
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    sorter = event_sorter.ExternalEventSorter()
+    self.assertIsNotNone(sorter)
+
+    with self.assertRaises(ValueError):
+      event_sorter.ExternalEventSorter(maximum_memory=0)
+
+  def testSortEntriesInMemory(self):
+    """Tests the SortEntries function with entries that fit in memory."""
+    test_entries = self._CreateTestEntries(500)
+
+    sorter = event_sorter.ExternalEventSorter()
+    sorted_entries = list(sorter.SortEntries(iter(test_entries)))
+
+    self.assertEqual(sorted_entries, sorted(test_entries))
+    self.assertEqual(sorter.number_of_runs, 0)
+    self.assertEqual(sorter.number_of_sorted_entries, 500)
+
+  def testSortEntriesWithRuns(self):
+    """Tests the SortEntries function with entries written to runs."""
+    test_entries = self._CreateTestEntries(5000)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      sorter = event_sorter.ExternalEventSorter(
+          maximum_memory=1, temporary_directory=temp_directory)
+      sorted_entries = list(sorter.SortEntries(iter(test_entries)))
+
+      self.assertEqual(os.listdir(temp_directory), [])
+
+    self.assertEqual(sorted_entries, sorted(test_entries))
+    self.assertEqual(sorter.number_of_runs, 4)
+    self.assertEqual(sorter.number_of_sorted_entries, 5000)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -7,6 +7,8 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+from plaso.containers import events
+from plaso.lib import timelib
 from plaso.storage import event_tag_index
 from plaso.storage import identifiers
 from plaso.storage.sqlite import sqlite_file
@@ -88,6 +90,91 @@ class EventTagIndexTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testGetEventTagForEvent(self):
+    """Tests the GetEventTagForEvent function."""
+    test_index = event_tag_index.EventTagIndex()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFileWithTags(temp_file)
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      event_tag_interval = events.EventTagInterval(
+          comment='Session.',
+          end_timestamp=timelib.Timestamp.CopyFromString('2012-04-20 23:00:00'),
+          start_timestamp=timelib.Timestamp.CopyFromString(
+              '2012-04-20 16:00:00'))
+      event_tag_interval.AddLabels(['session_0'])
+      storage_file.AddEventTagInterval(event_tag_interval)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      test_events = {
+          event.timestamp: event for event in storage_file.GetSortedEvents()}
+
+      # Event with an event tag within the interval.
+      event = test_events[timelib.Timestamp.CopyFromString(
+          '2012-04-20 22:38:46.929596')]
+      event_tag = test_index.GetEventTagForEvent(storage_file, event)
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.comment, 'This is interestingSession.')
+      self.assertEqual(event_tag.labels, ['Malware', 'Benign', 'session_0'])
+
+      event = test_events[timelib.Timestamp.CopyFromString(
+          '2012-04-20 16:44:46')]
+      event_tag = test_index.GetEventTagForEvent(storage_file, event)
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.comment, 'Session.')
+      self.assertEqual(event_tag.labels, ['Interesting', 'session_0'])
+
+      # Event with an event tag outside the interval.
+      event = test_events[timelib.Timestamp.CopyFromString(
+          '2009-04-05 12:27:39')]
+      event_tag = test_index.GetEventTagForEvent(storage_file, event)
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.comment, 'My comment')
+      self.assertEqual(event_tag.labels, [])
+
+      # Event without an event tag outside the interval.
+      event = test_events[timelib.Timestamp.CopyFromString(
+          '2012-04-20 23:56:46.929596')]
+      event_tag = test_index.GetEventTagForEvent(storage_file, event)
+      self.assertIsNone(event_tag)
+
+      storage_file.Close()
+
+  def testGetEventTagIntervals(self):
+    """Tests the _GetEventTagIntervals function."""
+    test_index = event_tag_index.EventTagIndex()
+
+    for start_timestamp, end_timestamp in ((10, 100), (20, 30), (50, 60)):
+      event_tag_interval = events.EventTagInterval(
+          end_timestamp=end_timestamp, start_timestamp=start_timestamp)
+      test_index.SetEventTagInterval(event_tag_interval)
+
+    intervals = test_index._GetEventTagIntervals(5)
+    self.assertEqual(intervals, [])
+
+    intervals = test_index._GetEventTagIntervals(25)
+    self.assertEqual(
+        [interval.start_timestamp for interval in intervals], [10, 20])
+
+    intervals = test_index._GetEventTagIntervals(40)
+    self.assertEqual(
+        [interval.start_timestamp for interval in intervals], [10])
+
+    intervals = test_index._GetEventTagIntervals(60)
+    self.assertEqual(
+        [interval.start_timestamp for interval in intervals], [10, 50])
+
+    intervals = test_index._GetEventTagIntervals(101)
+    self.assertEqual(intervals, [])
+
   # TODO: add test for SetEventTag.
 
 
@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import unittest
 
 from plaso.containers import event_sources
+from plaso.containers import events
 from plaso.containers import reports
 from plaso.containers import sessions
 from plaso.containers import tasks
@@ -101,6 +102,25 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
     with self.assertRaises(IOError):
       storage_writer.AddEventTag(event_tag)
 
+  def testAddEventTagInterval(self):
+    """Tests the AddEventTagInterval function."""
+    session = sessions.Session()
+    event_tag_interval = events.EventTagInterval(
+        end_timestamp=200, start_timestamp=100)
+
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    storage_writer.AddEventTagInterval(event_tag_interval)
+
+    event_tag_intervals = list(storage_writer.GetEventTagIntervals())
+    self.assertEqual(len(event_tag_intervals), 1)
+
+    storage_writer.Close()
+
+    with self.assertRaises(IOError):
+      storage_writer.AddEventTagInterval(event_tag_interval)
+
   def testAddWarning(self):
     """Tests the AddWarning function."""
     session = sessions.Session()
@@ -187,6 +207,21 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
 
     # TODO: add test with time range.
 
+  def testWriteExportWatermark(self):
+    """Tests the WriteExportWatermark function."""
+    session = sessions.Session()
+
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    storage_writer.WriteExportWatermark(5)
+    self.assertEqual(storage_writer.export_watermark, 5)
+
+    storage_writer.Close()
+
+    with self.assertRaises(IOError):
+      storage_writer.WriteExportWatermark(6)
+
   def testWriteSessionStartAndCompletion(self):
     """Tests the WriteSessionStart and WriteSessionCompletion functions."""
     session = sessions.Session()
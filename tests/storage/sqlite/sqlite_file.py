@@ -13,7 +13,9 @@ from plaso.containers import reports
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.containers import warnings
+from plaso.containers import windows_events
 from plaso.lib import definitions
+from plaso.storage import event_sorter
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -339,6 +341,22 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testAddWindowsEventLogXMLTemplate(self):
+    """Tests the AddWindowsEventLogXMLTemplate function."""
+    xml_template = windows_events.WindowsEventLogXMLTemplate(
+        event_identifier=7036, identifier='template1',
+        source_name='Service Control Manager',
+        xml_skeleton='<Event><Data Name="{0}">{1}</Data></Event>')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      storage_file.AddWindowsEventLogXMLTemplate(xml_template)
+
+      storage_file.Close()
+
   # TODO: add tests for CheckSupportedFormat
 
   def testGetAnalysisReports(self):
@@ -414,6 +432,46 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for GetEventData
   # TODO: add tests for GetEventDataByIdentifier
 
+  def testGetEventDataByIdentifier(self):
+    """Tests the GetEventDataByIdentifier function."""
+    xml_template = windows_events.WindowsEventLogXMLTemplate(
+        event_identifier=7036, identifier='template1',
+        source_name='Service Control Manager',
+        xml_skeleton='<Event><Data Name="{0}">{1}</Data></Event>')
+
+    event_data = events.EventData(data_type='windows:evtx:record')
+    event_data.strings = ['stopped']
+    event_data.xml_template_identifier = 'template1'
+    event_data.xml_template_values = ['param1', 0]
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      storage_file.AddWindowsEventLogXMLTemplate(xml_template)
+      storage_file.AddEventData(event_data)
+      event_data_identifier = event_data.GetIdentifier()
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      test_event_data = storage_file.GetEventDataByIdentifier(
+          event_data_identifier)
+
+      storage_file.Close()
+
+    self.assertIsNotNone(test_event_data)
+    self.assertEqual(
+        test_event_data.xml_string,
+        '<Event><Data Name="param1">stopped</Data></Event>')
+
+    attribute_names = test_event_data.GetAttributeNames()
+    self.assertNotIn('xml_template_identifier', attribute_names)
+    self.assertNotIn('xml_template_values', attribute_names)
+
   def testGetEvents(self):
     """Tests the GetEvents function."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -519,10 +577,74 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       test_events = list(storage_file.GetSortedEvents())
       self.assertEqual(len(test_events), 4)
 
+      test_events = list(storage_file.GetSortedEvents(watermark=2))
+      self.assertEqual(len(test_events), 2)
+
+      storage_file.SetEventSorter(event_sorter.ExternalEventSorter(
+          maximum_memory=1, temporary_directory=temp_directory))
+
+      test_events = list(storage_file.GetSortedEvents())
+      self.assertEqual(len(test_events), 4)
+
+      timestamps = [event.timestamp for event in test_events]
+      self.assertEqual(timestamps, sorted(timestamps))
+
       storage_file.Close()
 
     # TODO: add test with time range.
 
+  def testGetEventWatermark(self):
+    """Tests the GetEventWatermark function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      event_watermark = storage_file.GetEventWatermark()
+      self.assertEqual(event_watermark, 0)
+
+      for event, event_data in containers_test_lib.CreateEventsFromValues(
+          self._TEST_EVENTS):
+        storage_file.AddEventData(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        storage_file.AddEvent(event)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      event_watermark = storage_file.GetEventWatermark()
+      self.assertEqual(event_watermark, 4)
+
+      storage_file.Close()
+
+  def testGetAndWriteExportWatermark(self):
+    """Tests the GetExportWatermark and WriteExportWatermark functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      export_watermark = storage_file.GetExportWatermark()
+      self.assertEqual(export_watermark, 0)
+
+      storage_file.WriteExportWatermark(3)
+      storage_file.WriteExportWatermark(5)
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      export_watermark = storage_file.GetExportWatermark()
+      self.assertEqual(export_watermark, 5)
+
+      with self.assertRaises(IOError):
+        storage_file.WriteExportWatermark(6)
+
+      storage_file.Close()
+
   # TODO: add tests for HasAnalysisReports
   # TODO: add tests for HasWarnings
   # TODO: add tests for HasEventTags
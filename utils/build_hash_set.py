@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to build a hash set file from text hash lists.
+
+The hash set file can be used by the hash_set analysis plugin to look up
+file hashes without network access.
+
+The text hash lists contain one hash per line. Lines that contain multiple
+values, such as the comma separated NSRL RDS NSRLFile.txt, are supported,
+in which case the first value that is formatted as a hash of the specified
+type is used. Lines without such a value, such as headers and comments, are
+ignored.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import logging
+import re
+import sys
+import time
+
+from plaso.analysis import hash_set
+
+
+class HashListReader(object):
+  """Text hash list reader."""
+
+  _HEXADECIMAL_DIGITS_PER_HASH = {
+      'md5': 32,
+      'sha1': 40,
+      'sha256': 64}
+
+  def __init__(self, lookup_hash):
+    """Initializes a text hash list reader.
+
+    Args:
+      lookup_hash (str): name of the hash to read, such as "md5", "sha1" or
+          "sha256".
+
+    Raises:
+      ValueError: if the lookup hash is not supported.
+    """
+    number_of_digits = self._HEXADECIMAL_DIGITS_PER_HASH.get(lookup_hash, None)
+    if not number_of_digits:
+      raise ValueError('Unsupported lookup hash: {0!s}'.format(lookup_hash))
+
+    super(HashListReader, self).__init__()
+    self._hash_regex = re.compile(
+        r'(?<![0-9A-Fa-f])([0-9A-Fa-f]{{{0:d}}})(?![0-9A-Fa-f])'.format(
+            number_of_digits))
+
+    self.number_of_hashes = 0
+    self.number_of_ignored_lines = 0
+
+  def ReadHashes(self, path):
+    """Reads hashes from a text hash list.
+
+    Args:
+      path (str): path of the text hash list.
+
+    Yields:
+      str: lower case hexadecimal formatted hash.
+    """
+    with io.open(path, 'r', encoding='utf-8', errors='replace') as file_object:
+      for line in file_object:
+        match = self._hash_regex.search(line)
+        if not match:
+          self.number_of_ignored_lines += 1
+          continue
+
+        self.number_of_hashes += 1
+        yield match.group(1).lower()
+
+  def ReadHashesFromFiles(self, paths):
+    """Reads hashes from text hash lists.
+
+    Args:
+      paths (list[str]): paths of the text hash lists.
+
+    Yields:
+      str: lower case hexadecimal formatted hash.
+    """
+    for path in paths:
+      for hash_string in self.ReadHashes(path):
+        yield hash_string
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Builds a hash set file, for the hash_set analysis plugin, from text '
+      'hash lists.'))
+
+  argument_parser.add_argument(
+      '--hash', dest='lookup_hash', type=str, action='store', default='md5',
+      choices=sorted(hash_set.HashSetAnalyzer.SUPPORTED_HASHES),
+      metavar='HASH', help=(
+          'Type of hash in the hash lists, the default is: md5. Supported '
+          'options: {0:s}').format(', '.join(sorted(
+              hash_set.HashSetAnalyzer.SUPPORTED_HASHES))))
+
+  argument_parser.add_argument(
+      '--label', dest='label', type=str, action='store',
+      default='hash_set_present', metavar='LABEL', help=(
+          'Label to apply to events of files in the hash set, the default '
+          'is: hash_set_present.'))
+
+  argument_parser.add_argument(
+      '--maximum-hashes-in-memory', '--maximum_hashes_in_memory',
+      dest='maximum_hashes_in_memory', type=int, action='store', default=None,
+      metavar='NUMBER', help=(
+          'Maximum number of hashes that are sorted in memory before they '
+          'are written to a temporary file.'))
+
+  argument_parser.add_argument(
+      '--temporary-directory', '--temporary_directory',
+      dest='temporary_directory', type=str, action='store', default=None,
+      metavar='DIRECTORY', help=(
+          'Path to the directory that should be used to store temporary '
+          'files.'))
+
+  argument_parser.add_argument(
+      'hash_set_file', type=str, action='store', metavar='HASH_SET_FILE',
+      help='Path of the hash set file to write.')
+
+  argument_parser.add_argument(
+      'hash_lists', type=str, action='store', nargs='+', metavar='HASH_LIST',
+      help='Path of a text hash list to read.')
+
+  options = argument_parser.parse_args()
+
+  logging.basicConfig(
+      level=logging.INFO, format='[%(levelname)s] %(message)s')
+
+  try:
+    hash_list_reader = HashListReader(options.lookup_hash)
+    hash_set_writer = hash_set.HashSetFileWriter(
+        options.lookup_hash, options.label,
+        maximum_number_of_digests_in_memory=options.maximum_hashes_in_memory,
+        temporary_directory=options.temporary_directory)
+
+  except ValueError as exception:
+    print('Unable to build hash set file with error: {0!s}'.format(exception))
+    return False
+
+  start_time = time.time()
+
+  try:
+    number_of_digests = hash_set_writer.WriteFile(
+        options.hash_set_file,
+        hash_list_reader.ReadHashesFromFiles(options.hash_lists))
+
+  except (IOError, OSError, ValueError) as exception:
+    print('Unable to build hash set file with error: {0!s}'.format(exception))
+    return False
+
+  logging.info((
+      'Wrote {0:d} unique {1:s} hashes, from {2:d} hashes and {3:d} ignored '
+      'lines, to: {4:s} in {5:.1f} seconds.').format(
+          number_of_digests, options.lookup_hash,
+          hash_list_reader.number_of_hashes,
+          hash_list_reader.number_of_ignored_lines, options.hash_set_file,
+          time.time() - start_time))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to measure the memory usage of events on the psort event heap."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import sys
+import tracemalloc
+
+from plaso.containers import events
+from plaso.lib import definitions
+from plaso.multi_processing import psort
+from plaso.serializer import json_serializer
+
+
+class EventHeapMemoryUsageMeasurer(object):
+  """Measures the memory usage of events on the psort event heap."""
+
+  _SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
+  _TIME_DESCRIPTIONS = (
+      definitions.TIME_DESCRIPTION_CHANGE,
+      definitions.TIME_DESCRIPTION_CREATION,
+      definitions.TIME_DESCRIPTION_LAST_ACCESS,
+      definitions.TIME_DESCRIPTION_MODIFICATION)
+
+  def _CreateSerializedEvents(self, number_of_events):
+    """Creates serialized events and event data.
+
+    The events are serialized to ensure attribute values are allocated per
+    event, as they are when read from storage.
+
+    Args:
+      number_of_events (int): number of events to create.
+
+    Returns:
+      list[tuple[str, str]]: JSON serialized event and event data.
+    """
+    serialized_events = []
+    for index in range(number_of_events):
+      event = events.EventObject()
+      event.parser = 'filestat'
+      event.timestamp = 1542240000000000 + (index // 4)
+      event.timestamp_desc = self._TIME_DESCRIPTIONS[index % 4]
+
+      event_data = events.EventData(data_type='fs:stat')
+      event_data.filename = '/Windows/System32/file{0:d}.dll'.format(
+          index // 4)
+      event_data.inode = index // 4
+      event_data.parser = 'filestat'
+
+      serialized_events.append((
+          self._SERIALIZER.WriteSerialized(event),
+          self._SERIALIZER.WriteSerialized(event_data)))
+
+    return serialized_events
+
+  def MeasureEvents(self, number_of_events):
+    """Measures the memory usage of deserialized events.
+
+    Args:
+      number_of_events (int): number of events to measure.
+
+    Returns:
+      float: number of bytes per event.
+    """
+    serialized_events = self._CreateSerializedEvents(number_of_events)
+
+    tracemalloc.start()
+    snapshot_size, _ = tracemalloc.get_traced_memory()
+
+    event_objects = [
+        self._SERIALIZER.ReadSerialized(event_string)
+        for event_string, _ in serialized_events]
+
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return float(size - snapshot_size) / len(event_objects)
+
+  def MeasureEventHeap(self, number_of_events):
+    """Measures the memory usage of events on the psort event heap.
+
+    Args:
+      number_of_events (int): number of events to measure.
+
+    Returns:
+      float: number of bytes per event on the heap, which includes the event
+          data and identifiers.
+    """
+    serialized_events = self._CreateSerializedEvents(number_of_events)
+
+    event_heap = psort.PsortEventHeap()
+
+    tracemalloc.start()
+    snapshot_size, _ = tracemalloc.get_traced_memory()
+
+    for event_string, event_data_string in serialized_events:
+      event = self._SERIALIZER.ReadSerialized(event_string)
+      event_data = self._SERIALIZER.ReadSerialized(event_data_string)
+      event_heap.PushEvent(event, event_data)
+
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return float(size - snapshot_size) / event_heap.number_of_events
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Measures the memory usage of events on the psort event heap.'))
+
+  argument_parser.add_argument(
+      '--number_of_events', '--number-of-events', dest='number_of_events',
+      type=int, action='store', default=100000, help=(
+          'number of events to measure.'))
+
+  options = argument_parser.parse_args()
+
+  if options.number_of_events <= 0:
+    print('Number of events value out of bounds.')
+    return False
+
+  measurer = EventHeapMemoryUsageMeasurer()
+
+  bytes_per_event = measurer.MeasureEvents(options.number_of_events)
+  print('Event: {0:.1f} bytes per event'.format(bytes_per_event))
+
+  bytes_per_event = measurer.MeasureEventHeap(options.number_of_events)
+  print('Event heap: {0:.1f} bytes per event'.format(bytes_per_event))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)